@@ -0,0 +1,166 @@
+"""
+    Cobrança dos serviços básicos (equipamentos instalados)
+    Quantidades e custos por (organização, empresa, ID legado do contrato)
+    calculados em duas consultas agrupadas, com a aritmética de datas no SQL:
+      - mês cheio: equipamentos instalados antes do primeiro dia do mês de date_lt
+      - proporcional: instalados no mês, cobrados pelos dias instalados no período
+    Meses fechados (Equipments.snapshots) são lidos do snapshot, sem consultar o inventário
+    nem as tabelas de preço (o valor unitário fica congelado na linha do snapshot)
+    Usado pelos relatórios do administrador, da organização e da empresa
+"""
+
+# python
+from datetime import timedelta
+from decimal import Decimal
+
+# django
+from django.db.models import Count, Sum
+from django.db.models import DurationField, ExpressionWrapper, F, Value
+from django.db.models.functions import Greatest
+
+# project
+from core.constants import ACTIVE_STATUS
+
+# local
+from .models import Equipment
+from .models import EquipmentInstallDelta
+from .models import EquipmentSnapshot
+from .snapshots import get_closed_month
+
+PRICE_VALUE = 'contract__org_price_table__price__value'
+
+
+def get_billing_period(date_gt, date_lt):
+    """
+        Início da cobrança proporcional (primeiro dia do mês de date_lt, ou date_gt
+        se posterior) e número de dias do período
+    """
+    start = max(date_gt, date_lt.replace(day=1))
+    return start, (date_lt - start).days + 1
+
+
+def get_equipment_queryset(organization=None, company=None, model=Equipment):
+    """
+        Equipamentos com o preço ativo do contrato cujo serviço
+        básico é o ID legado do contrato (o mesmo filtro da junção contract__org_price_table__price)
+    """
+    filters = {
+        'contract__org_price_table__price__status': ACTIVE_STATUS,
+        'contract__org_price_table__price__basic_service': F('contract__legacyID')}
+    if organization is not None:
+        filters['organization'] = organization
+    if company is not None:
+        filters['company'] = company
+    return model.objects.filter(**filters)
+
+
+def get_snapshot_queryset(model, snapshot_month, organization=None, company=None):
+    """
+        Linhas do snapshot do mês fechado com preço (o valor unitário congelado na linha)
+    """
+    queryset = model.objects.filter(month=snapshot_month, price__isnull=False)
+    if organization is not None:
+        queryset = queryset.filter(organization=organization)
+    if company is not None:
+        queryset = queryset.filter(company=company)
+    return queryset
+
+
+def get_full_month_charges(date_gt, date_lt, organization=None, company=None):
+    """
+        Mês cheio: [{organization_id, company_id, legacy_id, price, amount, cost}, ...]
+    """
+    snapshot_month = get_closed_month(date_lt)
+    if snapshot_month is not None:
+        price_field = 'price'
+        queryset = get_snapshot_queryset(EquipmentSnapshot, snapshot_month, organization, company) \
+            .values('organization_id', 'company_id', 'contract__legacyID', price_field) \
+            .annotate(amount=Sum('amount')) \
+            .order_by()
+    else:
+        price_field = PRICE_VALUE
+        queryset = get_equipment_queryset(organization, company) \
+            .filter(Dateinstalled__lt=date_lt.replace(day=1)) \
+            .values('organization_id', 'company_id', 'contract__legacyID', price_field) \
+            .annotate(amount=Count('id')) \
+            .order_by()
+    return [{
+        'organization_id': row['organization_id'],
+        'company_id': row['company_id'],
+        'legacy_id': row['contract__legacyID'],
+        'price': row[price_field],
+        'amount': row['amount'],
+        'cost': row[price_field] * row['amount'],
+    } for row in queryset]
+
+
+def get_prorated_charges(date_gt, date_lt, organization=None, company=None):
+    """
+        Instalados no mês de date_lt (até date_lt), proporcionais aos dias instalados no período:
+        [{organization_id, company_id, legacy_id, price, amount, prop, cost}, ...]
+        prop é a quantidade equivalente de equipamentos (soma dos dias instalados / dias do período)
+    """
+    start, days = get_billing_period(date_gt, date_lt)
+    snapshot_month = get_closed_month(date_lt)
+    if snapshot_month is not None:
+        return get_snapshot_prorated_charges(snapshot_month, start, days, date_lt, organization, company)
+    # date - date no SQL; o +1 (o dia da instalação conta) é somado abaixo, por equipamento
+    installed = ExpressionWrapper(
+        Value(date_lt) - Greatest(F('Dateinstalled'), Value(start)), output_field=DurationField())
+    queryset = get_equipment_queryset(organization, company) \
+        .filter(Dateinstalled__gte=date_lt.replace(day=1), Dateinstalled__lte=date_lt) \
+        .values('organization_id', 'company_id', 'contract__legacyID', PRICE_VALUE) \
+        .annotate(amount=Count('id'), installed=Sum(installed)) \
+        .order_by()
+    charges = []
+    for row in queryset:
+        installed_days = (row['installed'] or timedelta()).days + row['amount']
+        prop = Decimal(installed_days) / Decimal(days)
+        charges.append({
+            'organization_id': row['organization_id'],
+            'company_id': row['company_id'],
+            'legacy_id': row['contract__legacyID'],
+            'price': row[PRICE_VALUE],
+            'amount': row['amount'],
+            'prop': prop,
+            'cost': prop * row[PRICE_VALUE],
+        })
+    return charges
+
+
+def get_snapshot_prorated_charges(snapshot_month, start, days, date_lt, organization=None, company=None):
+    """ Proporcional a partir das instalações por dia do mês fechado """
+    queryset = get_snapshot_queryset(EquipmentInstallDelta, snapshot_month, organization, company) \
+        .filter(day__lte=date_lt) \
+        .values('organization_id', 'company_id', 'contract__legacyID', 'price', 'day') \
+        .annotate(amount=Sum('amount')) \
+        .order_by()
+    grouped = {}
+    for row in queryset:
+        key = (row['organization_id'], row['company_id'], row['contract__legacyID'], row['price'])
+        amount, installed_days = grouped.get(key, (0, 0))
+        grouped[key] = (amount + row['amount'],
+                        installed_days + row['amount'] * ((date_lt - max(row['day'], start)).days + 1))
+    charges = []
+    for (organization_id, company_id, legacy_id, price), (amount, installed_days) in grouped.items():
+        prop = Decimal(installed_days) / Decimal(days)
+        charges.append({
+            'organization_id': organization_id,
+            'company_id': company_id,
+            'legacy_id': legacy_id,
+            'price': price,
+            'amount': amount,
+            'prop': prop,
+            'cost': prop * price,
+        })
+    return charges
+
+
+def group_charges(charges):
+    """
+        {(organization_id, company_id): [cobranças, ...]} para consulta por empresa
+    """
+    grouped = {}
+    for charge in charges:
+        grouped.setdefault((charge['organization_id'], charge['company_id']), []).append(charge)
+    return grouped
@@ -0,0 +1,62 @@
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Equipments', '0008_contractbasicservices_item_number'),
+        ('centers', '0002_initial'),
+        ('organizations', '0006_alter_organization_slug'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EquipmentSnapshotMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('month', models.DateField(unique=True, verbose_name='Mês')),
+                ('closed', models.BooleanField(default=False, verbose_name='Fechado')),
+            ],
+            options={
+                'verbose_name': 'Mês do Snapshot de Equipamentos',
+                'verbose_name_plural': 'Meses do Snapshot de Equipamentos',
+            },
+        ),
+        migrations.CreateModel(
+            name='EquipmentSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.IntegerField(verbose_name='Quantidade')),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='centers.company', verbose_name='Empresa')),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='Equipments.contractbasicservices', verbose_name='Contrato')),
+                ('equiptype', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='Equipments.typeofphone', verbose_name='Tipo do Equipamento')),
+                ('month', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='Equipments.equipmentsnapshotmonth', verbose_name='Mês')),
+                ('organization', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='organizations.organization', verbose_name='Organização')),
+            ],
+            options={
+                'verbose_name': 'Snapshot de Equipamentos',
+                'verbose_name_plural': 'Snapshots de Equipamentos',
+            },
+        ),
+        migrations.CreateModel(
+            name='EquipmentInstallDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Dia')),
+                ('amount', models.IntegerField(verbose_name='Quantidade')),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='centers.company', verbose_name='Empresa')),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='Equipments.contractbasicservices', verbose_name='Contrato')),
+                ('equiptype', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='Equipments.typeofphone', verbose_name='Tipo do Equipamento')),
+                ('month', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='Equipments.equipmentsnapshotmonth', verbose_name='Mês')),
+                ('organization', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='organizations.organization', verbose_name='Organização')),
+            ],
+            options={
+                'verbose_name': 'Instalações do Dia',
+                'verbose_name_plural': 'Instalações por Dia',
+            },
+        ),
+    ]
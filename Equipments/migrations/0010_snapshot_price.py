@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+from core.constants import ACTIVE_STATUS
+
+
+def fill_prices(apps, schema_editor):
+    """ Snapshots já gravados recebem o preço ativo atual do contrato """
+    ContractBasicServices = apps.get_model('Equipments', 'ContractBasicServices')
+    Price = apps.get_model('phonecalls', 'Price')
+    models_with_price = (apps.get_model('Equipments', 'EquipmentSnapshot'),
+                         apps.get_model('Equipments', 'EquipmentInstallDelta'))
+    for contract in ContractBasicServices.objects.filter(org_price_table__isnull=False):
+        price = Price.objects \
+            .filter(table_id=contract.org_price_table_id, status=ACTIVE_STATUS, basic_service=contract.legacyID) \
+            .order_by('pk') \
+            .values_list('value', flat=True) \
+            .first()
+        if price is not None:
+            for model in models_with_price:
+                model.objects.filter(contract=contract, price__isnull=True).update(price=price)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Equipments', '0009_equipment_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='equipmentinstalldelta',
+            name='price',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=20, null=True, verbose_name='Preço Unitário'),
+        ),
+        migrations.AddField(
+            model_name='equipmentsnapshot',
+            name='price',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=20, null=True, verbose_name='Preço Unitário'),
+        ),
+        migrations.RunPython(fill_prices, migrations.RunPython.noop),
+    ]
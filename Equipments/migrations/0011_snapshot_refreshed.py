@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Equipments', '0010_snapshot_price'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='equipmentsnapshotmonth',
+            name='refreshed',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Atualizado em'),
+        ),
+    ]
@@ -81,4 +81,76 @@ class Equipment(TimeStampedModel, ActivatorModel):
     center = models.ForeignKey(
         Center, verbose_name='Centro de Custo', on_delete=models.SET_NULL, blank=True, null=True)
     sector = models.ForeignKey(
-        Sector, verbose_name='Setor', on_delete=models.SET_NULL, blank=True, null=True)
\ No newline at end of file
+        Sector, verbose_name='Setor', on_delete=models.SET_NULL, blank=True, null=True)
+
+class EquipmentSnapshotMonth(TimeStampedModel):
+    """
+    Mês do snapshot de equipamentos
+    Meses fechados (closed) ficam congelados: os relatórios leem os snapshots
+    e o inventário de equipamentos não é mais consultado para eles
+    refreshed: início do último refresh (o próximo recalcula só o que foi salvo depois)
+    """
+    month = models.DateField(
+        verbose_name='Mês', unique=True)
+    closed = models.BooleanField(
+        verbose_name='Fechado', default=False)
+    refreshed = models.DateTimeField(
+        verbose_name='Atualizado em', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Mês do Snapshot de Equipamentos'
+        verbose_name_plural = 'Meses do Snapshot de Equipamentos'
+
+
+class EquipmentSnapshot(models.Model):
+    """
+    Equipamentos instalados antes do primeiro dia do mês
+    por organização, empresa, contrato e tipo de equipamento
+    price: valor unitário ativo do contrato no último refresh (congelado no fechamento)
+    """
+    month = models.ForeignKey(
+        EquipmentSnapshotMonth, verbose_name='Mês', on_delete=models.CASCADE)
+    organization = models.ForeignKey(
+        Organization, verbose_name='Organização', on_delete=models.SET_NULL, blank=True, null=True)
+    company = models.ForeignKey(
+        Company, verbose_name='Empresa', on_delete=models.CASCADE, blank=True, null=True)
+    contract = models.ForeignKey(
+        ContractBasicServices, verbose_name='Contrato', on_delete=models.CASCADE, null=True, blank=True)
+    equiptype = models.ForeignKey(
+        typeofphone, verbose_name='Tipo do Equipamento', on_delete=models.CASCADE, null=True, blank=True)
+    amount = models.IntegerField(
+        verbose_name='Quantidade')
+    price = models.DecimalField(
+        verbose_name='Preço Unitário', max_digits=20, decimal_places=4, null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Snapshot de Equipamentos'
+        verbose_name_plural = 'Snapshots de Equipamentos'
+
+
+class EquipmentInstallDelta(models.Model):
+    """
+    Equipamentos instalados no dia (dentro do mês do snapshot)
+    por organização, empresa, contrato e tipo de equipamento
+    price: valor unitário ativo do contrato no último refresh (congelado no fechamento)
+    """
+    month = models.ForeignKey(
+        EquipmentSnapshotMonth, verbose_name='Mês', on_delete=models.CASCADE)
+    day = models.DateField(
+        verbose_name='Dia')
+    organization = models.ForeignKey(
+        Organization, verbose_name='Organização', on_delete=models.SET_NULL, blank=True, null=True)
+    company = models.ForeignKey(
+        Company, verbose_name='Empresa', on_delete=models.CASCADE, blank=True, null=True)
+    contract = models.ForeignKey(
+        ContractBasicServices, verbose_name='Contrato', on_delete=models.CASCADE, null=True, blank=True)
+    equiptype = models.ForeignKey(
+        typeofphone, verbose_name='Tipo do Equipamento', on_delete=models.CASCADE, null=True, blank=True)
+    amount = models.IntegerField(
+        verbose_name='Quantidade')
+    price = models.DecimalField(
+        verbose_name='Preço Unitário', max_digits=20, decimal_places=4, null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Instalações do Dia'
+        verbose_name_plural = 'Instalações por Dia'
@@ -0,0 +1,189 @@
+"""
+    Snapshot mensal do inventário de equipamentos
+    Para cada mês: equipamentos instalados antes do primeiro dia (EquipmentSnapshot)
+    e instalações por dia dentro do mês (EquipmentInstallDelta), agrupados por
+    organização, empresa, contrato e tipo de equipamento, com o valor unitário do contrato
+    Meses abertos são atualizados (refresh_month, via cron): só os grupos com equipamento,
+    contrato ou preço salvo (modified) desde o último refresh são recalculados, e só as
+    linhas cuja quantidade ou preço mudou são gravadas. Exclusões e mudanças de grupo
+    deixam o total do snapshot acima da contagem do inventário; nesse caso o mês é
+    recalculado inteiro. O fechamento do mês (close_month) recalcula tudo e congela os
+    números e os preços, e a cobrança passa a ler só o snapshot
+    Alterações com queryset.update() precisam gravar modified para serem vistas
+"""
+
+# django
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models import Sum
+from django.utils import timezone
+
+# project
+from core.constants import ACTIVE_STATUS
+from core.partitions import add_months
+from core.partitions import month_start
+from phonecalls.models import Price
+
+# local
+from .models import ContractBasicServices
+from .models import Equipment
+from .models import EquipmentInstallDelta
+from .models import EquipmentSnapshot
+from .models import EquipmentSnapshotMonth
+
+SNAPSHOT_FIELDS = ('organization', 'company', 'contract', 'equiptype')
+# campos do Equipment -> campos das linhas do snapshot
+ROW_FIELDS = {'Dateinstalled': 'day'}
+
+
+def get_closed_month(day):
+    """ Mês fechado que contém `day`, ou None """
+    return EquipmentSnapshotMonth.objects.filter(month=month_start(day), closed=True).first()
+
+
+def get_contract_price():
+    """
+        Valor unitário do equipamento: preço ativo da tabela do contrato cujo serviço
+        básico é o ID legado do contrato (o mesmo filtro de Equipments.billing)
+    """
+    return Subquery(
+        Price.objects
+        .filter(table=OuterRef('contract__org_price_table'), status=ACTIVE_STATUS,
+                basic_service=OuterRef('contract__legacyID'))
+        .order_by('pk')
+        .values('value')[:1],
+        output_field=Price._meta.get_field('value'))
+
+
+def row_field(field):
+    return ROW_FIELDS.get(field, f'{field}_id')
+
+
+def get_rows(queryset, group_fields):
+    """ Quantidade e valor unitário por grupo, como linhas do snapshot """
+    rows = queryset \
+        .values(*group_fields) \
+        .annotate(amount=Count('id'), price=get_contract_price()) \
+        .order_by()
+    return [{'amount': row['amount'], 'price': row['price'],
+             **{row_field(field): row[field] for field in group_fields}} for row in rows]
+
+
+def get_changed_groups(queryset, group_fields, since):
+    """
+        Grupos (tuplas com os ids de group_fields) com equipamento salvo desde `since`
+        ou cujo contrato ou preço do contrato foi salvo desde `since`
+    """
+    contracts = ContractBasicServices.objects \
+        .filter(Q(modified__gte=since) | Q(org_price_table__price__modified__gte=since)) \
+        .values('pk')
+    return set(queryset
+               .filter(Q(modified__gte=since) | Q(contract__in=contracts))
+               .values_list(*group_fields)
+               .order_by()
+               .distinct())
+
+
+def get_groups_filter(groups, group_fields):
+    """ Q com os equipamentos dos grupos (ids None viram isnull) """
+    groups_filter = Q(pk__in=[])
+    for group in groups:
+        lookups = {}
+        for field, value in zip(group_fields, group):
+            if value is None:
+                lookups[f'{field}__isnull'] = True
+            else:
+                lookups[field] = value
+        groups_filter |= Q(**lookups)
+    return groups_filter
+
+
+def sync_rows(model, snapshot_month, rows, key_fields, keys=None):
+    """
+        Grava as linhas calculadas (dicts com key_fields, amount e price) no mês do snapshot:
+        cria as novas, atualiza só as que mudaram e apaga as que deixaram de existir
+        Com keys, só as linhas dessas chaves são comparadas (e apagadas)
+        Retorna o número de linhas gravadas ou apagadas
+    """
+    existing = {}
+    for obj in model.objects.filter(month=snapshot_month):
+        key = tuple(getattr(obj, field) for field in key_fields)
+        if keys is None or key in keys:
+            existing[key] = obj
+    created = []
+    updated = []
+    for row in rows:
+        obj = existing.pop(tuple(row[field] for field in key_fields), None)
+        if obj is None:
+            created.append(model(month=snapshot_month, **row))
+        elif obj.amount != row['amount'] or obj.price != row['price']:
+            obj.amount = row['amount']
+            obj.price = row['price']
+            updated.append(obj)
+    model.objects.bulk_create(created)
+    model.objects.bulk_update(updated, ['amount', 'price'])
+    model.objects.filter(pk__in=[obj.pk for obj in existing.values()]).delete()
+    return len(created) + len(updated) + len(existing)
+
+
+def sync_groups(model, snapshot_month, queryset, group_fields, since=None):
+    """
+        Atualiza as linhas do snapshot a partir dos equipamentos (queryset) agrupados por
+        group_fields; com since, só os grupos alterados desde então, a não ser que o total
+        do snapshot não bata com a contagem do inventário (exclusões, mudanças de grupo)
+    """
+    key_fields = tuple(row_field(field) for field in group_fields)
+    changed = 0
+    if since is not None:
+        groups = get_changed_groups(queryset, group_fields, since)
+        if groups:
+            rows = get_rows(queryset.filter(get_groups_filter(groups, group_fields)), group_fields)
+            changed = sync_rows(model, snapshot_month, rows, key_fields, keys=groups)
+        total = model.objects.filter(month=snapshot_month).aggregate(total=Sum('amount'))['total'] or 0
+        if total == queryset.count():
+            return changed
+    return changed + sync_rows(model, snapshot_month, get_rows(queryset, group_fields), key_fields)
+
+
+def refresh_month(month, full=False):
+    """
+        Atualiza o snapshot e as instalações por dia de um mês aberto a partir do inventário
+        (só os grupos alterados desde o último refresh são recalculados, e só as linhas que
+        mudaram são gravadas; full recalcula todos os grupos)
+        Retorna o mês e o número de linhas gravadas ou apagadas
+        Meses fechados não são alterados (ValueError)
+    """
+    month = month_start(month)
+    with transaction.atomic():
+        snapshot_month, _ = EquipmentSnapshotMonth.objects.select_for_update().get_or_create(month=month)
+        if snapshot_month.closed:
+            raise ValueError(f'{month:%m/%Y}: mês fechado')
+        # marcado antes das consultas: o que for salvo durante o refresh entra no próximo
+        started = timezone.now()
+        since = None if full else snapshot_month.refreshed
+
+        opening = Equipment.objects.filter(Dateinstalled__lt=month)
+        changed = sync_groups(EquipmentSnapshot, snapshot_month, opening, SNAPSHOT_FIELDS, since)
+
+        deltas = Equipment.objects.filter(Dateinstalled__gte=month, Dateinstalled__lt=add_months(month, 1))
+        changed += sync_groups(EquipmentInstallDelta, snapshot_month, deltas, ('Dateinstalled',) + SNAPSHOT_FIELDS, since)
+
+        snapshot_month.refreshed = started
+        snapshot_month.save()
+    return snapshot_month, changed
+
+
+def close_month(month):
+    """ Recalcula uma última vez (todos os grupos) e congela o mês (quantidades e preços) """
+    snapshot_month, _ = refresh_month(month, full=True)
+    snapshot_month.closed = True
+    snapshot_month.save(update_fields=['closed', 'modified'])
+    return snapshot_month
+
+
+def reopen_month(month):
+    """ Reabre um mês fechado (correções no inventário); o próximo refresh o recalcula inteiro """
+    return EquipmentSnapshotMonth.objects.filter(month=month_start(month)).update(closed=False, refreshed=None)
@@ -0,0 +1,113 @@
+# python
+from datetime import date
+from decimal import Decimal
+
+# django
+from django.db.models import Sum
+from django.test import TestCase
+
+# project
+from charges.constants import BASIC_SERVICE
+from core.synthetic import create_centers
+from core.synthetic import create_companies
+from core.synthetic import create_equipment
+from core.synthetic import create_extension_lines
+from core.synthetic import create_organizations
+from phonecalls.models import Price
+
+# local
+from .billing import get_full_month_charges
+from .models import Equipment
+from .models import EquipmentSnapshot
+from .snapshots import close_month
+from .snapshots import refresh_month
+
+
+class EquipmentSnapshotTestCase(TestCase):
+    """
+        refresh_month grava só as linhas que mudaram; o fechamento congela quantidades e preços
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization, = create_organizations(1, prefix='equipamentos')
+        cls.companies = create_companies(cls.organization, 2)
+        pricetable = cls.organization.settings.service_pricetable
+        cls.price = Price.objects.create(
+            table=pricetable, basic_service=BASIC_SERVICE, basic_service_amount=1, value=Decimal('10'))
+        cls.contracts = []
+        start = 31250000
+        for company in cls.companies:
+            lines = create_extension_lines(company, create_centers(company, 1, sectors=1), 5, start)
+            start += 5
+            equipment = create_equipment(company, lines)
+            contract = equipment[0].contract
+            contract.legacyID = BASIC_SERVICE
+            contract.org_price_table = pricetable
+            contract.save()
+            cls.contracts.append(contract)
+        cls.month = date.today().replace(day=1)
+
+    def get_rows(self):
+        return {row.company_id: row for row in EquipmentSnapshot.objects.all()}
+
+    def test_refresh_writes_only_changed_rows(self):
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 2)
+        rows = self.get_rows()
+        self.assertEqual(rows[self.companies[0].pk].amount, 5)
+        self.assertEqual(rows[self.companies[0].pk].price, Decimal('10'))
+
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 0)
+
+        Equipment.objects.filter(company=self.companies[0]).first().delete()
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 1)
+        refreshed = self.get_rows()
+        self.assertEqual(refreshed[self.companies[0].pk].amount, 4)
+        # as linhas são atualizadas no lugar, não recriadas
+        self.assertEqual({row.pk for row in refreshed.values()}, {row.pk for row in rows.values()})
+
+        Equipment.objects.filter(company=self.companies[1]).delete()
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 1)
+        self.assertEqual(list(self.get_rows()), [self.companies[0].pk])
+
+    def test_refresh_skips_unchanged_groups(self):
+        refresh_month(self.month)
+        # preço alterado direto no snapshot da segunda empresa: só um recálculo do grupo o desfaria
+        EquipmentSnapshot.objects.filter(company=self.companies[1]).update(price=Decimal('11'))
+        Equipment.objects.filter(company=self.companies[0]).first().save()
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 0)
+        self.assertEqual(self.get_rows()[self.companies[1].pk].price, Decimal('11'))
+
+        # preço salvo: os grupos dos contratos da tabela são recalculados
+        self.price.value = Decimal('12')
+        self.price.save()
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 2)
+        self.assertEqual({row.price for row in self.get_rows().values()}, {Decimal('12')})
+
+        # mudança de grupo: o grupo de origem não é visto, o total não bate e o mês é recalculado
+        equipment = Equipment.objects.filter(company=self.companies[0]).first()
+        equipment.company = self.companies[1]
+        equipment.save()
+        _, changed = refresh_month(self.month)
+        self.assertEqual(changed, 2)
+        amounts = EquipmentSnapshot.objects.values('company').annotate(amount=Sum('amount'))
+        self.assertEqual({row['company']: row['amount'] for row in amounts},
+                         {self.companies[0].pk: 4, self.companies[1].pk: 6})
+
+    def test_closed_month_keeps_price(self):
+        date_lt = date.today()
+        close_month(self.month)
+        self.price.value = Decimal('12')
+        self.price.save()
+
+        charges = get_full_month_charges(self.month, date_lt, self.organization)
+        self.assertEqual({charge['price'] for charge in charges}, {Decimal('10')})
+        self.assertEqual(sum(charge['cost'] for charge in charges), Decimal('100'))
+        with self.assertRaises(ValueError):
+            refresh_month(self.month)
@@ -1,142 +1,552 @@
 #!/usr/bin/env python3
 """
 send_syslog.py
-Replay de um arquivo de syslog: envia cada linha para um host:port via UDP ou TCP.
+Replay de um arquivo de syslog e gerador de carga para o syslog_ingestor (UDP ou TCP).
 
-Exemplos (no macOS):
+Modos:
+- replay (padrão): envia cada linha do arquivo, como sempre.
+- --template: gera linhas CALL_END a partir da primeira CALL_END do arquivo (mesmo layout
+  e larguras de coluna), com call id único LG<execução>-<remetente>-<seq>-<envio em µs>@loadgen,
+  números aleatórios (DDD --ddd, ramais --extensions) e horários do momento do envio.
+
+Carga:
+- --senders N: N remetentes concorrentes (asyncio), cada um com seu socket; a taxa total
+  (--rate ou --profile) é dividida entre eles. --delay é o intervalo de cada remetente.
+- --profile "100:30,100-2000:120,2000:60": segmentos TAXA:SEGUNDOS (linhas/s no total);
+  INICIO-FIM:SEGUNDOS é uma rampa linear. Termina no fim do último segmento.
+- --count N / --duration S: limites de linhas e de tempo.
+
+Verificação (--verify, só com --template; precisa de psycopg2 e --dsn):
+  syslog_events é consultada durante o envio (a cada --verify-interval) e depois dele, até
+  todas as linhas chegarem ou --verify-timeout segundos sem novidades. Relata perda,
+  duplicadas e percentis de latência:
+    envio -> recebimento: received_at menos o horário de envio do call id (relógios do
+      gerador e do ingestor);
+    recebimento -> commit: quando a linha ficou visível no banco (clock_timestamp) menos
+      received_at; resolução de --verify-interval.
+  Com --sbc-timeout S, espera até S segundos o ETL gravar as CALL_END em sbc_phonecall.
+
+Exemplos:
   python3 send_syslog.py syslog.txt --transport udp --host 203.0.113.42 --port 5514 --rate 200 --tty
   python3 send_syslog.py syslog.txt --transport tcp --host 203.0.113.42 --port 5514 --delay 0.01 --tty
   python3 send_syslog.py syslog.txt --loop --rate 100
+  python3 send_syslog.py syslog.txt --template --senders 20 --profile "200-5000:120,5000:300" --tty \\
+      --verify --dsn "host=localhost dbname=syslogdb user=sysloguser" --json carga.json
 
 Observações:
 - UDP: envia cada linha como um datagrama separado.
-- TCP: abre conexão, envia linha + \n, mantém ou reabre em caso de erro.
-- Use --rate ou --delay para controlar a velocidade de envio (não use ambos).
+- TCP: uma conexão por remetente, linha + \\n; reconecta em caso de erro (a linha é contada como erro).
+- Use --rate ou --delay para controlar a velocidade de envio (não use ambos); sem eles, o
+  mais rápido possível.
 """
 from __future__ import annotations
 import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import signal
 import socket
-import time
 import sys
-import os
-from typing import Optional
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
 
-def send_udp_line(sock: socket.socket, addr, line: bytes) -> None:
-    sock.sendto(line, addr)
+# core/callend (sem dependência do Django): colunas da linha CALL_END
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.callend import fields  # noqa: E402
 
-def send_tcp_line(sock: socket.socket, addr, line: bytes, reconnect: bool = True) -> socket.socket:
-    try:
-        sock.sendall(line + b"\n")
-        return sock
-    except (BrokenPipeError, ConnectionResetError, OSError):
-        if not reconnect:
-            raise
-        # reconectar
+MARKER_HOST = "loadgen"
+TCP_HIGH_WATER = 256 * 1024
+PREFIX_RE = re.compile(r"^(\d{2}:\d{2}:\d{2}\.\d{3})(.*\[S=)\d+(\].*)$", re.S)
+MARKER_RE = re.compile(r"\|LG([0-9a-f]+)-(\d+)-(\d+)-(\d+)@")
+PERCENTILES = (50, 90, 95, 99)
+
+# ------------------------ Perfil de carga ------------------------
+
+@dataclass
+class Segment:
+    start: float      # linhas/s no início do segmento (0 = sem limite)
+    end: float        # linhas/s no fim (rampa linear)
+    seconds: float
+
+
+class Profile:
+    """Taxa total (linhas/s) em função do tempo; None depois do último segmento."""
+
+    def __init__(self, segments: List[Segment]):
+        self.segments = segments
+        self.duration = sum(segment.seconds for segment in segments)
+
+    @classmethod
+    def parse(cls, text: str) -> "Profile":
+        segments = []
+        for part in text.split(","):
+            try:
+                rates, seconds = part.strip().split(":")
+                start, _, end = rates.partition("-")
+                segments.append(Segment(float(start), float(end or start), float(seconds)))
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"segmento inválido: {part!r} (use TAXA:SEGUNDOS ou INICIO-FIM:SEGUNDOS)")
+        return cls(segments)
+
+    @classmethod
+    def constant(cls, rate: float, seconds: float = math.inf) -> "Profile":
+        return cls([Segment(rate, rate, seconds)])
+
+    def rate_at(self, elapsed: float) -> Optional[float]:
+        for segment in self.segments:
+            if elapsed < segment.seconds:
+                return segment.start + (segment.end - segment.start) * elapsed / segment.seconds \
+                    if math.isfinite(segment.seconds) else segment.start
+            elapsed -= segment.seconds
+        return None
+
+# ------------------------ Linhas ------------------------
+
+def format_sbc_time(value: datetime) -> str:
+    return f"{value:%H:%M:%S}.{value.microsecond // 1000:03d}  UTC {value:%a %b %d %Y}"
+
+
+def first_call_end(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            parts = line.split("|", 2)
+            if len(parts) == 3 and parts[1].strip() == fields.CALL_END:
+                return line.rstrip("\r\n")
+    raise SystemExit(f"Nenhuma linha CALL_END em {path} para usar como modelo")
+
+
+class Template:
+    """CALL_END do arquivo com call id, números e horários trocados (mantém as larguras)."""
+
+    def __init__(self, line: str, run_id: str, ddd: str, extensions: Tuple[int, int], seed: int):
+        self.columns = line.split("|")
+        match = PREFIX_RE.match(self.columns[fields.PREFIX])
+        if match is None or len(self.columns) <= fields.RELEASE_TIME:
+            raise SystemExit("Linha CALL_END modelo fora do layout esperado")
+        self.prefix = match.group(2), match.group(3)
+        self.remote_host = self.columns[fields.SRC_URI].strip().partition("@")[2] or "179.131.10.48"
+        self.local_host = self.columns[fields.DST_URI].strip().partition("@")[2] or "trunk1.seatic.com.br"
+        self.run_id = run_id
+        self.ddd = ddd
+        self.extensions = extensions
+        self.rnd = random.Random(seed)
+
+    def put(self, columns: List[str], index: int, value: str) -> None:
+        columns[index] = value.ljust(len(self.columns[index]))
+
+    def render(self, sender: int, seq: int) -> bytes:
+        rnd = self.rnd
+        now = time.time()
+        end = datetime.fromtimestamp(now, timezone.utc)
+        connect = end - timedelta(seconds=rnd.randint(0, 900), milliseconds=rnd.randint(0, 999))
+        setup = connect - timedelta(seconds=rnd.randint(1, 20), milliseconds=rnd.randint(0, 999))
+        remote = f"+55{self.ddd}9{rnd.randint(80000000, 99999999)}@{self.remote_host}"
+        local = f"{self.ddd}{rnd.randint(*self.extensions)}@{self.local_host}"
+        source, destination = (remote, local) if rnd.random() < 0.5 else (local, remote)
+
+        columns = list(self.columns)
+        columns[fields.PREFIX] = f"{end:%H:%M:%S}.{end.microsecond // 1000:03d}{self.prefix[0]}{seq}{self.prefix[1]}"
+        self.put(columns, fields.CALL_ID, f"LG{self.run_id}-{sender}-{seq}-{int(now * 1_000_000)}@{MARKER_HOST}")
+        self.put(columns, fields.SESSION_ID, f"lg{self.run_id}:{sender}:{seq}")
+        for index in (fields.SRC_URI, fields.SRC_URI_BM):
+            self.put(columns, index, source)
+        for index in (fields.DST_URI, fields.DST_URI_BM):
+            self.put(columns, index, destination)
+        self.put(columns, fields.SETUP_TIME, format_sbc_time(setup))
+        self.put(columns, fields.CONNECT_TIME, format_sbc_time(connect))
+        self.put(columns, fields.RELEASE_TIME, format_sbc_time(end))
+        return "|".join(columns).encode("utf-8")
+
+
+def iter_file_lines(path: str, loop: bool) -> Iterator[bytes]:
+    while True:
+        with open(path, "rb") as fh:
+            for raw in fh:
+                line = raw.rstrip(b"\r\n")
+                if line:
+                    yield line
+        if not loop:
+            return
+
+# ------------------------ Envio ------------------------
+
+@dataclass
+class Stats:
+    sent: int = 0
+    errors: int = 0
+    reconnects: int = 0
+    per_sender: Dict[int, int] = field(default_factory=dict)
+
+
+class UdpSender:
+    def __init__(self, addr):
+        self.addr = addr
+        self.transport = None
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=self.addr)
         try:
-            sock.close()
+            self.transport.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 2**20)
         except Exception:
             pass
-        new = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        new.settimeout(5)
-        new.connect(addr)
-        new.sendall(line + b"\n")
-        return new
-
-def open_tcp(addr, timeout=5) -> socket.socket:
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(timeout)
-    s.connect(addr)
-    return s
 
-def main():
-    p = argparse.ArgumentParser(description="Replay syslog file to UDP/TCP host:port")
-    p.add_argument("file", nargs="?", default="syslog.txt", help="Arquivo de syslog a ser enviado")
+    async def send(self, line: bytes) -> None:
+        self.transport.sendto(line)
+        # o asyncio guarda o que o kernel não aceitou; espera esvaziar
+        while self.transport.get_write_buffer_size() > TCP_HIGH_WATER:
+            await asyncio.sleep(0.001)
+
+    async def close(self):
+        if self.transport:
+            self.transport.close()
+
+
+class TcpSender:
+    def __init__(self, addr):
+        self.addr = addr
+        self.writer = None
+
+    async def open(self):
+        _, self.writer = await asyncio.wait_for(asyncio.open_connection(*self.addr), timeout=5)
+
+    async def send(self, line: bytes) -> None:
+        self.writer.write(line + b"\n")
+        if self.writer.transport.get_write_buffer_size() > TCP_HIGH_WATER:
+            await self.writer.drain()
+
+    async def close(self):
+        if self.writer:
+            try:
+                self.writer.close()
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+            self.writer = None
+
+
+async def run_sender(index: int, args, lines, template: Optional[Template], profile: Profile,
+                     stats: Stats, started: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    addr = (args.host, args.port)
+    sender = (UdpSender if args.transport == "udp" else TcpSender)(addr)
+    connected = False
+    seq = 0
+    next_at = 0.0
+    try:
+        while not stop.is_set():
+            elapsed = loop.time() - started
+            rate = profile.rate_at(elapsed)
+            if rate is None or (args.count and stats.sent + stats.errors >= args.count):
+                break
+            if not connected:
+                try:
+                    await sender.open()
+                    connected = True
+                except Exception as e:
+                    print(f"[{args.transport.upper()}] remetente {index}: falha ao conectar {addr}: {e}", file=sys.stderr)
+                    await asyncio.sleep(1.0)
+                    continue
+            if template is not None:
+                line = template.render(index, seq)
+            else:
+                line = next(lines, None)
+                if line is None:
+                    break
+            seq += 1
+            try:
+                await sender.send(line)
+                stats.sent += 1
+                stats.per_sender[index] = stats.per_sender.get(index, 0) + 1
+            except Exception as e:
+                stats.errors += 1
+                stats.reconnects += 1
+                print(f"[{args.transport.upper()}] remetente {index}: erro ao enviar: {e}", file=sys.stderr)
+                await sender.close()
+                connected = False
+                await asyncio.sleep(0.5)
+                continue
+
+            if rate > 0:
+                # atrasos de mais de 1 s não são recuperados em rajada
+                next_at = max(next_at, elapsed - 1.0) + args.senders / rate
+                delay = next_at - (loop.time() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif seq % 256 == 0:
+                await asyncio.sleep(0)
+    finally:
+        await sender.close()
+
+
+async def report_progress(stats: Stats, profile: Profile, started: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    last_sent, last_time = 0, started
+    while not stop.is_set():
+        await asyncio.sleep(1.0)
+        now = loop.time()
+        rate = (stats.sent - last_sent) / (now - last_time)
+        target = profile.rate_at(now - started)
+        target = f"{target:.0f}/s" if target else "livre"
+        print(f"\r-> enviadas {stats.sent} ({rate:.0f}/s, alvo {target}), erros {stats.errors}   ", end="", flush=True)
+        last_sent, last_time = stats.sent, now
+    print("", flush=True)
+
+# ------------------------ Verificação ------------------------
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    values = sorted(values)
+    result = {f"p{p}": round(values[min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1)], 2)
+              for p in PERCENTILES}
+    result["max"] = round(values[-1], 2)
+    return result
+
+
+class Verifier:
+    """Lê do banco as linhas desta execução (call id LG<execução>-...)."""
+
+    def __init__(self, dsn: str, table: str, run_id: str):
+        import psycopg2  # requirements-ingestor.txt
+        self.conn = psycopg2.connect(dsn)
+        self.conn.autocommit = True
+        self.table = table
+        self.run_id = run_id
+        self.last_id = 0
+        self.seen = set()
+        self.duplicates = 0
+        self.send_to_receive: List[float] = []
+        self.receive_to_commit: List[float] = []
+
+    def start(self) -> None:
+        with self.conn.cursor() as cur:
+            cur.execute(f"SELECT coalesce(max(id), 0) FROM {self.table}")
+            self.last_id = cur.fetchone()[0]
+
+    def poll(self) -> int:
+        """Linhas novas desde a última consulta."""
+        with self.conn.cursor() as cur:
+            cur.execute(f"SELECT id, received_at, raw, clock_timestamp() FROM {self.table} "
+                        f"WHERE id > %s AND raw LIKE %s ORDER BY id",
+                        (self.last_id, f"%|LG{self.run_id}-%"))
+            rows = cur.fetchall()
+        for row_id, received_at, raw, seen_at in rows:
+            self.last_id = max(self.last_id, row_id)
+            match = MARKER_RE.search(raw)
+            if match is None or match.group(1) != self.run_id:
+                continue
+            key = (int(match.group(2)), int(match.group(3)))
+            if key in self.seen:
+                self.duplicates += 1
+                continue
+            self.seen.add(key)
+            self.send_to_receive.append((received_at.timestamp() - int(match.group(4)) / 1_000_000) * 1000)
+            self.receive_to_commit.append((seen_at - received_at).total_seconds() * 1000)
+        return len(rows)
+
+    def sbc_count(self) -> Optional[int]:
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("SELECT count(*) FROM sbc_phonecall WHERE callid LIKE %s", (f"LG{self.run_id}-%",))
+                return cur.fetchone()[0]
+        except Exception as e:
+            print(f"[VERIFY] sbc_phonecall: {e}", file=sys.stderr)
+            return None
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+async def run_verifier(verifier: Verifier, args, stats: Stats, sending_done: asyncio.Event) -> None:
+    idle_since = None
+    while True:
+        await asyncio.sleep(args.verify_interval)
+        new = await asyncio.to_thread(verifier.poll)
+        if not sending_done.is_set():
+            continue
+        if len(verifier.seen) >= stats.sent:
+            return
+        if new:
+            idle_since = None
+        elif idle_since is None:
+            idle_since = time.monotonic()
+        elif time.monotonic() - idle_since >= args.verify_timeout:
+            return
+
+
+async def wait_sbc(verifier: Verifier, expected: int, timeout: float) -> Optional[int]:
+    deadline = time.monotonic() + timeout
+    while True:
+        count = await asyncio.to_thread(verifier.sbc_count)
+        if count is None or count >= expected or time.monotonic() >= deadline:
+            return count
+        await asyncio.sleep(1.0)
+
+# ------------------------ Main ------------------------
+
+def parse_extensions(text: str) -> Tuple[int, int]:
+    first, _, last = text.partition("-")
+    try:
+        return int(first), int(last or first)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"faixa de ramais inválida: {text!r} (ex.: 31250000-31250999)")
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Replay syslog file / load generator to UDP/TCP host:port")
+    p.add_argument("file", nargs="?", default="syslog.txt", help="Arquivo de syslog a ser enviado (ou modelo do --template)")
     p.add_argument("--host", default="127.0.0.1", help="Host destino (IP público da EC2, por ex.)")
     p.add_argument("--port", type=int, default=5514, help="Porta destino (padrão 5514)")
     p.add_argument("--transport", choices=("udp","tcp"), default="udp", help="Protocolo (udp/tcp)")
-    p.add_argument("--rate", type=float, default=0.0, help="Linhas por segundo (0 = desativado)")
-    p.add_argument("--delay", type=float, default=0.0, help="Delay fixo entre linhas em segundos (0 = desativado)")
+    p.add_argument("--rate", type=float, default=0.0, help="Linhas por segundo, no total (0 = desativado)")
+    p.add_argument("--delay", type=float, default=0.0, help="Delay fixo entre linhas de cada remetente em segundos (0 = desativado)")
     p.add_argument("--loop", action="store_true", help="Repetir o envio indefinidamente")
     p.add_argument("--once", dest="once", action="store_true", help="Enviar o arquivo apenas uma vez (default)")
     p.add_argument("--tty", action="store_true", help="Mostrar progresso no terminal")
+    # gerador de carga
+    p.add_argument("--senders", type=int, default=1, help="Remetentes concorrentes (padrão 1)")
+    p.add_argument("--profile", type=Profile.parse, help='Perfil de taxa, ex.: "100:30,100-2000:120,2000:60"')
+    p.add_argument("--count", type=int, default=0, help="Total de linhas (0 = sem limite)")
+    p.add_argument("--duration", type=float, default=0.0, help="Segundos de envio (0 = sem limite)")
+    p.add_argument("--template", action="store_true", help="Gera CALL_END a partir da primeira CALL_END do arquivo")
+    p.add_argument("--ddd", default="85", help="DDD dos números gerados (padrão 85)")
+    p.add_argument("--extensions", type=parse_extensions, default=(31250000, 31259999),
+                   help="Faixa de ramais dos números gerados (padrão 31250000-31259999)")
+    p.add_argument("--seed", type=int, default=None, help="Semente dos números aleatórios")
+    p.add_argument("--run-id", default=None, help="Identificador da execução nos call ids (hex; padrão aleatório)")
+    # verificação
+    p.add_argument("--verify", action="store_true", help="Confere no banco perda e latências (só com --template)")
+    p.add_argument("--dsn", default=os.getenv("INGEST_DSN", ""), help="DSN do PostgreSQL (libpq; env INGEST_DSN)")
+    p.add_argument("--table", default="syslog_events", help="Tabela do ingestor (padrão syslog_events)")
+    p.add_argument("--verify-interval", type=float, default=0.2, help="Intervalo entre consultas (s)")
+    p.add_argument("--verify-timeout", type=float, default=10.0, help="Segundos sem linhas novas para encerrar")
+    p.add_argument("--sbc-timeout", type=float, default=0.0, help="Espera o ETL gravar em sbc_phonecall (s)")
+    p.add_argument("--json", help="Grava o resumo em JSON neste arquivo")
     args = p.parse_args()
+    if args.rate and args.delay:
+        p.error("use --rate ou --delay, não ambos")
+    if args.profile and (args.rate or args.delay):
+        p.error("--profile substitui --rate/--delay")
+    if args.senders < 1:
+        p.error("--senders precisa ser pelo menos 1")
+    if args.verify and not args.template:
+        p.error("--verify só funciona com --template (as linhas precisam do call id da execução)")
+    if args.verify and not args.dsn:
+        p.error("--verify precisa de --dsn (ou INGEST_DSN)")
+    if args.run_id and not re.fullmatch(r"[0-9a-f]+", args.run_id):
+        p.error("--run-id precisa ser hexadecimal")
+    return args
 
-    path = args.file
-    if not os.path.isfile(path):
-        print(f"Arquivo não encontrado: {path}", file=sys.stderr)
-        sys.exit(2)
 
-    addr = (args.host, args.port)
-    delay = args.delay
-    if args.rate > 0:
-        delay = 1.0 / args.rate
+def make_profile(args) -> Profile:
+    if args.profile:
+        return args.profile
+    rate = args.rate
+    if args.delay > 0:
+        rate = args.senders / args.delay
+    return Profile.constant(rate, args.duration or math.inf)
 
-    if args.transport == "udp":
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        try:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 2**20)
-        except Exception:
-            pass
+
+async def run(args) -> dict:
+    run_id = args.run_id or uuid.uuid4().hex[:8]
+    profile = make_profile(args)
+    template = None
+    lines = None
+    if args.template:
+        template = Template(first_call_end(args.file), run_id, args.ddd, args.extensions,
+                            args.seed if args.seed is not None else random.randrange(2**32))
     else:
-        sock = None
+        lines = iter_file_lines(args.file, args.loop)
+
+    verifier = None
+    if args.verify:
+        verifier = Verifier(args.dsn, args.table, run_id)
+        await asyncio.to_thread(verifier.start)
 
+    loop = asyncio.get_running_loop()
+    stats = Stats()
+    stop = asyncio.Event()
+    sending_done = asyncio.Event()
+    started = loop.time()
     try:
-        while True:
-            with open(path, "rb") as fh:
-                line_num = 0
-                for raw in fh:
-                    line_num += 1
-                    line = raw.rstrip(b"\r\n")
-                    if not line:
-                        continue
-
-                    try:
-                        if args.transport == "udp":
-                            send_udp_line(sock, addr, line)
-                        else:
-                            if sock is None:
-                                try:
-                                    sock = open_tcp(addr)
-                                except Exception as e:
-                                    print(f"[TCP] falha ao conectar {addr}: {e}", file=sys.stderr)
-                                    time.sleep(1.0)
-                                    continue
-                            try:
-                                sock = send_tcp_line(sock, addr, line, reconnect=True)
-                            except Exception as e:
-                                print(f"[TCP] erro ao enviar: {e}", file=sys.stderr)
-                                try:
-                                    sock.close()
-                                except Exception:
-                                    pass
-                                sock = None
-                                time.sleep(0.5)
-                                continue
-
-                    except Exception as ex:
-                        print(f"[ERRO] linha {line_num}: {ex}", file=sys.stderr)
-
-                    if args.tty:
-                        print(f"\r-> enviado linha {line_num}", end="", flush=True)
-
-                    if delay > 0:
-                        time.sleep(delay)
-
-                if args.tty:
-                    print("", flush=True)
-
-            if args.loop:
-                time.sleep(0.5)
-                continue
-            else:
-                break
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+    except (NotImplementedError, RuntimeError):
+        pass
+    if args.duration:
+        loop.call_later(args.duration, stop.set)
+    progress = asyncio.create_task(report_progress(stats, profile, started, sending_done)) if args.tty else None
+    checking = asyncio.create_task(run_verifier(verifier, args, stats, sending_done)) if verifier else None
 
+    print(f"[LOAD] execução {run_id}: {args.senders} remetente(s) {args.transport.upper()} -> {args.host}:{args.port}",
+          file=sys.stderr)
+    try:
+        await asyncio.gather(*(run_sender(i, args, lines, template, profile, stats, started, stop)
+                               for i in range(args.senders)))
     finally:
-        if sock:
-            try:
-                sock.close()
-            except Exception:
-                pass
+        elapsed = loop.time() - started
+        sending_done.set()
+        if progress:
+            await progress
+
+    summary = {
+        "run_id": run_id, "transport": args.transport, "senders": args.senders,
+        "sent": stats.sent, "errors": stats.errors, "reconnects": stats.reconnects,
+        "elapsed_s": round(elapsed, 3), "lines_per_s": round(stats.sent / elapsed, 1) if elapsed else 0,
+    }
+    if verifier:
+        try:
+            await checking
+            received = len(verifier.seen)
+            summary["syslog_events"] = {
+                "received": received, "duplicates": verifier.duplicates,
+                "drop_rate": round(1 - received / stats.sent, 6) if stats.sent else 0.0,
+                "send_to_receive_ms": percentiles(verifier.send_to_receive),
+                "receive_to_commit_ms": percentiles(verifier.receive_to_commit),
+            }
+            sbc = await wait_sbc(verifier, stats.sent, args.sbc_timeout)
+            if sbc is not None:
+                summary["sbc_phonecall"] = {
+                    "stored": sbc, "drop_rate": round(1 - sbc / stats.sent, 6) if stats.sent else 0.0}
+        finally:
+            verifier.close()
+    return summary
+
+
+def print_summary(summary: dict) -> None:
+    print(f"enviadas: {summary['sent']} em {summary['elapsed_s']:.1f} s ({summary['lines_per_s']:.0f} linhas/s), "
+          f"erros {summary['errors']}, reconexões {summary['reconnects']}")
+    events = summary.get("syslog_events")
+    if events:
+        print(f"syslog_events: {events['received']} recebidas (perda {events['drop_rate']:.4%}), "
+              f"{events['duplicates']} duplicadas")
+        for name, label in (("send_to_receive_ms", "envio -> recebimento"),
+                            ("receive_to_commit_ms", "recebimento -> commit")):
+            values = events[name]
+            if values:
+                print(f"  {label} (ms): " + "  ".join(f"{key} {value:.1f}" for key, value in values.items()))
+    sbc = summary.get("sbc_phonecall")
+    if sbc:
+        print(f"sbc_phonecall: {sbc['stored']} gravadas (perda {sbc['drop_rate']:.4%})")
+
+
+def main():
+    args = parse_args()
+    if not os.path.isfile(args.file):
+        print(f"Arquivo não encontrado: {args.file}", file=sys.stderr)
+        sys.exit(2)
+    summary = asyncio.run(run(args))
+    print_summary(summary)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+syslog_framing.py
+-----------------
+Caminho de recepção do syslog_ingestor em lote, sem dependências além de core/callend
+(importável pelos benchmarks sem psycopg2 nem banco).
+
+- LineFramer: recv_into em um buffer pré-alocado e recorte das linhas de um stream TCP;
+  um recv vira uma lista de payloads em bytes.
+- recv_datagrams: um recvfrom_into bloqueante seguido de leituras com MSG_DONTWAIT até
+  esvaziar o socket ou completar o lote (o "recvmmsg" possível em Python puro).
+- encode_copy / decode_rows: o worker converte os lotes no formato texto do COPY (bytes,
+  sem decodificar as linhas ASCII) ou nas tuplas do INSERT.
+
+Um lote na fila é (ts, transport, [(src_addr, payload), ...]): um timestamp por recv e os
+payloads em bytes até a gravação.
+"""
+from __future__ import annotations
+import os
+import socket
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.callend.parser import extract_event_type  # noqa: E402
+
+Item = Tuple[str, bytes]                 # (src_addr, payload)
+Batch = Tuple[datetime, str, List[Item]]  # (ts, transport, itens)
+
+MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+SRC_CACHE_SIZE = 4096
+COPY_NULL = b"\\N"
+REPLACEMENT = "�".encode("utf-8")
+
+
+class LineFramer:
+    """
+    Linhas de um stream TCP com um único buffer: recv_into escreve depois do resto da
+    leitura anterior, as linhas completas saem como bytes e o resto volta para o início.
+    Uma linha maior que o buffer é descartada (conta em `discarded`).
+    """
+
+    def __init__(self, size: int):
+        self.buf = bytearray(size)
+        self.view = memoryview(self.buf)
+        self.filled = 0
+        self.skipping = False
+        self.discarded = 0
+
+    def recv_into(self, conn: socket.socket) -> int:
+        return conn.recv_into(self.view[self.filled:])
+
+    def feed(self, count: int) -> List[bytes]:
+        """Linhas completas depois de `count` bytes novos (sem \\n nem \\r final)."""
+        buf, view = self.buf, self.view
+        end_of_data = self.filled + count
+        lines = []
+        start = 0
+        while True:
+            end = buf.find(b"\n", start, end_of_data)
+            if end < 0:
+                break
+            if self.skipping:
+                self.skipping = False
+            else:
+                stop = end - 1 if end > start and buf[end - 1] == 13 else end   # \r\n
+                if stop > start:
+                    lines.append(bytes(view[start:stop]))
+            start = end + 1
+        rest = end_of_data - start
+        if rest == len(buf):
+            # linha sem \n do tamanho do buffer: descarta até o próximo \n
+            if not self.skipping:
+                self.discarded += 1
+            self.skipping = True
+            rest = 0
+        elif start and rest:
+            buf[:rest] = buf[start:end_of_data]
+        self.filled = rest
+        return lines
+
+    def tail(self) -> Optional[bytes]:
+        """Resto sem \\n no fim da conexão."""
+        if self.skipping or not self.filled:
+            return None
+        line = bytes(self.view[:self.filled]).rstrip(b"\r")
+        self.filled = 0
+        return line or None
+
+
+def src_addr(cache: Dict[Tuple, str], addr: Tuple) -> str:
+    """"ip:porta" de origem, formatado uma vez por remetente."""
+    src = cache.get(addr)
+    if src is None:
+        if len(cache) >= SRC_CACHE_SIZE:
+            cache.clear()
+        src = cache[addr] = f"{addr[0]}:{addr[1]}"
+    return src
+
+
+def recv_datagrams(sock: socket.socket, view: memoryview, max_batch: int,
+                   cache: Dict[Tuple, str]) -> List[Item]:
+    """
+    Até max_batch datagramas: o primeiro respeita o timeout do socket, os demais só se
+    já estiverem na fila do kernel (sem MSG_DONTWAIT na plataforma, lotes de 1).
+    """
+    count, addr = sock.recvfrom_into(view)
+    items = [(src_addr(cache, addr), bytes(view[:count]))]
+    if not MSG_DONTWAIT:
+        return items
+    while len(items) < max_batch:
+        try:
+            count, addr = sock.recvfrom_into(view, 0, MSG_DONTWAIT)
+        except (BlockingIOError, InterruptedError):
+            break
+        items.append((src_addr(cache, addr), bytes(view[:count])))
+    return items
+
+
+def copy_escape(value: bytes) -> bytes:
+    """Formato texto do COPY (UTF-8 válido, sem NUL, com \\, TAB e CR escapados), sem tratar \\n."""
+    if not value.isascii():
+        value = value.decode("utf-8", errors="replace").encode("utf-8")
+    if b"\x00" in value:
+        value = value.replace(b"\x00", REPLACEMENT)
+    if b"\\" in value:
+        value = value.replace(b"\\", b"\\\\")
+    if b"\t" in value:
+        value = value.replace(b"\t", b"\\t")
+    if b"\r" in value:
+        value = value.replace(b"\r", b"\\r")
+    return value
+
+
+def copy_field(value: bytes) -> bytes:
+    """Um campo no formato texto do COPY."""
+    value = copy_escape(value)
+    if b"\n" in value:
+        value = value.replace(b"\n", b"\\n")
+    return value
+
+
+def copy_payloads(payloads: List[bytes]) -> List[bytes]:
+    """
+    copy_field de cada payload, escapando o lote de uma vez: os payloads unidos por \\n
+    passam uma vez por copy_escape e, se algo mudou, são separados de novo (se algum
+    tiver \\n, um a um).
+    """
+    blob = b"\n".join(payloads)
+    if blob.count(b"\n") != len(payloads) - 1:
+        return [copy_field(payload) for payload in payloads]
+    escaped = copy_escape(blob)
+    # o caso comum (ASCII sem caracteres especiais) devolve os próprios payloads
+    return payloads if escaped is blob else escaped.split(b"\n")
+
+
+def encode_copy(batches: List[Batch]) -> Tuple[bytes, int, Dict[str, int]]:
+    """
+    Dados do COPY ... FROM STDIN (received_at, transport, src_addr, event_type, raw), a
+    quantidade de linhas e as mensagens sem tipo de evento por transporte.
+    """
+    out = []
+    rows = 0
+    failures: Dict[str, int] = {}
+    for ts, transport, items in batches:
+        prefix = f"{ts.isoformat()}\t{transport}\t".encode("ascii")
+        missing = 0
+        src = head = None
+        payloads = [payload for _, payload in items]
+        for (item_src, payload), escaped in zip(items, copy_payloads(payloads)):
+            if item_src is not src:
+                src = item_src
+                head = prefix + copy_field(src.encode("utf-8")) + b"\t"
+            etype = extract_event_type(payload, decode=False)
+            if etype is None:
+                missing += 1
+                etype = COPY_NULL
+            elif not etype.replace(b"_", b"").isalnum():
+                etype = copy_field(etype)
+            out += (head, etype, b"\t", escaped, b"\n")
+        rows += len(items)
+        if missing:
+            failures[transport] = failures.get(transport, 0) + missing
+    return b"".join(out), rows, failures
+
+
+def decode_rows(batches: List[Batch]) -> Tuple[list, Dict[str, int]]:
+    """Tuplas do INSERT (execute_values) e as mensagens sem tipo de evento por transporte."""
+    values = []
+    failures: Dict[str, int] = {}
+    for ts, transport, items in batches:
+        missing = 0
+        for src, payload in items:
+            raw = payload.decode("utf-8", errors="replace").replace("\x00", "�")
+            etype = extract_event_type(raw)
+            if etype is None:
+                missing += 1
+            values.append((ts, transport, src, etype, raw))
+        if missing:
+            failures[transport] = failures.get(transport, 0) + missing
+    return values, failures
@@ -7,10 +7,22 @@ Servidor simples de Syslog (UDP e TCP) que ingere mensagens em PostgreSQL.
 
 Recursos:
 - Escuta UDP e/ou TCP em host/port configuráveis (env ou flags).
-- Fila com worker para inserção no Postgres (batch).
+- Fila com worker para inserção no Postgres (batch, COPY por padrão); depois de uma falha
+  no banco, o lote fica no worker e é gravado de novo depois de uma espera exponencial
+  com jitter (core/pgpool.py); enquanto isso a fila não é consumida.
+- Recepção em lote (syslog_framing.py): cada recv do TCP (recv_into em buffer pré-alocado)
+  e cada rajada de datagramas UDP viram um item da fila, com um timestamp só; as linhas
+  ficam em bytes até o worker montar o COPY.
+- TCP com contrapressão (padrão): acima de --queue-high-water da fila os clientes TCP
+  param de ser lidos e só voltam abaixo de --queue-low-water; o controle de fluxo do
+  TCP segura o remetente em vez de a linha ser descartada. UDP continua descartando
+  com a fila cheia.
 - Criação automática da tabela (se não existir).
 - Tratamento de SIGTERM/SIGINT para desligar com graça (systemd friendly).
-- Logs claros de status (stdout).
+- Logs claros de status (stdout) e resumo periódico em uma linha (--summary-interval).
+- Métricas no formato do Prometheus em http://<host>:<porta>/metrics (--metrics-port):
+  recebidas por transporte, falhas de parse, profundidade da fila, descartes por fila
+  cheia, latência e tamanho dos lotes gravados, erros e reconexões do banco.
 
 Requisitos:
   pip install psycopg2-binary
@@ -27,6 +39,14 @@ Variáveis de ambiente úteis (podem ser sobrescritas por flags):
   INGEST_TCP_PORT=5514
   INGEST_ENABLE_UDP=1
   INGEST_ENABLE_TCP=1
+  INGEST_TCP_BACKPRESSURE=1
+  INGEST_QUEUE_SIZE=10000          (mensagens)
+  INGEST_UDP_BATCH=256
+  INGEST_DB_WRITER=copy            (copy ou insert)
+  INGEST_METRICS_HOST=0.0.0.0
+  INGEST_METRICS_PORT=9464         (0 desliga)
+  INGEST_SUMMARY_INTERVAL=60       (segundos; 0 desliga)
+  INGEST_DB_STATEMENT_TIMEOUT_MS=0 (0 = sem limite)
   PGHOST=localhost
   PGPORT=5432
   PGDATABASE=syslogdb
@@ -52,8 +72,17 @@ import threading
 import queue
 import time
 import signal
+from bisect import bisect_left
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+
+from syslog_framing import Batch, LineFramer, decode_rows, encode_copy, recv_datagrams
+
+# core/ (sem dependência do Django) é compartilhado com os ETLs do Tarifador.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.pgpool import Backoff, connect as pg_connect  # noqa: E402
 
 # ------------------------ Config & Args ------------------------
 
@@ -77,13 +106,38 @@ def parse_args() -> argparse.Namespace:
                    help="Tamanho do lote para inserir no DB (default: 200)")
     p.add_argument("--batch-wait", type=float, default=float(os.getenv("INGEST_BATCH_WAIT", "0.5")),
                    help="Espera máx em segundos para completar lote (default: 0.5)")
+    p.add_argument("--queue-size", type=int, default=int(os.getenv("INGEST_QUEUE_SIZE", "10000")),
+                   help="Capacidade da fila de gravação (default: 10000)")
+    p.add_argument("--no-tcp-backpressure", action="store_true",
+                   help="Descarta linhas TCP com a fila cheia (em vez de parar de ler o socket)")
+    p.add_argument("--queue-high-water", type=float, default=float(os.getenv("INGEST_QUEUE_HIGH_WATER", "0.9")),
+                   help="Fração da fila a partir da qual os clientes TCP param de ser lidos (default: 0.9)")
+    p.add_argument("--queue-low-water", type=float, default=float(os.getenv("INGEST_QUEUE_LOW_WATER", "0.5")),
+                   help="Fração da fila abaixo da qual a leitura TCP é retomada (default: 0.5)")
+    p.add_argument("--tcp-recv-size", type=int, default=int(os.getenv("INGEST_TCP_RECV_SIZE", "65536")),
+                   help="Buffer de recv das conexões TCP; linhas maiores são descartadas (default: 65536)")
+    p.add_argument("--udp-batch", type=int, default=int(os.getenv("INGEST_UDP_BATCH", "256")),
+                   help="Máximo de datagramas UDP lidos de uma vez (default: 256)")
+    p.add_argument("--db-writer", choices=("copy", "insert"), default=os.getenv("INGEST_DB_WRITER", "copy"),
+                   help="Gravação dos lotes: COPY FROM STDIN ou INSERT com execute_values (default: copy)")
+    p.add_argument("--tcp-rcvbuf", type=int, default=int(os.getenv("INGEST_TCP_RCVBUF", str(2**22))),
+                   help="SO_RCVBUF das conexões TCP (default: 4 MiB)")
+    p.add_argument("--db-statement-timeout", type=int, default=int(os.getenv("INGEST_DB_STATEMENT_TIMEOUT_MS", "0")),
+                   help="statement_timeout da conexão com o PostgreSQL, em ms (default: 0 = sem limite)")
     p.add_argument("--db-schema", default=os.getenv("INGEST_DB_SCHEMA", ""),
                    help="Schema do Postgres (opcional). Ex: public")
+    p.add_argument("--metrics-host", default=os.getenv("INGEST_METRICS_HOST", "0.0.0.0"),
+                   help="Host do endpoint de métricas (default: 0.0.0.0)")
+    p.add_argument("--metrics-port", type=int, default=int(os.getenv("INGEST_METRICS_PORT", "9464")),
+                   help="Porta do endpoint /metrics (default: 9464; 0 desliga)")
+    p.add_argument("--summary-interval", type=float, default=float(os.getenv("INGEST_SUMMARY_INTERVAL", "60")),
+                   help="Segundos entre os resumos de uma linha (default: 60; 0 desliga)")
     return p.parse_args()
 
 ARGS = parse_args()
 ENABLE_UDP = not ARGS.no_udp and env_bool("INGEST_ENABLE_UDP", True)
 ENABLE_TCP = not ARGS.no_tcp and env_bool("INGEST_ENABLE_TCP", True)
+TCP_BACKPRESSURE = not ARGS.no_tcp_backpressure and env_bool("INGEST_TCP_BACKPRESSURE", True)
 
 # ------------------------ DB Helpers ------------------------
 try:
@@ -100,6 +154,7 @@ DB_CFG = {
     "user": os.getenv("PGUSER", "sysloguser"),
     "password": os.getenv("PGPASSWORD", ""),
 }
+DB_INIT_RETRIES = 5
 
 TABLE_NAME = "syslog_events"
 if ARGS.db_schema:
@@ -119,82 +174,366 @@ CREATE TABLE IF NOT EXISTS {TABLE_FQN} (
 """
 
 INSERT_SQL = f"INSERT INTO {TABLE_FQN} (received_at, transport, src_addr, event_type, raw) VALUES %s"
+COPY_SQL = f"COPY {TABLE_FQN} (received_at, transport, src_addr, event_type, raw) FROM STDIN"
 
-def db_connect():
-    return psycopg2.connect(**DB_CFG)
+def db_connect(retries: int = 0):
+    return pg_connect(driver=psycopg2, retries=retries, statement_timeout=ARGS.db_statement_timeout,
+                      application_name="syslog_ingestor", **DB_CFG)
 
 def db_init():
-    conn = db_connect()
+    # na subida o banco pode ainda não estar aceitando conexões
+    conn = db_connect(retries=DB_INIT_RETRIES)
     conn.autocommit = True
     with conn, conn.cursor() as cur:
         cur.execute(CREATE_TABLE_SQL)
     conn.close()
 
 # ------------------------ Ingest Queue & Worker ------------------------
-Message = Tuple[datetime, str, str, Optional[str], str]  # (ts, transport, src_addr, event_type, raw)
+class BatchQueue(queue.Queue):
+    """
+    Fila de lotes (ts, transport, itens) cujo tamanho é contado em mensagens: maxsize,
+    qsize() e a contrapressão continuam em linhas. Um lote entra se ainda houver espaço,
+    então a fila pode passar do limite em até um lote.
+    """
+
+    def _init(self, maxsize):
+        super()._init(maxsize)
+        self.messages = 0
+
+    def _qsize(self):
+        return self.messages
+
+    def _put(self, item):
+        self.queue.append(item)
+        self.messages += len(item[2])
 
-ingest_q: "queue.Queue[Message]" = queue.Queue(maxsize=10000)
+    def _get(self):
+        item = self.queue.popleft()
+        self.messages -= len(item[2])
+        return item
+
+
+QUEUE_SIZE = ARGS.queue_size
+ingest_q: "queue.Queue[Batch]" = BatchQueue(maxsize=QUEUE_SIZE)
 shutdown_flag = threading.Event()
 
-def extract_event_type(raw: str) -> Optional[str]:
-    # Heurística opcional: capturar um token entre pipes (|TYPE|...) se existir.
-    # Ex: "... |MEDIA_END|foo|bar" -> "MEDIA_END"
-    try:
-        first = raw.split("|", 2)
-        if len(first) >= 3 and first[1] and len(first[1]) <= 64:
-            return first[1].strip()
-    except Exception:
+# ------------------------ Métricas ------------------------
+FLUSH_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FLUSH_ROWS_BUCKETS = (1, 5, 10, 25, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+QUEUE_WARN_RATIO = 0.8
+
+COUNTERS = {
+    "syslog_received_total": "Mensagens recebidas, por transporte",
+    "syslog_parse_failures_total": "Mensagens sem tipo de evento reconhecível ou com erro ao enfileirar",
+    "syslog_dropped_total": "Mensagens descartadas, por motivo (queue_full)",
+    "syslog_rows_inserted_total": "Linhas gravadas no PostgreSQL",
+    "syslog_db_errors_total": "Tentativas de gravação de lote que falharam (o lote é tentado de novo)",
+    "syslog_db_reconnects_total": "Reconexões com o PostgreSQL",
+    "syslog_tcp_connections_total": "Conexões TCP aceitas",
+    "syslog_tcp_backpressure_pauses_total": "Vezes em que um cliente TCP deixou de ser lido (fila acima do limite)",
+    "syslog_tcp_backpressure_seconds_total": "Segundos com clientes TCP sem leitura por contrapressão",
+}
+HISTOGRAMS = {
+    "syslog_flush_seconds": ("Duração da gravação de um lote (s)", FLUSH_SECONDS_BUCKETS),
+    "syslog_flush_rows": ("Linhas por lote gravado", FLUSH_ROWS_BUCKETS),
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # último: +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        return list(self.counts), self.sum, self.count
+
+
+def bucket_quantile(buckets, counts, q: float) -> Optional[float]:
+    """Limite superior do bucket do quantil q (aproximação, como histogram_quantile)."""
+    total = sum(counts)
+    if not total:
+        return None
+    rank = q * total
+    seen = 0
+    for bound, count in zip(tuple(buckets) + (float("inf"),), counts):
+        seen += count
+        if seen >= rank:
+            return bound
+    return float("inf")
+
+
+class Metrics:
+    """Contadores e histogramas compartilhados pelas threads (um lock, operações curtas)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self.histograms = {name: Histogram(buckets) for name, (_, buckets) in HISTOGRAMS.items()}
+        self.tcp_active = 0
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        with self.lock:
+            self.histograms[name].observe(value)
+
+    def tcp_connection(self, delta: int) -> None:
+        with self.lock:
+            self.tcp_active += delta
+
+    def snapshot(self):
+        with self.lock:
+            return (dict(self.counters), {name: h.snapshot() for name, h in self.histograms.items()},
+                    self.tcp_active)
+
+    def render(self) -> str:
+        """Formato texto do Prometheus (0.0.4)."""
+        counters, histograms, tcp_active = self.snapshot()
+        out = []
+        for name, help_text in COUNTERS.items():
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} counter")
+            for (key, labels), value in sorted(counters.items()):
+                if key == name:
+                    out.append(f"{name}{format_labels(labels)} {value:g}")
+        for name, (help_text, buckets) in HISTOGRAMS.items():
+            counts, total, count = histograms[name]
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(tuple(buckets) + ("+Inf",), counts):
+                cumulative += bucket_count
+                out.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+            out.append(f"{name}_sum {total:g}")
+            out.append(f"{name}_count {count}")
+        gauges = (
+            ("syslog_queue_depth", "Mensagens na fila aguardando gravação", ingest_q.qsize()),
+            ("syslog_queue_capacity", "Capacidade da fila", QUEUE_SIZE),
+            ("syslog_tcp_connections_active", "Conexões TCP abertas", tcp_active),
+            ("syslog_uptime_seconds", "Segundos desde o início", round(time.time() - self.started, 3)),
+        )
+        for name, help_text, value in gauges:
+            out += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+        return "\n".join(out) + "\n"
+
+
+def format_labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+METRICS = Metrics()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = METRICS.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
         pass
-    return None
+
+
+def metrics_server(host: str, port: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.5}, daemon=True,
+                     name="metrics-http").start()
+    print(f"[OK] Métricas em http://{host}:{port}/metrics")
+    return server
+
+
+def summary_thread(interval: float):
+    """Uma linha por intervalo; [WARN] quando a fila passa de QUEUE_WARN_RATIO da capacidade."""
+    previous = METRICS.snapshot()
+    last = time.time()
+    while not shutdown_flag.wait(interval):
+        current = METRICS.snapshot()
+        now = time.time()
+        elapsed = max(now - last, 1e-9)
+
+        def delta(name, **labels):
+            wanted = set(labels.items())
+            return sum(value - previous[0].get(key, 0) for key, value in current[0].items()
+                       if key[0] == name and wanted <= set(key[1]))
+
+        flush_counts = [a - b for a, b in zip(current[1]["syslog_flush_seconds"][0],
+                                              previous[1]["syslog_flush_seconds"][0])]
+        flushes = current[1]["syslog_flush_rows"][2] - previous[1]["syslog_flush_rows"][2]
+        rows = current[1]["syslog_flush_rows"][1] - previous[1]["syslog_flush_rows"][1]
+        p95 = bucket_quantile(FLUSH_SECONDS_BUCKETS, flush_counts, 0.95)
+        depth = ingest_q.qsize()
+        received = delta("syslog_received_total")
+        line = (f"recebidas udp={delta('syslog_received_total', transport='udp'):g} "
+                f"tcp={delta('syslog_received_total', transport='tcp'):g} ({received / elapsed:.0f}/s) | "
+                f"fila {depth}/{QUEUE_SIZE} | descartadas {delta('syslog_dropped_total'):g} | "
+                f"parse {delta('syslog_parse_failures_total'):g} | "
+                f"gravadas {delta('syslog_rows_inserted_total'):g} em {flushes} lotes "
+                f"({rows / flushes if flushes else 0:.0f}/lote, p95 <= {'-' if p95 is None else f'{p95:g}s'}) | "
+                f"erros db {delta('syslog_db_errors_total'):g}, reconexões {delta('syslog_db_reconnects_total'):g} | "
+                f"tcp {current[2]}")
+        if depth >= QUEUE_SIZE * QUEUE_WARN_RATIO or delta("syslog_dropped_total"):
+            print(f"[WARN] {line}", file=sys.stderr, flush=True)
+        else:
+            print(f"[STATS] {line}", flush=True)
+        previous, last = current, now
+
+class FlowControl:
+    """
+    Contrapressão dos clientes TCP: com a fila em high ou mais, o handler para de chamar
+    recv (a janela TCP enche e o remetente espera) até a fila cair para low.
+    """
+
+    def __init__(self, high: float, low: float):
+        self.high = max(1, int(QUEUE_SIZE * high))
+        self.low = min(self.high - 1, int(QUEUE_SIZE * low))
+        self.cond = threading.Condition()
+
+    def wait_for_room(self) -> None:
+        if ingest_q.qsize() < self.high:
+            return
+        METRICS.inc("syslog_tcp_backpressure_pauses_total")
+        started = time.perf_counter()
+        with self.cond:
+            while ingest_q.qsize() > self.low and not shutdown_flag.is_set():
+                self.cond.wait(0.1)
+        METRICS.inc("syslog_tcp_backpressure_seconds_total", time.perf_counter() - started)
+
+    def notify(self) -> None:
+        # chamado pelo worker depois de tirar mensagens da fila
+        if ingest_q.qsize() <= self.low:
+            with self.cond:
+                self.cond.notify_all()
+
+
+flow = FlowControl(ARGS.queue_high_water, ARGS.queue_low_water)
+
+
+def enqueue(batch: Batch) -> bool:
+    """
+    Põe o lote na fila. TCP com contrapressão espera por espaço (a leitura do socket
+    fica parada enquanto isso); os demais descartam com a fila cheia.
+    """
+    transport = batch[1]
+    METRICS.inc("syslog_received_total", len(batch[2]), transport=transport)
+    if transport == "tcp" and TCP_BACKPRESSURE:
+        while not shutdown_flag.is_set():
+            try:
+                ingest_q.put(batch, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    try:
+        ingest_q.put_nowait(batch)
+        return True
+    except queue.Full:
+        METRICS.inc("syslog_dropped_total", len(batch[2]), reason="queue_full", transport=transport)
+        print(f"[WARN] Fila cheia: descartando {len(batch[2])} mensagens {transport.upper()}.", file=sys.stderr)
+        return False
+
 
 def worker_thread():
-    batch: list[Message] = []
+    batch: list[Batch] = []
+    pending = 0   # mensagens em batch
     batch_size = ARGS.batch_size
     batch_wait = ARGS.batch_wait
     last_flush = time.time()
 
     conn = None
     cur = None
+    connected_once = False
+    # depois de uma falha, a próxima tentativa espera (exponencial com jitter, até 30 s)
+    backoff = Backoff()
+    retry_at = 0.0
 
     def ensure_conn():
-        nonlocal conn, cur
+        nonlocal conn, cur, connected_once
         if conn is None or conn.closed != 0:
             conn = db_connect()
             conn.autocommit = True
             cur = conn.cursor()
-
-    while not shutdown_flag.is_set() or not ingest_q.empty():
+            if connected_once:
+                METRICS.inc("syslog_db_reconnects_total")
+            connected_once = True
+
+    def flush(batches):
+        # falhas de parse contadas só depois de gravar (um lote tentado de novo não conta duas vezes)
+        started = time.perf_counter()
+        if ARGS.db_writer == "copy":
+            data, rows, failures = encode_copy(batches)
+            cur.copy_expert(COPY_SQL, BytesIO(data))
+        else:
+            values, failures = decode_rows(batches)
+            rows = len(values)
+            execute_values(cur, INSERT_SQL, values, page_size=rows)
+        METRICS.observe("syslog_flush_seconds", time.perf_counter() - started)
+        METRICS.observe("syslog_flush_rows", rows)
+        METRICS.inc("syslog_rows_inserted_total", rows)
+        for transport, count in failures.items():
+            METRICS.inc("syslog_parse_failures_total", count, transport=transport)
+
+    # lote que falhou fica no worker e é gravado de novo, na mesma ordem, depois do backoff
+    failed = False
+    while not shutdown_flag.is_set() or not ingest_q.empty() or failed:
         try:
-            try:
-                msg = ingest_q.get(timeout=0.1)
-                batch.append(msg)
-            except queue.Empty:
-                pass
+            if failed:
+                wait = retry_at - time.time()
+                if wait > 0:
+                    # sem consumir a fila: ela enche e o TCP recebe contrapressão
+                    time.sleep(min(wait, 0.5))
+                    continue
+            else:
+                try:
+                    item = ingest_q.get(timeout=0.1)
+                    batch.append(item)
+                    pending += len(item[2])
+                except queue.Empty:
+                    pass
 
             now = time.time()
-            if (batch and len(batch) >= batch_size) or (batch and (now - last_flush) >= batch_wait) or (shutdown_flag.is_set() and batch):
+            if failed or (batch and pending >= batch_size) or (batch and (now - last_flush) >= batch_wait) or (shutdown_flag.is_set() and batch):
                 try:
                     ensure_conn()
-                    from psycopg2.extras import execute_values
-                    values = [(m[0], m[1], m[2], m[3], m[4]) for m in batch]
-                    execute_values(cur, INSERT_SQL, values, page_size=len(values))
+                    flush(batch)
+                    backoff.reset()
+                    failed = False
+                    batch.clear()
+                    pending = 0
+                    flow.notify()
                 except Exception as e:
-                    print(f"[DB] Falha ao inserir lote de {len(batch)}: {e}", file=sys.stderr)
+                    METRICS.inc("syslog_db_errors_total")
+                    delay = backoff.next()
+                    retry_at = time.time() + delay
+                    failed = True
+                    print(f"[DB] Falha ao inserir lote de {pending}: {e} (nova tentativa em {delay:.1f}s)",
+                          file=sys.stderr)
                     try:
                         if conn:
                             conn.close()
                     except Exception:
                         pass
                     conn, cur = None, None
-                    # re-enfileirar para tentar novamente
-                    for item in batch:
-                        try:
-                            ingest_q.put_nowait(item)
-                        except queue.Full:
-                            print("[WARN] Fila cheia ao re-enfileirar após falha no DB.", file=sys.stderr)
-                            break
                 finally:
-                    batch.clear()
                     last_flush = now
         except Exception as e:
             print(f"[WORKER] Erro inesperado: {e}", file=sys.stderr)
@@ -204,10 +543,10 @@ def worker_thread():
     if batch:
         try:
             ensure_conn()
-            values = [(m[0], m[1], m[2], m[3], m[4]) for m in batch]
-            execute_values(cur, INSERT_SQL, values, page_size=len(values))
+            flush(batch)
         except Exception as e:
-            print(f"[DB] Falha no flush final ({len(batch)} msgs): {e}", file=sys.stderr)
+            METRICS.inc("syslog_db_errors_total")
+            print(f"[DB] Falha no flush final ({pending} msgs): {e}", file=sys.stderr)
         finally:
             try:
                 if conn:
@@ -225,9 +564,11 @@ def udp_server(host: str, port: int):
     sock.bind((host, port))
     print(f"[OK] UDP syslog listening on {host}:{port}")
     sock.settimeout(0.5)
+    view = memoryview(bytearray(65535))
+    sources: Dict[Tuple, str] = {}
     while not shutdown_flag.is_set():
         try:
-            data, addr = sock.recvfrom(65535)
+            items = recv_datagrams(sock, view, ARGS.udp_batch, sources)
         except socket.timeout:
             continue
         except Exception as e:
@@ -235,14 +576,9 @@ def udp_server(host: str, port: int):
                 print(f"[UDP] Erro ao receber: {e}", file=sys.stderr)
             continue
         try:
-            raw = data.decode("utf-8", errors="replace")
-            etype = extract_event_type(raw)
-            src = f"{addr[0]}:{addr[1]}"
-            ts = datetime.now(timezone.utc)
-            ingest_q.put_nowait((ts, "udp", src, etype, raw))
-        except queue.Full:
-            print("[WARN] Fila cheia: descartando mensagem UDP.", file=sys.stderr)
+            enqueue((datetime.now(timezone.utc), "udp", items))
         except Exception as e:
+            METRICS.inc("syslog_parse_failures_total", transport="udp")
             print(f"[UDP] Erro ao enfileirar: {e}", file=sys.stderr)
     try:
         sock.close()
@@ -253,33 +589,41 @@ def udp_server(host: str, port: int):
 # ------------------------ TCP Server ------------------------
 def tcp_client_handler(conn: socket.socket, addr: Tuple[str, int]):
     conn.settimeout(1.0)
+    try:
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, ARGS.tcp_rcvbuf)
+    except Exception:
+        pass
     src = f"{addr[0]}:{addr[1]}"
-    buf = b""
+    framer = LineFramer(ARGS.tcp_recv_size)
+    METRICS.inc("syslog_tcp_connections_total")
+    METRICS.tcp_connection(1)
     try:
         while not shutdown_flag.is_set():
+            if TCP_BACKPRESSURE:
+                flow.wait_for_room()
             try:
-                chunk = conn.recv(4096)
-                if not chunk:
+                count = framer.recv_into(conn)
+                if not count:
+                    # última linha sem \n
+                    line = framer.tail()
+                    if line:
+                        enqueue((datetime.now(timezone.utc), "tcp", [(src, line)]))
                     break
-                buf += chunk
-                while b"\n" in buf:
-                    line, buf = buf.split(b"\n", 1)
-                    line = line.rstrip(b"\r")
-                    if not line:
-                        continue
-                    raw = line.decode("utf-8", errors="replace")
-                    etype = extract_event_type(raw)
-                    ts = datetime.now(timezone.utc)
-                    try:
-                        ingest_q.put_nowait((ts, "tcp", src, etype, raw))
-                    except queue.Full:
-                        print("[WARN] Fila cheia: descartando mensagem TCP.", file=sys.stderr)
+                discarded = framer.discarded
+                lines = framer.feed(count)
+                if framer.discarded != discarded:
+                    METRICS.inc("syslog_parse_failures_total", transport="tcp")
+                    print(f"[TCP] Linha de {src} sem \\n com mais de {ARGS.tcp_recv_size} bytes: descartada",
+                          file=sys.stderr)
+                if lines:
+                    enqueue((datetime.now(timezone.utc), "tcp", [(src, line) for line in lines]))
             except socket.timeout:
                 continue
             except Exception as e:
                 print(f"[TCP] Erro em recv de {src}: {e}", file=sys.stderr)
                 break
     finally:
+        METRICS.tcp_connection(-1)
         try:
             conn.close()
         except Exception:
@@ -326,6 +670,10 @@ def main():
         print("[WARN] Escutar em portas <1024 exige privilégios ou setcap no binário do Python.", file=sys.stderr)
 
     print(f"[BOOT] Iniciando syslog_ingestor | host={ARGS.listen_host} udp={ENABLE_UDP}:{ARGS.udp_port} tcp={ENABLE_TCP}:{ARGS.tcp_port}")
+    if ENABLE_TCP:
+        mode = f"contrapressão {flow.high}/{flow.low}" if TCP_BACKPRESSURE else "descarte com a fila cheia"
+        print(f"[BOOT] Fila {QUEUE_SIZE} | TCP: {mode}, recv {ARGS.tcp_recv_size} B")
+    print(f"[BOOT] Gravação: {ARGS.db_writer}, lotes de {ARGS.batch_size}")
     print(f"[BOOT] Conectando ao PostgreSQL em {DB_CFG['host']}:{DB_CFG['port']} db={DB_CFG['dbname']} user={DB_CFG['user']}")
     try:
         db_init()
@@ -337,6 +685,16 @@ def main():
     worker = threading.Thread(target=worker_thread, name="db-worker", daemon=True)
     worker.start()
 
+    metrics = None
+    if ARGS.metrics_port:
+        try:
+            metrics = metrics_server(ARGS.metrics_host, ARGS.metrics_port)
+        except OSError as e:
+            print(f"[WARN] Métricas desligadas: {e}", file=sys.stderr)
+    if ARGS.summary_interval > 0:
+        threading.Thread(target=summary_thread, args=(ARGS.summary_interval,), daemon=True,
+                         name="summary").start()
+
     threads: list[threading.Thread] = []
     if ENABLE_UDP:
         t_udp = threading.Thread(target=udp_server, args=(ARGS.listen_host, ARGS.udp_port), daemon=True, name="udp-server")
@@ -362,6 +720,8 @@ def main():
     print("[SHUTDOWN] Aguardando fila drenar...")
     shutdown_flag.set()
     worker.join(timeout=5.0)
+    if metrics:
+        metrics.shutdown()
     print("[BYE] Encerrado com sucesso.")
 
 if __name__ == "__main__":
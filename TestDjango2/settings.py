@@ -82,6 +82,9 @@ MIDDLEWARE = [
 
     # Downloaded Middleware
     'allauth.account.middleware.AccountMiddleware',
+
+    # Project Middleware
+    'core.instrumentation.ReportInstrumentationMiddleware',
 ]
 
 ROOT_URLCONF = 'TestDjango2.urls'
@@ -126,11 +129,43 @@ DATABASES = {
         #'HOST': '192.168.0.169',
         #'HOST': '172.18.185.82',
         # era Este'HOST': '172.20.25.34',
-        'HOST':'localhost'
+        'HOST':'localhost',
         'PORT': 5432,
+        # Persistent connections: 0 closes them at the end of each request/task. Workers
+        # (Celery, long-running processes) can set DB_CONN_MAX_AGE=600 to reuse the
+        # connection instead of paying connection + TLS setup on every short run;
+        # CONN_HEALTH_CHECKS pings a reused connection before handing it out.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 0)),
+        'CONN_HEALTH_CHECKS': True,
+        # Session statement_timeout in ms (0 = no limit)
+        'OPTIONS': {
+            'options': f"-c statement_timeout={int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))}",
+        },
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# 'default' is per process (LocMem): warm hits never leave the process. 'shared' is
+# seen by every process (gunicorn workers, Celery) and only holds the small version
+# keys of centers/choices.py, so a bump invalidates the local entries everywhere.
+# Redis when CACHE_REDIS_URL is set; otherwise the database cache, whose table is
+# created by the centers 0003 migration.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    },
+}
+if os.environ.get('CACHE_REDIS_URL'):
+    CACHES['shared'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['CACHE_REDIS_URL'],
+    }
+
 # Auth
 # https://docs.djangoproject.com/en/2.2/ref/settings/#authentication-backends
 AUTHENTICATION_BACKENDS = [
@@ -221,3 +256,13 @@ PHONENUMBER_DEFAULT_REGION = 'BR'
 
 # Amount referring to the transformation from R$ to UST
 PRICE_UST = 169.57
+
+
+# ### Report instrumentation ###
+# core/instrumentation.py: SQL queries, context/render time and memory per request;
+# aggregates at /instrumentation/ (superuser). Off by default. Memory is only measured
+# with REPORT_INSTRUMENTATION_TRACEMALLOC (process-wide tracemalloc, slower).
+REPORT_INSTRUMENTATION = os.environ.get('REPORT_INSTRUMENTATION', '') == '1'
+REPORT_INSTRUMENTATION_SLOW_MS = int(os.environ.get('REPORT_INSTRUMENTATION_SLOW_MS', 5000))
+REPORT_INSTRUMENTATION_TOP = 5
+REPORT_INSTRUMENTATION_TRACEMALLOC = False
@@ -32,6 +32,7 @@ from charges.views import AdmOtherPriceTableDetailView
 from charges.views import AdmOtherPriceTableListView
 from charges.views import AdmOtherPriceTableUpdateView
 from core.views import HomeRedirectView
+from core.views import InstrumentationView
 from extensions.views import ExtensionAssignedCreateView
 from extensions.views import ExtensionAssignedListView
 from phonecalls.views import AdmPhonecallCSVReportView
@@ -100,6 +101,10 @@ urlpatterns = [
     path('phonecalls/monthlyreport/',
          TotalReportPDFMasterOrg.as_view(), name='master_phonecall_reports'),
 
+    # instrumentação (settings.REPORT_INSTRUMENTATION)
+    path('instrumentation/',
+         InstrumentationView.as_view(), name='instrumentation'),
+
 
     # charges
     path('pricetable/call/',
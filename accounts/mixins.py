@@ -11,9 +11,9 @@ from django.shortcuts import get_object_or_404
 from organizations.models import Organization
 
 # project
-from centers.utils import get_center_choices
-from centers.utils import get_company_choices
-from centers.utils import get_sector_choices
+from centers.choices import get_organization_choices
+from centers.choices import get_selection
+from core.pagination import PAGINATION_PARAMS
 from core.utils import get_range_date
 from phonecalls.constants import CALLTYPE_CHOICES
 from phonecalls.constants import DDD_CHOICES
@@ -38,7 +38,8 @@ class OrganizationMixin(LoginRequiredMixin):
 class OrganizationContextMixin(object):
 
     def dispatch(self, request, *args, **kwargs):
-        self.params = {key: value for key, value in self.request.GET.items() if key != 'page' and value}
+        self.params = {key: value for key, value in self.request.GET.items()
+                       if key not in PAGINATION_PARAMS and value}
         self.date_gt, self.date_lt = get_range_date(self.request.GET)
         if self.date_gt is None or self.date_lt is None:
             self.date_lt = date.today()
@@ -47,15 +48,9 @@ class OrganizationContextMixin(object):
 
     def get_context_data(self, **kwargs):
         proportionality = self.params.get('proportionality')
-        company = self.organization.company_set.filter(slug=self.params.get('company')).first()
-        center = self.organization.center_set.filter(id=self.params.get('center')).first()
-        sector = self.organization.sector_set.filter(id=self.params.get('sector')).first()
-
-        if center:
-            company = center.company
-        if sector:
-            company = sector.company
-            center = sector.center
+        choices = get_organization_choices(self.organization.pk)
+        company_id, center_id = get_selection(
+            choices, self.params.get('company'), self.params.get('center'), self.params.get('sector'))
 
         kwargs.update({
             'urlencode': urllib.parse.urlencode(self.params),
@@ -66,7 +61,7 @@ class OrganizationContextMixin(object):
             'service_choices': SERVICE_CHOICES,
             'pabx_choices': PABX_CHOICES,
             'ddd_choices': DDD_CHOICES,
-            'company_choices': get_company_choices(self.organization),
-            'center_choices': get_center_choices(company),
-            'sector_choices': get_sector_choices(center)})
+            'company_choices': choices['company_choices'],
+            'center_choices': choices['center_choices'].get(company_id, []),
+            'sector_choices': choices['sector_choices'].get(center_id, [])})
         return super().get_context_data(**kwargs)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Benchmark dos leitores de linhas do syslog do SBC (core/callend).
+
+Compara, sobre o mesmo corpus, cada leitor anterior (copiado abaixo) com o
+caminho que o consumidor usa agora:
+
+* ``parse_call_end_line`` (scripts/sbc_syslog_etl.py): split da linha toda
+  contra ``core.callend`` com a linha em str e em bytes (modo paralelo);
+* ``parse_call_end_raw`` (scripts/etl_sbc_syslog_to_db.py): as 22 colunas
+  gravadas em sbc_phonecall, com um split único e com o ``CallEndRecord``
+  (leitura sob demanda, mais lenta para quem lê o registro inteiro);
+* ``extract_event_type`` (Ingestor/syslog_ingestor.py): tipo do evento de
+  cada mensagem, agora lido dos bytes recebidos;
+* heurísticas por regex (scripts/sbc_syslog_to_excel.py): números e duração
+  das linhas CALL_END.
+
+Os consumidores que importam psycopg/pandas no carregamento não são
+importados; o benchmark mede as chamadas do core/callend que eles fazem.
+
+Uso::
+
+    python benchmarks/callend_parsers.py --lines 200000
+    python benchmarks/callend_parsers.py --file Ingestor/syslog.txt --repeat 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from core.callend import fields  # noqa: E402
+from core.callend.parser import CallEndRecord, extract_event_type, parse_call_end, prefix_sequence, uri_user  # noqa: E402
+from sbc_syslog_etl import SbcCallRecord, parse_call_end_line, parse_datetime  # noqa: E402
+from syslog_corpus import extension_numbers, iter_syslog_lines  # noqa: E402
+
+TIMEZONE = ZoneInfo("America/Fortaleza")
+
+ETL_COLUMNS = (
+    fields.EVENT, fields.ENDPOINT_TYPE, fields.CALL_ID, fields.SESSION_ID, fields.LEG, fields.SRC_IP,
+    fields.SRC_PORT, fields.DST_IP, fields.DST_PORT, fields.TRANSPORT, fields.SRC_URI, fields.SRC_URI_BM,
+    fields.DST_URI, fields.DST_URI_BM, fields.CAUSE, fields.TERM_SIDE, fields.TERM_REASON,
+    fields.TERM_CATEGORY, fields.SETUP_TIME, fields.CONNECT_TIME, fields.RELEASE_TIME, fields.REDIRECT_REASON,
+)
+
+NUM_RE = re.compile(r"(?:(?:sip:|tel:)?)(\+?\d{3,})")
+SIP_URI_RE = re.compile(r"(?:sip:)?(?P<num>\+?\d{3,})@[^\s>]*")
+DUR_SECS_RE = re.compile(r"(?:^|\b)(?:duration|dur|len)\s*=\s*(\d+)\b", re.IGNORECASE)
+DUR_HHMMSS_RE = re.compile(r"\b(\d{1,2}):(\d{2}):(\d{2})\b")
+DUR_M_S_RE = re.compile(r"\b(?:(\d+)m)?\s*(\d+)s\b", re.IGNORECASE)
+
+
+# --- Leitores anteriores ----------------------------------------------------
+
+
+def legacy_parse_call_end_line(line, tz):
+    parts = line.rstrip("\n").split("|")
+    if len(parts) < 22 or parts[1].strip().upper() != "CALL_END":
+        return None
+    prefix = parts[0]
+    sequence = None
+    seq_start = prefix.find("[S=")
+    if seq_start != -1:
+        seq_start += 3
+        seq_end = prefix.find("]", seq_start)
+        if seq_end != -1:
+            seq_value = prefix[seq_start:seq_end].strip()
+            if seq_value.isdigit():
+                sequence = int(seq_value)
+
+    def _field(index):
+        return parts[index].strip() if index < len(parts) else ""
+
+    cause = _field(15)
+    return SbcCallRecord(
+        call_id=_field(3), session_id=_field(4), leg=_field(5).upper(), from_uri=_field(11), to_uri=_field(12),
+        orig_from_uri=_field(13), orig_to_uri=_field(14), calltype_label=_field(16).upper(),
+        cause_code=int(cause) if cause.isdigit() else None, release_cause=_field(17), release_text=_field(18),
+        start_time=parse_datetime(_field(19), tz), connect_time=parse_datetime(_field(20), tz),
+        end_time=parse_datetime(_field(21), tz), sequence=sequence, sip_method=_field(33),
+    )
+
+
+def legacy_raw_columns(line):
+    out = {"raw": line}
+    m = re.search(r'\[S=(\d+)\]', line[:line.find('|')])
+    if m:
+        out["session_id"] = m.group(1)
+    parts = [p for p in line.split('|')]
+    for index in ETL_COLUMNS:
+        out[index] = parts[index].strip() if index < len(parts) else None
+    return out
+
+
+def legacy_extract_event_type(raw):
+    try:
+        first = raw.split("|", 2)
+        if len(first) >= 3 and first[1] and len(first[1]) <= 64:
+            return first[1].strip()
+    except Exception:
+        pass
+    return None
+
+
+def legacy_excel_fields(text):
+    uris = SIP_URI_RE.findall(text)
+    if len(uris) >= 2:
+        caller, callee = uris[0], uris[1]
+    else:
+        nums = NUM_RE.findall(text)
+        caller, callee = (nums + [None, None])[:2]
+    m = DUR_SECS_RE.search(text)
+    if m:
+        return caller, callee, int(m.group(1))
+    m = DUR_HHMMSS_RE.search(text)
+    if m:
+        h, mnt, s = map(int, m.groups())
+        return caller, callee, h * 3600 + mnt * 60 + s
+    m = DUR_M_S_RE.search(text)
+    return caller, callee, (int(m.group(1) or 0) * 60 + int(m.group(2))) if m else 0
+
+
+# --- Caminhos atuais --------------------------------------------------------
+
+
+def raw_columns(line):
+    parts = line.split("|")
+    count = len(parts)
+    out = {"raw": line}
+    sequence = prefix_sequence(parts[fields.PREFIX]) if count > 1 else None
+    if sequence is not None:
+        out["session_id"] = str(sequence)
+    out.update(zip(ETL_COLUMNS, [parts[index].strip() if index < count else None for index in ETL_COLUMNS]))
+    return out
+
+
+def raw_columns_lazy(line):
+    """Mesmo mapeamento com o CallEndRecord (colunas localizadas sob demanda)"""
+    record = CallEndRecord(line, columns=fields.REDIRECT_REASON + 1)
+    out = {"raw": line}
+    if record.has_field(fields.EVENT) and record.sequence is not None:
+        out["session_id"] = str(record.sequence)
+    out.update(zip(ETL_COLUMNS, record.values(ETL_COLUMNS, None)))
+    return out
+
+
+def excel_fields(text):
+    record = parse_call_end(text)
+    if record is None:
+        return legacy_excel_fields(text)
+    return uri_user(record.src_uri) or None, uri_user(record.dst_uri) or None, record.duration_seconds()
+
+
+def timed(name, count, function, rounds):
+    """Melhor tempo de ``rounds`` execuções (a máquina pode estar ocupada)"""
+    elapsed = None
+    for _ in range(rounds):
+        start = perf_counter()
+        result = function()
+        current = perf_counter() - start
+        elapsed = current if elapsed is None else min(elapsed, current)
+    print(f"  {name:<36}{count / elapsed:>14.0f}{elapsed:>12.3f}")
+    return result, elapsed
+
+
+def compare(title, count, rounds, legacy, current, check=None):
+    print(title)
+    expected, legacy_elapsed = timed("anterior", count, legacy, rounds)
+    for name, function in current:
+        result, elapsed = timed(name, count, function, rounds)
+        status = ""
+        if check is not None and not check(expected, result):
+            status = "  DIVERGENTE"
+        print(f"  {'':<36}{legacy_elapsed / elapsed:>13.1f}x{status}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--file", help="Usa as linhas de um syslog real em vez do corpus sintético")
+    parser.add_argument("--repeat", type=int, default=1, help="Repete as linhas de --file N vezes")
+    parser.add_argument("--rounds", type=int, default=3, help="Execuções de cada leitor (vale a melhor)")
+    args = parser.parse_args()
+
+    if args.file:
+        lines = Path(args.file).read_text(encoding="utf-8").splitlines(keepends=True) * args.repeat
+    else:
+        lines = list(iter_syslog_lines(args.lines, extension_numbers(500)))
+    encoded = [line.encode("utf-8") for line in lines]
+    call_end = [line for line in lines if legacy_extract_event_type(line) == "CALL_END"]
+    print(f"{len(lines)} linhas, {len(call_end)} CALL_END")
+    print(f"  {'':<36}{'linhas/s':>14}{'tempo (s)':>12}")
+
+    compare(
+        "sbc_syslog_etl.parse_call_end_line", len(lines), args.rounds,
+        lambda: [legacy_parse_call_end_line(line, TIMEZONE) for line in lines],
+        [("core.callend (str)", lambda: [parse_call_end_line(line, TIMEZONE) for line in lines]),
+         ("core.callend (bytes)", lambda: [parse_call_end_line(line, TIMEZONE) for line in encoded])],
+        lambda expected, result: expected == result,
+    )
+    compare(
+        "etl_sbc_syslog_to_db.parse_call_end_raw (colunas)", len(call_end), args.rounds,
+        lambda: [legacy_raw_columns(line) for line in call_end],
+        [("split único", lambda: [raw_columns(line) for line in call_end]),
+         ("CallEndRecord (sob demanda)", lambda: [raw_columns_lazy(line) for line in call_end])],
+        lambda expected, result: expected == result,
+    )
+    compare(
+        "syslog_ingestor.extract_event_type", len(lines), args.rounds,
+        lambda: [legacy_extract_event_type(line) for line in lines],
+        [("core.callend (str)", lambda: [extract_event_type(line) for line in lines]),
+         ("core.callend (bytes)", lambda: [extract_event_type(line) for line in encoded])],
+        lambda expected, result: expected == result,
+    )
+    # a duração e os números mudam de propósito (as regex pegavam o horário do
+    # prefixo e o mesmo URI duas vezes), então aqui só o tempo é comparado
+    compare(
+        "sbc_syslog_to_excel (números e duração)", len(call_end), args.rounds,
+        lambda: [legacy_excel_fields(line) for line in call_end],
+        [("core.callend", lambda: [excel_fields(line) for line in call_end])],
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark do relatório detalhado de chamadas em PDF (core/reports/pdf/chunked.py).
+
+Gera ``--rows`` chamadas sintéticas distribuídas em ``--extensions`` ramais e
+monta o mesmo relatório de duas formas:
+
+* ``legado``: como ``SystemReport.make_phonecall_table`` — uma ``Table`` por
+  ramal, com a lista de ``TableStyle`` refeita a cada tabela, tudo guardado na
+  story e um único ``build`` no final;
+* ``fatiado``: ``DetailTableLayout`` (estilos montados uma vez) com fatias de
+  ``--chunk-rows`` linhas entregues ao ``build`` sob demanda (``FlowableStream``).
+
+Imprime linhas por segundo, páginas e o pico de memória de cada modo
+(``--trace-memory``; o tracemalloc deixa a geração mais lenta).
+
+Uso::
+
+    python benchmarks/detail_pdf.py --rows 100000 --extensions 200 --trace-memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import tracemalloc
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reportlab.lib import colors  # noqa: E402
+from reportlab.lib.colors import HexColor  # noqa: E402
+from reportlab.lib.styles import ParagraphStyle  # noqa: E402
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle  # noqa: E402
+
+from core.reports.pdf.chunked import DETAIL_CHUNK_ROWS, DetailTableLayout, build_document, iter_chunks  # noqa: E402
+
+FONT = "Helvetica"
+THEAD = ["Ramal", "Número Discado", "Tipo de Chamada", "Data/Hora Início", "Data/Hora Fim", "Duração", "Valor"]
+CALLTYPES = ["Local", "VC1", "VC2", "VC3", "LDN", "LDI"]
+
+
+def make_phonecalls(rows: int, extensions: int, seed: int = 0):
+    """Chamadas ordenadas por ramal, como no queryset da view (valores já calculados)."""
+    rnd = random.Random(seed)
+    names = sorted(f"3125{i:04d}" for i in range(extensions))
+    per_extension = [rows // extensions + (1 if i < rows % extensions else 0) for i in range(extensions)]
+    for extension, count in zip(names, per_extension):
+        for _ in range(count):
+            start = datetime.combine(date(2025, 9, 1) + timedelta(days=rnd.randrange(30)), time(8)) \
+                + timedelta(seconds=rnd.randrange(36000))
+            duration = rnd.randint(1, 900)
+            stop = start + timedelta(seconds=duration)
+            yield {
+                "extension__extension": extension,
+                "dialednumber": f"85{rnd.randint(980000000, 999999999)}",
+                "calltype": rnd.choice(CALLTYPES),
+                "startdate": start.date(), "starttime": start.time(),
+                "stopdate": stop.date(), "stoptime": stop.time(),
+                "duration": duration,
+                "billedamount": duration * 0.12 / 60,
+            }
+
+
+def format_duration(seconds: int) -> str:
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def phonecall_values(ramal, phonecall):
+    return [
+        ramal,
+        phonecall["dialednumber"],
+        phonecall["calltype"],
+        f"{phonecall['startdate'].strftime('%d/%m/%Y')} {phonecall['starttime'].strftime('%H:%M:%S')}",
+        f"{phonecall['stopdate'].strftime('%d/%m/%Y')} {phonecall['stoptime'].strftime('%H:%M:%S')}",
+        format_duration(phonecall["duration"]),
+        f"R$ {phonecall['billedamount']:.2f}"]
+
+
+def make_doc(buffer):
+    return SimpleDocTemplate(buffer, rightMargin=35, leftMargin=35, topMargin=135, bottomMargin=56)
+
+
+def column_widths(doc):
+    size = (doc.pagesize[0] - 50) / 7
+    return [size - 15, size - 15, size + 90, size, size, size - 30, size - 30]
+
+
+def legacy_create_table(story, data):
+    """``SystemReport.create_table`` (core/reports/pdf/company.py)"""
+    tblstyle = TableStyle([
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"), ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8), ("FONTNAME", (0, 0), (-1, -1), FONT),
+        ("BACKGROUND", (0, 0), (-1, -1), HexColor("#cccccc")),
+        ("INNERGRID", (0, 0), (-1, -1), 0.50, colors.white), ("BOX", (0, 0), (-1, -1), 0.50, colors.white)])
+    thead = [data["thead"]]
+    tbl = Table(thead, colWidths=data["len_col"], rowHeights=[20 for x in range(len(thead))])
+    tbl.setStyle(tblstyle)
+    story.append(tbl)
+
+    array_tblstyle = []
+    for cont, align in enumerate(data["align"]):
+        array_tblstyle.append(("ALIGN", (cont, 0), (cont, -1), align))
+    array_tblstyle += [
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"), ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("FONTNAME", (0, 0), (-1, -1), FONT), ("BACKGROUND", (0, 0), (-1, -1), HexColor("#ffffff")),
+        ("INNERGRID", (0, 0), (-1, -1), 0.50, colors.white), ("BOX", (0, 0), (-1, -1), 0.50, colors.white)]
+    tbl = Table(data["values"], colWidths=data["len_col"], rowHeights=[22 for x in range(len(data["values"]))])
+    tbl.setStyle(TableStyle(array_tblstyle))
+    story.append(tbl)
+
+
+def build_legacy(rows, extensions, chunk_rows, style):
+    # a view montava {ramal: {'phonecall_list': [...], ...}} com todas as chamadas antes do PDF
+    phonecall_data = {}
+    for phonecall in make_phonecalls(rows, extensions):
+        data = phonecall_data.setdefault(phonecall["extension__extension"], {
+            "phonecall_list": [], "count": 0, "billedtime_sum": 0, "cost_sum": 0.0})
+        data["phonecall_list"].append(phonecall)
+        data["count"] += 1
+        data["billedtime_sum"] += phonecall["duration"]
+        data["cost_sum"] += phonecall["billedamount"]
+
+    buffer = io.BytesIO()
+    doc = make_doc(buffer)
+    story = []
+    for ramal, data in phonecall_data.items():
+        story.append(Paragraph(f"<font size=9><b>RAMAL: {ramal}</b></font><br/>", style=style))
+        values = [phonecall_values(ramal, phonecall) for phonecall in data["phonecall_list"]]
+        values.append(["", "", "", "TOTAL:", data["count"], format_duration(data["billedtime_sum"]),
+                       f"R$ {data['cost_sum']:.2f}"])
+        legacy_create_table(story, {"thead": THEAD, "len_col": column_widths(doc), "align": ["CENTER"] * 7,
+                                    "values": values})
+        story.append(Paragraph("<br/><br/>", style=style))
+    doc.build(story)
+    return doc.page, len(buffer.getvalue())
+
+
+def build_chunked(rows, extensions, chunk_rows, style):
+    doc = make_doc(None)
+    layout = DetailTableLayout(column_widths(doc), ["CENTER"] * 7, font_name=FONT, font_size=8, row_height=22)
+
+    def flowables():
+        from itertools import groupby
+        for ramal, phonecall_list in groupby(make_phonecalls(rows, extensions),
+                                             key=lambda phonecall: phonecall["extension__extension"]):
+            yield Paragraph(f"<font size=9><b>RAMAL: {ramal}</b></font><br/>", style=style)
+            yield layout.header(THEAD)
+            count = billedtime_sum = 0
+            cost_sum = 0.0
+            for chunk in iter_chunks(phonecall_list, chunk_rows):
+                values = []
+                for phonecall in chunk:
+                    values.append(phonecall_values(ramal, phonecall))
+                    count += 1
+                    billedtime_sum += phonecall["duration"]
+                    cost_sum += phonecall["billedamount"]
+                yield layout.body(values)
+            yield layout.body([["", "", "", "TOTAL:", count, format_duration(billedtime_sum),
+                                f"R$ {cost_sum:.2f}"]])
+            yield Paragraph("<br/><br/>", style=style)
+
+    output = build_document(doc, flowables(), lambda canvas, doc: None)
+    size = output.seek(0, 2)
+    output.close()
+    return doc.page, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--extensions", type=int, default=50)
+    parser.add_argument("--chunk-rows", type=int, default=DETAIL_CHUNK_ROWS)
+    parser.add_argument("--modes", nargs="+", choices=("legado", "fatiado"), default=["legado", "fatiado"])
+    parser.add_argument("--trace-memory", action="store_true", help="Mede o pico de memória (tracemalloc)")
+    args = parser.parse_args()
+
+    style = ParagraphStyle(name="Sans", fontName=FONT, fontSize=9)
+    builders = {"legado": build_legacy, "fatiado": build_chunked}
+    print(f"{args.rows} chamadas, {args.extensions} ramais, fatias de {args.chunk_rows} linhas")
+    print(f"{'modo':<10}{'linhas/s':>12}{'tempo (s)':>12}{'páginas':>10}{'PDF (MB)':>10}{'pico (MB)':>12}")
+    for mode in args.modes:
+        if args.trace_memory:
+            tracemalloc.start()
+        start = perf_counter()
+        pages, size = builders[mode](args.rows, args.extensions, args.chunk_rows, style)
+        elapsed = perf_counter() - start
+        peak = "-"
+        if args.trace_memory:
+            peak = f"{tracemalloc.get_traced_memory()[1] / 2 ** 20:.1f}"
+            tracemalloc.stop()
+        print(f"{mode:<10}{args.rows / elapsed:>12.0f}{elapsed:>12.2f}{pages:>10}{size / 2 ** 20:>10.1f}{peak:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
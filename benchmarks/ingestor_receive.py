@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Benchmark do caminho de recepção do Ingestor/syslog_ingestor.py.
+
+Mede o CPU da thread que lê o socket (``time.thread_time``) por 100 mil
+mensagens, com o mesmo corpus, em três etapas:
+
+* TCP: o handler anterior (linha a linha: decode, ``extract_event_type``,
+  ``datetime.now``, contador e ``put_nowait`` por linha, copiado abaixo)
+  contra ``LineFramer`` (``recv_into`` em buffer pré-alocado, um lote por
+  recv);
+* UDP: ``recvfrom`` por datagrama contra ``recv_datagrams`` (rajadas com
+  ``MSG_DONTWAIT``), pelo loopback. Datagramas perdidos pelo kernel não
+  entram na conta; a perda é impressa;
+* gravação: CPU do worker para montar um lote, ``decode_rows`` (tuplas do
+  INSERT, sem o mogrify do psycopg2) contra ``encode_copy`` (bytes do COPY).
+
+Os contadores e a fila são os mesmos tipos do ingestor (um lock por
+incremento, ``queue.Queue``); não há banco nem psycopg2.
+
+Uso::
+
+    python benchmarks/ingestor_receive.py --lines 200000
+    python benchmarks/ingestor_receive.py --file Ingestor/syslog.txt --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Ingestor"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from core.callend.parser import extract_event_type  # noqa: E402
+from syslog_corpus import extension_numbers, iter_syslog_lines  # noqa: E402
+from syslog_framing import LineFramer, decode_rows, encode_copy, recv_datagrams  # noqa: E402
+
+PER = 100_000
+UDP_IDLE = 0.5
+
+
+class Counters:
+    """Mesmo custo do Metrics.inc do ingestor (lock + rótulos ordenados)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+
+# --- Recepção anterior --------------------------------------------------------
+
+def legacy_tcp_line(metrics, q, src, line):
+    raw = line.decode("utf-8", errors="replace")
+    etype = extract_event_type(raw)
+    metrics.inc("syslog_received_total", transport="tcp")
+    if etype is None:
+        metrics.inc("syslog_parse_failures_total", transport="tcp")
+    q.put_nowait((datetime.now(timezone.utc), "tcp", src, etype, raw))
+
+
+def legacy_tcp(conn, metrics, q, recv_size):
+    src = "127.0.0.1:5514"
+    buf = bytearray()
+    while True:
+        chunk = conn.recv(recv_size)
+        if not chunk:
+            break
+        buf += chunk
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            stop = end - 1 if end > start and buf[end - 1] == 13 else end
+            if stop > start:
+                legacy_tcp_line(metrics, q, src, buf[start:stop])
+            start = end + 1
+        if start:
+            del buf[:start]
+
+
+def legacy_udp(sock, metrics, q, expected):
+    received = 0
+    while received < expected:
+        try:
+            data, addr = sock.recvfrom(65535)
+        except socket.timeout:
+            break
+        raw = data.decode("utf-8", errors="replace")
+        etype = extract_event_type(raw)
+        metrics.inc("syslog_received_total", transport="udp")
+        if etype is None:
+            metrics.inc("syslog_parse_failures_total", transport="udp")
+        q.put_nowait((datetime.now(timezone.utc), "udp", f"{addr[0]}:{addr[1]}", etype, raw))
+        received += 1
+    return received
+
+
+# --- Recepção em lote ---------------------------------------------------------
+
+def batched_tcp(conn, metrics, q, recv_size):
+    src = "127.0.0.1:5514"
+    framer = LineFramer(recv_size)
+    while True:
+        count = framer.recv_into(conn)
+        if not count:
+            break
+        lines = framer.feed(count)
+        if lines:
+            metrics.inc("syslog_received_total", len(lines), transport="tcp")
+            q.put_nowait((datetime.now(timezone.utc), "tcp", [(src, line) for line in lines]))
+
+
+def batched_udp(sock, metrics, q, expected, max_batch):
+    view = memoryview(bytearray(65535))
+    sources = {}
+    received = 0
+    while received < expected:
+        try:
+            items = recv_datagrams(sock, view, max_batch, sources)
+        except socket.timeout:
+            break
+        metrics.inc("syslog_received_total", len(items), transport="udp")
+        q.put_nowait((datetime.now(timezone.utc), "udp", items))
+        received += len(items)
+    return received
+
+
+# --- Execução -----------------------------------------------------------------
+
+def run_receiver(target, *args):
+    """Roda target em uma thread; result recebe o retorno ("value") e o CPU da thread ("cpu")."""
+    result = {}
+
+    def body():
+        started = time.thread_time()
+        result["value"] = target(*args)
+        result["cpu"] = time.thread_time() - started
+
+    thread = threading.Thread(target=body)
+    started = time.perf_counter()
+    thread.start()
+    return thread, result, started
+
+
+def bench_tcp(data, lines, recv_size, batched):
+    receiver, sender = socket.socketpair()
+    metrics, q = Counters(), queue.Queue()
+    target = batched_tcp if batched else legacy_tcp
+    thread, result, started = run_receiver(target, receiver, metrics, q, recv_size)
+    sender.sendall(data)
+    sender.close()
+    thread.join()
+    elapsed = time.perf_counter() - started
+    receiver.close()
+    messages = sum(len(item[2]) for item in q.queue) if batched else q.qsize()
+    assert messages == lines, (messages, lines)
+    return result["cpu"], elapsed, messages
+
+
+def bench_udp(datagrams, max_batch, batched):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2**24)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(UDP_IDLE)
+    address = receiver.getsockname()
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    metrics, q = Counters(), queue.Queue()
+    if batched:
+        thread, result, started = run_receiver(batched_udp, receiver, metrics, q, len(datagrams), max_batch)
+    else:
+        thread, result, started = run_receiver(legacy_udp, receiver, metrics, q, len(datagrams))
+    for datagram in datagrams:
+        sender.sendto(datagram, address)
+    thread.join()
+    elapsed = time.perf_counter() - started
+    receiver.close()
+    sender.close()
+    return result["cpu"], elapsed, result["value"]
+
+
+def bench_writer(batches, copy):
+    started = time.process_time()
+    if copy:
+        rows = encode_copy(batches)[1]
+    else:
+        rows = len(decode_rows(batches)[0])
+    return time.process_time() - started, rows
+
+
+def report(label, cpu, messages, baseline=None):
+    per = cpu / messages * PER if messages else float("nan")
+    ratio = f"{baseline / per:8.2f}x" if baseline else ""
+    print(f"  {label:<44}{messages:>10}{per:>14.3f}{ratio:>10}")
+    return per
+
+
+def best(rounds, func):
+    results = [func() for _ in range(rounds)]
+    return min(results, key=lambda result: result[0] / max(result[-1], 1))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--file", help="Usa as linhas de um syslog real em vez do corpus sintético")
+    parser.add_argument("--repeat", type=int, default=1, help="Repete as linhas de --file N vezes")
+    parser.add_argument("--rounds", type=int, default=3, help="Execuções de cada caminho (vale a melhor)")
+    parser.add_argument("--recv-size", type=int, default=65536, help="Buffer de recv do TCP")
+    parser.add_argument("--udp-batch", type=int, default=256, help="Datagramas por lote no UDP")
+    parser.add_argument("--batch-size", type=int, default=200, help="Mensagens por gravação (etapa do worker)")
+    args = parser.parse_args()
+
+    if args.file:
+        lines = Path(args.file).read_text(encoding="utf-8").splitlines() * args.repeat
+    else:
+        lines = list(iter_syslog_lines(args.lines, extension_numbers(500)))
+    # linhas vazias não viram mensagem no TCP
+    lines = [line.rstrip("\r\n") + "\n" for line in lines if line.strip("\r\n")]
+    encoded = [line.encode("utf-8") for line in lines]
+    data = b"".join(encoded)
+    print(f"{len(lines)} linhas, {len(data) / len(lines):.0f} bytes/linha")
+    print(f"  {'':<44}{'mensagens':>10}{'CPU s/100k':>14}{'ganho':>10}")
+
+    print("TCP (socketpair)")
+    base = report("linha a linha", *best(args.rounds, lambda: bench_tcp(data, len(lines), args.recv_size, False))[::2])
+    report("LineFramer (lote por recv)",
+           *best(args.rounds, lambda: bench_tcp(data, len(lines), args.recv_size, True))[::2], base)
+
+    print("UDP (loopback)")
+    cpu, _, received = best(args.rounds, lambda: bench_udp(encoded, args.udp_batch, False))
+    base = report(f"recvfrom por datagrama (perdidos {len(encoded) - received})", cpu, received)
+    cpu, _, received = best(args.rounds, lambda: bench_udp(encoded, args.udp_batch, True))
+    report(f"recv_datagrams (perdidos {len(encoded) - received})", cpu, received, base)
+
+    print(f"Worker (lotes de {args.batch_size})")
+    ts = datetime.now(timezone.utc)
+    src = "127.0.0.1:5514"
+    batches = [(ts, "tcp", [(src, line.rstrip(b"\n")) for line in encoded[start:start + args.batch_size]])
+               for start in range(0, len(encoded), args.batch_size)]
+    base = report("decode_rows (INSERT, sem mogrify)", *best(args.rounds, lambda: bench_writer(batches, False)))
+    report("encode_copy (COPY)", *best(args.rounds, lambda: bench_writer(batches, True)), base)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark dos índices parciais de ``phonecalls_phonecall``.
+
+Gera chamadas sintéticas dentro de uma transação, mede as consultas de
+``phonecalls.query_shapes`` com os índices de chamadas originadas e, em
+seguida, sem eles (``DROP INDEX`` transacional). Tudo é desfeito ao final.
+
+Uso::
+
+    python benchmarks/phonecall_indexes.py --calls 500000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+OUTBOUND_INDEXES = ("phonecalls_org_out_idx", "phonecalls_company_out_idx", "phonecalls_out_date_idx")
+
+
+def _configure_django(settings_module: str) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    django.setup()
+
+
+def _time_shapes(shapes, repeat: int) -> Dict[str, float]:
+    timings = {}
+    for name, queryset in shapes:
+        best = None
+        for _ in range(repeat):
+            start = perf_counter()
+            list(queryset.all())
+            elapsed = perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best * 1000
+    return timings
+
+
+def run(calls: int, repeat: int) -> List[Dict[str, float]]:
+    from django.db import connection, transaction
+
+    from core.synthetic import create_companies, create_organizations, create_phonecalls
+    from phonecalls.query_shapes import get_query_shapes
+
+    with transaction.atomic():
+        organizations = create_organizations(4, prefix="benchmark")
+        companies = [company for org in organizations for company in create_companies(org, 10)]
+        create_phonecalls(companies, calls)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE phonecalls_phonecall")
+
+        date_lt = date.today()
+        shapes = get_query_shapes(organizations[0], companies[0], date_lt - timedelta(days=30), date_lt)
+        after = _time_shapes(shapes, repeat)
+
+        with connection.cursor() as cursor:
+            for index in OUTBOUND_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {index}")
+            cursor.execute("ANALYZE phonecalls_phonecall")
+        before = _time_shapes(shapes, repeat)
+
+        transaction.set_rollback(True)
+
+    return [{"shape": name, "before_ms": before[name], "after_ms": after[name]} for name, _ in shapes]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000, help="Chamadas sintéticas geradas")
+    parser.add_argument("--repeat", type=int, default=5, help="Execuções por consulta (menor tempo)")
+    parser.add_argument("--settings", default="TestDjango2.settings")
+    args = parser.parse_args(argv)
+
+    _configure_django(args.settings)
+    print(f"{'consulta':<16}{'sem índices (ms)':>18}{'com índices (ms)':>18}{'ganho':>8}")
+    for row in run(args.calls, args.repeat):
+        gain = row["before_ms"] / row["after_ms"] if row["after_ms"] else 0.0
+        print(f"{row['shape']:<16}{row['before_ms']:>18.1f}{row['after_ms']:>18.1f}{gain:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - execução via linha de comando
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark do PDF de resumo da organização (core/reports/pdf/organization.py).
+
+Gera uma base tarifária sintética (``core.synthetic.create_dataset``) no banco
+do settings ou num SQLite local (``--sqlite``), pede uma vez o ZIP de resumos
+do administrador (``TotalReportPDFMasterOrg``, um PDF por organização) para
+obter o contexto que a view passa ao relatório da organização, e mede só a
+geração com ``SystemReportOrganization.create_table_resume_services`` de duas
+formas:
+
+* ``legado``: ``table_style`` sem memorização (um ``TableStyle`` novo a cada
+  tabela, como antes);
+* ``estilos``: ``core.reports.pdf.styles.table_style`` (um ``TableStyle``
+  memorizado por combinação).
+
+Imprime o tempo total, o tempo gasto só montando estilos, os estilos pedidos e
+o tamanho do PDF. A base é criada numa transação desfeita ao final.
+
+Uso::
+
+    python benchmarks/resume_pdf.py --sqlite /tmp/tarifador.sqlite3 --companies 50 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from suite import configure_django, get_client, get_period  # noqa: E402
+
+PREFIX = "benchmark-resumo"
+
+
+def capture_context(client, organization, date_gt, date_lt):
+    """Contexto da organização montado pela view para o relatório (uma requisição real)"""
+    from django.urls import reverse
+
+    from core.reports.pdf.organization import SystemReportOrganization
+
+    captured = {}
+    create = SystemReportOrganization.create_table_resume_services
+
+    def capture(self, context, *args, **kwargs):
+        if context.get("organization") == organization:
+            captured.setdefault("context", context)
+        return create(self, context, *args, **kwargs)
+
+    SystemReportOrganization.create_table_resume_services = capture
+    try:
+        response = client.get(reverse("master_phonecall_reports"),
+                              {"date_gt": date_gt.isoformat(), "date_lt": date_lt.isoformat()})
+    finally:
+        SystemReportOrganization.create_table_resume_services = create
+    if response.status_code != 200 or "context" not in captured:
+        raise SystemExit(f"Resumos em PDF das organizações: HTTP {response.status_code}")
+    return captured["context"]
+
+
+def run(mode, org_context, date_gt, date_lt):
+    from core.reports.pdf import organization as module
+    from core.reports.pdf.styles import table_style
+
+    make_style = {"legado": table_style.__wrapped__, "estilos": table_style}[mode]
+    table_style.cache_clear()
+    stats = {"time": 0.0, "calls": 0}
+
+    def timed_style(*args, **kwargs):
+        start = perf_counter()
+        style = make_style(*args, **kwargs)
+        stats["time"] += perf_counter() - start
+        stats["calls"] += 1
+        return style
+
+    module.table_style = timed_style
+    try:
+        start = perf_counter()
+        report = module.SystemReportOrganization(
+            dateBegin=date_gt.strftime("%d/%m/%Y"), dateEnd=date_lt.strftime("%d/%m/%Y"),
+            reportTitle="Resumo Geral dos Serviços", context=org_context, showCompanies=True)
+        pdf = report.create_table_resume_services(org_context)
+        elapsed = perf_counter() - start
+    finally:
+        module.table_style = table_style
+    return elapsed, stats["time"], stats["calls"], len(pdf)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--settings", default="TestDjango2.settings")
+    parser.add_argument("--sqlite", help="Banco SQLite local (criado e migrado) no lugar do banco do settings")
+    parser.add_argument("--migrate", action="store_true", help="Aplica as migrações no banco do settings")
+    parser.add_argument("--companies", type=int, default=50)
+    parser.add_argument("--extensions", type=int, default=20, help="Ramais por empresa")
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Gerações por modo (vale a mais rápida)")
+    parser.add_argument("--modes", nargs="+", choices=("legado", "estilos"), default=["legado", "estilos"])
+    args = parser.parse_args()
+
+    configure_django(args.settings, args.sqlite, args.migrate)
+    from django.db import transaction
+
+    from core.synthetic import create_dataset
+
+    with transaction.atomic():
+        dataset = create_dataset(organizations=1, companies=args.companies, centers=1,
+                                 extensions=args.extensions, calls=args.calls, days=args.days,
+                                 prefix=PREFIX, seed=args.seed)
+        date_gt, date_lt = get_period(dataset)
+        org_context = capture_context(get_client(dataset), dataset["organizations"][0], date_gt, date_lt)
+
+        print(f"{args.companies} empresas, {args.calls} chamadas, melhor de {args.repeat}")
+        print(f"{'modo':<10}{'total (ms)':>12}{'estilos (ms)':>14}{'estilos':>10}{'bytes':>10}")
+        for mode in args.modes:
+            elapsed, style_time, styles, size = min(
+                run(mode, org_context, date_gt, date_lt) for _ in range(args.repeat))
+            print(f"{mode:<10}{elapsed * 1000:>12.1f}{style_time * 1000:>14.2f}{styles:>10}{size:>10}")
+        transaction.set_rollback(True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
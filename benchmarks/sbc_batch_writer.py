@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark da gravação em lote do new_task_sbc/task_sbc_standalone_fixed.py.
+
+Cria um schema temporário no PostgreSQL informado (``--dsn``) com a origem
+(``sbc_phonecall``), o destino (subconjunto de ``phonecalls_phonecall`` com
+colunas NOT NULL sem default e ``created``/``modified``) e
+``controlled_number_ranges``, gera ``--rows`` chamadas CALL_END e processa
+tudo com cada modo de gravação (``row``, ``executemany``, ``copy``),
+imprimindo linhas por segundo. O schema é removido no final.
+
+Uso::
+
+    python benchmarks/sbc_batch_writer.py --dsn "host=127.0.0.1 dbname=test_db user=usr" --rows 50000
+
+Requisitos: ``psycopg`` 3 e um banco onde o usuário possa criar schemas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "new_task_sbc"))
+
+import psycopg  # noqa: E402
+
+import task_sbc_standalone_fixed as standalone  # noqa: E402
+
+SCHEMA_NAME = "bench_sbc_batch_writer"
+MODES = ("row", "executemany", "copy")
+
+TABLES = """
+CREATE TABLE sbc_phonecall (
+    id bigint PRIMARY KEY, event_type varchar(20) NOT NULL, hostid integer,
+    startdate date, starttime time, stopdate date, stoptime time, duration integer,
+    dialednumber varchar(30), connectednumber varchar(30), chargednumber varchar(30),
+    conditioncode integer, callcasedata integer, seqnumber integer, seqlim integer,
+    callid varchar(100), callidass1 varchar(100), callidass2 varchar(100));
+CREATE TABLE phonecalls_phonecall (
+    id bigserial PRIMARY KEY, created timestamp with time zone NOT NULL,
+    modified timestamp with time zone NOT NULL, md_phonecall_id bigint NOT NULL,
+    startdate date NOT NULL, starttime time NOT NULL, stopdate date NOT NULL, stoptime time NOT NULL,
+    duration integer NOT NULL, dialednumber varchar(30) NOT NULL, connectednumber varchar(30) NOT NULL,
+    chargednumber varchar(30) NOT NULL, charged_ddd varchar(2), dialed_ddd varchar(2),
+    conditioncode integer NOT NULL, callcasedata integer,
+    seqnumber integer, seqlim integer, callid varchar(100), callidass1 varchar(100),
+    callidass2 varchar(100), pabx integer NOT NULL, hostid_id integer, inbound boolean NOT NULL,
+    internal boolean NOT NULL, calltype integer NOT NULL, service integer NOT NULL,
+    description varchar(600) NOT NULL, price numeric(10, 3) NOT NULL, billedtime integer NOT NULL);
+CREATE INDEX ON phonecalls_phonecall (md_phonecall_id);
+CREATE TABLE controlled_number_ranges (ddd varchar(2), start_local varchar(10), end_local varchar(10));
+"""
+
+
+def source_rows(count: int, seed: int = 0):
+    rnd = random.Random(seed)
+    day = date(2025, 9, 1)
+    for i in range(1, count + 1):
+        start = datetime.combine(day + timedelta(days=rnd.randrange(30)), time(8)) \
+            + timedelta(seconds=rnd.randrange(36000))
+        duration = rnd.randint(0, 900)
+        stop = start + timedelta(seconds=duration)
+        extension = f"853125{rnd.randrange(1000):04d}"
+        remote = f"85{rnd.randint(980000000, 999999999)}"
+        charged, dialed = (extension, remote) if rnd.random() < 0.5 else (remote, extension)
+        yield (i, "CALL_END", 1, start.date(), start.time(), stop.date(), stop.time(), duration,
+               dialed, dialed, charged, 16, 0, i, 0, f"{rnd.getrandbits(64)}@10.0.0.1", "", "")
+
+
+def setup(conn: psycopg.Connection, rows: int) -> None:
+    conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA_NAME} CASCADE")
+    conn.execute(f"CREATE SCHEMA {SCHEMA_NAME}")
+    conn.execute(f"SET search_path TO {SCHEMA_NAME}")
+    with conn.cursor() as cur:
+        cur.execute(TABLES)
+        cur.execute("INSERT INTO controlled_number_ranges VALUES ('85', '31250000', '31259999')")
+        with cur.copy("COPY sbc_phonecall FROM STDIN") as copy:
+            for row in source_rows(rows):
+                copy.write_row(row)
+        cur.execute("ANALYZE")
+
+
+def run(conn: psycopg.Connection, mode: str, batch_size: int) -> tuple[int, float]:
+    conn.execute("TRUNCATE phonecalls_phonecall")
+    nums, ranges = standalone.load_controlled(conn, ranges_only=True)
+    schema = standalone.DestinationSchema(conn, "phonecalls_phonecall")
+    writer = None if mode == "row" else standalone.PhonecallBatchWriter(conn, schema, mode)
+    total = 0
+    start = perf_counter()
+    while True:
+        ids = standalone.pending_ids(conn, "sbc_phonecall", "phonecalls_phonecall", "CALL_END", batch_size, True)
+        if not ids:
+            break
+        inserted, _ = standalone.process_batch(conn, "sbc_phonecall", "phonecalls_phonecall", ids, nums, ranges,
+                                               schema.columns, True, writer=writer, required=schema.required)
+        if not inserted:
+            break
+        total += inserted
+    return total, perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    standalone.CONFIG["log_sql_level"] = "OFF"
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        setup(conn, args.rows)
+        try:
+            print(f"{args.rows} linhas, lotes de {args.batch_size}")
+            print(f"{'modo':<14}{'linhas/s':>12}{'tempo (s)':>12}{'gravadas':>10}")
+            for mode in args.modes:
+                total, elapsed = run(conn, mode, args.batch_size)
+                print(f"{mode:<14}{total / elapsed:>12.0f}{elapsed:>12.2f}{total:>10}")
+        finally:
+            conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA_NAME} CASCADE")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
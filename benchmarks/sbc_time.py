@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark das datas do SBC (core/sbc_time.py).
+
+Compara, sobre as mesmas ``--lines`` datas sintéticas (90 dias):
+
+* a leitura anterior dos scripts (``strptime`` + ``astimezone``) com
+  ``parse_sbc_datetime`` e com a versão em lote ``parse_sbc_datetimes``;
+* a conversão UTC -> local de ``Phonecall.make_datetime`` (``pytz.timezone``
+  e ``astimezone`` a cada chamada; ``zoneinfo`` se o pytz não estiver
+  instalado) com a tabela de deslocamentos por dia.
+
+Uso::
+
+    python benchmarks/sbc_time.py --lines 1000000 --timezone America/Sao_Paulo
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+try:
+    import pytz
+except ImportError:
+    pytz = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from core.sbc_time import get_offset_table, parse_sbc_datetime, parse_sbc_datetimes  # noqa: E402
+from syslog_corpus import format_sbc_time  # noqa: E402
+
+
+def legacy_parse_datetime(value, tz):
+    """``scripts/sbc_syslog_etl.parse_datetime`` antes do core/sbc_time.py"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        naive = datetime.strptime(value, "%H:%M:%S.%f %Z %a %b %d %Y")
+    except ValueError:
+        try:
+            naive = datetime.strptime(value, "%H:%M:%S.%f %a %b %d %Y")
+        except ValueError:
+            return None
+    return naive.replace(tzinfo=timezone.utc).astimezone(tz)
+
+
+def legacy_to_local(value, name):
+    """Conversão de ``Phonecall.make_datetime`` antes da tabela por dia (pytz, se instalado)"""
+    if pytz is None:
+        return value.replace(tzinfo=timezone.utc).astimezone(ZoneInfo(name))
+    return value.replace(tzinfo=pytz.UTC).astimezone(pytz.timezone(name))
+
+
+def timed(name, lines, function):
+    start = perf_counter()
+    result = function()
+    elapsed = perf_counter() - start
+    print(f"{name:<34}{lines / elapsed:>14.0f}{elapsed:>12.2f}")
+    return result, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--timezone", default="America/Sao_Paulo")
+    parser.add_argument("--start", default="2018-10-01", help="Início do período (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    tz = ZoneInfo(args.timezone)
+    rnd = random.Random(0)
+    start = datetime.strptime(args.start, "%Y-%m-%d")
+    instants = sorted(start + timedelta(seconds=rnd.randrange(90 * 86400), milliseconds=rnd.randrange(1000))
+                      for _ in range(args.lines))
+    values = [format_sbc_time(instant) for instant in instants]
+
+    print(f"{args.lines} datas, {args.timezone}, 90 dias a partir de {args.start}")
+    print(f"{'leitura':<34}{'datas/s':>14}{'tempo (s)':>12}")
+    expected, legacy = timed("strptime + astimezone", args.lines,
+                             lambda: [legacy_parse_datetime(value, tz) for value in values])
+    single, elapsed = timed("parse_sbc_datetime", args.lines, lambda: [parse_sbc_datetime(value, tz) for value in values])
+    print(f"{'':<34}{legacy / elapsed:>13.1f}x")
+    batch, elapsed = timed("parse_sbc_datetimes (lote)", args.lines, lambda: parse_sbc_datetimes(values, tz))
+    print(f"{'':<34}{legacy / elapsed:>13.1f}x")
+    for name, result in (("parse_sbc_datetime", single), ("parse_sbc_datetimes", batch)):
+        if result != expected or [v.utcoffset() for v in result] != [v.utcoffset() for v in expected]:
+            print(f"{name}: DIVERGENTE")
+
+    print(f"{'conversão UTC -> local':<34}{'datas/s':>14}{'tempo (s)':>12}")
+    name = "astimezone (pytz)" if pytz else "astimezone (zoneinfo)"
+    expected, legacy = timed(name, args.lines, lambda: [legacy_to_local(value, args.timezone) for value in instants])
+    table = get_offset_table(tz)
+    result, elapsed = timed("UtcOffsetTable.to_local", args.lines, lambda: [table.to_local(value) for value in instants])
+    print(f"{'':<34}{legacy / elapsed:>13.1f}x")
+    if [value.replace(tzinfo=None) for value in result] != [value.replace(tzinfo=None) for value in expected]:
+        print("UtcOffsetTable.to_local: DIVERGENTE")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
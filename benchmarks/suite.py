@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""Suíte de benchmarks do Tarifador, com resultados em JSON.
+
+Gera uma base tarifária sintética (``core.synthetic.create_dataset``:
+organizações, empresas com tabelas de valores, centros de custo e setores,
+faixas de ramais, equipamentos e chamadas) no banco do settings (PostgreSQL)
+ou num SQLite local (``--sqlite``), um arquivo de syslog do SBC no formato do
+``Ingestor/syslog.txt`` com os mesmos ramais, e mede:
+
+* ``ingestor``: vazão do ``Ingestor/syslog_ingestor.py`` (TCP -> syslog_events),
+  com o syslog sintético enviado por uma conexão; só no PostgreSQL, com psycopg2;
+* ``etl``: ``SyslogImporter`` (scripts/sbc_syslog_etl.py) em lotes, num SQLite
+  temporário (ver ``benchmarks/syslog_import.py``);
+* ``sbc``: ``phonecalls.task_sbc.run_sbc_extension_analysis``;
+* ``pricing``: ``Phonecall.save`` com o pre_save (ramal, tabelas e preços);
+* ``views``: resumos e listas da empresa, da organização e do administrador;
+* ``exports``: relatórios CSV/XLSX/PDF;
+* ``filters``: ``PhonecallFilter`` com os filtros das telas de chamadas.
+
+Cada medida guarda o melhor tempo e a mediana de ``--repeat`` execuções (as
+views e exportações também o número de consultas e o tamanho da resposta). Um
+benchmark que não pode rodar neste ambiente vira ``{"skipped": motivo}``.
+
+A base é criada numa transação desfeita ao final; com ``--keep`` fica gravada
+e ``--reuse`` a usa de novo (prefixo ``benchmark``) sem gerar nada. Com
+``--compare`` os tempos são comparados aos de outro JSON (outro commit) e o
+script sai com 1 se algum piorou mais que ``--threshold``.
+
+Uso::
+
+    python benchmarks/suite.py --sqlite /tmp/tarifador.sqlite3 --calls 200000 --output base.json
+    python benchmarks/suite.py --calls 2000000 --keep --output base.json
+    python benchmarks/suite.py --reuse --only views exports --compare base.json --output novo.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+PREFIX = "benchmark"
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def timed(func: Callable, repeat: int) -> Dict[str, float]:
+    """Melhor tempo e mediana (ms) de ``repeat`` execuções; o último retorno vai junto"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = func()
+        runs.append((perf_counter() - start) * 1000)
+    measure = {"best_ms": round(min(runs), 2), "median_ms": round(median(runs), 2), "runs": repeat}
+    if isinstance(result, dict):
+        measure.update(result)
+    return measure
+
+
+def git_commit() -> Dict[str, object]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def configure_django(settings_module: str, sqlite: str | None, migrate: bool) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    from django.conf import settings
+    if sqlite:
+        settings.DATABASES["default"] = {"ENGINE": "django.db.backends.sqlite3", "NAME": sqlite}
+    import django
+    django.setup()
+    from django.test.utils import setup_test_environment
+    # ALLOWED_HOSTS com testserver para o Client
+    setup_test_environment()
+    if sqlite or migrate:
+        from django.core.management import call_command
+        call_command("migrate", verbosity=0)
+
+
+# ---------------------------------------------------------------- base sintética
+
+def create_dataset(args) -> Dict[str, object]:
+    from core.synthetic import create_dataset as create
+    from django.db import connection
+
+    start = perf_counter()
+    dataset = create(organizations=args.organizations, companies=args.companies, centers=args.centers,
+                     extensions=args.extensions, calls=args.calls, days=args.days, prefix=PREFIX,
+                     seed=args.seed)
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE phonecalls_phonecall")
+    dataset["elapsed"] = perf_counter() - start
+    return dataset
+
+
+def load_dataset() -> Dict[str, object]:
+    from centers.models import Company
+    from extensions.models import ExtensionLine
+    from organizations.models import Organization
+
+    organizations = list(Organization.objects.filter(slug__startswith=f"{PREFIX}-").order_by("pk"))
+    if not organizations:
+        raise SystemExit(f"Nenhuma organização {PREFIX}-*: gere a base com --keep antes de usar --reuse")
+    companies = list(Company.objects.filter(organization__in=organizations).select_related("organization")
+                     .order_by("pk"))
+    extensions: Dict[int, List] = {}
+    for line in ExtensionLine.objects.filter(company__in=companies).order_by("pk"):
+        extensions.setdefault(line.company_id, []).append(line)
+    return {"organizations": organizations, "companies": companies, "extensions": extensions, "elapsed": 0.0}
+
+
+def get_period(dataset) -> tuple:
+    from django.db.models import Max, Min
+    from phonecalls.models import Phonecall
+
+    period = Phonecall.objects.filter(organization__in=dataset["organizations"]) \
+        .aggregate(date_gt=Min("startdate"), date_lt=Max("startdate"))
+    return period["date_gt"], period["date_lt"]
+
+
+def get_client(dataset):
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+
+    user, _ = get_user_model().objects.get_or_create(
+        username=f"{PREFIX}-admin", defaults={"is_superuser": True, "is_staff": True})
+    for organization in dataset["organizations"]:
+        if not organization.is_member(user):
+            organization.add_user(user, is_admin=True)
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+# ---------------------------------------------------------------- benchmarks
+
+@benchmark("ingestor")
+def bench_ingestor(context, args):
+    from django.conf import settings
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        return {"ingestor": {"skipped": "syslog_events só no PostgreSQL"}}
+    try:
+        import psycopg2  # noqa: F401
+    except ImportError:
+        return {"ingestor": {"skipped": "psycopg2 não instalado (Ingestor/requirements-ingestor.txt)"}}
+
+    database = settings.DATABASES["default"]
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    env = dict(os.environ, PGHOST=str(database.get("HOST") or "localhost"), PGPORT=str(database.get("PORT") or 5432),
+               PGDATABASE=database["NAME"], PGUSER=database.get("USER", ""), PGPASSWORD=database.get("PASSWORD", ""))
+    command = [sys.executable, str(ROOT / "Ingestor" / "syslog_ingestor.py"), "--listen-host", "127.0.0.1",
+               "--tcp-port", str(port), "--no-udp", "--batch-size", str(args.batch_size)]
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        sock = None
+        deadline = time.monotonic() + 15
+        while sock is None:
+            try:
+                sock = socket.create_connection(("127.0.0.1", port), timeout=1)
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    return {"ingestor": {"skipped": f"ingestor não subiu: {process.stderr.read().decode()[-300:]}"}}
+                time.sleep(0.1)
+        lines = sum(1 for line in context["syslog"].open("rb") if line.strip())
+        src_addr = "%s:%d" % sock.getsockname()[:2]
+        start = perf_counter()
+        with sock, context["syslog"].open("rb") as handle:
+            sock.sendfile(handle)
+        sent = perf_counter() - start
+        stored = 0
+        with connection.cursor() as cursor:
+            deadline = time.monotonic() + max(60, lines / 1000)
+            while stored < lines and time.monotonic() < deadline:
+                time.sleep(0.05)
+                cursor.execute("SELECT count(*) FROM syslog_events WHERE src_addr = %s", [src_addr])
+                stored = cursor.fetchone()[0]
+            elapsed = perf_counter() - start
+            cursor.execute("DELETE FROM syslog_events WHERE src_addr = %s", [src_addr])
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return {"ingestor": {"lines": lines, "stored": stored, "send_s": round(sent, 3), "elapsed_s": round(elapsed, 3),
+                         "lines_per_s": round(stored / elapsed)}}
+
+
+@benchmark("etl")
+def bench_etl(context, args):
+    from syslog_import import create_database, run_import
+
+    template = context["workdir"] / "etl.sqlite3"
+    create_database(template, context["extension_numbers"], args.etl_existing)
+    results = {}
+    for name, batch_size in (("lines", 0), ("batched", args.batch_size)):
+        runs = []
+        for _ in range(args.repeat):
+            database = context["workdir"] / f"etl-{batch_size}.sqlite3"
+            shutil.copy(template, database)
+            stats, elapsed, _ = run_import(database, context["syslog"], batch_size, False)
+            runs.append(elapsed * 1000)
+        results[f"etl.{name}"] = {"best_ms": round(min(runs), 2), "median_ms": round(median(runs), 2),
+                                  "runs": args.repeat, "lines_per_s": round(args.syslog_lines / (min(runs) / 1000)),
+                                  "stats": stats.as_message()}
+    return results
+
+
+@benchmark("sbc")
+def bench_sbc(context, args):
+    from django.db import transaction
+    try:
+        from phonecalls.task_sbc import run_sbc_extension_analysis
+    except Exception as err:  # modelos do SBC (SbcPhonecall, voip) fora desta árvore
+        return {"sbc.extension_analysis": {"skipped": f"{type(err).__name__}: {err}"}}
+
+    def run():
+        with transaction.atomic():
+            message = run_sbc_extension_analysis()
+            transaction.set_rollback(True)
+        return {"message": message}
+    return {"sbc.extension_analysis": timed(run, args.repeat)}
+
+
+@benchmark("pricing")
+def bench_pricing(context, args):
+    import random
+    from core.synthetic import make_phonecall
+    from django.db import transaction
+
+    rnd = random.Random(args.seed)
+    companies = context["dataset"]["companies"]
+    extensions = context["dataset"]["extensions"]
+    date_gt = context["date_gt"]
+
+    def run():
+        phonecalls = []
+        for i in range(args.pricing_calls):
+            company = companies[i % len(companies)]
+            phonecall = make_phonecall(company.organization, company, date_gt, rnd,
+                                       rnd.choice(extensions[company.pk]))
+            phonecalls.append(phonecall)
+        with transaction.atomic():
+            start = perf_counter()
+            for phonecall in phonecalls:
+                phonecall.save()
+            elapsed = perf_counter() - start
+            transaction.set_rollback(True)
+        return {"calls": args.pricing_calls, "calls_per_s": round(args.pricing_calls / elapsed)}
+    return {"pricing.pre_save": timed(run, args.repeat)}
+
+
+def get_views(context, exports: bool):
+    organization = context["dataset"]["organizations"][0]
+    company = context["dataset"]["companies"][0]
+    org = {"org_slug": organization.slug}
+    com = {"org_slug": organization.slug, "company_slug": company.slug}
+    if not exports:
+        return [
+            ("company_list", "phonecalls:list", com),
+            ("company_resume", "phonecalls:resume", com),
+            ("org_list", "phonecalls:org_phonecall_list", org),
+            ("org_resume", "phonecalls:org_phonecall_resume", org),
+            ("org_ust", "phonecalls:org_phonecall_ust", org),
+            ("adm_list", "adm_phonecall_list", {}),
+            ("adm_resume", "adm_phonecall_resume", {}),
+            ("adm_ust", "adm_phonecall_ust", {}),
+        ]
+    return [
+        ("company_csv", "phonecalls:report_csv", com),
+        ("company_xlsx", "phonecalls:report_xlsx", com),
+        ("company_pdf", "phonecalls:report_pdf", com),
+        ("org_csv", "phonecalls:org_phonecall_report_csv", org),
+        ("org_xlsx", "phonecalls:org_phonecall_report_xlsx", org),
+        ("org_resume_xlsx", "phonecalls:org_phonecall_resume_report_xlsx", org),
+        ("org_resume_pdf", "phonecalls:org_phonecall_resume_report_pdf", org),
+        ("org_ust_resume_pdf", "phonecalls:org_phonecall_ust_resume_report_pdf", org),
+        ("adm_csv", "adm_phonecall_report_csv", {}),
+        ("adm_resume_pdf", "adm_phonecall_resume_report_pdf", {}),
+    ]
+
+
+def request_views(context, args, exports: bool):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.urls import reverse
+
+    params = {"date_gt": context["date_gt"].isoformat(), "date_lt": context["date_lt"].isoformat()}
+    client = context["client"]
+    group = "exports" if exports else "views"
+    results = {}
+
+    def get(url):
+        response = client.get(url, params)
+        size = sum(len(chunk) for chunk in response.streaming_content) if response.streaming \
+            else len(response.content)
+        response.close()
+        return {"status": response.status_code, "bytes": size}
+
+    for name, url_name, kwargs in get_views(context, exports):
+        url = reverse(url_name, kwargs=kwargs)
+        try:
+            # primeira requisição (aquece caches) conta as consultas
+            with CaptureQueriesContext(connection) as queries:
+                first = get(url)
+            measure = timed(lambda: get(url), args.repeat)
+        except Exception as err:
+            results[f"{group}.{name}"] = {"skipped": f"{type(err).__name__}: {err}"}
+            continue
+        measure["queries"] = len(queries)
+        if first["status"] != 200:
+            measure["skipped"] = f"HTTP {first['status']}"
+        results[f"{group}.{name}"] = measure
+    return results
+
+
+@benchmark("views")
+def bench_views(context, args):
+    return request_views(context, args, exports=False)
+
+
+@benchmark("exports")
+def bench_exports(context, args):
+    return request_views(context, args, exports=True)
+
+
+@benchmark("filters")
+def bench_filters(context, args):
+    from phonecalls.constants import OUTBOUND_CHARGED
+    from phonecalls.filters import PhonecallFilter
+    from phonecalls.models import Phonecall
+
+    organization = context["dataset"]["organizations"][0]
+    company = context["dataset"]["companies"][0]
+    extension = context["dataset"]["extensions"][company.pk][0].extension
+    period = {"date_gt": context["date_gt"].isoformat(), "date_lt": context["date_lt"].isoformat()}
+    cases = [
+        ("period", {}),
+        ("organization", {"organization": organization.slug}),
+        ("company_outbound", {"company": company.slug, "bound": OUTBOUND_CHARGED}),
+        ("ddd", {"organization": organization.slug, "ddd": "11"}),
+        ("extension_range", {"organization": organization.slug, "extension": f"{extension}-{int(extension) + 20}"}),
+        ("search", {"organization": organization.slug, "search": extension[-5:]}),
+    ]
+    results = {}
+    for name, data in cases:
+        def run(data=dict(period, **data)):
+            return {"rows": PhonecallFilter(data, queryset=Phonecall.objects.all()).qs.count()}
+        results[f"filters.{name}"] = timed(run, args.repeat)
+    return results
+
+
+# ---------------------------------------------------------------- comparação
+
+def compare(previous: dict, current: dict, threshold: float) -> int:
+    regressions = 0
+    print(f"\n{'medida':<36}{'antes (ms)':>12}{'agora (ms)':>12}{'razão':>9}")
+    for name, measure in current["results"].items():
+        before = previous.get("results", {}).get(name, {})
+        if "best_ms" not in measure or "best_ms" not in before or not before["best_ms"]:
+            continue
+        ratio = measure["best_ms"] / before["best_ms"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions += 1
+            flag = "  PIOROU"
+        print(f"{name:<36}{before['best_ms']:>12.1f}{measure['best_ms']:>12.1f}{ratio:>9.2f}{flag}")
+    print(f"{regressions} medidas pioraram mais que {threshold:.0%} "
+          f"(antes: {previous.get('meta', {}).get('commit')})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--settings", default="TestDjango2.settings")
+    parser.add_argument("--sqlite", help="Banco SQLite local (criado e migrado) no lugar do banco do settings")
+    parser.add_argument("--migrate", action="store_true", help="Aplica as migrações no banco do settings")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--organizations", type=int, default=2)
+    parser.add_argument("--companies", type=int, default=10, help="Empresas por organização")
+    parser.add_argument("--centers", type=int, default=3, help="Centros de custo por empresa")
+    parser.add_argument("--extensions", type=int, default=50, help="Ramais por empresa")
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--syslog-lines", type=int, default=100_000)
+    parser.add_argument("--syslog-output", help="Guarda o syslog sintético neste arquivo")
+    parser.add_argument("--etl-existing", type=int, default=50_000, help="Chamadas já gravadas no banco do ETL")
+    parser.add_argument("--pricing-calls", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="Grava a base sintética (para --reuse)")
+    parser.add_argument("--reuse", action="store_true", help="Usa a base gravada com --keep")
+    parser.add_argument("--output", help="Arquivo JSON dos resultados (padrão: stdout)")
+    parser.add_argument("--compare", help="JSON de outro commit para comparar")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Piora tolerada no --compare")
+    args = parser.parse_args()
+
+    configure_django(args.settings, args.sqlite, args.migrate)
+    from django.db import connection, transaction
+    import django
+
+    from syslog_corpus import write_syslog_file
+
+    workdir = Path(tempfile.mkdtemp(prefix="tarifador_bench_"))
+    report = {
+        "meta": dict(git_commit(), created=datetime.now().isoformat(timespec="seconds"),
+                     python=platform.python_version(), django=django.get_version(), database=connection.vendor,
+                     host=platform.node(), cpus=os.cpu_count(),
+                     dataset={key: getattr(args, key) for key in (
+                         "organizations", "companies", "centers", "extensions", "calls", "days",
+                         "syslog_lines", "seed")}, repeat=args.repeat, reuse=args.reuse),
+        "results": {},
+    }
+    try:
+        with transaction.atomic():
+            dataset = load_dataset() if args.reuse else create_dataset(args)
+            report["results"]["dataset"] = {"elapsed_s": round(dataset["elapsed"], 2)}
+            date_gt, date_lt = get_period(dataset)
+            extension_numbers = [line.extension for lines in dataset["extensions"].values() for line in lines]
+            syslog = Path(args.syslog_output) if args.syslog_output else workdir / "syslog.txt"
+            write_syslog_file(syslog, args.syslog_lines, extension_numbers, seed=args.seed)
+            context = {"dataset": dataset, "date_gt": date_gt, "date_lt": date_lt, "workdir": workdir,
+                       "syslog": syslog, "extension_numbers": extension_numbers, "client": get_client(dataset)}
+            for name in args.only:
+                print(f"[{name}]", file=sys.stderr)
+                report["results"].update(BENCHMARKS[name](context, args))
+            # dados sintéticos só ficam gravados com --keep
+            transaction.set_rollback(not args.keep)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        return 1 if compare(previous, report, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Corpus sintético de linhas do syslog do SBC para os benchmarks.
+
+As linhas seguem o layout real do evento ``CALL_END`` (34+ colunas separadas
+por ``|``, timestamps ``HH:MM:SS.fff  UTC Ddd Mmm DD YYYY``) e são misturadas
+com outros eventos (``CALL_START``, ``CALL_CONNECT``) na proporção observada
+em ``Ingestor/syslog.txt``.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List
+
+DEFAULT_DDD = "85"
+EXTENSION_PREFIX = "3125"
+
+
+def extension_numbers(count: int) -> List[str]:
+    return [f"{EXTENSION_PREFIX}{i:04d}" for i in range(count)]
+
+
+def format_sbc_time(value: datetime) -> str:
+    return f"{value:%H:%M:%S}.{value.microsecond // 1000:03d}  UTC {value:%a %b %d %Y}"
+
+
+def make_call_end(rnd: random.Random, sequence: int, when: datetime, extension: str, leg: str = "RMT") -> str:
+    setup = when
+    connect = setup + timedelta(seconds=rnd.randint(1, 20), milliseconds=rnd.randint(0, 999))
+    end = connect + timedelta(seconds=rnd.randint(0, 900), milliseconds=rnd.randint(0, 999))
+    call_id = f"{rnd.getrandbits(64)}{sequence}@179.131.10.48"
+    remote = f"+55{DEFAULT_DDD}9{rnd.randint(80000000, 99999999)}"
+    local = f"{DEFAULT_DDD}{extension}"
+    if rnd.random() < 0.5:
+        from_uri, to_uri = f"{remote}@179.131.10.48", f"{local}@trunk1.seatic.com.br"
+    else:
+        from_uri, to_uri = f"{local}@trunk1.seatic.com.br", f"{remote}@179.131.10.48"
+    columns = [
+        f"{end:%H:%M:%S}.{end.microsecond // 1000:03d}  172.20.25.47  local1.notice  [S={sequence}] ",
+        "CALL_END        ", "SBC       ", f"{call_id:<63}", f"b77740:15:{sequence:<14}",
+        f"{leg}  ", "179.131.10.48       ", "56959        ", "54.232.195.2        ", "2998       ",
+        "TLS             ", f"{from_uri:<40} ", f"{from_uri:<40} ", f"{to_uri:<40} ", f"{to_uri:<40} ",
+        f"{rnd.choice((16, 17, 19, 167)):<8}", "LCL  ", "GWAPP_NORMAL_CALL_CLEAR                 ",
+        "NORMAL_CALL_CLEAR", f"{format_sbc_time(setup)}  ", f"{format_sbc_time(connect)}  ",
+        f"{format_sbc_time(end)}  ", "-1             ", " " * 41, " " * 41, "24             ",
+        "SBC-VIVO                        ", "SEATIC-AWS                      ", "SBC-VIVO                        ",
+        "SBC-VIVO                        ", "SRTP                            ", "SBC-VIVO                        ",
+        "no         ", "BYE         ", " " * 30, " " * 51, " " * 37, "Normal  ", "1    ", " " * 25,
+    ]
+    return "|".join(columns)
+
+
+def make_other_event(rnd: random.Random, sequence: int, when: datetime) -> str:
+    event = rnd.choice(("CALL_START      ", "CALL_CONNECT    "))
+    return (f"{when:%H:%M:%S}.{when.microsecond // 1000:03d}  172.20.25.47  local1.notice  "
+            f"[S={sequence}] |{event}|SBC       |{rnd.getrandbits(64)}@172.20.25.46|RMT  |")
+
+
+def iter_syslog_lines(count: int, extensions: List[str], start: datetime = None,
+                      call_end_ratio: float = 0.6, seed: int = 0) -> Iterator[str]:
+    """``count`` linhas (com ``\\n``), ~``call_end_ratio`` delas CALL_END."""
+    rnd = random.Random(seed)
+    when = start or datetime(2025, 9, 1, 8, 0, 0)
+    for sequence in range(count):
+        when += timedelta(milliseconds=rnd.randint(10, 2000))
+        if rnd.random() < call_end_ratio:
+            yield make_call_end(rnd, sequence, when, rnd.choice(extensions), rnd.choice(("RMT", "LCL"))) + "\n"
+        else:
+            yield make_other_event(rnd, sequence, when) + "\n"
+
+
+def write_syslog_file(path: Path, count: int, extensions: List[str], **kwargs) -> Path:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.writelines(iter_syslog_lines(count, extensions, **kwargs))
+    return path
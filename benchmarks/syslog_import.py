@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark do ``SyslogImporter`` (scripts/sbc_syslog_etl.py).
+
+Cria um banco SQLite temporário com o subconjunto do schema usado pelo
+importador (ramais, preços, chamadas já existentes), gera um arquivo de
+syslog sintético e importa o mesmo arquivo linha a linha e em lotes,
+imprimindo linhas por segundo e o pico de memória de cada modo (``--trace-memory``).
+
+Uso::
+
+    python benchmarks/syslog_import.py --lines 200000 --existing 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+import zlib
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sbc_syslog_etl import SyslogImporter, iter_lines_from_path  # noqa: E402
+from syslog_corpus import DEFAULT_DDD, extension_numbers, write_syslog_file  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE accounts_organizationsetting (id integer PRIMARY KEY, organization_id integer, call_pricetable_id integer);
+CREATE TABLE centers_company (id integer PRIMARY KEY, call_pricetable_id integer);
+CREATE TABLE extensions_extensionline (id integer PRIMARY KEY, extension varchar(50), organization_id integer,
+    company_id integer, center_id integer, sector_id integer);
+CREATE TABLE phonecalls_price (id integer PRIMARY KEY, table_id integer, calltype integer, value decimal, status integer);
+CREATE TABLE phonecalls_phonecall (
+    id integer PRIMARY KEY AUTOINCREMENT, created datetime, modified datetime, pabx integer, inbound bool,
+    internal bool, calltype integer, service integer, description varchar(600), price decimal, org_price decimal,
+    billedamount decimal, org_billedamount decimal, billedtime integer, md_phonecall_id integer, startdate date,
+    starttime time, stopdate date, stoptime time, duration integer, chargednumber varchar(30),
+    connectednumber varchar(30), dialednumber varchar(30), charged_ddd varchar(2), dialed_ddd varchar(2),
+    conditioncode integer, center_id integer, company_id integer, extension_id integer, org_price_table_id integer,
+    organization_id integer, price_table_id integer, sector_id integer);
+CREATE INDEX phonecalls_date_idx ON phonecalls_phonecall (startdate DESC);
+"""
+
+
+def create_database(path: Path, extensions, existing: int) -> None:
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA)
+    conn.execute("INSERT INTO accounts_organizationsetting VALUES (1, 1, 1)")
+    conn.execute("INSERT INTO centers_company VALUES (1, 2)")
+    for table_id in (1, 2):
+        conn.executemany(
+            "INSERT INTO phonecalls_price (table_id, calltype, value, status) VALUES (?, ?, '0.1', 1)",
+            [(table_id, calltype) for calltype in range(1, 10)])
+    conn.executemany(
+        "INSERT INTO extensions_extensionline (extension, organization_id, company_id) VALUES (?, 1, 1)",
+        [(extension,) for extension in extensions])
+    rnd = random.Random(1)
+    day = date(2025, 9, 1)
+    conn.executemany(
+        "INSERT INTO phonecalls_phonecall (md_phonecall_id, startdate) VALUES (?, ?)",
+        [(zlib.crc32(f"existing-{i}".encode()) & 0xFFFFFFFF,
+          (day + timedelta(days=rnd.randrange(30))).isoformat()) for i in range(existing)])
+    conn.commit()
+    conn.close()
+
+
+def run_import(database: Path, syslog: Path, batch_size: int, trace_memory: bool):
+    conn = sqlite3.connect(str(database))
+    peak = 0
+    try:
+        importer = SyslogImporter(conn, DEFAULT_DDD, "America/Fortaleza")
+        if trace_memory:
+            # tracemalloc deixa a importação bem mais lenta: o tempo só vale sem ele
+            tracemalloc.start()
+        start = perf_counter()
+        stats = importer.import_lines(iter_lines_from_path(syslog, "utf-8"), "ANY", False, batch_size=batch_size)
+        elapsed = perf_counter() - start
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        conn.close()
+    return stats, elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--existing", type=int, default=50_000, help="Chamadas já gravadas no banco")
+    parser.add_argument("--extensions", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--trace-memory", action="store_true", help="Mede o pico de memória (tracemalloc)")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="syslog_import_"))
+    try:
+        extensions = extension_numbers(args.extensions)
+        template = workdir / "template.sqlite3"
+        create_database(template, extensions, args.existing)
+        syslog = write_syslog_file(workdir / "syslog.txt", args.lines, extensions)
+
+        print(f"{args.lines} linhas, {args.existing} chamadas existentes")
+        print(f"{'modo':<22}{'linhas/s':>12}{'tempo (s)':>12}{'pico (MB)':>12}  resultado")
+        for name, batch_size in (("linha a linha", 0), (f"lotes de {args.batch_size}", args.batch_size)):
+            database = workdir / f"{batch_size}.sqlite3"
+            shutil.copy(template, database)
+            stats, elapsed, peak = run_import(database, syslog, batch_size, args.trace_memory)
+            memory = f"{peak / 2 ** 20:.1f}" if args.trace_memory else "-"
+            print(f"{name:<22}{args.lines / elapsed:>12.0f}{elapsed:>12.2f}{memory:>12}  {stats.as_message()}")
+    finally:
+        shutil.rmtree(workdir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
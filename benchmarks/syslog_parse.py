@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark da interpretação de arquivos de syslog (scripts/sbc_syslog_etl.py).
+
+Gera um arquivo sintético e compara a leitura linha a linha
+(``iter_lines_from_path`` + ``parse_call_end_line``) com o modo paralelo
+(``iter_call_end_records_parallel``) para cada quantidade de processos,
+conferindo que os registros saem iguais e na mesma ordem.
+
+Uso::
+
+    python benchmarks/syslog_parse.py --lines 1000000 --workers 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sbc_syslog_etl import iter_call_end_records_parallel  # noqa: E402
+from sbc_syslog_etl import iter_lines_from_path, parse_call_end_line  # noqa: E402
+from syslog_corpus import extension_numbers, write_syslog_file  # noqa: E402
+
+TIMEZONE = "America/Fortaleza"
+
+
+def parse_sequential(path: Path):
+    tz = ZoneInfo(TIMEZONE)
+    records = (parse_call_end_line(line, tz) for line in iter_lines_from_path(path, "utf-8"))
+    return [record for record in records if record is not None]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--chunk-size", type=int, default=4 * 1024 * 1024)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="syslog_parse_"))
+    try:
+        syslog = write_syslog_file(workdir / "syslog.txt", args.lines, extension_numbers(500))
+        size = syslog.stat().st_size / 2 ** 20
+        print(f"{args.lines} linhas ({size:.0f} MB)")
+        print(f"{'modo':<22}{'linhas/s':>12}{'tempo (s)':>12}{'CALL_END':>10}")
+
+        start = perf_counter()
+        expected = parse_sequential(syslog)
+        elapsed = perf_counter() - start
+        print(f"{'linha a linha':<22}{args.lines / elapsed:>12.0f}{elapsed:>12.2f}{len(expected):>10}")
+
+        for workers in args.workers:
+            start = perf_counter()
+            records = list(iter_call_end_records_parallel(syslog, "utf-8", TIMEZONE, workers, args.chunk_size))
+            elapsed = perf_counter() - start
+            status = "" if records == expected else "  DIVERGENTE"
+            print(f"{f'{workers} processos':<22}{args.lines / elapsed:>12.0f}{elapsed:>12.2f}{len(records):>10}{status}")
+    finally:
+        shutil.rmtree(workdir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""
+    Cache versionado, por organização, das listas de empresas, centros de custo e
+    setores usadas nos filtros das páginas (OrganizationContextMixin/CompanyContextMixin)
+    A versão muda no post_save/post_delete de Company, Center e Sector (centers.models),
+    então as entradas antigas simplesmente deixam de ser lidas
+    As listas ficam no cache local do processo (CACHES['default']) e a versão no cache
+    compartilhado (CACHES['shared']: Redis ou banco), lido por todos os processos: cada
+    requisição consulta só a versão e a troca de versão vale para todos os workers
+"""
+
+# python
+import time
+
+# django
+from django.core.cache import cache
+from django.core.cache import caches
+
+# local
+from .models import Center
+from .models import Company
+from .models import Sector
+
+CHOICES_TIMEOUT = 60 * 60 * 24
+
+
+def get_version_key(organization_id):
+    return f'centers:choices:{organization_id}:version'
+
+
+def get_choices_version(organization_id):
+    shared = caches['shared']
+    key = get_version_key(organization_id)
+    version = shared.get(key)
+    if version is None:
+        # versão nova (e não um contador) para nunca reaproveitar entradas antigas
+        shared.add(key, time.time_ns(), None)
+        version = shared.get(key)
+    return version
+
+
+def invalidate_choices(organization_id):
+    caches['shared'].set(get_version_key(organization_id), time.time_ns(), None)
+
+
+def build_organization_choices(organization_id):
+    """
+        {
+            'companies': {slug: company_id},
+            'company_choices': [(slug, name), ...],  # empresas ativas
+            'centers': {center_id: company_id},
+            'center_choices': {company_id: [(center_id, name), ...]},
+            'sectors': {sector_id: (company_id, center_id)},
+            'sector_choices': {center_id: [(sector_id, name), ...]},
+        }
+    """
+    choices = {
+        'companies': {},
+        'company_choices': [],
+        'centers': {},
+        'center_choices': {},
+        'sectors': {},
+        'sector_choices': {},
+    }
+    for company in Company.objects.filter(organization_id=organization_id).order_by('pk').only('slug', 'name', 'status'):
+        choices['companies'][company.slug] = company.id
+        if company.status == Company.ACTIVE_STATUS:
+            choices['company_choices'].append((company.slug, company.name))
+    for center in Center.objects.filter(organization_id=organization_id).order_by('pk').only('company', 'name'):
+        choices['centers'][center.id] = center.company_id
+        choices['center_choices'].setdefault(center.company_id, []).append((center.id, center.name))
+    for sector in Sector.objects.filter(organization_id=organization_id).order_by('pk').only('company', 'center', 'name'):
+        choices['sectors'][sector.id] = (sector.company_id, sector.center_id)
+        choices['sector_choices'].setdefault(sector.center_id, []).append((sector.id, sector.name))
+    return choices
+
+
+def get_organization_choices(organization_id):
+    key = f'centers:choices:{organization_id}:{get_choices_version(organization_id)}'
+    choices = cache.get(key)
+    if choices is None:
+        choices = build_organization_choices(organization_id)
+        cache.set(key, choices, CHOICES_TIMEOUT)
+    return choices
+
+
+def get_choice_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_selection(choices, company_slug=None, center=None, sector=None, company_id=None):
+    """
+        Empresa e centro de custo selecionados nos filtros (ids), como nas consultas
+        anteriores: o setor define empresa e centro, o centro define a empresa
+        company_id restringe centros e setores a uma empresa (CompanyContextMixin)
+    """
+    selected_company = choices['companies'].get(company_slug) if company_slug else company_id
+    selected_center = None
+
+    center = get_choice_id(center)
+    if center in choices['centers'] and company_id in (None, choices['centers'][center]):
+        selected_center = center
+        selected_company = choices['centers'][center]
+
+    sector = get_choice_id(sector)
+    if sector in choices['sectors'] and company_id in (None, choices['sectors'][sector][0]):
+        selected_company, selected_center = choices['sectors'][sector]
+    return selected_company, selected_center
@@ -12,6 +12,7 @@ from organizations.views.mixins import MembershipRequiredMixin
 
 # project
 from accounts.mixins import OrganizationMixin
+from core.pagination import PAGINATION_PARAMS
 from core.utils import get_range_date
 from phonecalls.constants import CALLTYPE_CHOICES
 from phonecalls.constants import DDD_CHOICES
@@ -19,9 +20,9 @@ from phonecalls.constants import PABX_CHOICES
 from phonecalls.constants import SERVICE_CHOICES
 
 # local
+from .choices import get_organization_choices
+from .choices import get_selection
 from .models import Company
-from .utils import get_center_choices
-from .utils import get_sector_choices
 
 
 class CompanyMixin(OrganizationMixin, MembershipRequiredMixin):
@@ -38,7 +39,8 @@ class CompanyMixin(OrganizationMixin, MembershipRequiredMixin):
 class CompanyContextMixin(object):
 
     def dispatch(self, request, *args, **kwargs):
-        self.params = {key: value for key, value in self.request.GET.items() if key != 'page' and value}
+        self.params = {key: value for key, value in self.request.GET.items()
+                       if key not in PAGINATION_PARAMS and value}
         self.date_gt, self.date_lt = get_range_date(self.request.GET)
         if self.date_gt is None or self.date_lt is None:
             self.date_lt = date.today()
@@ -47,11 +49,9 @@ class CompanyContextMixin(object):
 
     def get_context_data(self, **kwargs):
         proportionality = self.params.get('proportionality')
-        center = self.company.center_set.filter(id=self.params.get('center')).first()
-        sector = self.company.sector_set.filter(id=self.params.get('sector')).first()
-
-        if sector:
-            center = sector.center
+        choices = get_organization_choices(self.company.organization_id)
+        _, center_id = get_selection(
+            choices, center=self.params.get('center'), sector=self.params.get('sector'), company_id=self.company.pk)
 
         kwargs.update({
             'urlencode': urllib.parse.urlencode(self.params),
@@ -62,8 +62,8 @@ class CompanyContextMixin(object):
             'service_choices': SERVICE_CHOICES,
             'pabx_choices': PABX_CHOICES,
             'ddd_choices': DDD_CHOICES,
-            'center_choices': get_center_choices(self.company),
-            'sector_choices': get_sector_choices(center)})
+            'center_choices': choices['center_choices'].get(self.company.pk, []),
+            'sector_choices': choices['sector_choices'].get(center_id, [])})
         return super().get_context_data(**kwargs)
 
 
@@ -1,6 +1,7 @@
 # django
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -206,3 +207,15 @@ def company_post_save(sender, instance, created, **kwargs):
             servicetype=BASIC_SERVICE)
         instance.service_pricetable = pricetable
         instance.save(update_fields=['service_pricetable'])
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_save, sender=Center)
+@receiver(post_delete, sender=Center)
+@receiver(post_save, sender=Sector)
+@receiver(post_delete, sender=Sector)
+def invalidate_organization_choices(sender, instance, **kwargs):
+    from .choices import invalidate_choices
+
+    invalidate_choices(instance.organization_id)
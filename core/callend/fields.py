@@ -0,0 +1,31 @@
+"""
+    Colunas da linha CALL_END do SBC (separadas por '|'), na ordem em que o SBC as envia
+    Ex.: "18:19:42.907  172.20.25.47  local1.notice  [S=70957] |CALL_END        |SBC       |..."
+"""
+
+PREFIX = 0               # "18:19:42.907  172.20.25.47  local1.notice  [S=70957] "
+EVENT = 1                # CALL_END
+ENDPOINT_TYPE = 2        # SBC
+CALL_ID = 3              # 18787669662292025181652@179.131.10.48
+SESSION_ID = 4           # b77740:15:18491131
+LEG = 5                  # RMT/LCL
+SRC_IP = 6
+SRC_PORT = 7
+DST_IP = 8
+DST_PORT = 9
+TRANSPORT = 10           # TLS/UDP/TCP
+SRC_URI = 11             # +5585982345900@179.131.10.48
+SRC_URI_BM = 12          # antes da manipulação
+DST_URI = 13             # 8531259999@trunk1.seatic.com.br
+DST_URI_BM = 14
+CAUSE = 15               # causa Q.850 (16 = normal)
+TERM_SIDE = 16           # RMT/LCL
+TERM_REASON = 17         # GWAPP_NORMAL_CALL_CLEAR
+TERM_CATEGORY = 18       # NORMAL_CALL_CLEAR / NO_ANSWER
+SETUP_TIME = 19          # "18:16:52.931  UTC Mon Sep 22 2025"
+CONNECT_TIME = 20        # pode vir vazio
+RELEASE_TIME = 21
+REDIRECT_REASON = 22     # "-1"
+SIP_METHOD = 33          # BYE
+
+CALL_END = 'CALL_END'
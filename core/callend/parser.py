@@ -0,0 +1,223 @@
+"""
+    Leitura das linhas do syslog do SBC compartilhada pelos consumidores de CALL_END
+    (scripts/sbc_syslog_etl.py, scripts/etl_sbc_syslog_to_db.py,
+    scripts/sbc_syslog_to_excel.py e Ingestor/syslog_ingestor.py)
+    Sem dependência do Django. A linha pode ser str ou bytes: o evento é conferido
+    antes de dividir a linha, a divisão vai só até as colunas usadas e, em bytes,
+    só as colunas lidas são decodificadas (CallEndRecord)
+    Quem lê o registro inteiro (mapeamentos dos ETLs) usa split_call_end: um split só
+    da linha é mais rápido que localizar as colunas uma a uma
+"""
+
+# project
+from core.sbc_time import parse_sbc_datetime
+from core.sbc_time import parse_sbc_utc
+
+# local
+from . import fields
+
+MAX_EVENT_TYPE_LENGTH = 64
+URI_SCHEMES = frozenset(('sip', 'sips', 'tel'))
+
+
+def column(index):
+    """ Propriedade de CallEndRecord para a coluna index (str, '' se ausente) """
+    return property(lambda self: self.field(index), doc=f'Coluna {index}')
+
+
+class CallEndRecord:
+    """
+        Uma linha do syslog do SBC, dividida e decodificada sob demanda
+        A linha é dividida (split em C) só até a coluna columns, ou até a coluna
+        pedida se for além; o restante fica em um único pedaço, sem criar strings
+        para as colunas que ninguém lê. Em bytes, só as colunas lidas são decodificadas
+    """
+
+    __slots__ = ('line', 'encoding', 'is_text', 'columns', 'parts', 'available')
+
+    def __init__(self, line, encoding='utf-8', columns=0):
+        self.line = line
+        self.encoding = encoding
+        self.is_text = isinstance(line, str)
+        self.columns = columns
+        self.parts = None
+        # quantas posições de parts são colunas (a seguinte, se houver, é o resto da linha)
+        self.available = 0
+
+    def __repr__(self):
+        return f'<CallEndRecord {self.event} {self.call_id}>'
+
+    def split(self, index):
+        # primeira vez: até columns (ou index); depois disso, a linha toda
+        limit = max(index, self.columns) + 1 if self.parts is None else -1
+        parts = self.line.split('|' if self.is_text else b'|', limit)
+        self.parts = parts
+        self.available = len(parts) if limit == -1 else min(len(parts), limit)
+        return parts
+
+    def has_field(self, index):
+        if index < self.available:
+            return True
+        if self.parts is not None and self.available == len(self.parts):
+            return False
+        return index < len(self.split(index))
+
+    def raw(self, index):
+        """ Coluna sem espaços nas pontas, ainda no tipo da linha (str ou bytes), ou None """
+        if not self.has_field(index):
+            return None
+        return self.parts[index].strip()
+
+    def field(self, index, default=''):
+        """ Coluna decodificada e sem espaços nas pontas (default se ausente) """
+        if index < self.available or self.has_field(index):
+            value = self.parts[index].strip()
+            return value if self.is_text else value.decode(self.encoding)
+        return default
+
+    def values(self, indexes, default=''):
+        """ Várias colunas de uma vez, como field (um laço só, para quem lê muitas colunas) """
+        self.has_field(max(indexes))
+        parts, available = self.parts, self.available
+        if self.is_text:
+            return [parts[index].strip() if index < available else default for index in indexes]
+        encoding = self.encoding
+        return [parts[index].strip().decode(encoding) if index < available else default for index in indexes]
+
+    @property
+    def is_call_end(self):
+        event = self.raw(fields.EVENT)
+        if event is None:
+            return False
+        return event.upper() == (fields.CALL_END if self.is_text else b'CALL_END')
+
+    @property
+    def sequence(self):
+        """ Número [S=xxxx] do prefixo do syslog (ordem do evento), ou None """
+        return prefix_sequence(self.raw(fields.PREFIX))
+
+    event = column(fields.EVENT)
+    endpoint_type = column(fields.ENDPOINT_TYPE)
+    call_id = column(fields.CALL_ID)
+    session_id = column(fields.SESSION_ID)
+    leg = column(fields.LEG)
+    src_ip = column(fields.SRC_IP)
+    src_port = column(fields.SRC_PORT)
+    dst_ip = column(fields.DST_IP)
+    dst_port = column(fields.DST_PORT)
+    transport = column(fields.TRANSPORT)
+    src_uri = column(fields.SRC_URI)
+    src_uri_bm = column(fields.SRC_URI_BM)
+    dst_uri = column(fields.DST_URI)
+    dst_uri_bm = column(fields.DST_URI_BM)
+    cause = column(fields.CAUSE)
+    term_side = column(fields.TERM_SIDE)
+    term_reason = column(fields.TERM_REASON)
+    term_category = column(fields.TERM_CATEGORY)
+    setup_time = column(fields.SETUP_TIME)
+    connect_time = column(fields.CONNECT_TIME)
+    release_time = column(fields.RELEASE_TIME)
+    redirect_reason = column(fields.REDIRECT_REASON)
+    sip_method = column(fields.SIP_METHOD)
+
+    def local_datetime(self, index, tz):
+        """ Data da coluna index no fuso tz (core.sbc_time), ou None """
+        return parse_sbc_datetime(self.field(index), tz)
+
+    def utc(self, index):
+        """ Data da coluna index em UTC (ingênua), ou None """
+        return parse_sbc_utc(self.field(index))
+
+    def duration_seconds(self):
+        """ Segundos entre a conexão e o fim da chamada (0 se não atendida ou sem datas) """
+        connect = self.utc(fields.CONNECT_TIME)
+        release = self.utc(fields.RELEASE_TIME)
+        if connect is None or release is None:
+            return 0
+        return max(0, int(round((release - connect).total_seconds())))
+
+
+def parse_call_end(line, encoding='utf-8', min_fields=fields.RELEASE_TIME + 1, columns=fields.SIP_METHOD + 1):
+    """
+        CallEndRecord se a linha for um CALL_END com ao menos min_fields colunas, senão None
+        O evento é conferido antes de dividir a linha (as demais linhas não geram strings);
+        columns é até onde o consumidor vai ler (o resto da linha não é dividido)
+    """
+    event = extract_event_type(line, encoding, decode=False)
+    if event is None or event.upper() != (fields.CALL_END if isinstance(line, str) else b'CALL_END'):
+        return None
+    record = CallEndRecord(line, encoding, max(columns, min_fields))
+    if not record.has_field(min_fields - 1):
+        return None
+    return record
+
+
+def split_call_end(line, encoding='utf-8', min_fields=fields.RELEASE_TIME + 1):
+    """
+        Todas as colunas (str, sem strip) se a linha for um CALL_END com ao menos min_fields
+        colunas, senão None
+        Para quem lê o registro inteiro: o evento é conferido com extract_event_type e a linha
+        é dividida com um único split (em C, mais rápido que localizar coluna a coluna)
+    """
+    event = extract_event_type(line, encoding, decode=False)
+    if event is None or event.upper() != (fields.CALL_END if isinstance(line, str) else b'CALL_END'):
+        return None
+    if not isinstance(line, str):
+        line = line.decode(encoding)
+    parts = line.rstrip('\r\n').split('|')
+    if len(parts) < min_fields:
+        return None
+    return parts
+
+
+def prefix_sequence(prefix):
+    """ Número [S=xxxx] do prefixo do syslog (str ou bytes), ou None """
+    marker, end_marker = ('[S=', ']') if isinstance(prefix, str) else (b'[S=', b']')
+    start = prefix.find(marker)
+    if start == -1:
+        return None
+    start += 3
+    end = prefix.find(end_marker, start)
+    if end == -1:
+        return None
+    value = prefix[start:end].strip()
+    return int(value) if value.isdigit() else None
+
+
+def extract_event_type(line, encoding='utf-8', decode=True):
+    """
+        Tipo do evento (coluna entre o primeiro e o segundo '|'), sem dividir a linha toda
+        Ex: "... |MEDIA_END|foo|bar" -> "MEDIA_END"; None se não houver ou for longo demais
+        Com decode=False, linhas em bytes devolvem bytes
+    """
+    text = isinstance(line, str)
+    separator = '|' if text else b'|'
+    # dois find em vez de split: nenhuma cópia do resto da linha
+    start = line.find(separator) + 1
+    if not start:
+        return None
+    end = line.find(separator, start)
+    if end < 0 or not 0 < end - start <= MAX_EVENT_TYPE_LENGTH:
+        return None
+    value = line[start:end].strip()
+    if text or not decode:
+        return value
+    return value.decode(encoding, errors='replace')
+
+
+def uri_user(uri):
+    """ Usuário/número de um URI SIP/TEL ('sip:+5585...@host;user=phone' -> '+5585...') """
+    if not uri:
+        return ''
+    value = uri.strip().strip('<>').strip('"').strip()
+    if not value:
+        return ''
+    if '@' in value:
+        value = value.split('@', 1)[0]
+    if ';' in value:
+        value = value.split(';', 1)[0]
+    if ':' in value:
+        prefix, rest = value.split(':', 1)
+        if prefix.lower() in URI_SCHEMES:
+            value = rest
+    return value.strip()
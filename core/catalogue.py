@@ -0,0 +1,253 @@
+"""
+    Catálogo por requisição
+    Carrega organizações (com configurações), empresas, tabelas de valores,
+    preços ativos e contratos uma única vez, sob demanda, e os serve por id/nome
+    para as views e geradores de relatório, evitando consultas dentro de laços
+    Nas views de organização/empresa o catálogo fica restrito à organização da
+    requisição (CatalogueMixin): a organização, as suas empresas e contratos, as
+    tabelas de valores dela, das suas empresas e as globais, e os preços dessas
+    tabelas. O que for pedido fora do escopo (ex.: empresa padrão por nome) é
+    buscado individualmente e guardado; as views da administração carregam tudo
+"""
+
+# python
+from collections import defaultdict
+from copy import copy
+
+# django
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+# third party
+from organizations.models import Organization
+
+# project
+from accounts.models import OrganizationSetting
+from centers.models import Company
+from Equipments.models import ContractBasicServices
+from phonecalls.models import Price
+from phonecalls.models import PriceTable
+
+
+class Catalogue(object):
+
+    def __init__(self, organization=None):
+        # None: todas as organizações (administração)
+        self.organization_id = organization.pk if organization is not None else None
+
+    # organizações
+
+    @cached_property
+    def _organizations(self):
+        organizations = Organization.objects.select_related('settings').order_by('pk')
+        if self.organization_id is not None:
+            organizations = organizations.filter(pk=self.organization_id)
+        return list(organizations)
+
+    @cached_property
+    def _organizations_by_id(self):
+        return {organization.pk: organization for organization in self._organizations}
+
+    @cached_property
+    def _organizations_by_name(self):
+        return {organization.name: organization for organization in self._organizations}
+
+    @cached_property
+    def _organizations_by_slug(self):
+        return {organization.slug: organization for organization in self._organizations}
+
+    def get_organizations(self):
+        return list(self._organizations)
+
+    def get_organization(self, pk=None, name=None, slug=None):
+        """ Equivalente a Organization.objects.get(...) """
+        if pk is not None:
+            organization = self._organizations_by_id.get(pk)
+        elif slug is not None:
+            organization = self._organizations_by_slug.get(slug)
+        else:
+            organization = self._organizations_by_name.get(name)
+        if organization is None and self.organization_id is not None:
+            organization = self.load_organization(pk=pk, slug=slug, name=name)
+        if organization is None:
+            raise Organization.DoesNotExist(f'Organização {pk or slug or name} não encontrada')
+        return organization
+
+    def load_organization(self, pk=None, name=None, slug=None):
+        """ Organização fora do escopo do catálogo, buscada e guardada """
+        lookup = {'pk': pk} if pk is not None else {'slug': slug} if slug is not None else {'name': name}
+        organization = Organization.objects.select_related('settings').filter(**lookup).first()
+        if organization is not None:
+            self._organizations_by_id[organization.pk] = organization
+            self._organizations_by_name.setdefault(organization.name, organization)
+            self._organizations_by_slug[organization.slug] = organization
+        return organization
+
+    def get_service_pricetable(self, organization):
+        return self.get_pricetable(organization.settings.service_pricetable_id)
+
+    def get_call_pricetable(self, organization):
+        return self.get_pricetable(organization.settings.call_pricetable_id)
+
+    # empresas
+
+    @cached_property
+    def _companies(self):
+        companies = Company.objects.order_by('pk')
+        if self.organization_id is not None:
+            companies = companies.filter(organization_id=self.organization_id)
+        return self.attach_organizations(list(companies))
+
+    def attach_organizations(self, companies):
+        for company in companies:
+            # reaproveita a organização já carregada (com settings)
+            if company.organization_id in self._organizations_by_id:
+                company.organization = self._organizations_by_id[company.organization_id]
+        return companies
+
+    @cached_property
+    def _companies_by_name(self):
+        companies = {}
+        for company in self._companies:
+            companies.setdefault(company.name, []).append(company)
+        return companies
+
+    def get_companies(self, organization=None, active=False):
+        """ Empresas (da organização), na ordem do id; active=True filtra pelo status """
+        return [company for company in self._companies
+                if (organization is None or company.organization_id == organization.pk) and
+                (not active or company.status == Company.ACTIVE_STATUS)]
+
+    def get_company(self, name=None, pk=None):
+        """ Equivalente a Company.objects.get(...) """
+        if pk is not None:
+            companies = [company for company in self._companies if company.pk == pk]
+        else:
+            companies = self._companies_by_name.get(name, [])
+        if not companies and self.organization_id is not None:
+            # fora da organização (ex.: empresa padrão de outra organização)
+            lookup = {'pk': pk} if pk is not None else {'name': name}
+            companies = self.attach_organizations(list(Company.objects.filter(**lookup).order_by('pk')[:2]))
+            if pk is None:
+                self._companies_by_name[name] = companies
+        if not companies:
+            raise Company.DoesNotExist(f'Empresa {pk or name} não encontrada')
+        if len(companies) > 1:
+            raise Company.MultipleObjectsReturned(f'Mais de uma empresa {name}')
+        return companies[0]
+
+    # tabelas de valores e preços
+
+    @cached_property
+    def _pricetables(self):
+        pricetables = PriceTable.objects.all()
+        if self.organization_id is not None:
+            companies = Company.objects.filter(organization_id=self.organization_id)
+            settings = OrganizationSetting.objects.filter(organization_id=self.organization_id)
+            pricetables = pricetables.filter(
+                Q(organization_id=self.organization_id) | Q(organization__isnull=True) |
+                Q(pk__in=companies.values('service_pricetable')) |
+                Q(pk__in=companies.values('call_pricetable')) |
+                Q(pk__in=companies.values('other_pricetable')) |
+                Q(pk__in=settings.values('service_pricetable')) |
+                Q(pk__in=settings.values('call_pricetable')) |
+                Q(pk__in=settings.values('other_pricetable')))
+        return {pricetable.pk: pricetable for pricetable in pricetables}
+
+    @cached_property
+    def _active_prices(self):
+        prices = defaultdict(list)
+        queryset = Price.objects.active().order_by('pk')
+        if self.organization_id is not None:
+            queryset = queryset.filter(table_id__in=list(self._pricetables))
+        for price in queryset:
+            prices[price.table_id].append(price)
+        return prices
+
+    def get_pricetable(self, pk=None, name=None):
+        if name is not None:
+            pricetables = [pricetable for pricetable in self._pricetables.values() if pricetable.name == name]
+            if not pricetables and self.organization_id is not None:
+                pricetables = [self.load_pricetable(PriceTable.objects.filter(name=name).order_by('pk').first())]
+            if not pricetables or pricetables[0] is None:
+                raise PriceTable.DoesNotExist(f'Tabela {name} não encontrada')
+            return pricetables[0]
+        if pk not in self._pricetables and pk is not None and self.organization_id is not None:
+            return self.load_pricetable(PriceTable.objects.filter(pk=pk).first())
+        return self._pricetables.get(pk)
+
+    def load_pricetable(self, pricetable):
+        """ Tabela fora do escopo do catálogo: guarda a tabela e os seus preços ativos """
+        if pricetable is not None and pricetable.pk not in self._pricetables:
+            self._pricetables[pricetable.pk] = pricetable
+            self._active_prices[pricetable.pk] = list(
+                Price.objects.active().filter(table_id=pricetable.pk).order_by('pk'))
+        return pricetable
+
+    def get_active_prices(self, pricetable, **lookup):
+        """
+            Preços ativos da tabela (objeto ou id), na ordem do id, filtrados por igualdade
+            Retorna cópias: as views alteram os objetos (basic_service) sem afetar o catálogo
+        """
+        if pricetable is None:
+            return []
+        table_id = pricetable if isinstance(pricetable, int) else pricetable.pk
+        if table_id not in self._pricetables and self.organization_id is not None:
+            self.get_pricetable(table_id)
+        return [copy(price) for price in self._active_prices.get(table_id, [])
+                if all(getattr(price, field) == value for field, value in lookup.items())]
+
+    def get_active_price(self, pricetable, **lookup):
+        """ Equivalente a pricetable.price_set.active().get(**lookup) """
+        prices = self.get_active_prices(pricetable, **lookup)
+        if not prices:
+            raise Price.DoesNotExist(f'Preço {lookup} não encontrado na tabela {pricetable}')
+        if len(prices) > 1:
+            raise Price.MultipleObjectsReturned(f'Mais de um preço {lookup} na tabela {pricetable}')
+        return prices[0]
+
+    def first_active_price(self, pricetable, **lookup):
+        """ Equivalente a pricetable.price_set.active().filter(**lookup).first() """
+        prices = self.get_active_prices(pricetable, **lookup)
+        return prices[0] if prices else None
+
+    # contratos
+
+    @cached_property
+    def _contracts(self):
+        contracts = defaultdict(list)
+        queryset = ContractBasicServices.objects.order_by('pk')
+        if self.organization_id is not None:
+            queryset = queryset.filter(organization_id=self.organization_id)
+        for contract in queryset:
+            contracts[contract.organization_id].append(contract)
+        return contracts
+
+    def get_contracts(self, organization):
+        """ Contratos da organização, na ordem do id """
+        if organization.pk not in self._contracts and self.organization_id not in (None, organization.pk):
+            self._contracts[organization.pk] = list(
+                ContractBasicServices.objects.filter(organization_id=organization.pk).order_by('pk'))
+        return list(self._contracts.get(organization.pk, []))
+
+
+def get_catalogue(request, organization=None):
+    """
+        Um catálogo por requisição, guardado no próprio request
+        organization restringe o catálogo à organização (views de organização/empresa)
+    """
+    if not hasattr(request, '_catalogue'):
+        request._catalogue = Catalogue(organization)
+    return request._catalogue
+
+
+class CatalogueMixin(object):
+
+    @cached_property
+    def catalogue(self):
+        # views de organização e de empresa têm self.organization; as da administração não
+        return get_catalogue(self.request, getattr(self, 'organization', None))
+
+    def get_context_data(self, **kwargs):
+        kwargs.setdefault('catalogue', self.catalogue)
+        return super().get_context_data(**kwargs)
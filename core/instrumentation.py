@@ -0,0 +1,324 @@
+"""
+    Instrumentação opcional das requisições (settings.REPORT_INSTRUMENTATION)
+    Para cada requisição: quantidade e tempo das consultas SQL (connection.execute_wrapper),
+    tempo montando o contexto (get_context_data), tempo gerando a resposta (PDF/XLSX/ZIP...)
+    e memória
+      - ReportInstrumentationMiddleware: mede a requisição; as lentas vão para o log com as
+        formas de consulta (SQL sem parâmetros) mais caras. Respostas em streaming (CSV)
+        são medidas até o fim do conteúdo, com as consultas feitas durante a iteração
+      - InstrumentedViewMixin: mede get_context_data e get das views (inclusive das subclasses)
+      - get_stats: agregados por view deste processo, expostos em core.views.InstrumentationView
+    Memória: só com REPORT_INSTRUMENTATION_TRACEMALLOC (bem mais lento), pico do tracemalloc
+    durante a requisição (MemoryTracker)
+"""
+
+# python
+import logging
+import re
+import threading
+import tracemalloc
+
+from collections import deque
+from contextlib import ExitStack
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+# django
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+SLOW_REQUEST_MS = 5000
+TOP_QUERIES = 5
+SLOW_REQUESTS_KEPT = 20
+# respostas cujo tempo fora do get_context_data é geração de arquivo
+RENDER_CONTENT_TYPES = ('application/pdf', 'application/vnd', 'application/octet-stream', 'text/csv')
+
+IN_LIST_RE = re.compile(r'\bIN \((?:%s, )*%s\)')
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+SPACE_RE = re.compile(r'\s+')
+
+_current_profile = ContextVar('report_instrumentation_profile', default=None)
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def query_shape(sql):
+    """ SQL sem valores: listas IN, literais e números viram '?' (agrupa as consultas repetidas) """
+    sql = IN_LIST_RE.sub('IN (?)', sql)
+    sql = STRING_RE.sub('?', sql)
+    sql = NUMBER_RE.sub('?', sql)
+    return SPACE_RE.sub(' ', sql).strip()
+
+
+class MemoryTracker(object):
+    """
+        Pico do tracemalloc acima da memória alocada no início da requisição
+        O tracemalloc fica ligado no processo todo; o pico só é zerado (reset_peak) quando
+        nenhuma outra requisição está sendo medida, então com requisições simultâneas o
+        valor é o pico do processo no período (um limite superior)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start(self):
+        with self.lock:
+            if self.active == 0:
+                tracemalloc.reset_peak()
+            self.active += 1
+            return tracemalloc.get_traced_memory()[0]
+
+    def stop(self, allocated):
+        with self.lock:
+            self.active -= 1
+            return max(tracemalloc.get_traced_memory()[1] - allocated, 0)
+
+
+class RequestProfile(object):
+    """ Medidas de uma requisição """
+
+    def __init__(self):
+        self.query_count = 0
+        self.query_time = 0.0
+        self.shapes = {}
+        self.phases = {}
+        self._depth = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - start
+            self.query_count += 1
+            self.query_time += elapsed
+            shape = self.shapes.setdefault(query_shape(sql), [0, 0.0])
+            shape[0] += 1
+            shape[1] += elapsed
+
+    def start_phase(self, name):
+        depth = self._depth.get(name, 0)
+        self._depth[name] = depth + 1
+        # só a chamada mais externa conta (super().get_context_data entre subclasses)
+        return perf_counter() if depth == 0 else None
+
+    def stop_phase(self, name, start):
+        self._depth[name] -= 1
+        if start is not None:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+    def top_queries(self, count):
+        """ [(forma, execuções, segundos), ...] das formas mais caras """
+        ranked = sorted(self.shapes.items(), key=lambda item: item[1][1], reverse=True)[:count]
+        return [(shape, executions, elapsed) for shape, (executions, elapsed) in ranked]
+
+
+def measure(name):
+    """ Decorador: soma o tempo do método à fase `name` da requisição instrumentada """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            profile = _current_profile.get()
+            if profile is None:
+                return method(*args, **kwargs)
+            start = profile.start_phase(name)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profile.stop_phase(name, start)
+        wrapper.instrumented_phase = name
+        return wrapper
+    return decorator
+
+
+class InstrumentedViewMixin(object):
+    """
+        get_context_data e get medidos, inclusive quando redefinidos nas subclasses
+        (sem requisição instrumentada, o custo é uma consulta ao ContextVar)
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attribute, phase in (('get_context_data', 'context'), ('get', 'view')):
+            method = getattr(cls, attribute, None)
+            if method is not None and getattr(method, 'instrumented_phase', None) != phase:
+                setattr(cls, attribute, measure(phase)(method))
+
+
+def record(view_name, summary):
+    with _stats_lock:
+        stats = _stats.setdefault(view_name, {
+            'requests': 0,
+            'slow_requests': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'queries': 0,
+            'max_queries': 0,
+            'query_ms': 0.0,
+            'context_ms': 0.0,
+            'render_ms': 0.0,
+            'max_memory_mb': None,
+            'shapes': {},
+            'slowest': deque(maxlen=SLOW_REQUESTS_KEPT),
+        })
+        stats['requests'] += 1
+        stats['total_ms'] += summary['total_ms']
+        stats['max_ms'] = max(stats['max_ms'], summary['total_ms'])
+        stats['queries'] += summary['queries']
+        stats['max_queries'] = max(stats['max_queries'], summary['queries'])
+        stats['query_ms'] += summary['query_ms']
+        stats['context_ms'] += summary['context_ms']
+        stats['render_ms'] += summary['render_ms']
+        if summary['memory_mb'] is not None:
+            stats['max_memory_mb'] = max(stats['max_memory_mb'] or 0.0, summary['memory_mb'])
+        for shape, executions, elapsed in summary['top_queries']:
+            total = stats['shapes'].setdefault(shape, [0, 0.0])
+            total[0] += executions
+            total[1] += elapsed * 1000
+        if summary['slow']:
+            stats['slow_requests'] += 1
+            stats['slowest'].append(summary)
+
+
+def get_stats(top=TOP_QUERIES):
+    """ Agregados por view (deste processo), com as médias e as formas de consulta mais caras """
+    result = {}
+    with _stats_lock:
+        for view_name, stats in _stats.items():
+            requests = stats['requests']
+            shapes = sorted(stats['shapes'].items(), key=lambda item: item[1][1], reverse=True)[:top]
+            result[view_name] = {
+                'requests': requests,
+                'slow_requests': stats['slow_requests'],
+                'avg_ms': round(stats['total_ms'] / requests, 1),
+                'max_ms': round(stats['max_ms'], 1),
+                'avg_queries': round(stats['queries'] / requests, 1),
+                'max_queries': stats['max_queries'],
+                'avg_query_ms': round(stats['query_ms'] / requests, 1),
+                'avg_context_ms': round(stats['context_ms'] / requests, 1),
+                'avg_render_ms': round(stats['render_ms'] / requests, 1),
+                'max_memory_mb': stats['max_memory_mb'],
+                'top_queries': [{'sql': shape, 'executions': executions, 'ms': round(elapsed, 1)}
+                                for shape, (executions, elapsed) in shapes],
+                'slowest': list(stats['slowest']),
+            }
+    return result
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+class ReportInstrumentationMiddleware(object):
+    """
+        Ligado por settings.REPORT_INSTRUMENTATION (fora disso o Django descarta o middleware)
+          - REPORT_INSTRUMENTATION_SLOW_MS: requisições mais lentas que isso vão para o log
+          - REPORT_INSTRUMENTATION_TOP: formas de consulta listadas por requisição lenta
+          - REPORT_INSTRUMENTATION_TRACEMALLOC: pico de memória pelo tracemalloc
+    """
+
+    def __init__(self, get_response):
+        if not get_setting('REPORT_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.slow_ms = get_setting('REPORT_INSTRUMENTATION_SLOW_MS', SLOW_REQUEST_MS)
+        self.top = get_setting('REPORT_INSTRUMENTATION_TOP', TOP_QUERIES)
+        self.memory = MemoryTracker() if get_setting('REPORT_INSTRUMENTATION_TRACEMALLOC', False) else None
+
+    @staticmethod
+    @contextmanager
+    def profiling(profile):
+        """ Consultas e fases dentro do bloco vão para `profile` """
+        token = _current_profile.set(profile)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                yield
+        finally:
+            _current_profile.reset(token)
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        allocated = self.memory.start() if self.memory is not None else None
+        start = perf_counter()
+        try:
+            with self.profiling(profile):
+                response = self.get_response(request)
+        except BaseException:
+            self.stop_memory(allocated)
+            raise
+        if response.streaming and not getattr(response, 'is_async', False):
+            response.streaming_content = self.stream(
+                request, response, profile, start, allocated, response.streaming_content)
+        else:
+            self.finish(request, response, profile, perf_counter() - start, self.stop_memory(allocated))
+        return response
+
+    def stop_memory(self, allocated):
+        return self.memory.stop(allocated) if self.memory is not None else None
+
+    def stream(self, request, response, profile, start, allocated, content):
+        """
+            Conteúdo em streaming: consultas e tempo de cada pedaço entram na requisição
+            (fase 'stream'); a medida termina quando o servidor esgota ou fecha o iterador
+        """
+        try:
+            while True:
+                with self.profiling(profile):
+                    phase = profile.start_phase('stream')
+                    try:
+                        chunk = next(content)
+                    except StopIteration:
+                        break
+                    finally:
+                        profile.stop_phase('stream', phase)
+                yield chunk
+        finally:
+            self.finish(request, response, profile, perf_counter() - start, self.stop_memory(allocated))
+
+    def finish(self, request, response, profile, total, memory):
+        match = getattr(request, 'resolver_match', None)
+        if match is None or match.view_name == 'instrumentation':
+            return
+        context = profile.phases.get('context', 0.0)
+        render = 0.0
+        if response.get('Content-Type', '').startswith(RENDER_CONTENT_TYPES):
+            render = max(profile.phases.get('view', 0.0) - context, 0.0) + profile.phases.get('stream', 0.0)
+        total_ms = total * 1000
+        summary = {
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'total_ms': round(total_ms, 1),
+            'queries': profile.query_count,
+            'query_ms': round(profile.query_time * 1000, 1),
+            'context_ms': round(context * 1000, 1),
+            'render_ms': round(render * 1000, 1),
+            'memory_mb': round(memory / 2 ** 20, 1) if memory is not None else None,
+            'top_queries': profile.top_queries(self.top),
+            'slow': total_ms >= self.slow_ms,
+        }
+        record(match.view_name, summary)
+        if summary['slow']:
+            memory = '' if summary['memory_mb'] is None else f", memória {summary['memory_mb']:.1f} MB"
+            logger.warning(
+                '%s %s: %.0f ms, %d consultas (%.0f ms), contexto %.0f ms, geração %.0f ms%s\n%s',
+                match.view_name, summary['path'], total_ms, profile.query_count, summary['query_ms'],
+                summary['context_ms'], summary['render_ms'], memory,
+                '\n'.join(f'  {executions}x {elapsed * 1000:.0f} ms: {shape[:500]}'
+                          for shape, executions, elapsed in summary['top_queries']))
@@ -0,0 +1,77 @@
+# python
+from datetime import datetime
+from datetime import timedelta
+from time import time
+
+# django
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+
+# project
+from phonecalls.models import Phonecall
+from phonecalls.utils import get_ddd
+
+
+class Command(BaseCommand):
+    help = 'Preenche charged_ddd/dialed_ddd das chamadas em lotes (keyset por id)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=5000)
+
+        parser.add_argument(
+            '--start-date', type=str, help='YYYY-MM-DD', required=False)
+
+        parser.add_argument(
+            '--stop-date', type=str, help='YYYY-MM-DD', required=False)
+
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Recalcula também as chamadas que já possuem DDD preenchido')
+
+    @staticmethod
+    def get_date(sdate):
+        if not sdate:
+            return None
+
+        try:
+            return datetime.strptime(sdate, '%Y-%m-%d').date()
+        except Exception as err:
+            raise CommandError(err)
+
+    @staticmethod
+    def time_format(time_start):
+        return timedelta(seconds=time() - time_start)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        start_date = self.get_date(options['start_date'])
+        stop_date = self.get_date(options['stop_date'])
+        time_start = time()
+
+        queryset = Phonecall.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(charged_ddd__isnull=True)
+        if start_date:
+            queryset = queryset.filter(startdate__gte=start_date)
+        if stop_date:
+            queryset = queryset.filter(startdate__lte=stop_date)
+        queryset = queryset.only('id', 'chargednumber', 'dialednumber').order_by('id')
+
+        call_count = 0
+        last_id = 0
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+            for instance in chunk:
+                instance.charged_ddd = get_ddd(instance.chargednumber)
+                instance.dialed_ddd = get_ddd(instance.dialednumber)
+            with transaction.atomic():
+                Phonecall.objects.bulk_update(chunk, ['charged_ddd', 'dialed_ddd'])
+            last_id = chunk[-1].id
+            call_count += len(chunk)
+            self.stdout.write(f'{call_count} chamadas atualizadas (id <= {last_id}) - '
+                              f'{self.time_format(time_start)}')
+        self.stdout.write(self.style.SUCCESS(f'{call_count} chamadas com DDD preenchido'))
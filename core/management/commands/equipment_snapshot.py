@@ -0,0 +1,69 @@
+# python
+from datetime import date
+from datetime import datetime
+
+# django
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+# project
+from core.partitions import add_months
+from core.partitions import month_start
+from Equipments.models import EquipmentSnapshotMonth
+from Equipments.snapshots import close_month
+from Equipments.snapshots import refresh_month
+from Equipments.snapshots import reopen_month
+
+
+class Command(BaseCommand):
+    help = 'Snapshot mensal do inventário de equipamentos (refresh dos meses abertos, fechamento do mês)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action', choices=['list', 'refresh', 'close', 'reopen'])
+
+        parser.add_argument(
+            '--month', type=str, required=False,
+            help='YYYY-MM (padrão: mês atual; close: mês anterior)')
+
+        parser.add_argument(
+            '--full', action='store_true',
+            help='refresh: recalcula todos os grupos, não só os alterados desde o último refresh')
+
+    @staticmethod
+    def get_month(smonth):
+        if not smonth:
+            return None
+
+        try:
+            return datetime.strptime(smonth, '%Y-%m').date()
+        except Exception as err:
+            raise CommandError(err)
+
+    def handle(self, *args, **options):
+        action = options['action']
+        month = self.get_month(options['month'])
+
+        if action == 'list':
+            for snapshot_month in EquipmentSnapshotMonth.objects.order_by('month'):
+                status = 'fechado' if snapshot_month.closed else 'aberto'
+                self.stdout.write(f'{snapshot_month.month:%m/%Y}: {status} (atualizado em {snapshot_month.modified:%d/%m/%Y %H:%M})')
+        elif action == 'refresh':
+            try:
+                snapshot_month, changed = refresh_month(month or date.today(), full=options['full'])
+            except ValueError as err:
+                raise CommandError(err)
+            self.stdout.write(f'{snapshot_month.month:%m/%Y}: atualizado ({changed} linhas gravadas)')
+        elif action == 'close':
+            month = month or add_months(month_start(date.today()), -1)
+            try:
+                snapshot_month = close_month(month)
+            except ValueError as err:
+                raise CommandError(err)
+            self.stdout.write(f'{snapshot_month.month:%m/%Y}: fechado')
+        elif action == 'reopen':
+            if not month:
+                raise CommandError('Informe --month')
+            if not reopen_month(month):
+                raise CommandError(f'{month:%m/%Y}: sem snapshot')
+            self.stdout.write(f'{month:%m/%Y}: reaberto')
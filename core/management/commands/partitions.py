@@ -0,0 +1,112 @@
+# python
+from datetime import date
+
+# django
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connections
+from django.db import transaction
+
+# project
+from core.partitions import PARTITIONED_TABLES
+from core.partitions import add_months
+from core.partitions import convert_to_partitioned
+from core.partitions import copy_legacy_rows
+from core.partitions import create_partitions
+from core.partitions import detach_partitions
+from core.partitions import is_partitioned
+from core.partitions import legacy_name
+from core.partitions import list_partitions
+from core.partitions import month_start
+from core.partitions import table_exists
+
+
+class Command(BaseCommand):
+    help = 'Gerencia as partições mensais (phonecalls_phonecall, sbc_phonecall, syslog_events)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action', choices=['list', 'create', 'convert', 'copy', 'detach'])
+
+        parser.add_argument(
+            '--table', choices=list(PARTITIONED_TABLES), nargs='+',
+            help='Tabelas (padrão: todas; detach: syslog_events)')
+
+        parser.add_argument(
+            '--months-ahead', type=int, default=3,
+            help='Meses futuros com partição criada (create/convert)')
+
+        parser.add_argument(
+            '--keep-months', type=int, default=6,
+            help='Meses mantidos anexados, além do atual (detach)')
+
+        parser.add_argument(
+            '--drop', action='store_true',
+            help='Remove as partições desanexadas em vez de mantê-las para arquivamento')
+
+        parser.add_argument(
+            '--batch-size', type=int, default=10000,
+            help='Linhas movidas da <tabela>_legacy por transação (copy)')
+
+        parser.add_argument(
+            '--database', default='default')
+
+    def handle(self, *args, **options):
+        action = options['action']
+        tables = options['table'] or (['syslog_events'] if action == 'detach' else list(PARTITIONED_TABLES))
+        connection = connections[options['database']]
+        if connection.vendor != 'postgresql':
+            raise CommandError('Particionamento disponível apenas no PostgreSQL')
+        if action == 'copy':
+            if options['batch_size'] <= 0:
+                raise CommandError('--batch-size deve ser maior que zero')
+            for table in tables:
+                self.copy(connection, table, options['batch_size'])
+            return
+
+        with transaction.atomic(using=options['database']), connection.cursor() as cursor:
+            for table in tables:
+                if not table_exists(cursor, table):
+                    self.stdout.write(self.style.WARNING(f'{table}: tabela não encontrada'))
+                    continue
+                if action == 'convert':
+                    try:
+                        converted = convert_to_partitioned(
+                            cursor, table, PARTITIONED_TABLES[table], options['months_ahead'])
+                    except ValueError as err:
+                        raise CommandError(err)
+                    if converted and table_exists(cursor, legacy_name(table)):
+                        self.stdout.write(f'{table}: convertida, rode `partitions copy` para mover as linhas')
+                    else:
+                        self.stdout.write(f"{table}: {'convertida' if converted else 'já particionada'}")
+                    continue
+                if not is_partitioned(cursor, table):
+                    self.stdout.write(self.style.WARNING(f'{table}: não particionada (use convert)'))
+                    continue
+                if action == 'list':
+                    for name, month in list_partitions(cursor, table):
+                        self.stdout.write(f'{table}: {name} ({month:%m/%Y})')
+                elif action == 'create':
+                    for name in create_partitions(cursor, table, options['months_ahead']):
+                        self.stdout.write(f'{table}: {name}')
+                elif action == 'detach':
+                    before = add_months(month_start(date.today()), -options['keep_months'])
+                    for name in detach_partitions(cursor, table, before, options['drop']):
+                        self.stdout.write(f"{table}: {name} {'removida' if options['drop'] else 'desanexada'}")
+
+    def copy(self, connection, table, batch_size):
+        """
+            Move as linhas da <tabela>_legacy (deixada pelo convert) em lotes, um por transação,
+            para não segurar bloqueios nem uma transação enorme com a tabela em uso
+        """
+        total = 0
+        while True:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                if not table_exists(cursor, legacy_name(table)):
+                    break
+                moved = copy_legacy_rows(cursor, table, batch_size)
+            if not moved:
+                break
+            total += moved
+            self.stdout.write(f'{table}: {total} linhas copiadas')
+        self.stdout.write(f'{table}: cópia concluída ({total} linhas)')
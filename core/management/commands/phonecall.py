@@ -15,6 +15,7 @@ from django.db.models import Q
 from centers.models import Company
 from organizations.models import Organization
 from phonecalls.constants import VC1, VC2, VC3, LOCAL, LDN, LDI
+from phonecalls.snapshots import invalidate_period
 
 
 class Command(BaseCommand):
@@ -106,3 +107,7 @@ class Command(BaseCommand):
                     self.stdout.write(f'{company.name} - {call_count}/{call_total} - '
                                       f'{100*call_count/call_total:.2f}% - {current_time}')
                 self.stdout.write(self.style.SUCCESS(f'{call_total} chamadas originadas cobradas atualizadas'))
+                # relatórios de meses fechados no período são gerados de novo no próximo download
+                snapshot_count = invalidate_period(start_date, stop_date)
+                if snapshot_count:
+                    self.stdout.write(f'{snapshot_count} snapshots de relatórios descartados')
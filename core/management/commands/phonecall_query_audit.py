@@ -0,0 +1,100 @@
+# python
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from time import time
+
+# django
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db import transaction
+
+# project
+from centers.models import Company
+from core.synthetic import create_companies
+from core.synthetic import create_organizations
+from core.synthetic import create_phonecalls
+from phonecalls.query_shapes import get_query_shapes
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN das consultas das listas e relatórios de chamadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--synthetic', type=int, default=0,
+            help='Gera N chamadas sintéticas (descartadas ao final) e audita sobre elas')
+
+        parser.add_argument(
+            '--organization', type=str, help='Slug da organização', required=False)
+
+        parser.add_argument(
+            '--company', type=str, help='Código da empresa', required=False)
+
+        parser.add_argument(
+            '--start-date', type=str, help='YYYY-MM-DD', required=False)
+
+        parser.add_argument(
+            '--stop-date', type=str, help='YYYY-MM-DD', required=False)
+
+        parser.add_argument(
+            '--analyze', action='store_true',
+            help='Executa as consultas (EXPLAIN ANALYZE, BUFFERS)')
+
+    @staticmethod
+    def get_date(sdate):
+        if not sdate:
+            return None
+
+        try:
+            return datetime.strptime(sdate, '%Y-%m-%d').date()
+        except Exception as err:
+            raise CommandError(err)
+
+    def handle(self, *args, **options):
+        date_lt = self.get_date(options['stop_date']) or date.today()
+        date_gt = self.get_date(options['start_date']) or date(date_lt.year, date_lt.month, 1)
+
+        with transaction.atomic():
+            if options['synthetic']:
+                organization, company = self.create_dataset(options['synthetic'])
+                date_gt, date_lt = date.today() - timedelta(days=30), date.today()
+            else:
+                organization, company = self.get_dataset(options['organization'], options['company'])
+            self.audit(organization, company, date_gt, date_lt, options['analyze'])
+            # dados sintéticos nunca são gravados
+            transaction.set_rollback(True)
+
+    def get_dataset(self, org_slug, company_code):
+        if not org_slug or not company_code:
+            raise CommandError('Informe --synthetic N ou --organization e --company')
+        try:
+            company = Company.objects.select_related('organization') \
+                .get(code=company_code, organization__slug=org_slug)
+        except Company.DoesNotExist:
+            raise CommandError(f'Empresa {company_code} não encontrada em {org_slug}')
+        return company.organization, company
+
+    def create_dataset(self, count):
+        time_start = time()
+        organizations = create_organizations(4, prefix='auditoria')
+        companies = []
+        for organization in organizations:
+            companies.extend(create_companies(organization, 10))
+        create_phonecalls(companies, count)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE phonecalls_phonecall')
+        self.stdout.write(f'{count} chamadas sintéticas em {timedelta(seconds=time() - time_start)}')
+        return organizations[0], companies[0]
+
+    def audit(self, organization, company, date_gt, date_lt, analyze):
+        explain_options = {'analyze': True, 'buffers': True} if analyze else {}
+        for name, queryset in get_query_shapes(organization, company, date_gt, date_lt):
+            time_start = time()
+            plan = queryset.explain(**explain_options)
+            elapsed = (time() - time_start) * 1000
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({elapsed:.1f} ms)'))
+            self.stdout.write(plan)
+            if 'Seq Scan on phonecalls_phonecall' in plan:
+                self.stdout.write(self.style.WARNING(f'{name}: seq scan em phonecalls_phonecall'))
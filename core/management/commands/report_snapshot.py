@@ -0,0 +1,69 @@
+# python
+from datetime import date
+from datetime import datetime
+
+# django
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db.models import Count
+
+# project
+from core.partitions import add_months
+from core.partitions import month_start
+from phonecalls.models import ReportMonth
+from phonecalls.snapshots import close_month
+from phonecalls.snapshots import invalidate_months
+from phonecalls.snapshots import prune_snapshot_files
+from phonecalls.snapshots import reopen_month
+
+
+class Command(BaseCommand):
+    help = 'Fechamento dos meses de faturamento (relatórios gerados uma vez a partir de snapshots)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action', choices=['list', 'close', 'reopen', 'invalidate', 'prune'])
+
+        parser.add_argument(
+            '--month', type=str, required=False,
+            help='YYYY-MM (padrão do close: mês anterior)')
+
+    @staticmethod
+    def get_month(smonth):
+        if not smonth:
+            return None
+
+        try:
+            return datetime.strptime(smonth, '%Y-%m').date()
+        except Exception as err:
+            raise CommandError(err)
+
+    def handle(self, *args, **options):
+        action = options['action']
+        month = self.get_month(options['month'])
+
+        if action == 'list':
+            for report_month in ReportMonth.objects.annotate(snapshots=Count('reportsnapshot')).order_by('month'):
+                status = 'fechado' if report_month.closed else 'aberto'
+                self.stdout.write(f'{report_month.month:%m/%Y}: {status}, {report_month.snapshots} snapshots '
+                                  f'(atualizado em {report_month.modified:%d/%m/%Y %H:%M})')
+        elif action == 'close':
+            month = month or add_months(month_start(date.today()), -1)
+            if month >= month_start(date.today()):
+                raise CommandError(f'{month:%m/%Y}: o mês ainda não terminou')
+            report_month = close_month(month)
+            self.stdout.write(f'{report_month.month:%m/%Y}: fechado')
+        elif action == 'reopen':
+            if not month:
+                raise CommandError('Informe --month')
+            if not reopen_month(month):
+                raise CommandError(f'{month:%m/%Y}: mês não encontrado')
+            self.stdout.write(f'{month:%m/%Y}: reaberto')
+        elif action == 'invalidate':
+            if not month:
+                raise CommandError('Informe --month')
+            count = invalidate_months([month])
+            self.stdout.write(f'{month:%m/%Y}: {count} snapshots descartados')
+        elif action == 'prune':
+            count = prune_snapshot_files()
+            self.stdout.write(f'{count} arquivos sem snapshot apagados')
@@ -0,0 +1,115 @@
+# python
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+
+# django
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db.models import Count
+
+# project
+from Equipments.billing import get_full_month_charges
+from Equipments.billing import get_prorated_charges
+from Equipments.models import Equipment
+
+
+class Command(BaseCommand):
+    help = 'Compara a cobrança de serviços básicos (Equipments.billing) com o cálculo anterior dos relatórios'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start-date', type=str, help='YYYY-MM-DD (padrão: primeiro dia do mês)', required=False)
+
+        parser.add_argument(
+            '--stop-date', type=str, help='YYYY-MM-DD (padrão: hoje)', required=False)
+
+    @staticmethod
+    def get_date(sdate):
+        if not sdate:
+            return None
+
+        try:
+            return datetime.strptime(sdate, '%Y-%m-%d').date()
+        except Exception as err:
+            raise CommandError(err)
+
+    def handle(self, *args, **options):
+        date_lt = self.get_date(options['stop_date']) or date.today()
+        date_gt = self.get_date(options['start_date']) or date_lt.replace(day=1)
+        if date_gt.month != date_lt.month or date_gt.year != date_lt.year:
+            # o cálculo anterior só é definido para períodos dentro do mesmo mês
+            raise CommandError('Informe um período dentro de um único mês')
+
+        errors = 0
+        errors += self.compare('mês cheio', self.legacy_full_month(date_lt),
+                               self.summarize(get_full_month_charges(date_gt, date_lt)))
+        errors += self.compare('proporcional', self.legacy_prorated(date_gt, date_lt),
+                               self.summarize(get_prorated_charges(date_gt, date_lt)))
+        if errors:
+            raise CommandError(f'{errors} divergências')
+        self.stdout.write(self.style.SUCCESS('Cobrança de serviços básicos confere com o cálculo anterior'))
+
+    @staticmethod
+    def summarize(charges):
+        result = {}
+        for charge in charges:
+            key = (charge['organization_id'], charge['company_id'], charge['legacy_id'])
+            amount, cost = result.get(key, (0, Decimal(0)))
+            result[key] = (amount + charge['amount'], cost + charge['cost'])
+        return result
+
+    @staticmethod
+    def legacy_queryset(queryset):
+        return queryset \
+            .values('organization_id', 'company_id', 'contract__id') \
+            .annotate(amount_sum=Count('id')) \
+            .values('organization_id', 'company_id', 'contract__id', 'contract__legacyID', 'amount_sum',
+                    'contract__org_price_table__price', 'Dateinstalled',
+                    'contract__org_price_table__price__basic_service', 'contract__org_price_table__price__value')
+
+    def legacy_full_month(self, date_lt):
+        """ Consulta e laço de TotalReportPDFMasterOrg antes do Equipments.billing """
+        queryset = self.legacy_queryset(Equipment.objects.filter(
+            Dateinstalled__lt=date_lt.replace(day=1), contract__org_price_table__price__status=1))
+        result = {}
+        for service in queryset:
+            if service['contract__org_price_table__price__basic_service'] != service['contract__legacyID']:
+                continue
+            key = (service['organization_id'], service['company_id'], service['contract__legacyID'])
+            amount, cost = result.get(key, (0, Decimal(0)))
+            result[key] = (amount + service['amount_sum'],
+                           cost + service['amount_sum'] * service['contract__org_price_table__price__value'])
+        return result
+
+    def legacy_prorated(self, date_gt, date_lt):
+        queryset = self.legacy_queryset(Equipment.objects.filter(
+            Dateinstalled__gte=date_lt.replace(day=1), Dateinstalled__lte=date_lt,
+            contract__org_price_table__price__status=1))
+        days = date_lt.day - date_gt.day + 1
+        result = {}
+        for service in queryset:
+            if service['contract__org_price_table__price__basic_service'] != service['contract__legacyID']:
+                continue
+            if date_gt > service['Dateinstalled']:
+                days_installed = days
+            else:
+                days_installed = date_lt.day - service['Dateinstalled'].day + 1
+            prop = Decimal(days_installed) / Decimal(days)
+            key = (service['organization_id'], service['company_id'], service['contract__legacyID'])
+            amount, cost = result.get(key, (0, Decimal(0)))
+            result[key] = (amount + service['amount_sum'],
+                           cost + prop * service['amount_sum'] * service['contract__org_price_table__price__value'])
+        return result
+
+    def compare(self, name, legacy, charges):
+        errors = 0
+        for key in sorted(set(legacy) | set(charges), key=str):
+            legacy_amount, legacy_cost = legacy.get(key, (0, Decimal(0)))
+            amount, cost = charges.get(key, (0, Decimal(0)))
+            if legacy_amount != amount or round(legacy_cost, 2) != round(cost, 2):
+                errors += 1
+                self.stdout.write(self.style.WARNING(
+                    f'{name} {key}: anterior {legacy_amount} / {legacy_cost:.2f}, novo {amount} / {cost:.2f}'))
+        self.stdout.write(f'{name}: {len(charges)} itens, {errors} divergências')
+        return errors
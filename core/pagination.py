@@ -0,0 +1,149 @@
+# python
+import base64
+import json
+
+from datetime import date
+from datetime import time
+
+# django
+from django.db import connections
+from django.db.models import Q
+from django.http import Http404
+
+PAGINATION_PARAMS = ('page', 'cursor', 'direction')
+# ordem da paginação por chave; a paginação por OFFSET usa a mesma para que o
+# cursor montado na primeira página continue exatamente de onde ela parou
+ORDERING = ('-startdate', '-starttime', '-pk')
+NEXT = 'next'
+PREVIOUS = 'prev'
+
+
+def encode_cursor(phonecall):
+    value = f'{phonecall.startdate.isoformat()}|{phonecall.starttime.isoformat()}|{phonecall.pk}'
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        startdate, starttime, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return date.fromisoformat(startdate), time.fromisoformat(starttime), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise Http404('Cursor inválido')
+
+
+def estimate_count(queryset):
+    """
+        Total estimado pelas estatísticas do planejador (EXPLAIN), sem COUNT(*)
+        Em bancos que não sejam PostgreSQL faz o count() normal
+    """
+    if connections[queryset.db].vendor != 'postgresql':
+        return queryset.count()
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPaginator(object):
+    """
+        Paginador por chave (startdate, starttime, id), em ordem decrescente
+        O custo de cada página não depende da posição: filtra a partir do
+        cursor em vez de usar OFFSET, e o total é estimado
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+        self._count = None
+
+    @property
+    def count(self):
+        if self._count is None:
+            self._count = estimate_count(self.queryset)
+        return self._count
+
+    def page(self, cursor=None, direction=NEXT):
+        queryset = self.queryset
+        if cursor:
+            startdate, starttime, pk = decode_cursor(cursor)
+            if direction == PREVIOUS:
+                queryset = queryset \
+                    .filter(startdate__gte=startdate) \
+                    .filter(Q(startdate__gt=startdate) |
+                            Q(startdate=startdate, starttime__gt=starttime) |
+                            Q(startdate=startdate, starttime=starttime, pk__gt=pk))
+            else:
+                # startdate__lte limita a varredura do índice ao dia do cursor
+                queryset = queryset \
+                    .filter(startdate__lte=startdate) \
+                    .filter(Q(startdate__lt=startdate) |
+                            Q(startdate=startdate, starttime__lt=starttime) |
+                            Q(startdate=startdate, starttime=starttime, pk__lt=pk))
+        if direction == PREVIOUS:
+            object_list = list(queryset.order_by('startdate', 'starttime', 'pk')[:self.per_page + 1])
+            has_more = len(object_list) > self.per_page
+            object_list = object_list[:self.per_page][::-1]
+            return KeysetPage(object_list, self, has_next=True, has_previous=has_more)
+        object_list = list(queryset.order_by(*ORDERING)[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        return KeysetPage(object_list[:self.per_page], self, has_next=has_more, has_previous=bool(cursor))
+
+
+class KeysetPage(object):
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next and bool(object_list)
+        self._has_previous = has_previous and bool(object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self.object_list[-1]) if self._has_next else None
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(self.object_list[0]) if self._has_previous else None
+
+
+class KeysetPaginationMixin(object):
+    """
+        Paginação por chave no ListView quando a requisição traz ?cursor= (vazio: primeira
+        página) e &direction=next|prev; sem cursor fica a paginação por OFFSET do ListView
+        (?page=N, total exato), então os links e favoritos com page continuam valendo
+        A primeira página por OFFSET já aponta a seguinte por cursor (page_obj.next_cursor),
+        de modo que a navegação passa para a busca pelo índice a partir da segunda página
+    """
+
+    def is_keyset(self):
+        return 'cursor' in self.request.GET
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.is_keyset():
+            paginator, page, object_list, is_paginated = super().paginate_queryset(
+                queryset.order_by(*ORDERING), page_size)
+            if page.number == 1 and page.has_next():
+                page.next_cursor = encode_cursor(page[-1])
+            return paginator, page, object_list, is_paginated
+        paginator = KeysetPaginator(queryset, page_size)
+        direction = PREVIOUS if self.request.GET.get('direction') == PREVIOUS else NEXT
+        page = paginator.page(self.request.GET.get('cursor'), direction)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['keyset_pagination'] = self.is_keyset()
+        return context
@@ -0,0 +1,247 @@
+"""
+    Particionamento mensal (RANGE) das tabelas que crescem indefinidamente
+    As funções recebem um cursor DB-API (Django ou psycopg) de uma conexão PostgreSQL
+    Partições: <tabela>_pAAAA_MM, mais <tabela>_default para valores fora das faixas criadas
+"""
+
+# python
+import re
+
+from datetime import date
+
+PARTITIONED_TABLES = {
+    'phonecalls_phonecall': 'startdate',
+    'sbc_phonecall': 'startdate',
+    'syslog_events': 'received_at',
+}
+
+PARTITION_RE = re.compile(r'_p(\d{4})_(\d{2})$')
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    return f'{table}_p{month:%Y_%m}'
+
+
+def table_exists(cursor, table):
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [table])
+    return cursor.fetchone()[0]
+
+
+def is_partitioned(cursor, table):
+    cursor.execute(
+        'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))', [table])
+    return cursor.fetchone()[0]
+
+
+def list_partitions(cursor, table):
+    """
+        Partições mensais da tabela, ordenadas: [(nome, primeiro dia do mês), ...]
+        A partição default não entra na lista
+    """
+    cursor.execute(
+        'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+        'WHERE i.inhparent = to_regclass(%s)', [table])
+    partitions = []
+    for name, in cursor.fetchall():
+        match = PARTITION_RE.search(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def has_identity(cursor, table):
+    cursor.execute(
+        "SELECT attidentity FROM pg_attribute WHERE attrelid = to_regclass(%s) AND attname = 'id'", [table])
+    row = cursor.fetchone()
+    return row is not None and row[0] != ''
+
+
+def partition_column(cursor, table):
+    cursor.execute(
+        'SELECT a.attname FROM pg_partitioned_table p '
+        'JOIN pg_attribute a ON a.attrelid = p.partrelid AND a.attnum = p.partattrs[0] '
+        'WHERE p.partrelid = to_regclass(%s)', [table])
+    return cursor.fetchone()[0]
+
+
+def create_month_partition(cursor, table, month):
+    """
+        Cria a partição do mês (nada a fazer se já existir)
+        O PostgreSQL recusa criar a partição se a default já tiver linhas do mês: nesse caso
+        a default é desanexada, a partição criada, as linhas do mês movidas para ela e a
+        default anexada de volta (tudo na transação do chamador)
+    """
+    month = month_start(month)
+    next_month = add_months(month, 1)
+    name = partition_name(table, month)
+    if table_exists(cursor, name):
+        return
+    bounds = f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+    default = f'{table}_default'
+    moved = False
+    if table_exists(cursor, default):
+        column = partition_column(cursor, table)
+        where = f"{column} >= '{month:%Y-%m-%d}' AND {column} < '{next_month:%Y-%m-%d}'"
+        cursor.execute(f'SELECT EXISTS (SELECT 1 FROM {default} WHERE {where})')
+        moved = cursor.fetchone()[0]
+    if not moved:
+        cursor.execute(f'CREATE TABLE {name} PARTITION OF {table} {bounds}')
+        return
+
+    cursor.execute(f'ALTER TABLE {table} DETACH PARTITION {default}')
+    cursor.execute(f'CREATE TABLE {name} PARTITION OF {table} {bounds}')
+    # pela tabela pai, com a default desanexada as linhas só podem ir para a partição nova
+    overriding = ' OVERRIDING SYSTEM VALUE' if has_identity(cursor, table) else ''
+    cursor.execute(f'INSERT INTO {table}{overriding} SELECT * FROM {default} WHERE {where}')
+    cursor.execute(f'DELETE FROM {default} WHERE {where}')
+    cursor.execute(f'ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT')
+
+
+def create_partitions(cursor, table, months_ahead=3, start=None):
+    """
+        Garante as partições do mês de `start` (padrão: mês atual) até `months_ahead` meses à frente
+        Deve rodar periodicamente (cron) para que a partição default fique vazia
+    """
+    month = month_start(start or date.today())
+    created = []
+    for i in range(months_ahead + 1):
+        create_month_partition(cursor, table, add_months(month, i))
+        created.append(partition_name(table, add_months(month, i)))
+    return created
+
+
+def detach_partitions(cursor, table, before, drop=False):
+    """
+        Desanexa (e opcionalmente remove) as partições com mês anterior a `before`
+        As partições desanexadas ficam como tabelas comuns para arquivamento
+    """
+    detached = []
+    for name, month in list_partitions(cursor, table):
+        if month >= month_start(before):
+            break
+        cursor.execute(f'ALTER TABLE {table} DETACH PARTITION {name}')
+        if drop:
+            cursor.execute(f'DROP TABLE {name}')
+        detached.append(name)
+    return detached
+
+
+def legacy_name(table):
+    return f'{table}_legacy'
+
+
+def convert_to_partitioned(cursor, table, column, months_ahead=3):
+    """
+        Converte uma tabela comum em particionada por mês em `column`, sem copiar os dados
+        A tabela antiga vira <tabela>_legacy e a nova (vazia) assume o nome, os índices,
+        FKs, CHECKs e a sequência do id; as linhas são movidas depois, em lotes e com a
+        tabela em uso, por copy_legacy_rows (manage.py partitions copy). O bloqueio
+        exclusivo dura só a troca de estrutura
+        A chave primária passa a ser (id, column), exigência do PostgreSQL; restrições e
+        índices únicos sem column não têm equivalente na tabela particionada, então a
+        conversão falha antes de alterar a tabela (não ficam mais fracos em silêncio)
+    """
+    if is_partitioned(cursor, table):
+        return False
+
+    legacy = legacy_name(table)
+    if table_exists(cursor, legacy):
+        raise ValueError(f'{legacy} já existe, termine a cópia anterior antes de converter')
+    cursor.execute(f'SELECT count(*) FROM {table} WHERE {column} IS NULL')
+    null_count = cursor.fetchone()[0]
+    if null_count:
+        raise ValueError(f'{table}: {null_count} registros com {column} nulo, corrija antes de particionar')
+    cursor.execute(
+        'SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+        'JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attname = %s '
+        'WHERE i.indrelid = to_regclass(%s) AND i.indisunique AND NOT i.indisprimary '
+        'AND NOT a.attnum = ANY(i.indkey)', [column, table])
+    unique_indexes = [row[0] for row in cursor.fetchall()]
+    if unique_indexes:
+        raise ValueError(
+            f"{table}: restrições/índices únicos sem {column} ({', '.join(unique_indexes)}) "
+            f'não valeriam mais para a tabela toda; inclua {column} ou remova-os antes de particionar')
+
+    cursor.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s "
+        "AND indexname NOT IN (SELECT conname FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype IN ('p', 'u'))", [table, table])
+    indexes = cursor.fetchall()
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype IN ('f', 'c', 'u')", [table])
+    constraints = cursor.fetchall()
+    identity = has_identity(cursor, table)
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+    sequence = cursor.fetchone()[0]
+    cursor.execute(f'SELECT min({column}), max({column}), max(id) FROM {table}')
+    min_value, max_value, max_id = cursor.fetchone()
+
+    cursor.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+    # os nomes dos índices (e das restrições únicas) ficam livres para a tabela nova
+    cursor.execute('SELECT indexname FROM pg_indexes WHERE tablename = %s', [legacy])
+    for number, (name,) in enumerate(cursor.fetchall()):
+        cursor.execute(f'ALTER INDEX {name} RENAME TO {table[:45]}_legacy_{number}')
+
+    cursor.execute(
+        f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING STORAGE) '
+        f'PARTITION BY RANGE ({column})')
+    cursor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, {column})')
+    cursor.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    if min_value is not None:
+        month = month_start(min_value)
+        while month <= month_start(max_value):
+            create_month_partition(cursor, table, month)
+            month = add_months(month, 1)
+    create_partitions(cursor, table, months_ahead)
+
+    if sequence and not identity:
+        # serial: a sequência pertence à coluna da tabela antiga
+        cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.id')
+    elif identity:
+        # a identidade da tabela nova tem sequência própria: continua depois das linhas antigas
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), %s, false)", [(max_id or 0) + 1])
+
+    for name, index_def in indexes:
+        # definições lidas antes do RENAME, já apontam para a nova tabela
+        cursor.execute(index_def)
+    for name, definition in constraints:
+        cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}')
+    if min_value is None:
+        cursor.execute(f'DROP TABLE {legacy}')
+    return True
+
+
+def copy_legacy_rows(cursor, table, batch_size=10000):
+    """
+        Move um lote de linhas de <tabela>_legacy para a tabela particionada, das mais novas
+        para as mais antigas (os meses recentes, mais consultados, voltam primeiro)
+        Devolve quantas linhas moveu; com a legacy vazia, remove a tabela e devolve 0
+        Cada lote deve rodar na sua própria transação
+    """
+    legacy = legacy_name(table)
+    if not table_exists(cursor, legacy):
+        return 0
+    overriding = ' OVERRIDING SYSTEM VALUE' if has_identity(cursor, table) else ''
+    # um id já gravado na tabela nova (reimportado durante a cópia) é a versão mais recente
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM {legacy} WHERE id IN '
+        f'(SELECT id FROM {legacy} ORDER BY id DESC LIMIT %s) RETURNING *), '
+        f'inserted AS (INSERT INTO {table}{overriding} SELECT * FROM moved '
+        f'WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE t.id = moved.id) RETURNING 1) '
+        f'SELECT count(*) FROM moved', [batch_size])
+    moved = cursor.fetchone()[0]
+    if not moved:
+        cursor.execute(f'DROP TABLE {legacy}')
+    return moved
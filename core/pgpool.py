@@ -0,0 +1,181 @@
+"""
+    Conexões PostgreSQL dos scripts do SBC (scripts/, new_task_sbc/, Ingestor/)
+    Sem dependência do Django; o pool é o do psycopg2, as conexões podem ser psycopg (3) ou
+    psycopg2 (o módulo do driver pode ser passado, senão psycopg tem preferência)
+      - connect: abre a conexão com statement_timeout, application_name e connect_timeout,
+        tentando de novo com espera exponencial com jitter se o servidor não responder
+      - Backoff: as esperas (full jitter: aleatório entre 0 e base * 2^n, limitado a cap)
+      - ConnectionPool: psycopg2.pool.ThreadedConnectionPool abrindo as conexões com connect;
+        conexões reaproveitadas entre lotes/execuções do mesmo processo
+      - shared_pool: um pool por DSN no processo (execuções curtas e repetidas do mesmo
+        script deixam de pagar conexão e TLS a cada vez)
+"""
+
+# python
+import atexit
+import logging
+import random
+import threading
+import time
+
+from contextlib import contextmanager
+
+# third party
+import psycopg2
+
+from psycopg2.pool import ThreadedConnectionPool
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+CONNECT_TIMEOUT = 10
+POOL_TIMEOUT = 30.0
+
+_shared_pools = {}
+_shared_lock = threading.Lock()
+
+
+def get_driver(driver=None):
+    if driver is not None:
+        return driver
+    if psycopg is not None:
+        return psycopg
+    return psycopg2
+
+
+class Backoff(object):
+    """ Esperas entre tentativas: aleatório em [0, min(cap, base * 2^n)] """
+
+    def __init__(self, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+        self.base = base
+        self.cap = cap
+        self.attempt = 0
+
+    def next(self):
+        delay = random.uniform(0, min(self.cap, self.base * 2 ** self.attempt))
+        self.attempt += 1
+        return delay
+
+    def reset(self):
+        self.attempt = 0
+
+
+def connection_kwargs(statement_timeout=None, application_name=None, connect_timeout=CONNECT_TIMEOUT, **kwargs):
+    """ Parâmetros do libpq (iguais no psycopg e no psycopg2); statement_timeout em ms """
+    if statement_timeout:
+        options = kwargs.get('options', '')
+        kwargs['options'] = f'{options} -c statement_timeout={int(statement_timeout)}'.strip()
+    if application_name:
+        kwargs['application_name'] = application_name
+    if connect_timeout:
+        kwargs['connect_timeout'] = connect_timeout
+    return kwargs
+
+
+def connect(dsn='', driver=None, retries=0, backoff=None, autocommit=None, **kwargs):
+    """
+        Conexão nova; com retries, falhas de conexão (OperationalError) são tentadas de novo
+        depois de backoff.next() segundos. kwargs: ver connection_kwargs
+    """
+    driver = get_driver(driver)
+    params = connection_kwargs(**kwargs)
+    backoff = backoff or Backoff()
+    attempt = 0
+    while True:
+        try:
+            conn = driver.connect(dsn, **params)
+            break
+        except driver.OperationalError as err:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            delay = backoff.next()
+            logger.warning('Falha ao conectar ao PostgreSQL (%s); tentativa %d de %d em %.1f s',
+                           str(err).strip(), attempt, retries, delay)
+            time.sleep(delay)
+    if autocommit is not None:
+        conn.autocommit = autocommit
+    return conn
+
+
+class ConnectionPool(ThreadedConnectionPool):
+    """
+        psycopg2.pool.ThreadedConnectionPool com as conexões abertas por connect (backoff,
+        statement_timeout, application_name); serve para psycopg (3) também, já que o pool
+        só usa closed, info.transaction_status, rollback e close
+          - max_size: conexões abertas no máximo, abertas sob demanda e mantidas paradas
+            para reuso; pool.connection() espera até timeout por uma livre
+          - retries / backoff_*: reconexão com espera exponencial com jitter
+        Conexões perdidas são descartadas na devolução; em transação, voltam com rollback
+    """
+
+    def __init__(self, dsn='', max_size=4, driver=None, autocommit=None, timeout=POOL_TIMEOUT,
+                 retries=5, backoff_base=BACKOFF_BASE, backoff_cap=BACKOFF_CAP, **kwargs):
+        super().__init__(0, max_size)
+        # minconn=0 não abre nada agora; com minconn=max_size as devolvidas ficam no pool
+        self.minconn = max_size
+        self.dsn = dsn
+        self.driver = get_driver(driver)
+        self.autocommit = autocommit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.connect_kwargs = kwargs
+        # getconn do psycopg2 falha com o pool esgotado em vez de esperar
+        self.slots = threading.BoundedSemaphore(max_size)
+
+    def _connect(self, key=None):
+        conn = connect(self.dsn, self.driver, retries=self.retries, autocommit=self.autocommit,
+                       backoff=Backoff(self.backoff_base, self.backoff_cap), **self.connect_kwargs)
+        if key is not None:
+            self._used[key] = conn
+            self._rused[id(conn)] = key
+        else:
+            self._pool.append(conn)
+        return conn
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """ with pool.connection() as conn: ... (erro com a conexão perdida a descarta) """
+        if not self.slots.acquire(timeout=self.timeout if timeout is None else timeout):
+            raise TimeoutError(f'Nenhuma das {self.maxconn} conexões ficou livre a tempo')
+        try:
+            conn = self.getconn()
+            try:
+                yield conn
+            finally:
+                if not self.closed:
+                    self.putconn(conn)
+        finally:
+            self.slots.release()
+
+    def close(self):
+        with self._lock:
+            if not self.closed:
+                self._closeall()
+
+
+def shared_pool(dsn='', **kwargs):
+    """ Um ConnectionPool por (dsn, parâmetros) no processo, fechado na saída """
+    key = (dsn, tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+    with _shared_lock:
+        pool = _shared_pools.get(key)
+        if pool is None or pool.closed:
+            pool = _shared_pools[key] = ConnectionPool(dsn, **kwargs)
+        return pool
+
+
+@atexit.register
+def close_shared_pools():
+    with _shared_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.close()
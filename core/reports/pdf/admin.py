@@ -11,8 +11,6 @@ from django.contrib.staticfiles import finders
 from django.templatetags.static import static
 
 # third party
-from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -20,7 +18,6 @@ from reportlab.platypus import PageBreak
 from reportlab.platypus import Paragraph
 from reportlab.platypus import SimpleDocTemplate
 from reportlab.platypus import Table
-from reportlab.platypus import TableStyle
 from reportlab.rl_config import TTFSearchPath
 
 # project
@@ -28,6 +25,11 @@ from centers.utils import make_price_adm
 from charges.constants import BASIC_SERVICE_ACCESS_MAP, BASIC_SERVICE_ACCESS_MAP_NEW
 from charges.constants import BASIC_SERVICE_MAP,  BASIC_SERVICE_MAP_NEW, BASIC_SERVICE_MAP_PMF
 from charges.constants import BASIC_SERVICE_MO_MAP
+from core.reports.pdf.styles import BLANK_BACKGROUND
+from core.reports.pdf.styles import ROW_BACKGROUND
+from core.reports.pdf.styles import TITLE_BACKGROUND
+from core.reports.pdf.styles import TOTAL_BACKGROUND
+from core.reports.pdf.styles import table_style
 from core.utils import time_format
 from phonecalls.constants import CALLTYPE_CHOICES
 from phonecalls.constants import VC1, VC2, VC3, LOCAL, LDN, LDI
@@ -140,15 +142,7 @@ class SystemReportAdministrador(object):
         Creating the table header
         """
 
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#ffffff')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(BLANK_BACKGROUND)
         thead = [data['thead']]
         tbl = Table(
             thead,
@@ -158,18 +152,7 @@ class SystemReportAdministrador(object):
         self._story.append(tbl)
 
         # Inserting the data in the table
-        cont = 0
-        array_tblstyle = []
-        for align in data['align']:
-            array_tblstyle.append(('ALIGN', (cont, 0), (cont, -1), align))
-            cont += 1
-        array_tblstyle.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
-        array_tblstyle.append(('FONTSIZE', (0, 0), (-1, -1), 9))
-        array_tblstyle.append(('FONTNAME', (0, 0), (-1, -1), 'Sans'))
-        array_tblstyle.append(('BACKGROUND', (0, 0), (-1, -1), HexColor('#ffffff')))
-        array_tblstyle.append(('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white))
-        array_tblstyle.append(('BOX', (0, 0), (-1, -1), 0.50, colors.white))
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(BLANK_BACKGROUND, align=tuple(data['align']))
 
         tbl = Table(
             data['values'],
@@ -203,15 +186,7 @@ class SystemReportAdministrador(object):
                 value_service_comunication_total = call_organization_map['cost_sum']
 
                 # ### Parte 1 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['SERVIÇOS DE COMUNICAÇÃO']]
                 size = self._width - 50
                 tbl = Table(
@@ -222,15 +197,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 2 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                 thead = [['SERVIÇO', 'CHAMADAS', 'TEMPO FATURADO', 'VALOR PERÍODO']]
                 size = (self._width - 50) / 5
                 tbl = Table(
@@ -241,15 +208,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 3 - Título Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['DISCAGEM LOCAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -260,18 +219,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
                 local_list = [{
                         'type': LOCAL,  # LOCAL
                         'desc': 'Local Fixo-Fixo Extragrupo'
@@ -311,18 +259,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 5 - Total de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'local' in call_organization_map:
                     minutes = call_organization_map['local']['billedtime_sum']
                     thead = [[
@@ -341,15 +278,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 6 - Título Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA NACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -360,18 +289,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
                 if LDN in call_organization_map:
                     call_organization = call_organization_map[LDN]
                     if type(call_organization) is not dict:
@@ -393,18 +311,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 8 - Total de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'national' in call_organization_map:
                     minutes = call_organization_map['national']['billedtime_sum']
                     thead = [[
@@ -427,15 +334,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 9 - Título Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -446,18 +345,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 10 - Chamadas de Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
                 thead = [['Longa Distância Internacional', '0', '00:00:00', 'R$ 2,00']]
                 size = (self._width - 50) / 5
                 tbl = Table(
@@ -468,18 +356,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 11 - Total de Longa Distancia Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'international' in call_organization_map:
                     minutes = call_organization_map['international']['billedtime_sum']
                     thead = [[
@@ -502,18 +379,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 minutes = call_organization_map['billedtime_sum']
                 thead = [[
                     'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
@@ -534,15 +400,7 @@ class SystemReportAdministrador(object):
                 self.insert_title_table(title=organization)
 
                 # ### Parte 2 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['SERVIÇOS BASICOS']]
                 size = self._width - 50
                 tbl = Table(
@@ -553,15 +411,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 1 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                 thead = [['SERVIÇO', 'QUANTIDADE', 'VALOR PERÍODO']]
                 size = (self._width - 50) / 5
                 tbl = Table(
@@ -572,17 +422,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'))
                 thead = []
 
                 service_amount = 0
@@ -607,16 +447,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70, font_name=None)
                 thead = [[
                     'TOTAL DOS SERVIÇOS BASICOS',
                     str(service_amount),
@@ -636,15 +467,7 @@ class SystemReportAdministrador(object):
 
                 if 'service_basic' in call_organization_map:
                     # ### Parte 2 - Título Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND)
                     thead = [['SERVIÇOS BASICOS']]
                     size = self._width - 50
                     tbl = Table(
@@ -655,15 +478,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 1 - Cabeçalho da tabela ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                     thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'QUANTIDADE', 'VALOR PERÍODO']]
                     size = (self._width - 50) / 5
                     tbl = Table(
@@ -674,19 +489,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 4 - Chamadas de Discagem Local ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                        ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'RIGHT'), first_font_size=7)
                     thead = []
 
                     if organization == 'Prefeitura Municipal de Fortaleza':
@@ -713,17 +516,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 12 - Total dos Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70)
                     thead = [[
                         'TOTAL DOS SERVIÇOS BASICOS',
                         str(service_amount),
@@ -738,15 +531,7 @@ class SystemReportAdministrador(object):
                     self.space_between_tables()
 
                 # ### Parte 1 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['SERVIÇOS DE COMUNICAÇÃO']]
                 size = self._width - 50
                 tbl = Table(
@@ -757,15 +542,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 2 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                 thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'CHAMADAS',
                           'TEMPO FATURADO', 'VALOR PERÍODO']]
                 size = (self._width - 50) / 6
@@ -777,15 +554,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 3 - Título Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['DISCAGEM LOCAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -796,19 +565,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 #In this case I assume that the amount comes already coorected in VC1
                 local_list_etice = [{
                         'type': LOCAL,  # LOCAL
@@ -859,18 +616,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 5 - Total de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'local' in call_organization_map:
                     minutes = call_organization_map['local']['billedtime_sum']
                     thead = [[
@@ -889,15 +635,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 6 - Título Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA NACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -908,19 +646,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 #if organization == 'Prefeitura Municipal de Fortaleza':
                 #    title = 'Operação de acesso externo à rede para ligações de longa distância Nacional para fixo'
                 #else:
@@ -948,18 +674,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 8 - Total de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'national' in call_organization_map:
                     minutes = call_organization_map['national']['billedtime_sum']
                     thead = [[
@@ -982,15 +697,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 9 - Título Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -1001,19 +708,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 10 - Chamadas de Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 # Perhaps change later -> The name
                 #if organization == 'Prefeitura Municipal de Fortaleza':
                 #    title = 'Operação de acesso externo à rede para ligações internacionais'
@@ -1042,18 +737,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 11 - Total de Longa Distancia Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'international' in call_organization_map:
                     minutes = call_organization_map['international']['billedtime_sum']
                     thead = [[
@@ -1076,18 +760,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 minutes = call_organization_map['billedtime_sum']
                 thead = [[
                     'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
@@ -1104,15 +777,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
                 self.space_between_tables()
 
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['TOTAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -1124,16 +789,7 @@ class SystemReportAdministrador(object):
 
                 value_total = float(service_cost) + float(call_organization_map['cost_sum'])
 
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 minutes = call_organization_map['billedtime_sum'] * 60
                 thead = [[
                     'TOTAL DOS SERVIÇOS',
@@ -1161,15 +817,7 @@ class SystemReportAdministrador(object):
 
                         if 'services' in call_company_map:
                              # ### Parte 2 - Título Serviços de Comunicação ###
-                            array_tblstyle = [
-                                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                                 ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                 ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                                 ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                 ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                                 ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                                 ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(TITLE_BACKGROUND)
                             thead = [['SERVIÇOS BASICOS']]
                             size = self._width - 50
                             tbl = Table(
@@ -1180,15 +828,7 @@ class SystemReportAdministrador(object):
                             self._story.append(tbl)
 
                             # ### Parte 1 - Cabeçalho da tabela ###
-                            array_tblstyle = [
-                                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                                ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                             thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'QUANTIDADE', 'VALOR PERÍODO']]
                             size = (self._width - 50) / 5
                             tbl = Table(
@@ -1199,19 +839,7 @@ class SystemReportAdministrador(object):
                             self._story.append(tbl)
 
                              # ### Parte 4 - Chamadas de Discagem Local ###
-                            array_tblstyle = [
-                                 ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                                 ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                                 ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                                 ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                                 ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                 ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                                 ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                                 ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                 ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                                 ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                                 ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'RIGHT'), first_font_size=7)
                             thead = []
                             service_amount = 0
                             service_cost = 0
@@ -1246,17 +874,7 @@ class SystemReportAdministrador(object):
                             self._story.append(tbl)
 
                              # ### Parte 12 - Total dos Serviços de Comunicação ###
-                            array_tblstyle = [
-                                 ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                                 ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                                 ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                                 ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                 ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                                 ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                 ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                                 ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                                 ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70)
                             thead = [[
                                  'TOTAL DOS SERVIÇOS BASICOS',
                                  str(service_amount),
@@ -1271,15 +889,7 @@ class SystemReportAdministrador(object):
                             self.space_between_tables()
 
                         # ### Parte 1 - Título Serviços de Comunicação ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TITLE_BACKGROUND)
                         thead = [['SERVIÇOS DE COMUNICAÇÃO']]
                         size = self._width - 50
                         tbl = Table(
@@ -1290,15 +900,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 2 - Cabeçalho da tabela ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                         thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'CHAMADAS',
                                   'TEMPO FATURADO', 'VALOR PERÍODO']]
                         size = (self._width - 50) / 6
@@ -1310,15 +912,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 3 - Título Discagem Local ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                         thead = [['DISCAGEM LOCAL']]
                         size = self._width - 50
                         tbl = Table(
@@ -1329,19 +923,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 4 - Chamadas de Discagem Local ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                         local_list = [{
                                 'type': LOCAL,  # LOCAL
                                 'desc': 'Local Fixo-Fixo Extragrupo'
@@ -1379,18 +961,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 5 - Total de Discagem Local ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         if 'local' in call_company_map:
                             minutes = call_company_map['local']['billedtime_sum']
                             thead = [[
@@ -1409,15 +980,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 6 - Título Longa Distancia Nacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                         thead = [['LONGA DISTÂNCIA NACIONAL']]
                         size = self._width - 50
                         tbl = Table(
@@ -1428,19 +991,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                         if LDN in call_company_map:
                             call_company = call_company_map[LDN]
                             if type(call_company) is not dict:
@@ -1464,18 +1015,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 8 - Total de Longa Distancia Nacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         if 'national' in call_company_map:
                             minutes = call_company_map['national']['billedtime_sum']
                             thead = [[
@@ -1498,15 +1038,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 9 - Título Longa Distância Internacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                         thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                         size = self._width - 50
                         tbl = Table(
@@ -1517,19 +1049,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 10 - Chamadas de Longa Distância Internacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                         if LDI in call_company_map:
                             call_company = call_company_map[LDI]
                             if type(call_company) is not dict:
@@ -1553,18 +1073,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 11 - Total de Longa Distancia Internacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         if 'international' in call_company_map:
                             minutes = call_company_map['international']['billedtime_sum']
                             cost = make_price_adm(call_company_map['international']['cost_sum'])
@@ -1588,18 +1097,7 @@ class SystemReportAdministrador(object):
                         self._story.append(tbl)
 
                         # ### Parte 12 - Total dos Serviços de Comunicação ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         minutes = call_company_map['billedtime_sum']
                         thead = [[
                             'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
@@ -1618,15 +1116,7 @@ class SystemReportAdministrador(object):
                         self.space_between_tables()
                         self.space_between_tables2()
 
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND)
         thead = [['TOTAL GERAL']]
         size = self._width - 50
         tbl = Table(
@@ -1638,16 +1128,7 @@ class SystemReportAdministrador(object):
 
         value_total = float(value_service_basic_total) + float(value_service_comunication_total)
 
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
         minutes = call_organization_map['billedtime_sum'] * 60
         thead = [[
             'TOTAL DOS SERVIÇOS',
@@ -1677,15 +1158,7 @@ class SystemReportAdministrador(object):
                 self.insert_title_table(title=organization)
 
                 # ### Parte 2 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['SERVIÇOS BASICOS']]
                 size = self._width - 50
                 tbl = Table(
@@ -1696,15 +1169,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 1 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, font_size=8, grid=0.70)
                 thead = [['SERVIÇO', 'QUANTIDADE', 'VALOR MENSAL(UST)', 'VALOR MENSAL(R$)']]
                 size = (self._width - 50) / 6
                 tbl = Table(
@@ -1715,17 +1180,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'))
                 thead = []
 
                 service_amount = 0
@@ -1753,16 +1208,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70, font_name=None)
                 thead = [[
                     'TOTAL DOS SERVIÇOS BASICOS',
                     str(make_price_adm(service_amount)),
@@ -1784,15 +1230,7 @@ class SystemReportAdministrador(object):
 
                 if 'service_basic' in call_organization_map:
                     # ### Parte 2 - Título Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND)
                     thead = [[
                         'TABELA 1 – SERVIÇOS DE DISPONIBILIZAÇÃO DE ACESSO A COMUNICAÇÃO VOIP']]
                     size = self._width - 50
@@ -1804,15 +1242,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 1 - Cabeçalho da tabela ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 7),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND, font_size=7, grid=0.70)
                     thead = [['SERVIÇO', 'VALOR MENSAL(R$)']]
                     size = (self._width - 50) / 3
                     tbl = Table(
@@ -1823,17 +1253,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 4 - Chamadas de Discagem Local ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                        ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT'), first_font_size=7)
                     thead = []
 
                     service_amount = 0
@@ -1860,16 +1280,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 12 - Total dos Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                     thead = [[
                         'TOTAL',
                         f"R$ {make_price_adm(service_cost)}"]]
@@ -1886,15 +1297,7 @@ class SystemReportAdministrador(object):
                     value_service_cost_ust = service_cost_ust
 
                     # ### Parte 13 - Título Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND)
                     thead = [['TABELA 2 –SERVIÇOS DE CONTACT CENTER']]
                     size = self._width - 50
                     tbl = Table(
@@ -1905,15 +1308,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 14 - Cabeçalho da tabela ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 7),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND, font_size=7, grid=0.70)
                     thead = [['SERVIÇO', 'VALOR MENSAL(R$)']]
                     size = (self._width - 50) / 3
                     tbl = Table(
@@ -1924,17 +1319,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 15 - Chamadas de Discagem Local ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                        ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT'), first_font_size=7)
                     thead = []
 
                     service_amount = 0
@@ -1961,16 +1346,7 @@ class SystemReportAdministrador(object):
                     self._story.append(tbl)
 
                     # ### Parte 16 - Total dos Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                     thead = [[
                         'TOTAL',
                         f"R$ {make_price_adm(service_cost)}"]]
@@ -1987,15 +1363,7 @@ class SystemReportAdministrador(object):
                     value_service_cost_ust += service_cost_ust
 
                 # ### Parte 17 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['TABELA 3 - SERVIÇOS MENSAL EXECUTADOS POR DEMANDA (MINUTAGEM)']]
                 size = self._width - 50
                 tbl = Table(
@@ -2006,15 +1374,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 18 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 7),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, font_size=7, grid=0.70)
                 thead = [['SERVIÇO', 'VALOR MENSAL(R$)']]
                 size = (self._width - 50) / 3
                 tbl = Table(
@@ -2025,15 +1385,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 19 - Título Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['DISCAGEM LOCAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2044,16 +1396,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 20 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT'))
                 local_list = [{
                         'type': LOCAL,  # LOCAL
                         'desc': 'Local Fixo-Fixo Extragrupo'
@@ -2093,16 +1436,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 21 - Total de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 if 'local' in call_organization_map:
                     thead = [[
                         'Total de Discagem Local',
@@ -2118,15 +1452,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 22 - Título Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA NACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2137,16 +1463,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 23 - Chamadas de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT'))
 
                 # Valores referentes a quantidade total de cada tabela de serviços de comunicação
                 partial_quantity = 0
@@ -2177,16 +1494,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 24 - Total de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 if 'national' in call_organization_map:
                     thead = [[
                         'Total de Longa Distancia Nacional',
@@ -2204,15 +1512,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 25 - Título Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2223,16 +1523,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 26 - Chamadas de Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT'))
                 thead = [[
                     'Longa Distância Internacional', 'R$ 0,0000']]
                 size = (self._width - 50) / 3
@@ -2244,16 +1535,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 27 - Total de Longa Distancia Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 if 'international' in call_organization_map:
                     thead = [[
                         'Total de Longa Distancia Internacional',
@@ -2271,16 +1553,7 @@ class SystemReportAdministrador(object):
                 self._story.append(tbl)
 
                 # ### Parte 28 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 thead = [[
                     'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
                     f"R$ {make_price_adm(call_organization_map['cost_sum'])}"]]
@@ -2298,15 +1571,7 @@ class SystemReportAdministrador(object):
                 self.space_between_tables()
                 self.space_between_tables2()
 
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['TOTAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2320,16 +1585,7 @@ class SystemReportAdministrador(object):
                 value_total_ust = \
                     float(value_service_cost_ust) + float(call_organization_map['cost_ust_sum'])
 
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 thead = [[
                     'Valor Mensal (R$) (t1+t2+t3+t4+t5):',
                     f"R$ {make_price_adm(value_total)}"]]
@@ -2351,7 +1607,7 @@ class SystemReportAdministrador(object):
         #     ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
         #     ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
         #     ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        # tblstyle = TableStyle(array_tblstyle)
+        # tblstyle = style
         # thead = [['TOTAL GERAL']]
         # size = self._width - 50
         # tbl = Table(
@@ -2375,7 +1631,7 @@ class SystemReportAdministrador(object):
         #     ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
         #     ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
         #     ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        # tblstyle = TableStyle(array_tblstyle)
+        # tblstyle = style
         # thead = [[
         #     'TOTAL DOS SERVIÇOS',
         #     f"{make_price_adm(value_total_ust)}",
@@ -0,0 +1,100 @@
+"""
+    Relatórios detalhados em PDF com memória limitada (centenas de milhares de chamadas)
+      - FlowableStream: lista entregue ao build do ReportLab e reabastecida sob demanda;
+        cada flowable é gerado só quando o build chega nele e descartado depois de desenhado,
+        então restam em memória apenas as páginas já prontas (comprimidas) no canvas
+      - DetailTableLayout: estilos do cabeçalho e do corpo montados uma vez por relatório;
+        o corpo vai em fatias de chunk_rows linhas (uma Table por fatia), em vez de uma
+        Table única que o ReportLab reparte página a página
+      - iter_chunks: consome as chamadas (ex.: queryset.iterator()) em fluxo
+    Sem dependência do Django (usado por benchmarks/detail_pdf.py)
+"""
+
+# python
+import tempfile
+from itertools import islice
+
+# third party
+from reportlab.platypus import Table
+
+# local
+from .styles import BLANK_BACKGROUND
+from .styles import HEAD_BACKGROUND
+from .styles import table_style
+
+DETAIL_CHUNK_ROWS = 500
+# acima disso o PDF gerado vai para um arquivo temporário em disco
+PDF_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+class FlowableStream(list):
+    """
+        Lista "preguiçosa" para DocTemplate.build: o build só consulta o início da lista
+        (len, flowables[0], fatias curtas em keepWithNext) e remove o que desenhou;
+        aqui a lista é completada a partir do iterável sempre que fica com menos de prefetch itens
+    """
+
+    def __init__(self, flowables, prefetch=8):
+        super().__init__()
+        self._source = iter(flowables)
+        self._prefetch = prefetch
+
+    def _fill(self):
+        while self._source is not None and list.__len__(self) < self._prefetch:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+
+class DetailTableLayout(object):
+    """
+        Cabeçalho e fatias do corpo de uma tabela do relatório detalhado, com os mesmos
+        estilos de create_table (TableStyle compartilhados, ver styles.table_style)
+    """
+
+    def __init__(self, len_col, align, font_name='Sans', font_size=8, header_height=20, row_height=22):
+        self.len_col = len_col
+        self.header_height = header_height
+        self.row_height = row_height
+        self.header_style = table_style(HEAD_BACKGROUND, font_size=font_size, font_name=font_name)
+        self.body_style = table_style(BLANK_BACKGROUND, align=tuple(align), font_size=font_size, font_name=font_name)
+
+    def header(self, thead):
+        table = Table([thead], colWidths=self.len_col, rowHeights=[self.header_height])
+        table.setStyle(self.header_style)
+        return table
+
+    def body(self, values):
+        table = Table(values, colWidths=self.len_col, rowHeights=[self.row_height] * len(values))
+        table.setStyle(self.body_style)
+        return table
+
+
+def iter_chunks(iterable, size):
+    """ Listas de até size itens, na ordem """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def build_document(doc, flowables, on_page, spool_max_size=PDF_SPOOL_MAX_SIZE):
+    """
+        Gera o PDF de doc (SimpleDocTemplate) a partir de flowables (gerador) num arquivo
+        temporário, que volta posicionado no início; o chamador fecha o arquivo
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+    doc.filename = output
+    doc.build(FlowableStream(flowables), onFirstPage=on_page, onLaterPages=on_page)
+    output.seek(0)
+    return output
@@ -4,6 +4,8 @@ import os
 
 # from cgi import escape
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
 # django
 from django.conf import settings
@@ -30,6 +32,11 @@ from phonecalls.constants import CALLTYPE_CHOICES
 from phonecalls.constants import VC1, VC2, VC3, LOCAL, LDN
 
 # local
+from .chunked import DETAIL_CHUNK_ROWS
+from .chunked import DetailTableLayout
+from .chunked import build_document
+from .chunked import iter_chunks
+from .utils import get_contract_list
 from .utils import get_tj_calltype_title
 from phonecalls.constants import OLD_CONTRACT,  NEW_CONTRACT
 
@@ -52,7 +59,6 @@ from charges.constants import MO_SUPERVISOR
 from charges.constants import SOFTWARE_ACCESS_SERVICE
 from charges.constants import SOFTWARE_EXTENSION_SERVICE
 from charges.constants import WIRELESS_ACCESS_SERVICE
-from Equipments.models import ContractBasicServices
 
 CALLTYPE_MAP = dict(CALLTYPE_CHOICES)
 
@@ -347,6 +353,65 @@ class SystemReport(object):
             self.space_between_tables()
         return self.close()
 
+    def iter_phonecall_flowables(self, phonecall_rows, chunk_rows):
+        """
+            Mesmo conteúdo de make_phonecall_table, gerado em fluxo: phonecall_rows
+            ordenadas por ramal (extension__extension), tabelas de até chunk_rows linhas
+        """
+        size = (self._width - 50) / 7
+        thead = ['Ramal', 'Número Discado', 'Tipo de Chamada',
+                 'Data/Hora Início', 'Data/Hora Fim', 'Duração', 'Valor']
+        layout = DetailTableLayout(
+            len_col=[size - 15, size - 15, size + 90, size, size, size - 30, size - 30],
+            align=['CENTER'] * 7,
+            font_size=8,
+            row_height=22)
+        tj_titles = self.company.slug in ('tj', 'sema')
+
+        for ramal, phonecall_list in groupby(phonecall_rows, key=itemgetter('extension__extension')):
+            yield Paragraph(f"<font size=9><b>{ escape(f'RAMAL: {ramal}') }</b></font><br/>", style=self.style)
+            yield layout.header(thead)
+            count = billedtime_sum = 0
+            cost_sum = 0.0
+            for chunk in iter_chunks(phonecall_list, chunk_rows):
+                values = []
+                for phonecall in chunk:
+                    calltype_title = CALLTYPE_MAP[phonecall['calltype']]
+                    if tj_titles:
+                        calltype_title = get_tj_calltype_title(phonecall['calltype'])
+                    values.append([
+                        ramal,
+                        phonecall['dialednumber'],
+                        calltype_title,
+                        f"{phonecall['startdate'].strftime('%d/%m/%Y')} {phonecall['starttime'].strftime('%H:%M:%S')}",
+                        f"{phonecall['stopdate'].strftime('%d/%m/%Y')} {phonecall['stoptime'].strftime('%H:%M:%S')}",
+                        time_format(phonecall['duration']),
+                        f"R$ {make_price(phonecall['billedamount'])}"])
+                    count += 1
+                    billedtime_sum += phonecall['duration']
+                    cost_sum += float(phonecall['billedamount'])
+                yield layout.body(values)
+            yield layout.body([[
+                '',
+                '',
+                '',
+                'TOTAL:',
+                count,
+                time_format(billedtime_sum),
+                f"R$ {make_price(cost_sum)}"]])
+            yield Paragraph("<br/><br/>", style=self.style)
+
+    def make_phonecall_table_chunked(self, phonecall_rows, chunk_rows=DETAIL_CHUNK_ROWS):
+        """
+            Relatório detalhado com memória limitada: as chamadas são lidas em fluxo
+            (ex.: queryset.iterator()) e as páginas desenhadas à medida que as tabelas são geradas
+            Retorna um arquivo temporário com o PDF, posicionado no início
+        """
+        return build_document(
+            self._doc,
+            self.iter_phonecall_flowables(phonecall_rows, chunk_rows),
+            self.create_header_and_footer)
+
     def make_phonecall_resume_table(self, context):
         service_amount = 0
         service_cost = 0
@@ -425,7 +490,7 @@ class SystemReport(object):
                                     f"R$ {make_price(context['basic_service'][key]['cost'])}"])
             else:
                 #Here I may need to consider not only company but also contract number
-                contract_list = ContractBasicServices.objects.filter(organization=context['organization'])
+                contract_list = get_contract_list(context)
                 styles = getSampleStyleSheet()
                 styleN = styles['Normal']
                 styleN.wordWrap = 'CJK'
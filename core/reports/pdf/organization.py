@@ -11,8 +11,6 @@ from django.contrib.staticfiles import finders
 from django.templatetags.static import static
 
 # third party
-from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -20,7 +18,6 @@ from reportlab.platypus import PageBreak
 from reportlab.platypus import Paragraph, Spacer
 from reportlab.platypus import SimpleDocTemplate
 from reportlab.platypus import Table
-from reportlab.platypus import TableStyle
 from reportlab.rl_config import TTFSearchPath
 from reportlab.lib.styles import getSampleStyleSheet
 
@@ -33,10 +30,15 @@ from charges.constants import BASIC_SERVICE_MAP_NEW
 from charges.constants import BASIC_SERVICE_MAP_PMF
 from charges.constants import BASIC_SERVICE_MO_MAP
 from core.utils import time_format
+from core.reports.pdf.utils import get_contract_list
+from core.reports.pdf.styles import BLANK_BACKGROUND
+from core.reports.pdf.styles import ROW_BACKGROUND
+from core.reports.pdf.styles import TITLE_BACKGROUND
+from core.reports.pdf.styles import TOTAL_BACKGROUND
+from core.reports.pdf.styles import table_style
 from phonecalls.constants import CALLTYPE_CHOICES
 from phonecalls.constants import VC1, VC2, VC3, LOCAL, LDN, LDI
 from phonecalls.constants import NEW_CONTRACT, OLD_CONTRACT
-from Equipments.models import ContractBasicServices
 
 CALLTYPE_MAP = dict(CALLTYPE_CHOICES)
 
@@ -168,15 +170,7 @@ class SystemReportOrganization(object):
         Creating the table header
         """
 
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#ffffff')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(BLANK_BACKGROUND)
         thead = [data['thead']]
         tbl = Table(
             thead,
@@ -186,18 +180,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # Inserting the data in the table
-        cont = 0
-        array_tblstyle = []
-        for align in data['align']:
-            array_tblstyle.append(('ALIGN', (cont, 0), (cont, -1), align))
-            cont += 1
-        array_tblstyle.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
-        array_tblstyle.append(('FONTSIZE', (0, 0), (-1, -1), 9))
-        array_tblstyle.append(('FONTNAME', (0, 0), (-1, -1), 'Sans'))
-        array_tblstyle.append(('BACKGROUND', (0, 0), (-1, -1), HexColor('#ffffff')))
-        array_tblstyle.append(('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white))
-        array_tblstyle.append(('BOX', (0, 0), (-1, -1), 0.50, colors.white))
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(BLANK_BACKGROUND, align=tuple(data['align']))
 
         tbl = Table(
             data['values'],
@@ -222,15 +205,7 @@ class SystemReportOrganization(object):
         self.insert_title_table(title=f"Organização: {context['organization'].name}")
         org_id = context['organization'].id
         # ### Parte 2 - Título Serviços de Comunicação ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND)
         if context['organization'].id == 2:
             thead = [['SERVIÇOS BASICOS']]
         else:
@@ -245,15 +220,7 @@ class SystemReportOrganization(object):
 
         # ### Parte 1 - Cabeçalho da tabela ###
 
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
         #ADDIng ITEM per request of Vera
         if context['organization'].id != 2:
             thead = [['ITEM', 'SERVIÇO', 'VALOR UNITÁRIO' ,'QUANTIDADE', 'VALOR PERÍODO']]
@@ -274,31 +241,9 @@ class SystemReportOrganization(object):
 
         # ### Parte 4 - Chamadas de Discagem Local ###
         if context['organization'].id != 2:
-            array_tblstyle_rows = [
-                ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle_rows)
+            tblstyle = table_style(ROW_BACKGROUND, align=('CENTER', 'LEFT', 'RIGHT', 'CENTER', 'RIGHT'))
         else:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'))
         thead = []
 
         service_amount = 0
@@ -308,8 +253,7 @@ class SystemReportOrganization(object):
         call_prop_map = context['prop']
         # ETICE Customization Item number less than 10 are telphones. greater are call center. Needs to start groups??
         if context['organization'].id != 2:
-            contract_list = ContractBasicServices.objects.filter(organization=context['organization'],
-                                                                 item_number__lt=10).order_by('item_number')
+            contract_list = [contract for contract in get_contract_list(context, ordered=True) if contract.item_number < 10]
             styles = getSampleStyleSheet()
             styleN = styles['Normal']
             styleN.wordWrap = 'CJK'
@@ -354,16 +298,7 @@ class SystemReportOrganization(object):
             self._story.append(tbl)
 
             #Totals
-            array_tblstyle_total = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle_total)
+            tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70, font_name=None)
             thead = [[
                 'TOTAL',
                 str(service_amount),
@@ -379,7 +314,7 @@ class SystemReportOrganization(object):
             self._story.append(PageBreak())  # Perhaps here
 
             # Starting new table
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
             thead = [['TABELA 2 - SERVIÇOS DE CONTACT CENTER']]
             size = self._width - 50
             tbl = Table(
@@ -397,12 +332,11 @@ class SystemReportOrganization(object):
                 rowHeights=[20 for x in range(len(thead))])
             tbl.setStyle(tblstyle)
             self._story.append(tbl)
-            tblstyle = TableStyle(array_tblstyle_rows)
+            tblstyle = table_style(ROW_BACKGROUND, align=('CENTER', 'LEFT', 'RIGHT', 'CENTER', 'RIGHT'))
             thead = []
             service_amount = 0
             service_cost = 0
-            contract_list = ContractBasicServices.objects.filter(organization=context['organization'],
-                                                                 item_number__gte=10).order_by('item_number')
+            contract_list = [contract for contract in get_contract_list(context, ordered=True) if contract.item_number >= 10]
             for contract in contract_list:
                 if contract.legacyID in call_company_map and call_company_map[contract.legacyID]['amount'] != 0:
                     service_amount += call_company_map[contract.legacyID]['amount']
@@ -442,16 +376,7 @@ class SystemReportOrganization(object):
             self._story.append(tbl)
 
             # Totals
-            array_tblstyle_total = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle_total)
+            tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70, font_name=None)
             thead = [[
                 'TOTAL',
                 str(service_amount),
@@ -466,7 +391,7 @@ class SystemReportOrganization(object):
             self._story.append(tbl)
             self._story.append(PageBreak()) # Perhaps here
         else:
-            contract_list = ContractBasicServices.objects.filter(organization=context['organization']).order_by('item_number')
+            contract_list = get_contract_list(context, ordered=True)
             for contract in contract_list:
                 if contract.legacyID in call_company_map and call_company_map[contract.legacyID]['amount'] != 0:
                     service_amount += call_company_map[contract.legacyID]['amount']
@@ -498,16 +423,7 @@ class SystemReportOrganization(object):
             self._story.append(tbl)
 
             # ### Parte 12 - Total dos Serviços de Comunicação ###
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70, font_name=None)
             thead = [[
                 'TOTAL DOS SERVIÇOS BASICOS',
                 str(service_amount),
@@ -527,15 +443,7 @@ class SystemReportOrganization(object):
         #value_service_comunication_total = call_company_map['cost_sum']
 
         # ### Parte 1 - Título Serviços de Comunicação ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND)
         if context['organization'].id != 2:
             thead = [['TABELA 3 - SERVIÇOS DE COMUNICAÇÃO']]
         else:
@@ -549,15 +457,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 2 - Cabeçalho da tabela ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
         if context['organization'].id != 2:
             thead = [['SERVIÇO', 'VALOR/nUNITÁRIO', 'CHAMADAS', 'TEMPO FATURADO', 'VALOR PERÍODO']]
             size = (self._width - 50) / 6
@@ -576,15 +476,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 3 - Título Discagem Local ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
         thead = [['DISCAGEM LOCAL']]
         size = self._width - 50
         tbl = Table(
@@ -595,18 +487,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 4 - Chamadas de Discagem Local ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
         local_list = [{
             'type': LOCAL,  # LOCAL
             'desc': 'Local Fixo-Fixo Extragrupo'
@@ -631,19 +512,7 @@ class SystemReportOrganization(object):
         call_company_map = context
 
         if context['organization'].id != 2:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
             local_list = [{
                 'type': LOCAL,  # LOCAL
                 'desc': 'Operação de acesso externo à rede para telefone fixo para ligações locais'
@@ -672,18 +541,7 @@ class SystemReportOrganization(object):
                 colWidths=[size * 2, size, size, size, size],
                 rowHeights=[30 for x in range(len(thead))])
         else:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
             local_list = [{
                 'type': LOCAL,  # LOCAL
                 'desc': 'Local Fixo-Fixo Extragrupo'
@@ -716,18 +574,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 5 - Total de Discagem Local ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
         if 'local' in call_company_map:
             minutes = call_company_map['local']['billedtime_sum']
             thead = [[
@@ -753,15 +600,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 6 - Título Longa Distancia Nacional ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
         thead = [['LONGA DISTÂNCIA NACIONAL']]
         size = self._width - 50
         tbl = Table(
@@ -773,19 +612,7 @@ class SystemReportOrganization(object):
 
         # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
         if context['organization'].id != 2:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
             if LDN in call_company_map:
                 call_company = call_company_map[LDN]
                 if type(call_company) is not dict:
@@ -805,18 +632,7 @@ class SystemReportOrganization(object):
                 colWidths=[size * 2, size, size, size, size],
                 rowHeights=[20 for x in range(len(thead))])
         else:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
             if LDN in call_company_map:
                 call_company = call_company_map[LDN]
                 if type(call_company) is not dict:
@@ -838,18 +654,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 8 - Total de Longa Distancia Nacional ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
         if 'national' in call_company_map:
             minutes = call_company_map['national']['billedtime_sum']
             thead = [[
@@ -879,15 +684,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 9 - Título Longa Distância Internacional ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
         thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
         size = self._width - 50
         tbl = Table(
@@ -899,19 +696,7 @@ class SystemReportOrganization(object):
 
         # ### Parte 10 - Chamadas de Longa Distância Internacional ###
         if context['organization'].id != 2:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
             if 'international' in call_company_map:
                 minutes = call_company_map[LDI]['billedtime_sum']
                 thead = [[
@@ -933,18 +718,7 @@ class SystemReportOrganization(object):
                 colWidths=[size * 2, size,size, size, size],
                 rowHeights=[30 for x in range(len(thead))])
         else:
-            array_tblstyle = [
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-            tblstyle = TableStyle(array_tblstyle)
+            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'))
             if 'international' in call_company_map:
                 minutes = call_company_map['international']['billedtime_sum']
                 thead = [[
@@ -967,18 +741,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 11 - Total de Longa Distancia Internacional ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
         if 'international' in call_company_map:
             minutes = call_company_map['international']['billedtime_sum']
             thead = [[
@@ -1008,18 +771,7 @@ class SystemReportOrganization(object):
         self._story.append(tbl)
 
         # ### Parte 12 - Total dos Serviços de Comunicação ###
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
         seconds = call_company_map['billedtime_sum']
         thead = [[
             'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
@@ -1046,15 +798,7 @@ class SystemReportOrganization(object):
 
         #-----------------------
         value_service_comunication_total = call_company_map['cost_sum']
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND)
         thead = [['TOTAL']]
         size = self._width - 50
         tbl = Table(
@@ -1066,16 +810,7 @@ class SystemReportOrganization(object):
 
         value_total = float(value_service_basic_total) + float(value_service_comunication_total)
 
-        array_tblstyle = [
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-        tblstyle = TableStyle(array_tblstyle)
+        tblstyle = table_style(TITLE_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
         # minutes = call_company_map['billedtime_sum'] * 60
 
         if context['organization'].id != 2:
@@ -1121,15 +856,7 @@ class SystemReportOrganization(object):
 
                 if 'services' in call_company_map:
                     # ### Parte 2 - Título Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND)
                     thead = [['SERVIÇOS BASICOS']]
                     size = self._width - 50
                     tbl = Table(
@@ -1140,15 +867,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 1 - Cabeçalho da tabela ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                     thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'QUANTIDADE', 'VALOR PERÍODO']]
                     size = (self._width - 50) / 5
                     tbl = Table(
@@ -1159,22 +878,10 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 4 - Chamadas de Discagem Local ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                        ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'RIGHT'), first_font_size=7)
                     thead = []
 
-                    contract_list = ContractBasicServices.objects.filter(organization=context['organization'])
+                    contract_list = get_contract_list(context)
                     try:
                         call_prop_map = call_company_map['prop']
                     except KeyError:
@@ -1218,17 +925,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 12 - Total dos Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70)
                     thead = [[
                         'TOTAL DOS SERVIÇOS BASICOS',
                         str(service_amount),
@@ -1243,15 +940,7 @@ class SystemReportOrganization(object):
                     self.space_between_tables()
 
                 # ### Parte 1 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['SERVIÇOS DE COMUNICAÇÃO']]
                 size = self._width - 50
                 tbl = Table(
@@ -1262,15 +951,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 2 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                 thead = [[
                     'SERVIÇO', 'VALOR UNITÁRIO', 'CHAMADAS', 'TEMPO FATURADO', 'VALOR PERÍODO']]
                 size = (self._width - 50) / 6
@@ -1282,15 +963,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 3 - Título Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['DISCAGEM LOCAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -1301,19 +974,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 local_list = [{
                         'type': LOCAL,  # LOCAL
                         'desc': 'Local Fixo-Fixo Extragrupo'
@@ -1351,18 +1012,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 5 - Total de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'local' in call_company_map:
                     minutes = call_company_map['local']['billedtime_sum']
                     thead = [[
@@ -1381,15 +1031,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 6 - Título Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA NACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -1400,19 +1042,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 if LDN in call_company_map:
                     call_company = call_company_map[LDN]
                     if type(call_company) is not dict:
@@ -1436,18 +1066,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 8 - Total de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'national' in call_company_map:
                     minutes = call_company_map['national']['billedtime_sum']
                     thead = [[
@@ -1470,15 +1089,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 9 - Título Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -1489,19 +1100,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 10 - Chamadas de Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 if LDI in call_company_map:
                     call_company = call_company_map[LDI]
                     if type(call_company) is not dict:
@@ -1525,18 +1124,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 11 - Total de Longa Distancia Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'international' in call_company_map:
                     minutes = call_company_map['international']['billedtime_sum']
                     cost = make_price_adm(call_company_map['international']['cost_sum'])
@@ -1560,18 +1148,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 seconds = call_company_map['billedtime_sum']
                 thead = [[
                     'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
@@ -1604,15 +1181,7 @@ class SystemReportOrganization(object):
 
                         if 'services' in call_company_map:
                             # ### Parte 2 - Título Serviços de Comunicação ###
-                            array_tblstyle = [
-                                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(TITLE_BACKGROUND)
                             thead = [['SERVIÇOS BASICOS']]
                             size = self._width - 50
                             tbl = Table(
@@ -1623,15 +1192,7 @@ class SystemReportOrganization(object):
                             self._story.append(tbl)
 
                             # ### Parte 1 - Cabeçalho da tabela ###
-                            array_tblstyle = [
-                                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                                ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                             thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'QUANTIDADE', 'VALOR PERÍODO']]
                             size = (self._width - 50) / 5
                             tbl = Table(
@@ -1642,19 +1203,7 @@ class SystemReportOrganization(object):
                             self._story.append(tbl)
 
                             # ### Parte 4 - Chamadas de Discagem Local ###
-                            array_tblstyle = [
-                                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                                ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                                ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                                ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                                ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'RIGHT'), first_font_size=7)
                             thead = []
                             service_amount = 0
                             service_cost = 0
@@ -1677,17 +1226,7 @@ class SystemReportOrganization(object):
                             self._story.append(tbl)
 
                             # ### Parte 12 - Total dos Serviços de Comunicação ###
-                            array_tblstyle = [
-                                ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                                ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),  # 1 column
-                                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                                ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                                ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                                ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                                ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                                ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                            tblstyle = TableStyle(array_tblstyle)
+                            tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70)
                             thead = [[
                                 'TOTAL DOS SERVIÇOS BASICOS',
                                 str(service_amount),
@@ -1702,15 +1241,7 @@ class SystemReportOrganization(object):
                             self.space_between_tables()
 
                         # ### Parte 1 - Título Serviços de Comunicação ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TITLE_BACKGROUND)
                         thead = [['SERVIÇOS DE COMUNICAÇÃO']]
                         size = self._width - 50
                         tbl = Table(
@@ -1721,15 +1252,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 2 - Cabeçalho da tabela ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TITLE_BACKGROUND, grid=0.70)
                         thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'CHAMADAS',
                                   'TEMPO FATURADO', 'VALOR PERÍODO']]
                         size = (self._width - 50) / 6
@@ -1741,15 +1264,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 3 - Título Discagem Local ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                         thead = [['DISCAGEM LOCAL']]
                         size = self._width - 50
                         tbl = Table(
@@ -1760,19 +1275,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 4 - Chamadas de Discagem Local ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                         local_list = [{
                             'type': LOCAL,  # LOCAL
                             'desc': 'Local Fixo-Fixo Extragrupo'
@@ -1810,18 +1313,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 5 - Total de Discagem Local ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         if 'local' in call_company_map:
                             minutes = call_company_map['local']['billedtime_sum']
                             thead = [[
@@ -1840,15 +1332,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 6 - Título Longa Distancia Nacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                         thead = [['LONGA DISTÂNCIA NACIONAL']]
                         size = self._width - 50
                         tbl = Table(
@@ -1859,19 +1343,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                         if LDN in call_company_map:
                             call_company = call_company_map[LDN]
                             if type(call_company) is not dict:
@@ -1895,18 +1367,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 8 - Total de Longa Distancia Nacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         if 'national' in call_company_map:
                             minutes = call_company_map['national']['billedtime_sum']
                             thead = [[
@@ -1929,15 +1390,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 9 - Título Longa Distância Internacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                         thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                         size = self._width - 50
                         tbl = Table(
@@ -1948,19 +1401,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 10 - Chamadas de Longa Distância Internacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (4, 0), (4, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                         if LDI in call_company_map:
                             call_company = call_company_map[LDI]
                             if type(call_company) is not dict:
@@ -1984,18 +1425,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 11 - Total de Longa Distancia Internacional ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         if 'international' in call_company_map:
                             minutes = call_company_map['international']['billedtime_sum']
                             cost = make_price_adm(call_company_map['international']['cost_sum'])
@@ -2019,18 +1449,7 @@ class SystemReportOrganization(object):
                         self._story.append(tbl)
 
                         # ### Parte 12 - Total dos Serviços de Comunicação ###
-                        array_tblstyle = [
-                            ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                            ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (2, 0), (2, -1), 'CENTER'),  # 1 column
-                            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),  # 1 column
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                            ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                            ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                            ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                            ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                        tblstyle = TableStyle(array_tblstyle)
+                        tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                         minutes = call_company_map['billedtime_sum']
                         thead = [[
                             'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
@@ -2068,15 +1487,7 @@ class SystemReportOrganization(object):
                 self.insert_title_table(title=organization)
 
                 # ### Parte 2 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['SERVIÇOS BASICOS']]
                 size = self._width - 50
                 tbl = Table(
@@ -2087,15 +1498,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 1 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, font_size=8, grid=0.70)
                 thead = [['SERVIÇO', 'QUANTIDADE', 'VALOR MENSAL(UST)', 'VALOR MENSAL(R$)']]
                 size = (self._width - 50) / 6
                 tbl = Table(
@@ -2106,17 +1509,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'))
                 thead = []
 
                 service_amount = 0
@@ -2144,16 +1537,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT'), grid=0.70, font_name=None)
                 thead = [[
                     'TOTAL DOS SERVIÇOS BASICOS',
                     str(service_amount),
@@ -2173,15 +1557,7 @@ class SystemReportOrganization(object):
             else:
                 if 'service_basic' in call_organization_map:
                     # ### Parte 2 - Título Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND)
                     thead = [[
                         'TABELA 1 – SERVIÇOS DE DISPONIBILIZAÇÃO DE ACESSO A COMUNICAÇÃO VOIP']]
                     size = self._width - 50
@@ -2193,15 +1569,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 1 - Cabeçalho da tabela ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 7),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND, font_size=7, grid=0.70)
                     thead = [['SERVIÇO', 'VALOR UNITÁRIO(UST)', 'QUANTIDADE(UST)',
                               'VALOR MENSAL(UST)', 'VALOR MENSAL(R$)']]
                     size = (self._width - 50) / 6
@@ -2213,20 +1581,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 4 - Chamadas de Discagem Local ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                        ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'RIGHT', 'RIGHT'), first_font_size=7)
                     thead = []
 
                     service_amount = 0
@@ -2259,18 +1614,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 12 - Total dos Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT', 'RIGHT'), grid=0.70)
                     thead = [[
                         'TOTAL',
                         str(make_price_adm(service_amount)),
@@ -2290,15 +1634,7 @@ class SystemReportOrganization(object):
                     value_service_cost_ust = service_cost_ust
 
                     # ### Parte 2 - Título Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND)
                     thead = [['TABELA 2 –SERVIÇOS DE CONTACT CENTER']]
                     size = self._width - 50
                     tbl = Table(
@@ -2309,15 +1645,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 1 - Cabeçalho da tabela ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 7),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TITLE_BACKGROUND, font_size=7, grid=0.70)
                     thead = [['SERVIÇO', 'VALOR UNITÁRIO(UST)', 'QUANTIDADE(UST)',
                               'VALOR MENSAL(UST)', 'VALOR MENSAL(R$)']]
                     size = (self._width - 50) / 6
@@ -2329,20 +1657,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 4 - Chamadas de Discagem Local ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (0, -1), 7),  # middle column
-                        ('FONTSIZE', (1, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'RIGHT', 'RIGHT'), first_font_size=7)
                     thead = []
 
                     service_amount = 0
@@ -2375,18 +1690,7 @@ class SystemReportOrganization(object):
                     self._story.append(tbl)
 
                     # ### Parte 12 - Total dos Serviços de Comunicação ###
-                    array_tblstyle = [
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                        ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),   # 1 column
-                        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                        ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                        ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                        ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                    tblstyle = TableStyle(array_tblstyle)
+                    tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'RIGHT', 'RIGHT'), grid=0.70)
                     thead = [[
                         'TOTAL',
                         str(make_price_adm(service_amount)),
@@ -2406,15 +1710,7 @@ class SystemReportOrganization(object):
                     value_service_cost_ust += service_cost_ust
 
                 # ### Parte 1 - Título Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['TABELA 3 - SERVIÇOS MENSAL EXECUTADOS POR DEMANDA (MINUTAGEM)']]
                 size = self._width - 50
                 tbl = Table(
@@ -2425,15 +1721,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 2 - Cabeçalho da tabela ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, font_size=8, grid=0.70)
                 thead = [['SERVIÇO', 'VALOR UNITÁRIO', 'CHAMADAS',
                           'VALOR MENSAL(UST)', 'VALOR MENSAL(R$)']]
                 size = (self._width - 50) / 6
@@ -2445,15 +1733,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 3 - Título Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['DISCAGEM LOCAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2464,19 +1744,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 4 - Chamadas de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 local_list = [{
                         'type': LOCAL,  # LOCAL
                         'desc': 'Local Fixo-Fixo Extragrupo'
@@ -2525,18 +1793,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 5 - Total de Discagem Local ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'local' in call_organization_map:
                     thead = [[
                         'Total de Discagem Local',
@@ -2554,15 +1811,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 6 - Título Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA NACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2573,19 +1822,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 7 - Chamadas de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 partial_quantity = 0
                 if LDN in call_organization_map:
                     call_organization = call_organization_map[LDN]
@@ -2617,18 +1854,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 8 - Total de Longa Distancia Nacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'national' in call_organization_map:
                     thead = [[
                         'Total de Longa Distancia Nacional',
@@ -2650,15 +1876,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 9 - Título Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, grid=0.70)
                 thead = [['LONGA DISTÂNCIA INTERNACIONAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2669,19 +1887,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 10 - Chamadas de Longa Distância Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (4, 0), (4, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#f1f1f1')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(ROW_BACKGROUND, align=('LEFT', 'RIGHT', 'CENTER', 'CENTER', 'RIGHT'))
                 thead = [[
                     'Longa Distância Internacional', 'R$ 0,0000', '0,0000', '0,0000', 'R$ 0,0000']]
                 size = (self._width - 50) / 6
@@ -2693,18 +1899,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 11 - Total de Longa Distancia Internacional ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 if 'international' in call_organization_map:
                     thead = [[
                         'Total de Longa Distancia Internacional',
@@ -2726,18 +1921,7 @@ class SystemReportOrganization(object):
                 self._story.append(tbl)
 
                 # ### Parte 12 - Total dos Serviços de Comunicação ###
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),   # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),   # 1 column
-                    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#dedede')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TOTAL_BACKGROUND, align=('LEFT', 'CENTER', 'CENTER', 'RIGHT'), grid=0.70)
                 thead = [[
                     'TOTAL DOS SERVIÇOS DE COMUNICAÇÃO',
                     str(make_price_adm(total_amount)),
@@ -2757,15 +1941,7 @@ class SystemReportOrganization(object):
                 self.space_between_tables()
                 self.space_between_tables2()
 
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),   # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.50, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND)
                 thead = [['TOTAL']]
                 size = self._width - 50
                 tbl = Table(
@@ -2779,16 +1955,7 @@ class SystemReportOrganization(object):
                 value_total_ust = \
                     float(value_service_cost_ust) + float(call_organization_map['cost_ust_sum'])
 
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 thead = [[
                     'Valor Mensal (UST) (t1+t2+t3+t4+t5):',
                     f"{make_price_adm(value_total_ust)}"]]
@@ -2799,16 +1966,7 @@ class SystemReportOrganization(object):
                     rowHeights=[20 for x in range(len(thead))])
                 tbl.setStyle(tblstyle)
                 self._story.append(tbl)
-                array_tblstyle = [
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # 1 column
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # 1 column
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # middle column
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),  # middle column
-                    ('FONTNAME', (0, 0), (-1, -1), 'Sans'),
-                    ('BACKGROUND', (0, 0), (-1, -1), HexColor('#c3c3c3')),
-                    ('INNERGRID', (0, 0), (-1, -1), 0.70, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
-                tblstyle = TableStyle(array_tblstyle)
+                tblstyle = table_style(TITLE_BACKGROUND, align=('LEFT', 'RIGHT'), grid=0.70)
                 thead = [[
                     'Valor Mensal (R$) (t1+t2+t3+t4+t5):',
                     f"R$ {make_price_adm(value_total)}"]]
@@ -0,0 +1,49 @@
+"""
+    Estilos das tabelas dos relatórios em PDF, montados uma vez e reaproveitados
+    Os relatórios da organização e do administrador criam perto de cem Table por PDF;
+    os estilos variam só no alinhamento das colunas, na cor de fundo, no tamanho da
+    fonte e na espessura da grade, então cada combinação vira um TableStyle memorizado
+    (o Table só lê os comandos do estilo, que pode ser compartilhado)
+    Sem dependência do Django
+"""
+
+# python
+from functools import lru_cache
+
+# third party
+from reportlab.lib import colors
+from reportlab.lib.colors import HexColor
+from reportlab.platypus import TableStyle
+
+TITLE_BACKGROUND = '#c3c3c3'   # títulos e cabeçalhos das tabelas
+TOTAL_BACKGROUND = '#dedede'   # linhas de total
+ROW_BACKGROUND = '#f1f1f1'     # linhas de serviços/chamadas
+HEAD_BACKGROUND = '#cccccc'    # cabeçalho do relatório detalhado
+BLANK_BACKGROUND = '#ffffff'
+
+
+@lru_cache(maxsize=None)
+def table_style(background, align='CENTER', font_size=9, grid=0.50, first_font_size=None, font_name='Sans'):
+    """
+        TableStyle com os comandos usados nos relatórios, na mesma ordem:
+          - align: alinhamento de todas as células ('CENTER') ou tupla com um por coluna
+          - first_font_size: fonte menor só na primeira coluna (descrições longas)
+          - font_name=None: sem FONTNAME (fonte padrão do ReportLab)
+    """
+    if isinstance(align, str):
+        commands = [('ALIGN', (0, 0), (-1, -1), align)]
+    else:
+        commands = [('ALIGN', (column, 0), (column, -1), value) for column, value in enumerate(align)]
+    commands.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
+    if first_font_size is None:
+        commands.append(('FONTSIZE', (0, 0), (-1, -1), font_size))
+    else:
+        commands.append(('FONTSIZE', (0, 0), (0, -1), first_font_size))
+        commands.append(('FONTSIZE', (1, 0), (-1, -1), font_size))
+    if font_name is not None:
+        commands.append(('FONTNAME', (0, 0), (-1, -1), font_name))
+    commands += [
+        ('BACKGROUND', (0, 0), (-1, -1), HexColor(background)),
+        ('INNERGRID', (0, 0), (-1, -1), grid, colors.white),
+        ('BOX', (0, 0), (-1, -1), 0.50, colors.white)]
+    return TableStyle(commands)
@@ -1,4 +1,5 @@
 # project
+from Equipments.models import ContractBasicServices
 from phonecalls.constants import VC1, VC2, VC3, LOCAL, LDN, LDI
 
 
@@ -17,3 +18,16 @@ def get_tj_calltype_title(calltype):
         return 'Operação de acesso externo à rede \npara ligações internacionais'
 
 
+def get_contract_list(context, ordered=False):
+    """
+        Contratos da organização do contexto (ordered=True: na ordem do item)
+        Usa o catálogo da requisição quando presente no contexto (sem nova consulta)
+    """
+    catalogue = context.get('catalogue')
+    if catalogue is not None:
+        contract_list = catalogue.get_contracts(context['organization'])
+    else:
+        contract_list = list(ContractBasicServices.objects.filter(organization=context['organization']).order_by('pk'))
+    if ordered:
+        contract_list.sort(key=lambda contract: contract.item_number)
+    return contract_list
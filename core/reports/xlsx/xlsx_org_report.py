@@ -443,7 +443,7 @@ class XLSXOrgReport(object):
 
             # total international
             self.write_row([
-                '', ''
+                '', '',
                 (f'=SUM(C{row_begin}:C{row_end})', self.center),
                 (f'=SUM(D{row_begin}:D{row_end})', self.time_format),
                 (f'=SUM(E{row_begin}:E{row_end})', self.price_format)])
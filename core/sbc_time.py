@@ -0,0 +1,166 @@
+"""
+    Datas do SBC (ex.: '18:16:52.931  UTC Mon Sep 22 2025') e conversão UTC -> fuso local
+    Sem dependência do Django: usado pelos scripts de ETL (scripts/) e por Phonecall.make_datetime
+      - parse_sbc_utc: formato fixo "%H:%M:%S.%f %Z %a %b %d %Y" lido à mão (strptime só nos casos fora do padrão)
+      - UtcOffsetTable: deslocamento do fuso calculado uma vez por dia UTC; dias com mudança
+        de horário (DST) são convertidos pelo tzinfo, instante a instante
+      - parse_sbc_datetimes: versão para listas, com as datas repetidas interpretadas uma vez
+"""
+
+# python
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+SBC_DATETIME_FORMAT = '%H:%M:%S.%f %Z %a %b %d %Y'
+SBC_DATETIME_FORMATS = (
+    SBC_DATETIME_FORMAT,
+    '%H:%M:%S.%f %a %b %d %Y',
+    '%H:%M:%S %Z %a %b %d %Y',
+)
+
+MONTHS = {name: number for number, name in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)}
+UTC_NAMES = frozenset(('UTC', 'GMT'))
+ONE_DAY = timedelta(days=1)
+
+
+def strptime_sbc(value):
+    """ Caminho lento: os mesmos formatos aceitos antes pelos scripts """
+    for date_format in SBC_DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            pass
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_sbc_date(month, day, year):
+    """
+        'Sep', '22', '2025' -> (date, '2025-09-22T'), ou None
+        Memorizado: há poucos dias distintos por arquivo
+    """
+    try:
+        value = date(int(year), MONTHS[month], int(day))
+    except (KeyError, ValueError):
+        return None
+    return value, f'{value.isoformat()}T'
+
+
+def is_sbc_clock(value):
+    """ 'HH:MM:SS' ou 'HH:MM:SS.f' (até 6 casas), o que o fromisoformat deve ler """
+    size = len(value)
+    return (8 <= size <= 15 and value[2] == ':' and value[5] == ':'
+            and (size == 8 or (value[8] == '.' and value[9:].isdigit())))
+
+
+def parse_sbc_utc(value):
+    """
+        Data do SBC -> datetime ingênuo em UTC, ou None se inválida
+        Aceita espaços repetidos, o fuso (UTC/GMT) omitido e os segundos sem fração
+    """
+    if not value:
+        return None
+    parts = value.split()
+    if len(parts) == 6 and parts[1] in UTC_NAMES:
+        del parts[1]
+    if len(parts) == 5:
+        day = parse_sbc_date(parts[2], parts[3], parts[4])
+        if day is not None and is_sbc_clock(parts[0]):
+            try:
+                return datetime.fromisoformat(day[1] + parts[0])
+            except ValueError:
+                pass
+    return strptime_sbc(' '.join(parts)) if parts else None
+
+
+@lru_cache(maxsize=None)
+def get_fixed_timezone(offset):
+    return timezone(offset)
+
+
+class UtcOffsetTable:
+    """
+        Converte datetimes UTC para o fuso informado consultando uma tabela
+        dia UTC -> deslocamento, preenchida sob demanda
+        Dias em que o deslocamento muda (início/fim do horário de verão) ficam
+        marcados com None e passam pelo astimezone do próprio fuso
+    """
+
+    def __init__(self, tz):
+        self.tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+        self.days = {}
+
+    def get_day(self, ordinal):
+        try:
+            return self.days[ordinal]
+        except KeyError:
+            pass
+        start = datetime.fromordinal(ordinal).replace(tzinfo=timezone.utc)
+        first = start.astimezone(self.tz).utcoffset()
+        last = (start + ONE_DAY - timedelta(microseconds=1)).astimezone(self.tz).utcoffset()
+        tzinfo = get_fixed_timezone(first) if first == last else None
+        self.days[ordinal] = tzinfo
+        return tzinfo
+
+    def to_local(self, value):
+        """ datetime UTC (ingênuo ou com tzinfo) -> datetime no fuso local """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(self.get_day(value.toordinal()) or self.tz)
+
+
+@lru_cache(maxsize=None)
+def get_offset_table(tz):
+    """ Tabela compartilhada por fuso (nome ou tzinfo) """
+    return UtcOffsetTable(tz)
+
+
+def parse_sbc_datetime(value, tz):
+    """ Data do SBC -> datetime no fuso tz, ou None """
+    utc_value = parse_sbc_utc(value)
+    if utc_value is None:
+        return None
+    return get_offset_table(tz).to_local(utc_value)
+
+
+def parse_sbc_datetimes(values, tz):
+    """
+        Versão em lote de parse_sbc_datetime (mesma ordem, None para inválidos)
+        A data ('Mon Sep 22 2025') e o deslocamento do dia são resolvidos uma
+        vez por valor distinto; para cada item resta ler o horário
+    """
+    table = get_offset_table(tz)
+    fromisoformat = datetime.fromisoformat
+    days = {}
+    result = []
+    append = result.append
+    for value in values:
+        parts = value.split() if value else ()
+        size = len(parts)
+        if size == 6 and parts[1] in UTC_NAMES:
+            key = (parts[3], parts[4], parts[5])
+        elif size == 5:
+            key = (parts[2], parts[3], parts[4])
+        else:
+            append(parse_sbc_datetime(value, tz))
+            continue
+        try:
+            prefix, tzinfo = days[key]
+        except KeyError:
+            day = parse_sbc_date(*key)
+            # dia inválido ou com mudança de horário: caminho item a item
+            prefix, tzinfo = (day[1], table.get_day(day[0].toordinal())) if day is not None else (None, None)
+            days[key] = prefix, tzinfo
+        if tzinfo is not None and is_sbc_clock(parts[0]):
+            try:
+                append(fromisoformat(f'{prefix}{parts[0]}+00:00').astimezone(tzinfo))
+                continue
+            except ValueError:
+                pass
+        append(parse_sbc_datetime(value, tz))
+    return result
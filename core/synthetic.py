@@ -0,0 +1,220 @@
+# python
+import random
+
+from datetime import date
+from datetime import time
+from datetime import timedelta
+from decimal import Decimal
+
+# django
+from django.utils.text import slugify
+
+# third party
+from organizations.models import Organization
+
+# project
+from centers.models import Center
+from centers.models import Company
+from centers.models import Sector
+from charges.constants import COMMUNICATION_SERVICE
+from Equipments.models import ContractBasicServices
+from Equipments.models import Equipment
+from Equipments.models import typeofphone
+from extensions.models import ExtensionLine
+from phonecalls.constants import PABX
+from phonecalls.constants import OUT_CALL, IN_CALL
+from phonecalls.constants import VC1, VC2, VC3, LOCAL, LDN, LDI
+from phonecalls.models import Phonecall
+from phonecalls.models import Price
+from phonecalls.models import PriceTable
+from phonecalls.utils import get_ddd
+
+CALLTYPES = [LOCAL, LOCAL, LOCAL, VC1, VC1, VC2, VC3, LDN, LDI]
+# valores por minuto (organização; empresas pagam EXTRA a mais)
+CALL_PRICES = {LOCAL: Decimal('0.05'), VC1: Decimal('0.12'), VC2: Decimal('0.35'),
+               VC3: Decimal('0.40'), LDN: Decimal('0.25'), LDI: Decimal('1.20')}
+COMPANY_PRICE_EXTRA = Decimal('0.01')
+# mesmo DDD e numeração de ramais do corpus de syslog (benchmarks/syslog_corpus.py)
+DEFAULT_DDD = '85'
+EXTENSION_START = 31250000
+
+
+def create_organizations(count, prefix='sintetica'):
+    """
+        Cria organizações sintéticas (o post_save cria configurações e tabela de serviços básicos)
+    """
+    return [Organization.objects.create(name=f'{prefix} {i}', slug=slugify(f'{prefix}-{i}'))
+            for i in range(count)]
+
+
+def create_companies(organization, count, start=0):
+    return [Company.objects.create(organization=organization,
+                                   name=f'EMP{organization.pk}-{i}',
+                                   slug=f'{organization.slug}-emp{i}',
+                                   code=f'{organization.slug}-{i}')
+            for i in range(start, start + count)]
+
+
+def create_call_pricetables(organization, companies):
+    """
+        Tabelas de valores de chamadas (um preço por tipo de chamada) da organização
+        e de cada empresa, já associadas
+    """
+    def create_pricetable(name, extra):
+        pricetable = PriceTable.objects.create(
+            organization=organization, name=name, servicetype=COMMUNICATION_SERVICE)
+        Price.objects.bulk_create([Price(table=pricetable, calltype=calltype, value=value + extra)
+                                   for calltype, value in CALL_PRICES.items()])
+        return pricetable
+
+    org_settings = organization.settings
+    org_settings.call_pricetable = create_pricetable(f'{organization.name} Chamadas', Decimal('0'))
+    org_settings.save(update_fields=['call_pricetable'])
+    for company in companies:
+        company.call_pricetable = create_pricetable(f'{company.name} Chamadas', COMPANY_PRICE_EXTRA)
+        company.save(update_fields=['call_pricetable'])
+
+
+def create_centers(company, count, sectors=2):
+    """ Centros de custo da empresa, cada um com `sectors` setores """
+    centers = []
+    for i in range(count):
+        center = Center.objects.create(organization=company.organization, company=company, name=f'Centro {i}')
+        for j in range(sectors):
+            Sector.objects.create(organization=company.organization, company=company, center=center,
+                                  name=f'Setor {j}')
+        centers.append(center)
+    return centers
+
+
+def create_extension_lines(company, centers, count, start=EXTENSION_START):
+    """
+        `count` ramais a partir de `start`, divididos em faixas contíguas entre os
+        centros de custo (Center.extension_range e setor do centro)
+    """
+    lines = []
+    size = -(-count // max(len(centers), 1))
+    for i, center in enumerate(centers or [None]):
+        first = start + i * size
+        last = min(first + size, start + count) - 1
+        if last < first:
+            break
+        sector = center.sector_set.first() if center else None
+        if center:
+            center.extension_range = f'{first}-{last}'
+            center.save(update_fields=['extension_range'])
+        lines.extend(ExtensionLine(organization=company.organization, company=company,
+                                   center=center, sector=sector, extension=str(extension))
+                     for extension in range(first, last + 1))
+    return ExtensionLine.objects.bulk_create(lines)
+
+
+def create_equipment(company, extension_lines, installed=None):
+    """ Um contrato e um tipo de aparelho da empresa e um equipamento por ramal """
+    installed = installed or date.today() - timedelta(days=365)
+    contract = ContractBasicServices.objects.create(
+        organization=company.organization, company=company, legacyID=1, contractID=company.pk,
+        item_number=1, description='Acesso básico', is_subcontract=False)
+    equiptype = typeofphone.objects.create(
+        manufacturer='Sintético', phoneModel='IP-100', organization=company.organization)
+    equiptype.servicetype.add(contract)
+    return Equipment.objects.bulk_create([
+        Equipment(contract=contract, equiptype=equiptype, extensionNumber=line, Dateinstalled=installed,
+                  OSNumber=f'OS{line.extension}', TagNumber=f'T{line.extension}',
+                  MACAdress=f'02:00:{int(line.extension) % 2 ** 32:08x}', IPAddress='10.0.0.1',
+                  organization=company.organization, company=company,
+                  center=line.center, sector=line.sector)
+        for line in extension_lines])
+
+
+def make_phonecall(organization, company, startdate, rnd, extension=None):
+    """
+        Monta uma chamada sem salvar, com valores já calculados
+        (bulk_create não dispara o pre_save)
+    """
+    inbound = rnd.random() < 0.4
+    calltype = rnd.choice(CALLTYPES)
+    duration = rnd.randint(0, 900)
+    starttime = time(rnd.randint(7, 19), rnd.randint(0, 59), rnd.randint(0, 59))
+    if extension is None:
+        chargednumber = f'85{rnd.randint(30000000, 39999999)}'
+    else:
+        chargednumber = f'{DEFAULT_DDD}{extension.extension}'
+    dialednumber = f'0{rnd.randint(11, 99)}9{rnd.randint(80000000, 99999999)}'
+    phonecall = Phonecall(
+        organization=organization,
+        company=company,
+        pabx=IN_CALL if inbound else OUT_CALL,
+        inbound=inbound,
+        calltype=calltype,
+        duration=duration,
+        startdate=startdate,
+        starttime=starttime,
+        stopdate=startdate,
+        stoptime=starttime,
+        chargednumber=chargednumber,
+        connectednumber=chargednumber,
+        dialednumber=dialednumber,
+        conditioncode=rnd.choice(PABX[OUT_CALL]))
+    if extension is not None:
+        phonecall.extension = extension
+        phonecall.center_id = extension.center_id
+        phonecall.sector_id = extension.sector_id
+    phonecall.billedtime = phonecall.make_billedtime()
+    phonecall.price = phonecall.org_price = Decimal('0.1')
+    phonecall.billedamount = phonecall.org_billedamount = \
+        round((phonecall.price / 60) * phonecall.billedtime, 2)
+    phonecall.charged_ddd = get_ddd(chargednumber)
+    phonecall.dialed_ddd = get_ddd(dialednumber)
+    return phonecall
+
+
+def create_phonecalls(companies, count, date_start=None, days=90, seed=0, batch_size=5000, extensions=None):
+    """
+        Cria `count` chamadas distribuídas entre as empresas e os `days` dias
+        a partir de `date_start`
+        extensions: {company.pk: [ExtensionLine, ...]} para associar as chamadas aos ramais
+    """
+    rnd = random.Random(seed)
+    date_start = date_start or date.today() - timedelta(days=days)
+    batch = []
+    created = 0
+    for i in range(count):
+        company = companies[i % len(companies)]
+        startdate = date_start + timedelta(days=rnd.randrange(days))
+        extension = rnd.choice(extensions[company.pk]) if extensions and extensions.get(company.pk) else None
+        batch.append(make_phonecall(company.organization, company, startdate, rnd, extension))
+        if len(batch) >= batch_size:
+            Phonecall.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
+    if batch:
+        Phonecall.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def create_dataset(organizations=2, companies=10, centers=3, extensions=50, calls=100000,
+                   days=90, date_start=None, equipment=True, prefix='sintetica', seed=0):
+    """
+        Base tarifária completa: organizações, empresas com tabelas de valores, centros de
+        custo e setores, faixas de ramais (a partir de EXTENSION_START, sem repetir entre
+        empresas), equipamentos e `calls` chamadas associadas aos ramais
+        Devolve {'organizations', 'companies', 'extensions': {company.pk: [ExtensionLine]}}
+    """
+    dataset = {'organizations': create_organizations(organizations, prefix=prefix),
+               'companies': [], 'extensions': {}}
+    start = EXTENSION_START
+    for organization in dataset['organizations']:
+        org_companies = create_companies(organization, companies)
+        create_call_pricetables(organization, org_companies)
+        for company in org_companies:
+            lines = create_extension_lines(company, create_centers(company, centers), extensions, start)
+            start += extensions
+            if equipment:
+                create_equipment(company, lines)
+            dataset['extensions'][company.pk] = lines
+        dataset['companies'].extend(org_companies)
+    create_phonecalls(dataset['companies'], calls, date_start=date_start, days=days, seed=seed,
+                      extensions=dataset['extensions'])
+    return dataset
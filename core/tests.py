@@ -1,3 +1,301 @@
+import threading
+import time
+import tracemalloc
+
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.test import Client
+from django.test import RequestFactory
+from django.test import SimpleTestCase
 from django.test import TestCase
+from django.test import override_settings
+from django.urls import reverse
+
+from core import pgpool
+from core.catalogue import Catalogue
+from core.instrumentation import InstrumentedViewMixin
+from core.instrumentation import ReportInstrumentationMiddleware
+from core.instrumentation import RequestProfile
+from core.instrumentation import _current_profile
+from core.instrumentation import get_stats
+from core.instrumentation import query_shape
+from core.instrumentation import record
+from core.instrumentation import reset_stats
+from core.synthetic import create_call_pricetables
+from core.synthetic import create_companies
+from core.synthetic import create_dataset
+from core.synthetic import create_organizations
+from Equipments.models import Equipment
+from phonecalls.models import Phonecall
+
+
+class InstrumentationTestCase(SimpleTestCase):
+
+    def test_query_shape(self):
+        self.assertEqual(
+            query_shape("SELECT *\n  FROM t WHERE id IN (%s, %s, %s) AND name = 'x' LIMIT 21"),
+            'SELECT * FROM t WHERE id IN (?) AND name = ? LIMIT ?')
+
+    def test_phases_count_outermost_call(self):
+        class Base(InstrumentedViewMixin):
+            def get_context_data(self):
+                return {'base': True}
+
+        class Child(Base):
+            def get_context_data(self):
+                return {**super().get_context_data(), 'child': True}
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        try:
+            context = Child().get_context_data()
+        finally:
+            _current_profile.reset(token)
+        self.assertEqual(context, {'base': True, 'child': True})
+        self.assertEqual(list(profile.phases), ['context'])
+        self.assertEqual(profile._depth['context'], 0)
+
+
+class InstrumentationViewTestCase(TestCase):
+    """ GET só lê os agregados; zerar exige POST com o token CSRF """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+
+    def setUp(self):
+        self.addCleanup(reset_stats)
+        record('report', {'total_ms': 10.0, 'queries': 2, 'query_ms': 1.0, 'context_ms': 5.0,
+                          'render_ms': 4.0, 'memory_mb': 0.0, 'top_queries': [], 'slow': False})
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.force_login(self.user)
+        self.url = reverse('instrumentation')
+
+    def test_get_is_read_only(self):
+        response = self.client.get(self.url + '?reset=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['views']['report']['requests'], 1)
+        self.assertIn('report', get_stats())
+
+    def test_post_requires_csrf(self):
+        self.assertEqual(self.client.post(self.url).status_code, 403)
+        self.assertIn('report', get_stats())
+
+    def test_post_resets(self):
+        token = 'a' * 32
+        self.client.cookies['csrftoken'] = token
+        response = self.client.post(self.url, HTTP_X_CSRFTOKEN=token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['views']['report']['requests'], 1)
+        self.assertEqual(get_stats(), {})
+
+
+@override_settings(REPORT_INSTRUMENTATION=True, REPORT_INSTRUMENTATION_SLOW_MS=0)
+class InstrumentationMiddlewareTestCase(TestCase):
+
+    def setUp(self):
+        self.addCleanup(reset_stats)
+
+    def request(self, view):
+        request = RequestFactory().get('/report/')
+        request.resolver_match = SimpleNamespace(view_name='report')
+        return ReportInstrumentationMiddleware(view)(request)
+
+    def test_streaming_queries_count(self):
+        def view(request):
+            def rows():
+                yield 'ramal\n'
+                yield f'{User.objects.count()}\n'
+            return StreamingHttpResponse(rows(), content_type='text/csv')
+
+        response = self.request(view)
+        self.assertNotIn('report', get_stats())
+        with self.assertLogs('core.instrumentation', 'WARNING'):
+            self.assertEqual(b''.join(response.streaming_content), b'ramal\n0\n')
+            response.close()
+        stats = get_stats()['report']
+        self.assertEqual(stats['max_queries'], 1)
+        self.assertIsNone(stats['max_memory_mb'])
+
+    @override_settings(REPORT_INSTRUMENTATION_TRACEMALLOC=True)
+    def test_memory_of_each_request(self):
+        if not tracemalloc.is_tracing():
+            self.addCleanup(tracemalloc.stop)
+
+        def view(request):
+            buffer = bytearray(4 * 2 ** 20)
+            return HttpResponse(str(len(buffer)))
+
+        # o segundo pedido igual mede o mesmo pico (não só o crescimento do pico do processo)
+        with self.assertLogs('core.instrumentation', 'WARNING'):
+            self.request(view)
+            self.request(view)
+        memory = [summary['memory_mb'] for summary in get_stats()['report']['slowest']]
+        self.assertEqual(len(memory), 2)
+        self.assertTrue(all(value >= 3.9 for value in memory), memory)
+
+
+class SyntheticDatasetTestCase(TestCase):
+
+    def test_create_dataset(self):
+        dataset = create_dataset(organizations=1, companies=2, centers=2, extensions=10, calls=50)
+        company = dataset['companies'][1]
+        lines = dataset['extensions'][company.pk]
+        self.assertEqual([line.extension for line in lines], [str(31250010 + i) for i in range(10)])
+        self.assertEqual(company.center_set.order_by('pk').first().extension_range, '31250010-31250014')
+        self.assertEqual(company.call_pricetable.price_set.count(), 6)
+        self.assertIsNotNone(company.organization.settings.call_pricetable)
+        self.assertEqual(Equipment.objects.filter(company=company).count(), 10)
+        self.assertEqual(Phonecall.objects.filter(extension__isnull=False).count(), 50)
+
+
+class CatalogueScopeTestCase(TestCase):
+    """ O catálogo de uma organização só carrega os dados dela; o resto vem sob demanda """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization, cls.other = create_organizations(2, prefix='escopo')
+        cls.companies = create_companies(cls.organization, 2)
+        cls.other_companies = create_companies(cls.other, 2)
+        for organization, companies in ((cls.organization, cls.companies), (cls.other, cls.other_companies)):
+            create_call_pricetables(organization, companies)
+
+    def test_scoped_loaders(self):
+        catalogue = Catalogue(self.organization)
+        self.assertEqual(catalogue.get_organizations(), [self.organization])
+        self.assertEqual(catalogue.get_companies(), self.companies)
+        tables = {company.call_pricetable_id for company in self.companies}
+        other_tables = {company.call_pricetable_id for company in self.other_companies}
+        self.assertTrue(tables <= set(catalogue._pricetables))
+        self.assertFalse(other_tables & set(catalogue._pricetables))
+        self.assertFalse(other_tables & set(catalogue._active_prices))
+
+    def test_lookups_outside_scope(self):
+        catalogue = Catalogue(self.organization)
+        company = catalogue.get_company(name=self.other_companies[0].name)
+        self.assertEqual(company, self.other_companies[0])
+        self.assertEqual(catalogue.get_organization(pk=self.other.pk), self.other)
+        self.assertEqual(len(catalogue.get_active_prices(company.call_pricetable_id)), 6)
+        with self.assertNumQueries(0):
+            catalogue.get_active_prices(company.call_pricetable_id)
+
+    def test_unscoped(self):
+        catalogue = Catalogue()
+        self.assertEqual(catalogue.get_companies(), self.companies + self.other_companies)
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.closed = 0
+        self.autocommit = False
+        self.rollbacks = 0
+        self.rollback_delay = 0
+        # 0 = TRANSACTION_STATUS_IDLE, 2 = INTRANS
+        self.info = SimpleNamespace(transaction_status=0)
+
+    def rollback(self):
+        self.rollbacks += 1
+        time.sleep(self.rollback_delay)
+        self.info.transaction_status = 0
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeDriver(object):
+
+    class OperationalError(Exception):
+        pass
+
+    def __init__(self, failures=0, rollback_delay=0):
+        self.failures = failures
+        self.rollback_delay = rollback_delay
+        self.calls = []
+        self.connections = []
+
+    def connect(self, dsn, **kwargs):
+        self.calls.append(kwargs)
+        if self.failures:
+            self.failures -= 1
+            raise self.OperationalError('could not connect to server')
+        conn = FakeConnection()
+        conn.rollback_delay = self.rollback_delay
+        self.connections.append(conn)
+        return conn
+
+    @property
+    def opened(self):
+        return sum(1 for conn in self.connections if not conn.closed)
+
+
+class PgPoolTestCase(SimpleTestCase):
+
+    def test_connect_retries_with_options(self):
+        driver = FakeDriver(failures=2)
+        conn = pgpool.connect('dbname=x', driver=driver, retries=2, backoff=pgpool.Backoff(base=0),
+                              autocommit=True, statement_timeout=5000, application_name='etl')
+        self.assertTrue(conn.autocommit)
+        self.assertEqual(len(driver.calls), 3)
+        self.assertEqual(driver.calls[0]['options'], '-c statement_timeout=5000')
+        self.assertEqual(driver.calls[0]['application_name'], 'etl')
+        with self.assertRaises(FakeDriver.OperationalError):
+            pgpool.connect(driver=FakeDriver(failures=1), retries=0)
+
+    def test_backoff_is_capped(self):
+        backoff = pgpool.Backoff(base=1, cap=4)
+        delays = [backoff.next() for _ in range(10)]
+        self.assertTrue(all(0 <= delay <= 4 for delay in delays))
+        backoff.reset()
+        self.assertLessEqual(backoff.next(), 1)
+
+    def test_pool_reuses_and_discards(self):
+        driver = FakeDriver()
+        pool = pgpool.ConnectionPool(driver=driver, max_size=1, timeout=0)
+        with pool.connection() as first:
+            first.info.transaction_status = 2
+            with self.assertRaises(TimeoutError):
+                with pool.connection():
+                    pass
+        self.assertEqual(first.rollbacks, 1)
+        with pool.connection() as conn:
+            self.assertIs(conn, first)
+            conn.closed = 2
+        with pool.connection() as conn:
+            self.assertIsNot(conn, first)
+        self.assertEqual(len(driver.connections), 2)
+        pool.close()
+        self.assertTrue(conn.closed)
+
+    def test_pool_never_exceeds_max_size(self):
+        # rollback lento na devolução: quem espera não pode abrir conexão antes da devolvida voltar
+        driver = FakeDriver(rollback_delay=0.001)
+        pool = pgpool.ConnectionPool(driver=driver, max_size=2, timeout=5)
+        peak = []
+
+        def work():
+            for _ in range(20):
+                with pool.connection() as conn:
+                    conn.info.transaction_status = 2
+                    peak.append(driver.opened)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(max(peak), 2)
+        self.assertLessEqual(len(driver.connections), 2)
+        pool.close()
+        self.assertEqual(driver.opened, 0)
 
-# Create your tests here.
+    def test_shared_pool(self):
+        driver = SimpleNamespace(connect=None, OperationalError=Exception)
+        pool = pgpool.shared_pool('dbname=x', driver=driver, max_size=2)
+        self.assertIs(pgpool.shared_pool('dbname=x', driver=driver, max_size=2), pool)
+        self.assertIsNot(pgpool.shared_pool('dbname=y', driver=driver, max_size=2), pool)
+        pgpool.close_shared_pools()
+        self.assertTrue(pool.closed)
@@ -2,8 +2,16 @@
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
 from django.shortcuts import redirect
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_protect
 from django.views.generic.base import RedirectView
+from django.views.generic.base import View
+
+# project
+from core.instrumentation import get_stats
+from core.instrumentation import reset_stats
 
 
 class HomeRedirectView(LoginRequiredMixin, RedirectView):
@@ -29,3 +37,32 @@ class SuperuserRequiredMixin(LoginRequiredMixin):
                 request, 'Você não tem a permissão necessária para executar a operação solicitada')
             return redirect(settings.LOGIN_URL)
         return super().dispatch(request, *args, **kwargs)
+
+
+@method_decorator(csrf_protect, name='dispatch')
+class InstrumentationView(SuperuserRequiredMixin, View):
+    """
+    Agregados da instrumentação (settings.REPORT_INSTRUMENTATION) por view, deste processo
+    GET: só leitura, ?top=N formas de consulta por view
+    POST (com o token CSRF): devolve os agregados e os zera
+    """
+
+    http_method_names = ['get', 'post']
+
+    def get_data(self):
+        try:
+            top = int(self.request.GET.get('top', 10))
+        except ValueError:
+            top = 10
+        return {
+            'enabled': getattr(settings, 'REPORT_INSTRUMENTATION', False),
+            'views': get_stats(top),
+        }
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(self.get_data(), json_dumps_params={'ensure_ascii': False, 'indent': 2})
+
+    def post(self, request, *args, **kwargs):
+        data = self.get_data()
+        reset_stats()
+        return JsonResponse(data, json_dumps_params={'ensure_ascii': False, 'indent': 2})
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import re
 import sys
 from typing import Iterable, List, Tuple, Dict, Any
@@ -30,6 +31,10 @@ from typing import Iterable, List, Tuple, Dict, Any
 import psycopg
 from psycopg.errors import Error as PsyError
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from phonecalls.snapshot_sql import invalidate_snapshots, snapshot_scope, snapshots_enabled  # noqa: E402
+from phonecalls.utils import get_ddd  # noqa: E402
+
 # Configuração global controlada pelo argparse
 CONFIG = {
     'log_sql_level': 'DEBUG',   # OFF|DEBUG|INFO
@@ -377,6 +382,7 @@ def process_batch(
             rows = rows[:sample_n]
 
         inserted = 0
+        scopes = set()
         for (
             sid,
             hostid,
@@ -432,6 +438,12 @@ def process_batch(
             elif "hostid" in dest_cols:
                 row["hostid"] = hostid
 
+            # mesmos valores do pre_save de Phonecall (set_ddd): o filtro de DDD usa essas colunas
+            if "charged_ddd" in dest_cols:
+                row["charged_ddd"] = get_ddd(charged)
+            if "dialed_ddd" in dest_cols:
+                row["dialed_ddd"] = get_ddd(dialed)
+
             if "inbound" in dest_cols:
                 row["inbound"] = inbound if inbound is not None else False
             if "calltype" in dest_cols:
@@ -508,6 +520,8 @@ def process_batch(
                 log_sql(sql_insert, params)
                 cur.execute(sql_insert, params)
                 inserted += 1
+                # (mês, organização, empresa); sem organização vale o mês inteiro
+                scopes.add(snapshot_scope(sdate, row.get("organization_id") or None, row.get("company_id") or None))
             except PsyError as e:
                 logging.error("Falha INSERT id=%s | erro=%s", sid, e.__class__.__name__)
                 logging.error("Detalhe erro: %s", getattr(e, "pgerror", None))
@@ -517,6 +531,9 @@ def process_batch(
                 logging.error("ROW CONTEXT: %s", {k: safe_preview(v) for k, v in row.items()})
                 continue
 
+        # snapshots de relatório (Django) dos meses que receberam chamadas: um DELETE por lote
+        if scopes and snapshots_enabled(cur):
+            invalidate_snapshots(cur, scopes)
         logging.info("Inseridos neste lote: %d", inserted)
         return inserted
 
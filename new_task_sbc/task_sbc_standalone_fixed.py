@@ -8,12 +8,24 @@ task_sbc_standalone.py — processa registros da SBC sem Django (psycopg + SQL p
 - Modo de debug com logs detalhados e controle de verbosidade no console/arquivo.
 - Controle de log de SQL (OFF/DEBUG/INFO) e opção de amostragem por lote (--sample).
 - Deduplicação em lote de md_phonecall_id (remove SELECT 1 por registro).
+- Gravação do lote numa transação via COPY (padrão) ou executemany (--writer); --writer row
+  mantém o INSERT por linha.
+- --checkpoint: retoma do maior sbc_phonecall.id processado (por modo de execução) com uma
+  varredura por faixa de id; uma janela abaixo do checkpoint é revisada para ids tardios.
+- --pipeline: busca, classificação e gravação em paralelo, com filas limitadas entre os estágios
+  (profundidade e espera de cada fila no log).
+- Conexões por um pool (core/pgpool.py): reconexão com espera exponencial com jitter,
+  descarte das conexões perdidas e --statement-timeout; com --interval o processo repete
+  a análise sem reabrir as conexões.
 
 Uso:
   python task_sbc_standalone.py --dsn "host=127.0.0.1 port=5432 dbname=test_db user=usr password=pwd" analysis
   python task_sbc_standalone.py --dsn "..." --debug --log-file sbc_debug.log analysis
   python task_sbc_standalone.py --dsn "..." --ranges-only --quiet-missing-clients --dry-run analysis
   python task_sbc_standalone.py --dsn "..." analysis-with-date 2025-10-20 2025-10-21
+  python task_sbc_standalone.py --dsn "..." --pipeline --classify-workers 2 analysis
+  python task_sbc_standalone.py --dsn "..." --checkpoint --repair-window 50000 analysis
+  python task_sbc_standalone.py --dsn "..." --checkpoint --interval 60 analysis
 
 Requisitos:
   pip install "psycopg[binary]~=3.2"
@@ -23,13 +35,23 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import queue
 import re
 import sys
+import threading
+import time
 from typing import Iterable, List, Tuple, Dict, Any
 
 import psycopg
 from psycopg.errors import Error as PsyError
 
+# core/pgpool.py (sem dependência do Django) é compartilhado com os scripts de ETL e o Ingestor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.pgpool import Backoff, ConnectionPool  # noqa: E402
+from phonecalls.snapshot_sql import invalidate_snapshots, snapshot_scope, snapshots_enabled  # noqa: E402
+from phonecalls.utils import get_ddd  # noqa: E402
+
 # Configuração global controlada pelo argparse
 CONFIG = {
     'log_sql_level': 'DEBUG',   # OFF|DEBUG|INFO
@@ -212,25 +234,6 @@ def classify_by_controlled(charged: str, dialed: str, nums: set[str], ranges: li
 # ------------------------------
 # Metadados do schema alvo
 # ------------------------------
-def get_table_columns(conn: psycopg.Connection, table: str) -> set[str]:
-    with conn.cursor() as cur:
-        sql = """
-            SELECT c.column_name
-            FROM information_schema.columns c
-            WHERE c.table_name = %s
-              AND c.table_schema = ANY (current_schemas(true))
-        """
-        log_sql(sql, (table,))
-        cur.execute(sql, (table,))
-        cols = {r[0] for r in cur.fetchall()}
-        if not cols:
-            sql2 = "SELECT c.column_name FROM information_schema.columns c WHERE c.table_name = %s"
-            log_sql(sql2, (table,))
-            cur.execute(sql2, (table,))
-            cols = {r[0] for r in cur.fetchall()}
-        logging.info("Colunas em %s: %s", table, sorted(cols))
-        return cols
-
 def get_required_columns(conn: psycopg.Connection, table: str) -> Dict[str, str]:
     with conn.cursor() as cur:
         sql = """
@@ -248,16 +251,68 @@ def get_required_columns(conn: psycopg.Connection, table: str) -> Dict[str, str]
         logging.info("Colunas NOT NULL sem default em %s: %s", table, sorted(required.items()))
         return required
 
+class DestinationSchema:
+    """Colunas do destino (tipo e NOT NULL sem default), lidas uma única vez por execução."""
+
+    def __init__(self, conn: psycopg.Connection, table: str):
+        self.table = table
+        self.types: Dict[str, str] = {}
+        self.required: Dict[str, str] = {}
+        with conn.cursor() as cur:
+            sql = """
+                SELECT c.column_name, c.data_type, c.is_nullable, c.column_default
+                FROM information_schema.columns c
+                WHERE c.table_name = %s
+                  AND c.table_schema = ANY (current_schemas(true))
+            """
+            log_sql(sql, (table,))
+            cur.execute(sql, (table,))
+            rows = cur.fetchall()
+            if not rows:
+                sql2 = """
+                    SELECT c.column_name, c.data_type, c.is_nullable, c.column_default
+                    FROM information_schema.columns c
+                    WHERE c.table_name = %s
+                """
+                log_sql(sql2, (table,))
+                cur.execute(sql2, (table,))
+                rows = cur.fetchall()
+            for name, dtype, is_nullable, default in rows:
+                self.types[name] = dtype or ""
+                if is_nullable == "NO" and default is None:
+                    self.required[name] = dtype or ""
+            # snapshots de relatório (Django) dos meses que recebem chamadas são apagados na gravação
+            self.snapshots = snapshots_enabled(cur)
+        logging.info("Colunas em %s: %s", table, sorted(self.types))
+        logging.info("Colunas NOT NULL sem default em %s: %s", table, sorted(self.required.items()))
+
+    @property
+    def columns(self) -> set[str]:
+        return set(self.types)
+
 # ------------------------------
 # Seleção de pendências
 # ------------------------------
-def pending_ids(conn: psycopg.Connection, src_table: str, dst_table: str, event_type: str, limit: int, negate_md: bool) -> list[int]:
+def pending_ids(conn: psycopg.Connection, src_table: str, dst_table: str, event_type: str, limit: int, negate_md: bool, after_id: int | None = None, until_id: int | None = None) -> list[int]:
+    """
+    after_id: paginação por chave (s.id > after_id), usada quando o lote anterior ainda não foi gravado.
+    until_id: limite superior (s.id <= until_id), usado no reparo de lacunas abaixo do checkpoint.
+    """
+    after = ""
+    params: list[Any] = [event_type]
+    if after_id is not None:
+        after += "\n                  AND s.id > %s"
+        params.append(after_id)
+    if until_id is not None:
+        after += "\n                  AND s.id <= %s"
+        params.append(until_id)
+    params.append(limit)
     with conn.cursor() as cur:
         if negate_md:
             sql = f"""
                 SELECT s.id
                 FROM {src_table} s
-                WHERE s.event_type = %s
+                WHERE s.event_type = %s{after}
                   AND NOT EXISTS (
                       SELECT 1 FROM {dst_table} p
                       WHERE p.md_phonecall_id = -s.id
@@ -269,7 +324,7 @@ def pending_ids(conn: psycopg.Connection, src_table: str, dst_table: str, event_
             sql = f"""
                 SELECT s.id
                 FROM {src_table} s
-                WHERE s.event_type = %s
+                WHERE s.event_type = %s{after}
                   AND NOT EXISTS (
                       SELECT 1 FROM {dst_table} p
                       WHERE p.md_phonecall_id = s.id
@@ -277,12 +332,29 @@ def pending_ids(conn: psycopg.Connection, src_table: str, dst_table: str, event_
                 ORDER BY s.id
                 LIMIT %s
             """
-        log_sql(sql, (event_type, limit))
-        cur.execute(sql, (event_type, limit))
+        log_sql(sql, params)
+        cur.execute(sql, params)
         out = [r[0] for r in cur.fetchall()]
         logging.info("pending_ids: %d", len(out))
         return out
 
+def pending_ids_after(conn: psycopg.Connection, src_table: str, event_type: str, after_id: int, limit: int) -> list[int]:
+    """Ids acima do checkpoint: varredura por faixa da PK, sem anti-join com o destino."""
+    with conn.cursor() as cur:
+        sql = f"""
+            SELECT s.id
+            FROM {src_table} s
+            WHERE s.id > %s
+              AND s.event_type = %s
+            ORDER BY s.id
+            LIMIT %s
+        """
+        log_sql(sql, (after_id, event_type, limit))
+        cur.execute(sql, (after_id, event_type, limit))
+        out = [r[0] for r in cur.fetchall()]
+        logging.info("pending_ids_after(%d): %d", after_id, len(out))
+        return out
+
 def pending_ids_by_date(conn: psycopg.Connection, src_table: str, dst_table: str, event_type: str, dates: Iterable[str], limit: int, negate_md: bool) -> list[int]:
     with conn.cursor() as cur:
         if negate_md:
@@ -317,9 +389,345 @@ def pending_ids_by_date(conn: psycopg.Connection, src_table: str, dst_table: str
         logging.info("pending_ids_by_date: %d", len(out))
         return out
 
+# ------------------------------
+# Checkpoint (high-water mark por modo de execução)
+# ------------------------------
+class RunCheckpoint:
+    """
+    Maior sbc_phonecall.id já processado, por modo de execução (comando, tabelas, evento, sinal do md_id).
+
+    O avanço é gravado na mesma transação do lote (PhonecallBatchWriter), então um lote
+    gravado e o seu checkpoint nunca divergem; GREATEST torna o avanço idempotente.
+    """
+
+    def __init__(self, table: str, mode: str):
+        self.table = table
+        self.mode = mode
+
+    @staticmethod
+    def run_mode(command: str, src_table: str, dst_table: str, event_type: str, negate_md: bool) -> str:
+        return f"{command}:{src_table}:{dst_table}:{event_type}:{'neg' if negate_md else 'pos'}"
+
+    def ensure_table(self, conn: psycopg.Connection) -> None:
+        sql = f"""
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                mode varchar(200) PRIMARY KEY,
+                last_id bigint NOT NULL,
+                updated_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        log_sql(sql, None)
+        conn.execute(sql)
+
+    def load(self, conn: psycopg.Connection) -> int | None:
+        sql = f"SELECT last_id FROM {self.table} WHERE mode = %s"
+        log_sql(sql, (self.mode,))
+        row = conn.execute(sql, (self.mode,)).fetchone()
+        return row[0] if row else None
+
+    def bootstrap(self, conn: psycopg.Connection, dst_table: str, negate_md: bool, dry_run: bool = False) -> int:
+        """Sem checkpoint: parte do maior id de origem já gravado no destino (gravado só fora do dry-run)."""
+        if negate_md:
+            sql = f"SELECT COALESCE(-MIN(md_phonecall_id), 0) FROM {dst_table} WHERE md_phonecall_id < 0"
+        else:
+            sql = f"SELECT COALESCE(MAX(md_phonecall_id), 0) FROM {dst_table} WHERE md_phonecall_id > 0"
+        log_sql(sql, None)
+        last_id = conn.execute(sql).fetchone()[0]
+        if not dry_run:
+            with conn.cursor() as cur:
+                self.advance(cur, last_id)
+        logging.info("Checkpoint %s criado em %d (maior id gravado em %s)", self.mode, last_id, dst_table)
+        return last_id
+
+    def advance(self, cur: psycopg.Cursor, last_id: int) -> None:
+        sql = f"""
+            INSERT INTO {self.table} AS c (mode, last_id, updated_at)
+            VALUES (%s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (mode) DO UPDATE
+            SET last_id = GREATEST(c.last_id, EXCLUDED.last_id), updated_at = EXCLUDED.updated_at
+        """
+        log_sql(sql, (self.mode, last_id))
+        cur.execute(sql, (self.mode, last_id))
+
+def sample_rows(rows: list[tuple], sample: int) -> Tuple[list[tuple], bool]:
+    """--sample: só as primeiras N linhas do lote; devolve as linhas e se o lote foi cortado."""
+    if sample and len(rows) > sample:
+        logging.info("Sampleando %d de %d registros do lote", sample, len(rows))
+        return rows[:sample], True
+    return rows, False
+
+def batch_high_water(ids: list[int], rows: list[tuple], sampled: bool) -> int:
+    """Id até o qual o lote foi tratado: o último id pedido, ou a última linha mantida no --sample."""
+    return rows[-1][0] if sampled and rows else ids[-1]
+
 # ------------------------------
 # Processamento (INSERT dinâmico)
 # ------------------------------
+SOURCE_COLUMNS_SQL = """
+    SELECT id, hostid, startdate, starttime, stopdate, stoptime,
+           COALESCE(duration,0),
+           COALESCE(dialednumber,''), COALESCE(connectednumber,''),
+           COALESCE(chargednumber, COALESCE(connectednumber,'')),
+           COALESCE(conditioncode,0),
+           COALESCE(callcasedata,0), COALESCE(seqnumber,0), COALESCE(seqlim,0),
+           COALESCE(callid,''), COALESCE(callidass1,''), COALESCE(callidass2,'')
+"""
+
+def load_source_rows(cur: psycopg.Cursor, src_table: str, dst_table: str, ids: list[int], negate_md: bool) -> list[tuple]:
+    """Linhas SBC do lote ainda não gravadas no destino (deduplicação em lote por md_phonecall_id)."""
+    sql = f"""
+        {SOURCE_COLUMNS_SQL}
+        FROM {src_table}
+        WHERE id = ANY(%s) AND event_type = 'CALL_END'
+        ORDER BY id
+    """
+    log_sql(sql, (ids,))
+    cur.execute(sql, (ids,))
+    rows = cur.fetchall()
+    logging.info("Lote SBC carregado: %d linhas", len(rows))
+
+    md_ids = [(-r[0] if negate_md else r[0]) for r in rows]
+    if md_ids:
+        sql_seen = f"SELECT md_phonecall_id FROM {dst_table} WHERE md_phonecall_id = ANY(%s)"
+        log_sql(sql_seen, (md_ids,))
+        cur.execute(sql_seen, (md_ids,))
+        seen = {r[0] for r in cur.fetchall()}
+        rows = [r for r in rows if ((-r[0] if negate_md else r[0]) not in seen)]
+        logging.info("Deduplicados por md_phonecall_id: %d restantes", len(rows))
+    return rows
+
+def build_row(source_row: tuple, nums: set[str], ranges: list[Tuple[str, int, int]], dest_cols: set[str], negate_md: bool) -> Tuple[int, Dict[str, Any]]:
+    """Classifica uma linha SBC e monta os campos do destino: (id na origem, {coluna: valor})."""
+    (
+        sid,
+        hostid,
+        sdate,
+        stime,
+        edate,
+        etime,
+        duration,
+        dialed,
+        connected,
+        charged,
+        cc,
+        callcasedata,
+        seqnumber,
+        seqlim,
+        callid,
+        callidass1,
+        callidass2,
+    ) = source_row
+
+    md_id = -sid if negate_md else sid
+
+    # Classificação por números controlados (fallback)
+    pabx, inbound, why = classify_by_controlled(charged, dialed, nums, ranges)
+    desc = f"Ainda não implementado por cc: {cc} — {why}"
+    logging.debug("Classificação id=%s | pabx=%s inbound=%s | charged=%s dialed=%s | %s",
+                  sid, pabx, inbound, charged, dialed, why)
+
+    # Monta campos dinamicamente
+    row = {
+        "md_phonecall_id": md_id,
+        "startdate": sdate,
+        "starttime": stime,
+        "stopdate": edate,
+        "stoptime": etime,
+        "duration": duration,
+        "dialednumber": dialed,
+        "connectednumber": connected,
+        "chargednumber": charged,
+        "conditioncode": cc,
+        "callcasedata": callcasedata,
+        "seqnumber": seqnumber,
+        "seqlim": seqlim,
+        "callid": callid,
+        "callidass1": callidass1,
+        "callidass2": callidass2,
+        "pabx": pabx,
+    }
+
+    if "hostid_id" in dest_cols:
+        row["hostid_id"] = hostid
+    elif "hostid" in dest_cols:
+        row["hostid"] = hostid
+
+    # mesmos valores do pre_save de Phonecall (set_ddd): o filtro de DDD usa essas colunas
+    if "charged_ddd" in dest_cols:
+        row["charged_ddd"] = get_ddd(charged)
+    if "dialed_ddd" in dest_cols:
+        row["dialed_ddd"] = get_ddd(dialed)
+
+    if "inbound" in dest_cols:
+        row["inbound"] = inbound if inbound is not None else False
+    if "calltype" in dest_cols:
+        row["calltype"] = FREE
+    if "description" in dest_cols:
+        row["description"] = desc
+
+    row.pop("id", None)
+    return sid, row
+
+def row_columns(dest_cols: set[str]) -> list[str]:
+    """Colunas geradas por build_row, na mesma ordem, para o schema de destino."""
+    cols = [
+        "md_phonecall_id", "startdate", "starttime", "stopdate", "stoptime", "duration",
+        "dialednumber", "connectednumber", "chargednumber", "conditioncode",
+        "callcasedata", "seqnumber", "seqlim", "callid", "callidass1", "callidass2", "pabx",
+    ]
+    if "hostid_id" in dest_cols:
+        cols.append("hostid_id")
+    elif "hostid" in dest_cols:
+        cols.append("hostid")
+    cols += ["charged_ddd", "dialed_ddd", "inbound", "calltype", "description"]
+    return [c for c in cols if c in dest_cols]
+
+def row_scope(row: Dict[str, Any]) -> tuple:
+    """
+    (mês, organização, empresa) da chamada para a invalidação dos snapshots de relatório.
+    Sem organização (a classificação daqui não resolve o ramal) vale o mês inteiro.
+    """
+    return snapshot_scope(row["startdate"], row.get("organization_id") or None, row.get("company_id") or None)
+
+# ------------------------------
+# Gravação em lote (COPY / executemany)
+# ------------------------------
+# Relógio do banco no início da transação (o mesmo valor que CURRENT_* teria no INSERT)
+CLOCK_SQL = "SELECT CURRENT_TIMESTAMP, LOCALTIMESTAMP, CURRENT_DATE, CURRENT_TIME, LOCALTIME"
+CLOCK_TIMESTAMPTZ, CLOCK_TIMESTAMP, CLOCK_DATE, CLOCK_TIMETZ, CLOCK_TIME = range(5)
+
+def _clock_index(dtype: str) -> int:
+    """Valor do relógio equivalente ao CURRENT_* convertido para o tipo da coluna."""
+    dt = (dtype or "").lower()
+    if dt == "date":
+        return CLOCK_DATE
+    if dt.startswith("timestamp"):
+        return CLOCK_TIMESTAMPTZ if "with time zone" in dt else CLOCK_TIMESTAMP
+    if dt.startswith("time"):
+        return CLOCK_TIMETZ if "with time zone" in dt else CLOCK_TIME
+    return CLOCK_TIMESTAMPTZ
+
+class PhonecallBatchWriter:
+    """
+    Grava um lote inteiro numa transação, com a ordem de colunas fixada uma vez por execução.
+
+    - method="copy": COPY ... FROM STDIN (cursor.copy / write_row)
+    - method="executemany": INSERT preparado com cursor.executemany
+    Colunas NOT NULL sem default e as de timestamp automáticas recebem os mesmos valores
+    do INSERT linha a linha; CURRENT_TIMESTAMP/DATE/TIME vêm de CLOCK_SQL, lido na transação.
+    Se o lote falhar, cada linha é regravada na sua própria transação e as falhas são logadas.
+    """
+
+    METHODS = ("copy", "executemany")
+
+    def __init__(self, conn: psycopg.Connection, schema: DestinationSchema, method: str = "copy", dry_run: bool = False):
+        if method not in self.METHODS:
+            raise ValueError(f"Método de gravação inválido: {method}")
+        self.conn = conn
+        self.schema = schema
+        self.method = method
+        self.dry_run = dry_run
+
+        dest_cols = schema.columns
+        cols = row_columns(dest_cols)
+        cols += sorted(c for c in AUTO_TS_COLUMNS if c in dest_cols and c not in cols)
+        cols += sorted(c for c in schema.required if c not in cols)
+        self.columns = cols
+
+        # (posição, índice do relógio ou None, constante) para valores None
+        self.fills: list[Tuple[int, int | None, Any]] = []
+        for i, col in enumerate(cols):
+            dtype = schema.types.get(col, "")
+            if col in AUTO_TS_COLUMNS:
+                self.fills.append((i, _clock_index(dtype), None))
+            elif col in schema.required:
+                value = _coerce_required_value(dtype)
+                if isinstance(value, tuple):
+                    self.fills.append((i, _clock_index(dtype), None))
+                else:
+                    self.fills.append((i, None, value))
+
+        collist = ", ".join(cols)
+        self.copy_sql = f"COPY {schema.table} ({collist}) FROM STDIN"
+        self.insert_sql = f"INSERT INTO {schema.table} ({collist}) VALUES ({', '.join(['%s'] * len(cols))})"
+        logging.info("Gravação em lote (%s): %d colunas -> %s", method, len(cols), collist)
+
+    def to_values(self, row: Dict[str, Any], clock: tuple) -> tuple:
+        values = [row.get(c) for c in self.columns]
+        for i, clock_index, constant in self.fills:
+            if values[i] is None:
+                values[i] = clock[clock_index] if clock_index is not None else constant
+        return tuple(values)
+
+    def write(self, rows: list[Tuple[int, Dict[str, Any]]], checkpoint: RunCheckpoint | None = None,
+              last_id: int | None = None) -> int:
+        """
+        Grava [(id na origem, row), ...]; retorna o número de linhas inseridas.
+        Com checkpoint, avança-o para last_id na mesma transação (mesmo com o lote vazio).
+        """
+        if self.dry_run:
+            for sid, row in rows:
+                logging.info("[DRY-RUN] id=%s -> %s | row=%s", sid, self.method,
+                             {k: safe_preview(v) for k, v in row.items()})
+            return len(rows)
+        advance = checkpoint is not None and last_id is not None
+        if not rows and not advance:
+            return 0
+
+        try:
+            with self.conn.transaction(), self.conn.cursor() as cur:
+                if rows:
+                    cur.execute(CLOCK_SQL)
+                    clock = cur.fetchone()
+                    values = [self.to_values(row, clock) for _, row in rows]
+                    if self.method == "copy":
+                        log_sql(self.copy_sql, None)
+                        with cur.copy(self.copy_sql) as copy:
+                            for v in values:
+                                copy.write_row(v)
+                    else:
+                        log_sql(self.insert_sql, None)
+                        cur.executemany(self.insert_sql, values)
+                    if self.schema.snapshots:
+                        invalidate_snapshots(cur, {row_scope(row) for _, row in rows})
+                if advance:
+                    checkpoint.advance(cur, last_id)
+            return len(rows)
+        except PsyError as e:
+            logging.warning("Falha no lote (%s, %d linhas): %s — regravando linha a linha",
+                            self.method, len(rows), e.__class__.__name__)
+        inserted = self.write_rows(rows)
+        if advance:
+            # linhas que falharam ficam registradas no log; o checkpoint segue adiante
+            with self.conn.transaction(), self.conn.cursor() as cur:
+                checkpoint.advance(cur, last_id)
+        return inserted
+
+    def write_rows(self, rows: list[Tuple[int, Dict[str, Any]]]) -> int:
+        inserted = 0
+        scopes = set()
+        for sid, row in rows:
+            params: tuple = ()
+            try:
+                with self.conn.transaction(), self.conn.cursor() as cur:
+                    cur.execute(CLOCK_SQL)
+                    params = self.to_values(row, cur.fetchone())
+                    log_sql(self.insert_sql, params)
+                    cur.execute(self.insert_sql, params)
+                inserted += 1
+                scopes.add(row_scope(row))
+            except PsyError as e:
+                logging.error("Falha INSERT id=%s | erro=%s", sid, e.__class__.__name__)
+                logging.error("Detalhe erro: %s", getattr(e, "pgerror", None))
+                logging.error("SQLSTATE: %s", getattr(e, "sqlstate", None))
+                logging.error("SQL: %s", self.insert_sql)
+                logging.error("PARAMS: %s", [safe_preview(p) for p in params])
+                logging.error("ROW CONTEXT: %s", {k: safe_preview(v) for k, v in row.items()})
+        if scopes and self.schema.snapshots:
+            with self.conn.transaction(), self.conn.cursor() as cur:
+                invalidate_snapshots(cur, scopes)
+        return inserted
+
 def process_batch(
     conn: psycopg.Connection,
     src_table: str,
@@ -330,115 +738,41 @@ def process_batch(
     dest_cols: set[str],
     negate_md: bool,
     dry_run: bool = False,
-) -> int:
+    writer: PhonecallBatchWriter | None = None,
+    required: Dict[str, str] | None = None,
+    checkpoint: RunCheckpoint | None = None,
+    snapshots: bool = False,
+    sample: int = 0,
+) -> Tuple[int, int | None]:
+    """
+    Classifica e grava um lote de ids da origem (writer: em lote; senão, INSERT por linha).
+    snapshots: apaga os snapshots de relatório dos meses gravados (DestinationSchema.snapshots).
+    sample: só as primeiras N linhas do lote (--sample).
+    Devolve as inseridas e o id até o qual o lote foi tratado (batch_high_water), de onde
+    segue o próximo lote e para onde o checkpoint avança.
+    """
     if not ids:
-        return 0
+        return 0, None
 
-    required = get_required_columns(conn, dst_table)
+    if required is None:
+        required = get_required_columns(conn, dst_table)
 
     with conn.cursor() as cur:
-        sql = f"""
-            SELECT id, hostid, startdate, starttime, stopdate, stoptime,
-                   COALESCE(duration,0),
-                   COALESCE(dialednumber,''), COALESCE(connectednumber,''),
-                   COALESCE(chargednumber, COALESCE(connectednumber,'')),
-                   COALESCE(conditioncode,0),
-                   COALESCE(callcasedata,0), COALESCE(seqnumber,0), COALESCE(seqlim,0),
-                   COALESCE(callid,''), COALESCE(callidass1,''), COALESCE(callidass2,'')
-            FROM {src_table}
-            WHERE id = ANY(%s) AND event_type = 'CALL_END'
-            ORDER BY id
-        """
-        log_sql(sql, (ids,))
-        cur.execute(sql, (ids,))
-        rows = cur.fetchall()
-        logging.info("Lote SBC carregado: %d linhas", len(rows))
-
-        # Deduplicação em lote por md_phonecall_id
-        md_ids = [(-r[0] if negate_md else r[0]) for r in rows]
-        if md_ids:
-            sql_seen = f"SELECT md_phonecall_id FROM {dst_table} WHERE md_phonecall_id = ANY(%s)"
-            log_sql(sql_seen, (md_ids,))
-            cur.execute(sql_seen, (md_ids,))
-            seen = {r[0] for r in cur.fetchall()}
-            rows = [r for r in rows if ((-r[0] if negate_md else r[0]) not in seen)]
-            logging.info("Deduplicados por md_phonecall_id: %d restantes", len(rows))
-
-        # Sample opcional
-        try:
-            from types import SimpleNamespace
-            args_ref = globals().get('_ARGS_REF', None)
-            sample_n = getattr(args_ref, 'sample', 0) if args_ref else 0
-        except Exception:
-            sample_n = 0
-
-        if sample_n and len(rows) > sample_n:
-            logging.info("Sampleando %d de %d registros do lote", sample_n, len(rows))
-            rows = rows[:sample_n]
+        rows = load_source_rows(cur, src_table, dst_table, ids, negate_md)
 
-        inserted = 0
-        for (
-            sid,
-            hostid,
-            sdate,
-            stime,
-            edate,
-            etime,
-            duration,
-            dialed,
-            connected,
-            charged,
-            cc,
-            callcasedata,
-            seqnumber,
-            seqlim,
-            callid,
-            callidass1,
-            callidass2,
-        ) in rows:
-
-            md_id = -sid if negate_md else sid
-
-            # Classificação por números controlados (fallback)
-            pabx, inbound, why = classify_by_controlled(charged, dialed, nums, ranges)
-            desc = f"Ainda não implementado por cc: {cc} — {why}"
-            logging.debug("Classificação id=%s | pabx=%s inbound=%s | charged=%s dialed=%s | %s",
-                          sid, pabx, inbound, charged, dialed, why)
-
-            # Monta campos dinamicamente
-            row = {
-                "md_phonecall_id": md_id,
-                "startdate": sdate,
-                "starttime": stime,
-                "stopdate": edate,
-                "stoptime": etime,
-                "duration": duration,
-                "dialednumber": dialed,
-                "connectednumber": connected,
-                "chargednumber": charged,
-                "conditioncode": cc,
-                "callcasedata": callcasedata,
-                "seqnumber": seqnumber,
-                "seqlim": seqlim,
-                "callid": callid,
-                "callidass1": callidass1,
-                "callidass2": callidass2,
-                "pabx": pabx,
-            }
+        rows, sampled = sample_rows(rows, sample)
+        last_id = batch_high_water(ids, rows, sampled)
 
-            if "hostid_id" in dest_cols:
-                row["hostid_id"] = hostid
-            elif "hostid" in dest_cols:
-                row["hostid"] = hostid
+        if writer is not None:
+            inserted = writer.write([build_row(r, nums, ranges, dest_cols, negate_md) for r in rows],
+                                    checkpoint, last_id)
+            logging.info("Inseridos neste lote: %d", inserted)
+            return inserted, last_id
 
-            if "inbound" in dest_cols:
-                row["inbound"] = inbound if inbound is not None else False
-            if "calltype" in dest_cols:
-                row["calltype"] = FREE
-            if "description" in dest_cols:
-                row["description"] = desc
-
-            row.pop("id", None)
+        inserted = 0
+        scopes = set()
+        for source_row in rows:
+            sid, row = build_row(source_row, nums, ranges, dest_cols, negate_md)
 
             for ts in AUTO_TS_COLUMNS:
                 if ts in dest_cols and ts not in row:
@@ -486,13 +820,7 @@ def process_batch(
                 except Exception:
                     params_display.append(pval)
 
-            try:
-                args_ref = globals().get('_ARGS_REF', None)
-                dry_run_flag = getattr(args_ref, 'dry_run', dry_run) if args_ref else dry_run
-            except Exception:
-                dry_run_flag = dry_run
-
-            if dry_run_flag:
+            if dry_run:
                 logging.info("[DRY-RUN] id=%s -> %s | params=%s", sid, sql_insert, params_display)
                 inserted += 1
                 continue
@@ -501,6 +829,7 @@ def process_batch(
                 log_sql(sql_insert, params)
                 cur.execute(sql_insert, params)
                 inserted += 1
+                scopes.add(row_scope(row))
             except PsyError as e:
                 logging.error("Falha INSERT id=%s | erro=%s", sid, e.__class__.__name__)
                 logging.error("Detalhe erro: %s", getattr(e, "pgerror", None))
@@ -510,12 +839,350 @@ def process_batch(
                 logging.error("ROW CONTEXT: %s", {k: safe_preview(v) for k, v in row.items()})
                 continue
 
+        if snapshots and scopes:
+            invalidate_snapshots(cur, scopes)
+        if checkpoint is not None and not dry_run:
+            checkpoint.advance(cur, last_id)
         logging.info("Inseridos neste lote: %d", inserted)
-        return inserted
+        return inserted, last_id
+
+# ------------------------------
+# Pipeline (busca -> classificação -> gravação)
+# ------------------------------
+_STOP = object()
+
+class StageQueue:
+    """Fila limitada entre estágios, com métricas de profundidade e de espera."""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.lock = threading.Lock()
+        self.puts = 0
+        self.depth_sum = 0
+        self.max_depth = 0
+        self.put_wait = 0.0  # produtor bloqueado (fila cheia)
+        self.get_wait = 0.0  # consumidor ocioso (fila vazia)
+
+    def put(self, item: Any, stop: threading.Event) -> bool:
+        """Enfileira; retorna False se o pipeline foi interrompido enquanto esperava."""
+        start = time.perf_counter()
+        while not stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.2)
+            except queue.Full:
+                continue
+            depth = self.queue.qsize()
+            with self.lock:
+                self.put_wait += time.perf_counter() - start
+                if item is not _STOP:
+                    self.puts += 1
+                    self.depth_sum += depth
+                    self.max_depth = max(self.max_depth, depth)
+            return True
+        return False
+
+    def get(self, stop: threading.Event) -> Any:
+        start = time.perf_counter()
+        while not stop.is_set():
+            try:
+                item = self.queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            with self.lock:
+                self.get_wait += time.perf_counter() - start
+            return item
+        return _STOP
+
+    def metrics(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "depth": self.queue.qsize(),
+                "maxsize": self.maxsize,
+                "max_depth": self.max_depth,
+                "avg_depth": round(self.depth_sum / self.puts, 2) if self.puts else 0.0,
+                "puts": self.puts,
+                "put_wait_s": round(self.put_wait, 3),
+                "get_wait_s": round(self.get_wait, 3),
+            }
+
+class SbcPipeline:
+    """
+    Execução em pipeline: o banco e a classificação trabalham ao mesmo tempo.
+
+    - busca (thread, conexão própria): próximo lote de ids por paginação de chave,
+      SELECT da origem e deduplicação por md_phonecall_id
+    - classificação (pool de threads): build_row de cada linha
+    - gravação (thread, conexão própria): PhonecallBatchWriter, um lote por transação
+    As filas entre os estágios são limitadas (queue_size lotes), então a busca não
+    se adianta mais que isso em relação à gravação.
+    """
+
+    def __init__(self, pool: ConnectionPool, src_table: str, dst_table: str, schema: DestinationSchema,
+                 nums: set[str], ranges: list[Tuple[str, int, int]], negate_md: bool,
+                 writer_method: str = "copy", dry_run: bool = False, sample: int = 0,
+                 classify_workers: int = 2, queue_size: int = 2, checkpoint: RunCheckpoint | None = None):
+        self.pool = pool
+        self.src_table = src_table
+        self.dst_table = dst_table
+        self.schema = schema
+        self.nums = nums
+        self.ranges = ranges
+        self.negate_md = negate_md
+        self.writer_method = writer_method
+        self.dry_run = dry_run
+        self.sample = sample
+        self.checkpoint = checkpoint
+        self.classify_workers = max(1, classify_workers)
+        self.fetched = StageQueue("busca", queue_size)
+        self.classified = StageQueue("classificacao", queue_size)
+        self.stop = threading.Event()
+        self.errors: list[BaseException] = []
+        self.lock = threading.Lock()
+        self.running_classifiers = self.classify_workers
+        self.batches = 0
+        self.total = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {q.name: q.metrics() for q in (self.fetched, self.classified)}
+
+    def fail(self, exc: BaseException) -> None:
+        logging.exception("Pipeline interrompido: %s", exc)
+        with self.lock:
+            self.errors.append(exc)
+        self.stop.set()
+
+    def fetch_batches(self, batches: Any) -> None:
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cur:
+                seq = 0
+                for ids in batches(conn) if callable(batches) else batches:
+                    rows, sampled = sample_rows(
+                        load_source_rows(cur, self.src_table, self.dst_table, ids, self.negate_md), self.sample)
+                    if not rows and self.checkpoint is None:
+                        continue
+                    # lotes vazios seguem adiante só para avançar o checkpoint
+                    if not self.fetched.put((seq, batch_high_water(ids, rows, sampled), rows), self.stop):
+                        return
+                    seq += 1
+        except Exception as e:
+            self.fail(e)
+        finally:
+            self.fetched.put(_STOP, self.stop)
+
+    def classify_batches(self) -> None:
+        dest_cols = self.schema.columns
+        try:
+            while True:
+                item = self.fetched.get(self.stop)
+                if item is _STOP:
+                    # devolve o marcador para os demais classificadores
+                    self.fetched.put(_STOP, self.stop)
+                    return
+                seq, last_id, rows = item
+                built = [build_row(r, self.nums, self.ranges, dest_cols, self.negate_md) for r in rows]
+                if not self.classified.put((seq, last_id, built), self.stop):
+                    return
+        except Exception as e:
+            self.fail(e)
+        finally:
+            with self.lock:
+                self.running_classifiers -= 1
+                last = self.running_classifiers == 0
+            if last:
+                self.classified.put(_STOP, self.stop)
+
+    def write_batches(self) -> None:
+        try:
+            with self.pool.connection() as conn:
+                writer = PhonecallBatchWriter(conn, self.schema, self.writer_method, dry_run=self.dry_run)
+                # os classificadores podem terminar fora de ordem; a gravação segue a ordem
+                # da busca para o checkpoint nunca passar à frente de um lote não gravado
+                waiting: Dict[int, Tuple[int, list]] = {}
+                next_seq = 0
+                while True:
+                    item = self.classified.get(self.stop)
+                    if item is _STOP:
+                        return
+                    seq, last_id, rows = item
+                    waiting[seq] = (last_id, rows)
+                    while next_seq in waiting:
+                        last_id, rows = waiting.pop(next_seq)
+                        next_seq += 1
+                        inserted = writer.write(rows, self.checkpoint, last_id)
+                        self.batches += 1
+                        self.total += inserted
+                        logging.info("Inseridos neste lote: %d | filas: %s", inserted, self.metrics())
+        except Exception as e:
+            self.fail(e)
+
+    def run(self, batches) -> int:
+        """
+        batches: iterável de listas de ids, ou função conn -> iterável (executada na
+        conexão da busca). Retorna o total inserido; repassa o primeiro erro de um estágio.
+        """
+        threads = [threading.Thread(target=self.fetch_batches, args=(batches,), name="sbc-fetch")]
+        threads += [threading.Thread(target=self.classify_batches, name=f"sbc-classify-{i}")
+                    for i in range(self.classify_workers)]
+        threads.append(threading.Thread(target=self.write_batches, name="sbc-write"))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        logging.info("Pipeline: %d lotes, %d inseridos | filas: %s", self.batches, self.total, self.metrics())
+        if self.errors:
+            raise self.errors[0]
+        return self.total
+
+def iter_checkpoint_batches(src_table: str, event_type: str, batch_size: int, after_id: int):
+    """Lotes de ids acima do checkpoint (pending_ids_after), para SbcPipeline.run."""
+    def batches(conn: psycopg.Connection):
+        last = after_id
+        while True:
+            ids = pending_ids_after(conn, src_table, event_type, last, batch_size)
+            if not ids:
+                return
+            last = ids[-1]
+            yield ids
+    return batches
+
+def repair_gaps(conn: psycopg.Connection, args: argparse.Namespace, nums: set[str], ranges: list[Tuple[str, int, int]],
+                schema: DestinationSchema, writer: PhonecallBatchWriter | None, negate_md: bool,
+                low: int, high: int) -> int:
+    """
+    Ids em (low, high] ainda sem chamada no destino: chegaram depois que o checkpoint os
+    ultrapassou (transações concorrentes na origem confirmam fora de ordem).
+    O anti-join fica limitado à janela, pela PK; o checkpoint não é alterado.
+    """
+    if high <= low:
+        return 0
+    total = 0
+    after = low
+    while True:
+        ids = pending_ids(conn, args.src_table, args.dst_table, args.event_type, args.batch_size, negate_md,
+                          after_id=after, until_id=high)
+        if not ids:
+            break
+        inserted, after = process_batch(conn, args.src_table, args.dst_table, ids, nums, ranges, schema.columns,
+                                        negate_md, args.dry_run, writer=writer, required=schema.required,
+                                        snapshots=schema.snapshots, sample=args.sample)
+        total += inserted
+    logging.info("Reparo de lacunas (%d, %d]: %d inseridas", low, high, total)
+    return total
+
+def iter_pending_batches(src_table: str, dst_table: str, event_type: str, batch_size: int, negate_md: bool):
+    """Lotes de pending_ids paginados por id, para a busca não repetir lotes ainda não gravados."""
+    def batches(conn: psycopg.Connection):
+        after_id = 0
+        while True:
+            ids = pending_ids(conn, src_table, dst_table, event_type, batch_size, negate_md, after_id=after_id)
+            if not ids:
+                return
+            after_id = ids[-1]
+            yield ids
+    return batches
+
+def run_command(conn: psycopg.Connection, pool: ConnectionPool, args: argparse.Namespace, negate_md: bool) -> None:
+    """Uma execução do comando; conn é a conexão principal e o pool fornece as do --pipeline."""
+    nums, ranges = load_controlled(conn, ranges_only=args.ranges_only, quiet_missing_clients=args.quiet_missing_clients)
+    schema = DestinationSchema(conn, args.dst_table)
+    dest_cols = schema.columns
+    writer = None
+    if args.writer != "row":
+        writer = PhonecallBatchWriter(conn, schema, args.writer, dry_run=args.dry_run)
+
+    pipeline = None
+    if args.pipeline:
+        pipeline = SbcPipeline(pool, args.src_table, args.dst_table, schema, nums, ranges, negate_md,
+                               writer_method=args.writer, dry_run=args.dry_run, sample=args.sample,
+                               classify_workers=args.classify_workers, queue_size=args.queue_size)
+
+    if args.command == "analysis" and args.checkpoint:
+        checkpoint = RunCheckpoint(args.checkpoint_table, RunCheckpoint.run_mode(
+            args.command, args.src_table, args.dst_table, args.event_type, negate_md))
+        checkpoint.ensure_table(conn)
+        last_id = checkpoint.load(conn)
+        if last_id is None:
+            # primeira execução: a faixa abaixo do maior id gravado é verificada inteira uma vez
+            last_id, repair_from = checkpoint.bootstrap(conn, args.dst_table, negate_md, args.dry_run), 0
+        else:
+            repair_from = max(0, last_id - args.repair_window)
+        logging.info("Checkpoint %s: %d (reparo a partir de %d)", checkpoint.mode, last_id, repair_from)
+
+        total = repair_gaps(conn, args, nums, ranges, schema, writer, negate_md, repair_from, last_id)
+        if pipeline is not None:
+            pipeline.checkpoint = checkpoint
+            total += pipeline.run(iter_checkpoint_batches(args.src_table, args.event_type, args.batch_size, last_id))
+        else:
+            while True:
+                ids = pending_ids_after(conn, args.src_table, args.event_type, last_id, args.batch_size)
+                if not ids:
+                    break
+                # o mesmo id do checkpoint: com --sample, as linhas além da amostra vêm no próximo lote
+                inserted, last_id = process_batch(conn, args.src_table, args.dst_table, ids, nums, ranges, dest_cols,
+                                                  negate_md, args.dry_run, writer=writer, required=schema.required,
+                                                  checkpoint=checkpoint, snapshots=schema.snapshots, sample=args.sample)
+                total += inserted
+        logging.info("%d SBC analisadas", total)
+        if not CONFIG.get('no_console'):
+            print(f"{total} SBC analisadas")
+
+    elif args.command == "analysis" and pipeline is not None:
+        total = pipeline.run(iter_pending_batches(args.src_table, args.dst_table, args.event_type, args.batch_size, negate_md))
+        logging.info("%d SBC analisadas", total)
+        if not CONFIG.get('no_console'):
+            print(f"{total} SBC analisadas")
+
+    elif args.command == "analysis":
+        total = 0
+        while True:
+            ids = pending_ids(conn, args.src_table, args.dst_table, args.event_type, args.batch_size, negate_md)
+            if not ids:
+                break
+            inserted, _ = process_batch(conn, args.src_table, args.dst_table, ids, nums, ranges, dest_cols, negate_md,
+                                        args.dry_run, writer=writer, required=schema.required,
+                                        snapshots=schema.snapshots, sample=args.sample)
+            total += inserted
+        logging.info("%d SBC analisadas", total)
+        if not CONFIG.get('no_console'):
+            print(f"{total} SBC analisadas")
+
+    elif args.command == "analysis-with-date":
+        if not args.dates:
+            raise SystemExit("Forneça ao menos uma data YYYY-MM-DD")
+        ids = pending_ids_by_date(conn, args.src_table, args.dst_table, args.event_type, args.dates, 10**7, negate_md)
+        if pipeline is not None:
+            total = pipeline.run([ids[i:i+args.batch_size] for i in range(0, len(ids), args.batch_size)])
+        else:
+            total = 0
+            for i in range(0, len(ids), args.batch_size):
+                inserted, _ = process_batch(conn, args.src_table, args.dst_table, ids[i:i+args.batch_size], nums, ranges,
+                                            dest_cols, negate_md, args.dry_run, writer=writer, required=schema.required,
+                                            snapshots=schema.snapshots, sample=args.sample)
+                total += inserted
+        logging.info("%d SBC analisadas (datas: %s)", total, ", ".join(args.dates))
+        if not CONFIG.get('no_console'):
+            print(f"{total} SBC analisadas (datas: {', '.join(args.dates)})")
+
+    elif args.command == "reanalysis":
+        logging.info("Reanálise: personalize o critério no código conforme sua necessidade.")
+        if not CONFIG.get('no_console'):
+            print("Reanálise: personalize o critério no código conforme sua necessidade.")
 
 # ------------------------------
 # CLI
 # ------------------------------
+def positive_int(value: str) -> int:
+    """Tipo do argparse para inteiros maiores que zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero: {value}")
+    return number
+
 def main() -> None:
     ap = argparse.ArgumentParser(description="Processa SBC sem Django (SQL puro)")
     ap.add_argument("--dsn", required=True, help="Ex.: 'host=127.0.0.1 port=5432 dbname=test_db user=usr password=pwd' ou URL postgresql://")
@@ -525,9 +1192,25 @@ def main() -> None:
     ap.add_argument("--src-table", default="sbc_phonecall", help="Tabela de origem (default: sbc_phonecall)")
     ap.add_argument("--dst-table", default="phonecalls_phonecall", help="Tabela de destino (default: phonecalls_phonecall)")
     ap.add_argument("--event-type", default="CALL_END", help="Tipo de evento a filtrar na origem (default: CALL_END)")
-    ap.add_argument("--batch-size", type=int, default=5000, help="Tamanho do lote (default: 5000)")
+    ap.add_argument("--batch-size", type=positive_int, default=5000, help="Tamanho do lote (default: 5000)")
     ap.add_argument("--no-negate-md", action="store_true", help="Não negue o md_phonecall_id (use id positivo)")
     ap.add_argument("--dry-run", action="store_true", help="Não insere; apenas simula (loga)")
+    ap.add_argument("--writer", choices=["row", "executemany", "copy"], default="copy",
+                    help="Gravação: INSERT por linha, executemany ou COPY, um lote por transação (default: copy)")
+    ap.add_argument("--pipeline", action="store_true",
+                    help="Busca, classificação e gravação em paralelo (duas conexões; requer --writer copy/executemany)")
+    ap.add_argument("--checkpoint", action="store_true",
+                    help="analysis: retoma do maior id já processado (tabela de checkpoint) em vez do anti-join completo")
+    ap.add_argument("--checkpoint-table", default="sbc_processing_checkpoint",
+                    help="Tabela de checkpoint, criada se não existir (default: sbc_processing_checkpoint)")
+    ap.add_argument("--repair-window", type=int, default=50000,
+                    help="Ids abaixo do checkpoint revisitados a cada execução, para chegadas tardias (default: 50000)")
+    ap.add_argument("--classify-workers", type=positive_int, default=2, help="Threads de classificação no --pipeline (default: 2)")
+    ap.add_argument("--queue-size", type=positive_int, default=2, help="Lotes em espera entre estágios no --pipeline (default: 2)")
+    ap.add_argument("--interval", type=float, default=0,
+                    help="Repete o comando a cada N segundos no mesmo processo, reaproveitando as conexões (0 = uma vez)")
+    ap.add_argument("--statement-timeout", type=int, default=0,
+                    help="statement_timeout das conexões, em ms (0 = sem limite)")
 
     # Flags de leitura e logging
     ap.add_argument("--ranges-only", action="store_true", help="Ignore controlled_number_clients e use apenas controlled_number_ranges")
@@ -554,45 +1237,38 @@ def main() -> None:
     CONFIG['log_params'] = True if args.log_params else (bool(args.debug) and not args.no_console)
     CONFIG['no_console'] = bool(args.no_console)
 
-    # expor args para funções (sample/dry-run)
-    globals()['_ARGS_REF'] = args
-
     negate_md = not args.no_negate_md
-
-    logging.info("Iniciando: cmd=%s src=%s dst=%s batch=%d negate_md=%s dry_run=%s",
-                 args.command, args.src_table, args.dst_table, args.batch_size, negate_md, args.dry_run)
-
-    with psycopg.connect(args.dsn, autocommit=True) as conn:
-        logging.info("Conectado ao Postgres")
-        nums, ranges = load_controlled(conn, ranges_only=args.ranges_only, quiet_missing_clients=args.quiet_missing_clients)
-        dest_cols = get_table_columns(conn, args.dst_table)
-
-        if args.command == "analysis":
-            total = 0
-            while True:
-                ids = pending_ids(conn, args.src_table, args.dst_table, args.event_type, args.batch_size, negate_md)
-                if not ids:
-                    break
-                total += process_batch(conn, args.src_table, args.dst_table, ids, nums, ranges, dest_cols, negate_md, args.dry_run)
-            logging.info("%d SBC analisadas", total)
-            if not CONFIG.get('no_console'):
-                print(f"{total} SBC analisadas")
-
-        elif args.command == "analysis-with-date":
-            if not args.dates:
-                raise SystemExit("Forneça ao menos uma data YYYY-MM-DD")
-            ids = pending_ids_by_date(conn, args.src_table, args.dst_table, args.event_type, args.dates, 10**7, negate_md)
-            total = 0
-            for i in range(0, len(ids), args.batch_size):
-                total += process_batch(conn, args.src_table, args.dst_table, ids[i:i+args.batch_size], nums, ranges, dest_cols, negate_md, args.dry_run)
-            logging.info("%d SBC analisadas (datas: %s)", total, ", ".join(args.dates))
-            if not CONFIG.get('no_console'):
-                print(f"{total} SBC analisadas (datas: {', '.join(args.dates)})")
-
-        elif args.command == "reanalysis":
-            logging.info("Reanálise: personalize o critério no código conforme sua necessidade.")
-            if not CONFIG.get('no_console'):
-                print("Reanálise: personalize o critério no código conforme sua necessidade.")
+    if args.pipeline and args.writer == "row":
+        ap.error("--pipeline requer --writer copy ou executemany")
+
+    logging.info("Iniciando: cmd=%s src=%s dst=%s batch=%d negate_md=%s dry_run=%s writer=%s",
+                 args.command, args.src_table, args.dst_table, args.batch_size, negate_md, args.dry_run, args.writer)
+
+    # busca e gravação do --pipeline usam conexões próprias, além da principal
+    pool = ConnectionPool(args.dsn, driver=psycopg, max_size=3 if args.pipeline else 1, autocommit=True,
+                          statement_timeout=args.statement_timeout, application_name="task_sbc_standalone")
+    backoff = Backoff()
+    try:
+        while True:
+            try:
+                with pool.connection() as conn:
+                    logging.info("Conectado ao Postgres")
+                    run_command(conn, pool, args, negate_md)
+            except psycopg.OperationalError as e:
+                # servidor fora ou conexão perdida: com --interval, tenta de novo com espera crescente
+                if args.interval <= 0:
+                    raise
+                delay = args.interval + backoff.next()
+                logging.error("Falha de conexão (%s); nova tentativa em %.1fs", str(e).strip(), delay)
+                time.sleep(delay)
+                continue
+            backoff.reset()
+            if args.interval <= 0:
+                break
+            logging.info("Próxima execução em %.0fs", args.interval)
+            time.sleep(args.interval)
+    finally:
+        pool.close()
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,5 @@
 # django
 from django.db.models import Q
-from django.db.models.functions import Reverse
-from django.db.models.functions import Substr
 from django.db.models.functions import Trim
 
 # third party
@@ -87,11 +85,11 @@ class PhonecallFilter(django_filters.FilterSet):
         return queryset
 
     def ddd_filter(self, queryset, name, value):
+        # charged_ddd/dialed_ddd são preenchidos no pre_save (ver backfill_phonecall_ddd)
         return queryset \
-            .annotate(cnumber=Reverse(Substr(Reverse(Trim('chargednumber')), 10, 2)),
-                      dnumber=Reverse(Substr(Reverse(Trim('dialednumber')), 10, 2)),
-                      extnumber=Substr('extension__extension', 1, 2)) \
-            .filter(Q(extnumber=value) | Q(cnumber=value) | Q(dnumber=value))
+            .filter(Q(extension__extension__startswith=value) |
+                    Q(charged_ddd=value) |
+                    Q(dialed_ddd=value))
 
     def extension_filter(self, queryset, name, value):
         extension_list = make_extension_list(value)
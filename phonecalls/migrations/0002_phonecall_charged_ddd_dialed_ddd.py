@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phonecalls', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='phonecall',
+            name='charged_ddd',
+            field=models.CharField(blank=True, max_length=2, null=True, verbose_name='DDD do Número Cobrado'),
+        ),
+        migrations.AddField(
+            model_name='phonecall',
+            name='dialed_ddd',
+            field=models.CharField(blank=True, max_length=2, null=True, verbose_name='DDD do Número Discado'),
+        ),
+        migrations.AddIndex(
+            model_name='phonecall',
+            index=models.Index(fields=['charged_ddd', 'startdate'], name='phonecalls_charged_ddd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phonecall',
+            index=models.Index(fields=['dialed_ddd', 'startdate'], name='phonecalls_dialed_ddd_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phonecalls', '0002_phonecall_charged_ddd_dialed_ddd'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='phonecall',
+            index=models.Index(condition=models.Q(inbound=False), fields=['organization', '-startdate', '-starttime'], include=['company', 'calltype', 'billedtime', 'billedamount'], name='phonecalls_org_out_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phonecall',
+            index=models.Index(condition=models.Q(inbound=False), fields=['company', '-startdate', '-starttime'], include=['calltype', 'billedtime', 'billedamount'], name='phonecalls_company_out_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phonecall',
+            index=models.Index(condition=models.Q(inbound=False), fields=['-startdate', '-starttime'], name='phonecalls_out_date_idx'),
+        ),
+    ]
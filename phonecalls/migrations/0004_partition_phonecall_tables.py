@@ -0,0 +1,31 @@
+from django.db import migrations
+
+from core.partitions import PARTITIONED_TABLES
+from core.partitions import convert_to_partitioned
+from core.partitions import table_exists
+
+
+def partition_tables(apps, schema_editor):
+    """
+        Particiona por mês phonecalls_phonecall e, se estiverem nesta base,
+        sbc_phonecall e syslog_events (criadas pelo ETL/Ingestor)
+        Só troca a estrutura: as linhas existentes ficam em <tabela>_legacy até
+        `manage.py partitions copy`, que as move em lotes fora do migrate
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table, column in PARTITIONED_TABLES.items():
+            if table_exists(cursor, table):
+                convert_to_partitioned(cursor, table, column)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phonecalls', '0003_phonecall_outbound_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tables),
+    ]
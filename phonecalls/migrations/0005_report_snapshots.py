@@ -0,0 +1,50 @@
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phonecalls', '0004_partition_phonecall_tables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('month', models.DateField(unique=True, verbose_name='Mês')),
+                ('closed', models.BooleanField(default=False, verbose_name='Fechado')),
+            ],
+            options={
+                'verbose_name': 'Mês de Faturamento',
+                'verbose_name_plural': 'Meses de Faturamento',
+            },
+        ),
+        migrations.CreateModel(
+            name='ReportSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('report', models.CharField(max_length=50, verbose_name='Relatório')),
+                ('key', models.CharField(max_length=40, verbose_name='Chave')),
+                ('data', models.BinaryField(blank=True, null=True, verbose_name='Agregados')),
+                ('file', models.FileField(blank=True, null=True, upload_to='report_snapshots/', verbose_name='Arquivo')),
+                ('filename', models.CharField(blank=True, max_length=255, verbose_name='Nome do Arquivo')),
+                ('content_type', models.CharField(blank=True, max_length=100, verbose_name='Tipo do Arquivo')),
+                ('month', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='phonecalls.reportmonth', verbose_name='Mês')),
+            ],
+            options={
+                'verbose_name': 'Snapshot de Relatório',
+                'verbose_name_plural': 'Snapshots de Relatórios',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reportsnapshot',
+            constraint=models.UniqueConstraint(fields=('month', 'report', 'key'), name='phonecalls_report_snapshot_uniq'),
+        ),
+    ]
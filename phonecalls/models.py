@@ -1,6 +1,5 @@
 # python
-import pytz
-
+from datetime import datetime
 from decimal import Decimal
 
 # django
@@ -22,6 +21,7 @@ from centers.models import Sector
 from charges.constants import BASIC_SERVICE_CHOICES
 from charges.constants import SERVICE_TYPE_CHOICES
 from core.constants import INACTIVE_STATUS
+from core.sbc_time import get_offset_table
 from extensions.models import ExtensionLine
 
 # local
@@ -30,6 +30,7 @@ from .constants import OTHERTYPE_CHOICES
 from .constants import PABX_CHOICES
 from .constants import SERVICE_CHOICES
 from .constants import VC1, VC2, VC3, LOCAL, LDN, LDI
+from .utils import get_ddd
 
 
 class PriceTable(TimeStampedModel, ActivatorModel):
@@ -191,6 +192,13 @@ class Phonecall(TimeStampedModel):
     dialednumber = models.CharField(
         'Número Discado', max_length=40)
 
+    # DDD pré-calculado na classificação (vazio quando o número não tem DDD)
+    charged_ddd = models.CharField(
+        'DDD do Número Cobrado', max_length=2, blank=True, null=True)
+
+    dialed_ddd = models.CharField(
+        'DDD do Número Discado', max_length=2, blank=True, null=True)
+
     conditioncode = models.SmallIntegerField(
         'Código de Condição')
 
@@ -201,6 +209,23 @@ class Phonecall(TimeStampedModel):
         indexes = [
             models.Index(fields=['-startdate'],
                          name='phonecalls_date_idx'),
+            models.Index(fields=['charged_ddd', 'startdate'],
+                         name='phonecalls_charged_ddd_idx'),
+            models.Index(fields=['dialed_ddd', 'startdate'],
+                         name='phonecalls_dialed_ddd_idx'),
+            # listas e relatórios só consultam chamadas originadas (inbound=False)
+            # ordenadas por -startdate, -starttime (ver query_shapes / phonecall_query_audit)
+            models.Index(fields=['organization', '-startdate', '-starttime'],
+                         name='phonecalls_org_out_idx',
+                         condition=models.Q(inbound=False),
+                         include=['company', 'calltype', 'billedtime', 'billedamount']),
+            models.Index(fields=['company', '-startdate', '-starttime'],
+                         name='phonecalls_company_out_idx',
+                         condition=models.Q(inbound=False),
+                         include=['calltype', 'billedtime', 'billedamount']),
+            models.Index(fields=['-startdate', '-starttime'],
+                         name='phonecalls_out_date_idx',
+                         condition=models.Q(inbound=False)),
         ]
 
     @property
@@ -223,8 +248,8 @@ class Phonecall(TimeStampedModel):
     def make_datetime(_date, _time):
         year, month, day = _date.year, _date.month, _date.day
         hour, minute, second = _time.hour, _time.minute, _time.second
-        utc_datetime = timezone.datetime(year, month, day, hour, minute, second, tzinfo=pytz.UTC)
-        _datetime = utc_datetime.astimezone(pytz.timezone(settings.TIME_ZONE))
+        utc_datetime = datetime(year, month, day, hour, minute, second)
+        _datetime = get_offset_table(settings.TIME_ZONE).to_local(utc_datetime)
         return _datetime.date(), _datetime.time()
 
     def set_md_data(self, md_phonecall):
@@ -246,10 +271,15 @@ class Phonecall(TimeStampedModel):
             billedtime += ((time // 6) + (0 if time % 6 == 0 else 1)) * 6
         return billedtime
 
+    def set_ddd(self):
+        self.charged_ddd = get_ddd(self.chargednumber)
+        self.dialed_ddd = get_ddd(self.dialednumber)
+
 
 @receiver(pre_save, sender=Phonecall)
 def phonecall_pre_save(sender, instance, **kwargs):
     instance.billedtime = instance.make_billedtime()
+    instance.set_ddd()
 
     if not instance.extension or not instance.extension.organization:
         return
@@ -278,3 +308,55 @@ def phonecall_pre_save(sender, instance, **kwargs):
     except Price.DoesNotExist:
         instance.price = 0.0
     instance.billedamount = round((instance.price / 60) * instance.billedtime, 2)
+
+
+class ReportMonth(TimeStampedModel):
+    """
+    Mês de faturamento dos relatórios
+    Meses fechados (closed) não mudam mais: os relatórios do período passam a ser
+    gerados a partir dos agregados congelados (ReportSnapshot) e os arquivos gerados
+    são guardados e reaproveitados
+    """
+    month = models.DateField(
+        verbose_name='Mês', unique=True)
+    closed = models.BooleanField(
+        verbose_name='Fechado', default=False)
+
+    class Meta:
+        verbose_name = 'Mês de Faturamento'
+        verbose_name_plural = 'Meses de Faturamento'
+
+
+class ReportSnapshot(TimeStampedModel):
+    """
+    Agregados de um relatório (phonecall_map, basic_service, prop...) de um mês fechado,
+    por relatório e por escopo/filtros (key), e o último arquivo gerado com eles
+    data guarda o contexto serializado com pickle (chaves inteiras, Decimal e datas)
+    organization/company: escopo do relatório, usado na invalidação pelos scripts de
+    ingestão (vazios nos relatórios de todas as organizações)
+    """
+    month = models.ForeignKey(
+        ReportMonth, verbose_name='Mês', on_delete=models.CASCADE)
+    organization = models.ForeignKey(
+        Organization, verbose_name='Organização', on_delete=models.CASCADE, blank=True, null=True)
+    company = models.ForeignKey(
+        Company, verbose_name='Empresa', on_delete=models.CASCADE, blank=True, null=True)
+    report = models.CharField(
+        verbose_name='Relatório', max_length=50)
+    key = models.CharField(
+        verbose_name='Chave', max_length=40)
+    data = models.BinaryField(
+        verbose_name='Agregados', blank=True, null=True)
+    file = models.FileField(
+        verbose_name='Arquivo', upload_to='report_snapshots/', blank=True, null=True)
+    filename = models.CharField(
+        verbose_name='Nome do Arquivo', max_length=255, blank=True)
+    content_type = models.CharField(
+        verbose_name='Tipo do Arquivo', max_length=100, blank=True)
+
+    class Meta:
+        verbose_name = 'Snapshot de Relatório'
+        verbose_name_plural = 'Snapshots de Relatórios'
+        constraints = [
+            models.UniqueConstraint(fields=['month', 'report', 'key'], name='phonecalls_report_snapshot_uniq'),
+        ]
@@ -0,0 +1,60 @@
+# django
+from django.db.models import Count
+from django.db.models import Sum
+
+# local
+from .constants import VC1, VC2, VC3, LOCAL, LDN, LDI
+from .models import Phonecall
+
+OUTBOUND_CALLTYPES = [LOCAL, VC1, VC2, VC3, LDN, LDI]
+PAGE_SIZE = 100
+
+
+def get_query_shapes(organization, company, date_gt, date_lt):
+    """
+        Consultas equivalentes às das listas e relatórios de chamadas
+        (Base*PhonecallView e BaseContextData), usadas na auditoria de índices
+    """
+    outbound = Phonecall.objects \
+        .filter(startdate__gte=date_gt,
+                startdate__lte=date_lt,
+                inbound=False,
+                calltype__in=OUTBOUND_CALLTYPES)
+    list_fields = ('chargednumber', 'dialednumber', 'calltype', 'service', 'pabx',
+                   'startdate', 'starttime', 'stopdate', 'stoptime', 'duration', 'billedamount')
+    return [
+        ('company_list',
+         outbound.filter(company=company)
+                 .only(*list_fields)
+                 .order_by('-startdate', '-starttime')[:PAGE_SIZE]),
+        ('org_list',
+         outbound.filter(organization=organization)
+                 .select_related('extension')
+                 .only('extension__extension', *list_fields)
+                 .order_by('-startdate', '-starttime')[:PAGE_SIZE]),
+        ('adm_list',
+         outbound.select_related('extension')
+                 .only('extension__extension', *list_fields)
+                 .order_by('-startdate', '-starttime')[:PAGE_SIZE]),
+        ('company_report',
+         outbound.filter(company=company)
+                 .values('calltype')
+                 .annotate(count=Count('id'),
+                           billedtime_sum=Sum('billedtime'),
+                           cost_sum=Sum('billedamount'))
+                 .order_by('calltype')),
+        ('org_report',
+         outbound.filter(organization=organization, company__isnull=False)
+                 .values('company__name', 'calltype')
+                 .annotate(count=Count('id'),
+                           billedtime_sum=Sum('billedtime'),
+                           cost_sum=Sum('billedamount'))
+                 .order_by('company__name', '-calltype')),
+        ('adm_report',
+         outbound.filter(organization__isnull=False)
+                 .values('organization__name', 'company__name', 'calltype')
+                 .annotate(count=Count('id'),
+                           billedtime_sum=Sum('billedtime'),
+                           cost_sum=Sum('org_billedamount'))
+                 .order_by('organization__name', 'company__name', 'calltype')),
+    ]
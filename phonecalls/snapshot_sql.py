@@ -0,0 +1,69 @@
+"""
+    Invalidação dos snapshots de relatório (ReportSnapshot) em SQL, sem o Django
+    Usada pelos escritores que gravam chamadas direto no banco (scripts/sbc_syslog_etl.py,
+    new_task_sbc/): cada lote gravado apaga, na mesma transação e com um único DELETE, os
+    snapshots dos (mês, organização, empresa) que recebeu
+      - escopo com organização None: todos os snapshots do mês
+      - snapshots sem organização (relatórios de todas as organizações) caem com qualquer
+        escopo do mês; os de uma organização sem empresa, com qualquer empresa dela
+    Os arquivos gerados ficam no storage até 'manage.py report_snapshot prune'
+"""
+
+# python
+from datetime import date
+
+SNAPSHOT_TABLE = 'phonecalls_reportsnapshot'
+MONTH_TABLE = 'phonecalls_reportmonth'
+
+# uma linha do VALUES por escopo; no PostgreSQL os tipos precisam ser explícitos
+# (uma coluna só com NULL viraria text), no SQLite os tipos são dinâmicos
+VALUES_ROW = {
+    'format': '(CAST(%s AS date), CAST(%s AS integer), CAST(%s AS integer))',
+    'qmark': '(?, ?, ?)',
+}
+
+TABLE_EXISTS_SQL = {
+    'format': 'SELECT to_regclass(%s) IS NOT NULL',
+    'qmark': "SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?)",
+}
+
+
+def snapshot_scope(day, organization_id=None, company_id=None):
+    """ (primeiro dia do mês, organização, empresa) de uma chamada gravada """
+    return date(day.year, day.month, 1), organization_id, company_id
+
+
+def invalidation_sql(count, paramstyle='format'):
+    """ DELETE dos snapshots de count escopos (VALUES: column1=mês, column2=org, column3=empresa) """
+    values = ', '.join([VALUES_ROW[paramstyle]] * count)
+    return f'''
+        DELETE FROM {SNAPSHOT_TABLE}
+        WHERE id IN (
+            SELECT s.id
+            FROM {SNAPSHOT_TABLE} s
+            JOIN {MONTH_TABLE} m ON m.id = s.month_id
+            JOIN (VALUES {values}) a ON m.month = a.column1
+            WHERE a.column2 IS NULL
+               OR s.organization_id IS NULL
+               OR (s.organization_id = a.column2
+                   AND (s.company_id IS NULL OR a.column3 IS NULL OR s.company_id = a.column3))
+        )
+    '''
+
+
+def snapshots_enabled(cursor, paramstyle='format'):
+    """ A tabela de snapshots existe (bancos sem as migrações do Django não têm) """
+    cursor.execute(TABLE_EXISTS_SQL[paramstyle], [SNAPSHOT_TABLE])
+    return bool(cursor.fetchone()[0])
+
+
+def invalidate_snapshots(cursor, scopes, paramstyle='format'):
+    """ Apaga os snapshots dos escopos (snapshot_scope) com um DELETE; devolve quantos """
+    scopes = set(scopes)
+    if not scopes:
+        return 0
+    params = []
+    for month, organization_id, company_id in scopes:
+        params += [month.isoformat(), organization_id, company_id]
+    cursor.execute(invalidation_sql(len(scopes), paramstyle), params)
+    return cursor.rowcount
@@ -0,0 +1,214 @@
+"""
+    Relatórios de meses fechados: gerados uma vez, reaproveitados depois
+    close_month fecha o mês de faturamento; a partir daí, para cada relatório, escopo
+    (organização/empresa) e filtros, o primeiro download guarda os agregados usados no
+    relatório (ReportSnapshot.data: phonecall_map, basic_service, prop...) e o arquivo
+    gerado, e os seguintes devolvem o arquivo sem consultar as chamadas
+    Reclassificações e reprecificações que alcançam um mês fechado chamam invalidate_months
+    ou invalidate_period: os snapshots são descartados e recapturados no próximo download
+    (o mês continua fechado). Os escritores fora do Django (ETL do syslog, new_task_sbc)
+    apagam os snapshots dos meses/organizações/empresas de cada lote (snapshot_sql.py)
+"""
+
+# python
+import hashlib
+import json
+import os
+import pickle
+
+from calendar import monthrange
+from datetime import timedelta
+
+# django
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import FileResponse
+from django.utils import timezone
+
+# project
+from core.partitions import month_start
+
+# local
+from .models import ReportMonth
+from .models import ReportSnapshot
+
+# o período já é o mês do snapshot
+IGNORED_PARAMS = ('date_gt', 'date_lt')
+
+
+def get_closed_month(date_gt, date_lt):
+    """ Mês fechado quando o período é um mês inteiro (do dia 1 ao último dia), ou None """
+    if date_gt is None or date_lt is None:
+        return None
+    if date_gt.day != 1 or (date_gt.year, date_gt.month) != (date_lt.year, date_lt.month):
+        return None
+    if date_lt.day != monthrange(date_lt.year, date_lt.month)[1]:
+        return None
+    return ReportMonth.objects.filter(month=month_start(date_gt), closed=True).first()
+
+
+def get_snapshot_key(scope, params):
+    """ sha1 do escopo (ids da organização e da empresa) e dos filtros da requisição (na ordem das chaves) """
+    values = sorted((key, value) for key, value in params.items() if key not in IGNORED_PARAMS)
+    return hashlib.sha1(json.dumps([list(scope), values]).encode()).hexdigest()
+
+
+def get_report_snapshot(report, scope, params, date_gt, date_lt):
+    """
+        Snapshot do relatório no mês fechado (criado vazio no primeiro acesso), ou None
+        scope: ids (organização, empresa); None nos relatórios de todas as organizações
+    """
+    report_month = get_closed_month(date_gt, date_lt)
+    if report_month is None:
+        return None
+    organization_id, company_id = scope
+    snapshot, _ = ReportSnapshot.objects.get_or_create(
+        month=report_month, report=report, key=get_snapshot_key(scope, params),
+        defaults={'organization_id': organization_id, 'company_id': company_id})
+    return snapshot
+
+
+def load_snapshot_data(snapshot):
+    if not snapshot.data:
+        return None
+    return pickle.loads(snapshot.data)
+
+
+def save_snapshot_data(snapshot, data):
+    snapshot.data = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    snapshot.save(update_fields=['data', 'modified'])
+
+
+def save_snapshot_file(snapshot, content, filename, content_type):
+    """ Guarda o arquivo gerado (bytes) no storage padrão """
+    extension = os.path.splitext(filename)[1]
+    name = f'{snapshot.month.month:%Y-%m}-{snapshot.report}-{snapshot.key}{extension}'
+    snapshot.file.save(name, ContentFile(content), save=False)
+    snapshot.filename = filename
+    snapshot.content_type = content_type
+    snapshot.save(update_fields=['file', 'filename', 'content_type', 'modified'])
+
+
+def get_snapshot_response(snapshot):
+    """ Download do arquivo guardado, ou None se ainda não foi gerado (ou sumiu do storage) """
+    if not snapshot.file:
+        return None
+    try:
+        file = snapshot.file.open('rb')
+    except OSError:
+        return None
+    return FileResponse(file, as_attachment=True, filename=snapshot.filename, content_type=snapshot.content_type)
+
+
+def delete_snapshots(queryset):
+    """ Apaga os snapshots e, depois do commit, os arquivos gerados """
+    names = [name for name in queryset.values_list('file', flat=True) if name]
+    count, _ = queryset.delete()
+
+    def delete_files():
+        for name in names:
+            default_storage.delete(name)
+    transaction.on_commit(delete_files)
+    return count
+
+
+def prune_snapshot_files(min_age=timedelta(hours=1)):
+    """
+        Apaga do storage os arquivos sem snapshot (apagados em SQL pelos scripts); devolve quantos
+        Arquivos mais novos que min_age ficam (o download pode estar salvando o snapshot)
+    """
+    upload_to = ReportSnapshot._meta.get_field('file').upload_to
+    try:
+        _, files = default_storage.listdir(upload_to)
+    except FileNotFoundError:
+        return 0
+    referenced = set(ReportSnapshot.objects.exclude(file='').values_list('file', flat=True))
+    limit = timezone.now() - min_age
+    count = 0
+    for name in (os.path.join(upload_to, file) for file in files):
+        if name not in referenced and default_storage.get_modified_time(name) < limit:
+            default_storage.delete(name)
+            count += 1
+    return count
+
+
+def close_month(month):
+    """ Fecha o mês; snapshots anteriores (de um fechamento antigo) são descartados """
+    with transaction.atomic():
+        report_month, _ = ReportMonth.objects.select_for_update().get_or_create(month=month_start(month))
+        delete_snapshots(ReportSnapshot.objects.filter(month=report_month))
+        report_month.closed = True
+        report_month.save()
+    return report_month
+
+
+def reopen_month(month):
+    """ Reabre o mês: os relatórios voltam a ser calculados a cada download """
+    with transaction.atomic():
+        delete_snapshots(ReportSnapshot.objects.filter(month__month=month_start(month)))
+        return ReportMonth.objects.filter(month=month_start(month)).update(closed=False)
+
+
+def invalidate_months(months):
+    """ Descarta os snapshots dos meses (datas quaisquer dentro do mês); devolve quantos """
+    months = {month_start(month) for month in months}
+    if not months:
+        return 0
+    with transaction.atomic():
+        return delete_snapshots(ReportSnapshot.objects.filter(month__month__in=months))
+
+
+def invalidate_period(date_gt=None, date_lt=None):
+    """ Descarta os snapshots dos meses entre date_gt e date_lt (None: sem limite) """
+    queryset = ReportSnapshot.objects.all()
+    if date_gt is not None:
+        queryset = queryset.filter(month__month__gte=month_start(date_gt))
+    if date_lt is not None:
+        queryset = queryset.filter(month__month__lte=date_lt)
+    with transaction.atomic():
+        return delete_snapshots(queryset)
+
+
+class ReportSnapshotMixin(object):
+    """
+        Views de relatório com snapshot nos meses fechados
+          - snapshot_report: nome do relatório (None desliga o snapshot)
+          - snapshot_context: chaves do contexto congeladas
+          - get_snapshot_scope: ids (organização, empresa) do relatório
+        No get: get_snapshot_response antes de gerar e save_snapshot_file depois
+        No get_context_data: get_snapshot_data no início e save_snapshot_data no fim
+        Usa self.params, self.date_gt e self.date_lt (depois do get_queryset)
+    """
+
+    snapshot_report = None
+    snapshot_context = ('phonecall_map',)
+
+    def get_snapshot_scope(self):
+        return None, None
+
+    def get_report_snapshot(self):
+        if not hasattr(self, 'report_snapshot'):
+            self.report_snapshot = None
+            if self.snapshot_report is not None:
+                self.report_snapshot = get_report_snapshot(
+                    self.snapshot_report, self.get_snapshot_scope(), self.params, self.date_gt, self.date_lt)
+        return self.report_snapshot
+
+    def get_snapshot_response(self):
+        snapshot = self.get_report_snapshot()
+        return get_snapshot_response(snapshot) if snapshot is not None else None
+
+    def get_snapshot_data(self):
+        snapshot = self.get_report_snapshot()
+        return load_snapshot_data(snapshot) if snapshot is not None else None
+
+    def save_snapshot_data(self, context):
+        snapshot = self.get_report_snapshot()
+        if snapshot is not None and not snapshot.data:
+            save_snapshot_data(snapshot, {key: context[key] for key in self.snapshot_context})
+
+    def save_snapshot_file(self, content, filename, content_type):
+        snapshot = self.get_report_snapshot()
+        if snapshot is not None:
+            save_snapshot_file(snapshot, content, filename, content_type)
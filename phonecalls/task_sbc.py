@@ -9,7 +9,6 @@
 from __future__ import annotations
 import argparse
 import os
-import re
 import sys
 from pathlib import Path
 from typing import Iterable, List, Optional, Set, Tuple
@@ -37,6 +36,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - falha visível só em r
 from core.utils import batch_qs
 from voip.models import Phonecall
 from .models import SbcPhonecall
+from .snapshots import invalidate_months
 
 from .constants import (
     IN_CALL, OUT_CALL, IN_ABANDONED, INTERNAL, CONFERENCE, TRANSFER,
@@ -44,6 +44,7 @@ from .constants import (
     PABX, VC1, VC2, VC3, LOCAL, LDN, LDI, FREE, UNKNOWN, ADDEDVALUE
 )
 from .tasks import extension_number_analysis, get_extension, check_extension, phonecall_fixsave
+from .utils import DDD_LEN, normalize_digits, split_ddd_local
 
 # ------------------------------------------------------------------------------
 # NOVO: Cache em memória dos números controlados e faixas
@@ -51,16 +52,9 @@ from .tasks import extension_number_analysis, get_extension, check_extension, ph
 _CONTROLLED_NUMBERS_SET: Optional[Set[str]] = None            # ex.: {"8531065600", "85999991234", ...}
 _CONTROLLED_RANGES_LIST: Optional[List[Tuple[str, int, int]]] = None  # ex.: [("85", 31065600, 31065644), ...]
 
-DDD_LEN = 2  # >>> NOVO: DDD brasileiro com 2 dígitos (ajuste aqui se precisar)
-
-def _normalize_digits(s: str) -> str:
-    return re.sub(r"\D+", "", s or "")
-
-def _split_ddd_local(normalized: str) -> Tuple[str, str]:
-    """Separa DDD (2 dígitos) e parte local. Ex.: '8531065600' -> ('85','31065600')."""
-    if len(normalized) <= DDD_LEN:
-        return "", normalized
-    return normalized[:DDD_LEN], normalized[DDD_LEN:]
+# Normalização compartilhada com Phonecall.set_ddd (DDD pré-calculado)
+_normalize_digits = normalize_digits
+_split_ddd_local = split_ddd_local
 
 def _load_controlled_from_db() -> Tuple[Set[str], List[Tuple[str, int, int]]]:
     """
@@ -205,7 +199,9 @@ def _is_extension(md_phonecall_id: int, number: str, field_name: str) -> bool:
     return check_extension(md_phonecall_id, number, field_name) is not None
 
 def _sbc_extension_calltype_analysis(sbc_qs, phonecall_map=None, reanalysis=False):
+    """Classifica e grava as chamadas; devolve as datas (startdate) gravadas, para invalidar snapshots"""
     phonecall_map = phonecall_map or {}
+    startdates = set()
     for sbc in sbc_qs:
         if reanalysis:
             phonecall = (phonecall_map.get(-int(sbc.id)) if NEGATE else phonecall_map.get(int(sbc.id)))
@@ -293,6 +289,9 @@ def _sbc_extension_calltype_analysis(sbc_qs, phonecall_map=None, reanalysis=Fals
         phonecall.extension = get_extension(sbc.id, chargednumber, dialednumber, getattr(phonecall, "inbound", False))
         phonecall_fixsave(phonecall)
         phonecall.save()
+        if phonecall.startdate:
+            startdates.add(phonecall.startdate)
+    return startdates
 
 def _pending_sbc_qs():
     base_qs = SbcPhonecall.objects.filter(event_type=CALL_END_EVENT_TYPE)
@@ -309,8 +308,11 @@ def run_sbc_extension_analysis() -> str:
     _load_controlled_from_db()
     pending_qs = _pending_sbc_qs()
     total = pending_qs.count()
+    startdates = set()
     for start, end, total, qs in batch_qs(pending_qs.order_by("id"), batch_size=BATCH_SIZE):
-        _sbc_extension_calltype_analysis(qs)
+        startdates |= _sbc_extension_calltype_analysis(qs)
+    # chamadas atrasadas de um mês fechado: os relatórios do mês são gerados de novo
+    invalidate_months(startdates)
     return f"{total} SBC analisadas"
 
 @shared_task
@@ -327,7 +329,7 @@ def run_sbc_extension_analysis_with_date(liststartdate: Iterable) -> str:
         else:
             done = set(Phonecall.objects.filter(md_phonecall_id__gte=0).values_list("md_phonecall_id", flat=True))
             day_qs = day_qs.exclude(id__in=list(done))
-        _sbc_extension_calltype_analysis(day_qs.order_by("id"))
+        invalidate_months(_sbc_extension_calltype_analysis(day_qs.order_by("id")))
     return "Datas SBC analisadas"
 
 @shared_task
@@ -344,7 +346,7 @@ def run_sbc_extension_reanalysis() -> str:
         phonecall_map = {pc.md_phonecall_id: pc for pc in qs}
         sbc_ids = [-mid for mid in phonecall_map.keys()] if NEGATE else list(phonecall_map.keys())
         sbc_qs = SbcPhonecall.objects.filter(id__in=sbc_ids, event_type=CALL_END_EVENT_TYPE)
-        _sbc_extension_calltype_analysis(sbc_qs, phonecall_map=phonecall_map, reanalysis=True)
+        invalidate_months(_sbc_extension_calltype_analysis(sbc_qs, phonecall_map=phonecall_map, reanalysis=True))
     return f"{phonecall_list.count()} SBC reanalisadas"
 
 @shared_task
@@ -1,3 +1,397 @@
+# python
+import re
+import shutil
+import tempfile
+
+from datetime import date
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+from unittest import skipUnless
+from zipfile import ZipFile
+
+# django
+from django.contrib.auth.models import User
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# project
+from charges.constants import BASIC_SERVICE_CHOICES
+from charges.constants import COMMUNICATION_SERVICE
+from core.synthetic import create_companies
+from core.synthetic import create_organizations
+from core.synthetic import create_phonecalls
+from Equipments.models import ContractBasicServices
+from phonecalls.constants import CALLTYPE_CHOICES
+from phonecalls.models import Phonecall
+from phonecalls.models import Price
+from phonecalls.models import PriceTable
+from phonecalls.models import ReportMonth
+from phonecalls.models import ReportSnapshot
+from phonecalls.snapshot_sql import invalidate_snapshots
+from phonecalls.snapshot_sql import snapshot_scope
+from phonecalls.snapshots import close_month
+from phonecalls.snapshots import invalidate_months
+
+# tabelas servidas pelo catálogo da requisição (core.catalogue)
+CATALOGUE_TABLES = (
+    'organizations_organization',
+    'accounts_organizationsetting',
+    'centers_company',
+    'phonecalls_pricetable',
+    'phonecalls_price',
+    'Equipments_contractbasicservices',
+)
+CATALOGUE_QUERY_RE = re.compile(r'\bFROM "(%s)"' % '|'.join(CATALOGUE_TABLES))
+# logotipo dos PDFs da administração (core/reports/pdf/admin.py), fora do repositório
+ADMIN_REPORT_LOGO = 'img/Logo.jpg'
+
+
+def create_call_pricetable(name, organization=None):
+    pricetable = PriceTable.objects.create(
+        organization=organization, name=name, servicetype=COMMUNICATION_SERVICE)
+    for calltype, _ in CALLTYPE_CHOICES:
+        Price.objects.create(table=pricetable, calltype=calltype, value=Decimal('0.1'))
+    return pricetable
+
+
+def create_basic_service_prices(pricetable):
+    """ Um preço por serviço básico (os relatórios de serviços procuram todos) """
+    Price.objects.bulk_create([
+        Price(table=pricetable, basic_service=basic_service, basic_service_amount=1, value=Decimal('10'))
+        for basic_service, _ in BASIC_SERVICE_CHOICES])
+
+
+class CatalogueQueryCountTestCase(TestCase):
+    """
+        As consultas ao catálogo (organizações, empresas, tabelas e preços) não
+        podem crescer com o número de empresas/organizações do relatório
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        create_call_pricetable('Valores Base ETICE')
+        cls.organization, = create_organizations(1, prefix='catalogo')
+        cls.companies = create_companies(cls.organization, 2)
+        cls.setup_pricetables(cls.organization, cls.companies)
+        create_phonecalls(cls.companies, 200, date_start=date.today().replace(day=1), days=1)
+
+    def setUp(self):
+        # a versão das listas de filtros vem de setUpTestData, igual em todos os testes:
+        # sem limpar o cache local, um teste leria as listas montadas pelo anterior
+        cache.clear()
+
+    @staticmethod
+    def setup_pricetables(organization, companies, organization_prices=True):
+        call_pricetable = create_call_pricetable(f'{organization.name} Chamadas', organization)
+        organization.settings.call_pricetable = call_pricetable
+        organization.settings.save()
+        for company in companies:
+            company.call_pricetable = call_pricetable
+            company.save()
+            create_basic_service_prices(company.service_pricetable)
+        if organization_prices:
+            create_basic_service_prices(organization.settings.service_pricetable)
+            # sem contratos o resumo da organização (ZIP geral) não tem linhas de serviços básicos
+            ContractBasicServices.objects.bulk_create([
+                ContractBasicServices(organization=organization, legacyID=basic_service,
+                                      contractID=organization.pk, item_number=basic_service,
+                                      description=description, is_subcontract=False)
+                for basic_service, description in BASIC_SERVICE_CHOICES])
+
+    def grow_dataset(self):
+        companies = create_companies(self.organization, 3, start=len(self.companies))
+        other_organization, = create_organizations(1, prefix='catalogo-extra')
+        other_companies = create_companies(other_organization, 3)
+        self.setup_pricetables(self.organization, companies, organization_prices=False)
+        self.setup_pricetables(other_organization, other_companies)
+        create_phonecalls(companies + other_companies, 300,
+                          date_start=date.today().replace(day=1), days=1, seed=1)
+
+    def count_catalogue_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sum(1 for query in context.captured_queries if CATALOGUE_QUERY_RE.search(query['sql']))
+
+    def assertCatalogueQueriesConstant(self, url):
+        self.client.force_login(self.user)
+        before = self.count_catalogue_queries(url)
+        self.grow_dataset()
+        self.assertEqual(self.count_catalogue_queries(url), before)
+
+    def download(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def assertNumQueriesConstant(self, num, url):
+        """
+            Total de consultas da requisição, antes e depois de mais empresas e organizações
+            A primeira requisição de cada rodada preenche o cache das listas de filtros (centers.choices)
+        """
+        self.client.force_login(self.user)
+        for grow in (False, True):
+            if grow:
+                self.grow_dataset()
+            self.download(url)
+            with self.assertNumQueries(num):
+                response = self.download(url)
+        return response
+
+    def get_period(self):
+        today = date.today()
+        return f'?date_gt={today.replace(day=1):%Y-%m-%d}&date_lt={today:%Y-%m-%d}'
+
+    def test_company_resume(self):
+        self.assertCatalogueQueriesConstant(reverse('phonecalls:resume', kwargs={
+            'org_slug': self.organization.slug, 'company_slug': self.companies[0].slug}))
+
+    def test_org_resume(self):
+        self.assertCatalogueQueriesConstant(reverse('phonecalls:org_phonecall_resume', kwargs={
+            'org_slug': self.organization.slug}))
+
+    def test_org_ust(self):
+        self.assertCatalogueQueriesConstant(reverse('phonecalls:org_phonecall_ust', kwargs={
+            'org_slug': self.organization.slug}))
+
+    def test_adm_resume(self):
+        self.assertCatalogueQueriesConstant(reverse('adm_phonecall_resume'))
+
+    def test_adm_ust(self):
+        self.assertCatalogueQueriesConstant(reverse('adm_phonecall_ust'))
+
+    @skipUnless(finders.find(ADMIN_REPORT_LOGO), f'{ADMIN_REPORT_LOGO} não está no static')
+    def test_adm_resume_report_pdf(self):
+        self.assertCatalogueQueriesConstant(reverse('adm_phonecall_resume_report_pdf'))
+
+    @skipUnless(finders.find(ADMIN_REPORT_LOGO), f'{ADMIN_REPORT_LOGO} não está no static')
+    def test_adm_ust_report_pdf(self):
+        self.assertCatalogueQueriesConstant(reverse('adm_phonecall_ust_report_pdf'))
+
+    def test_master_reports_zip_queries(self):
+        response = self.assertNumQueriesConstant(12, reverse('master_phonecall_reports') + self.get_period())
+        self.assertEqual(response['Content-Type'], 'application/octet-stream')
+
+    def test_total_report_pdf_company_queries(self):
+        response = self.assertNumQueriesConstant(14, reverse('phonecalls:TotalReportPDFCompany', kwargs={
+            'org_slug': self.organization.slug}) + self.get_period())
+        self.assertEqual(response['Content-Type'], 'application/octet-stream')
+
+    def test_total_report_xls_company_queries(self):
+        response = self.assertNumQueriesConstant(8, reverse('phonecalls:TotalReportPDFXLSCompany', kwargs={
+            'org_slug': self.organization.slug}) + self.get_period())
+        self.assertEqual(response['Content-Type'], 'application/octet-stream')
+        # uma planilha e um PDF por empresa da organização com chamadas
+        with ZipFile(BytesIO(response.content)) as archive:
+            names = archive.namelist()
+            company_names = set(Phonecall.objects.filter(company__organization=self.organization)
+                                .values_list('company__name', flat=True))
+            self.assertEqual(len(names), 2 * len(company_names))
+            for company_name in company_names:
+                self.assertEqual(sum(name.endswith(f'{company_name}.xlsx') for name in names), 1)
+                pdf_name, = [name for name in names if name.endswith(f'{company_name}.pdf')]
+                self.assertTrue(archive.read(pdf_name).startswith(b'%PDF'))
+
+    def test_company_report_xlsx_queries(self):
+        self.assertNumQueriesConstant(9, reverse('phonecalls:report_xlsx', kwargs={
+            'org_slug': self.organization.slug, 'company_slug': self.companies[0].slug}))
+
+    def test_company_report_csv_queries(self):
+        self.assertNumQueriesConstant(6, reverse('phonecalls:report_csv', kwargs={
+            'org_slug': self.organization.slug, 'company_slug': self.companies[0].slug}))
+
+    def test_company_resume_report_xlsx_queries(self):
+        self.assertNumQueriesConstant(11, reverse('phonecalls:resume_report_xlsx', kwargs={
+            'org_slug': self.organization.slug, 'company_slug': self.companies[0].slug}))
+
+    def test_org_report_xlsx_queries(self):
+        self.assertNumQueriesConstant(7, reverse('phonecalls:org_phonecall_report_xlsx', kwargs={
+            'org_slug': self.organization.slug}))
+
+    def test_org_report_csv_queries(self):
+        self.assertNumQueriesConstant(5, reverse('phonecalls:org_phonecall_report_csv', kwargs={
+            'org_slug': self.organization.slug}))
+
+    def test_org_resume_report_xlsx_queries(self):
+        self.assertNumQueriesConstant(11, reverse('phonecalls:org_phonecall_resume_report_xlsx', kwargs={
+            'org_slug': self.organization.slug}))
+
+    def test_adm_report_csv_queries(self):
+        self.assertNumQueriesConstant(3, reverse('adm_phonecall_report_csv'))
+
+
+class PhonecallListPaginationTestCase(TestCase):
+    """
+        ?page=N continua paginando por OFFSET; a paginação por chave vale com ?cursor=,
+        alcançado pelo link "próxima" da primeira página
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        cls.organization, = create_organizations(1, prefix='paginacao')
+        create_phonecalls(create_companies(cls.organization, 1), 50, date_start=date.today().replace(day=1), days=1)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = reverse('adm_phonecall_list')
+
+    def get(self, query):
+        response = self.client.get(self.url + query)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_page_number(self):
+        response = self.get('?page=2&page_size=10')
+        self.assertFalse(response.context['keyset_pagination'])
+        self.assertEqual(response.context['page_obj'].number, 2)
+        self.assertGreater(response.context['paginator'].count, 20)
+        self.assertContains(response, 'page=3')
+
+    def get_pks(self, page):
+        return [phonecall.pk for phonecall in page]
+
+    def test_cursor_pages(self):
+        """ A primeira página aponta a seguinte por cursor; duas páginas seguidas por cursor """
+        first = self.get('?page_size=10')
+        self.assertFalse(first.context['keyset_pagination'])
+        first_page = first.context['page_obj']
+        self.assertContains(first, f'cursor={first_page.next_cursor}')
+        offset_pks = [self.get_pks(self.get(f'?page_size=10&page={number}').context['page_obj'])
+                      for number in (2, 3)]
+
+        cursor = first_page.next_cursor
+        for pks in offset_pks:
+            response = self.get(f'?page_size=10&cursor={cursor}')
+            self.assertTrue(response.context['keyset_pagination'])
+            page = response.context['page_obj']
+            self.assertEqual(self.get_pks(page), pks)
+            self.assertTrue(page.has_previous())
+            self.assertContains(response, f'cursor={page.previous_cursor}&direction=prev')
+            self.assertContains(response, f'cursor={page.next_cursor}"')
+            cursor = page.next_cursor
+
+        previous = self.get(f'?page_size=10&cursor={page.previous_cursor}&direction=prev').context['page_obj']
+        self.assertEqual(self.get_pks(previous), offset_pks[0])
+
+    def test_first_cursor_page(self):
+        """ ?cursor= vazio é a primeira página, sem sair da paginação por chave """
+        response = self.get('?page_size=10&cursor=')
+        self.assertTrue(response.context['keyset_pagination'])
+        page = response.context['page_obj']
+        self.assertFalse(page.has_previous())
+        self.assertEqual(self.get_pks(page), self.get_pks(self.get('?page_size=10').context['page_obj']))
+
+
+class ReportSnapshotTestCase(TestCase):
+    """
+        Meses fechados: o primeiro download guarda agregados e arquivo, os seguintes
+        não consultam as chamadas; a invalidação faz o relatório ser gerado de novo
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        create_call_pricetable('Valores Base ETICE')
+        cls.organization, = create_organizations(1, prefix='snapshot')
+        cls.companies = create_companies(cls.organization, 2)
+        CatalogueQueryCountTestCase.setup_pricetables(cls.organization, cls.companies)
+        cls.date_lt = date.today().replace(day=1) - timedelta(days=1)
+        cls.date_gt = cls.date_lt.replace(day=1)
+        create_phonecalls(cls.companies, 200, date_start=cls.date_gt, days=cls.date_lt.day)
+        close_month(cls.date_gt)
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.client.force_login(self.user)
+        self.url = self.get_url() + f'?date_gt={self.date_gt:%Y-%m-%d}&date_lt={self.date_lt:%Y-%m-%d}'
+
+    def get_url(self):
+        return reverse('phonecalls:resume_report_xlsx', kwargs={
+            'org_slug': self.organization.slug, 'company_slug': self.companies[0].slug})
+
+    def download(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        phonecall_queries = sum(1 for query in context.captured_queries
+                                if 'FROM "phonecalls_phonecall"' in query['sql'])
+        return content, phonecall_queries
+
+    def invalidate(self, *scopes):
+        paramstyle = 'qmark' if connection.vendor == 'sqlite' else 'format'
+        with connection.cursor() as cursor:
+            return invalidate_snapshots(cursor, scopes, paramstyle)
+
+    def test_closed_month_renders_once(self):
+        content, phonecall_queries = self.download()
+        self.assertGreater(phonecall_queries, 0)
+        snapshot = ReportSnapshot.objects.get(report='company_resume_xlsx')
+        self.assertTrue(snapshot.data)
+        self.assertTrue(snapshot.file)
+        self.assertEqual(snapshot.organization, self.organization)
+        self.assertEqual(snapshot.company, self.companies[0])
+
+        cached_content, phonecall_queries = self.download()
+        self.assertEqual(phonecall_queries, 0)
+        self.assertEqual(cached_content, content)
+
+    def test_invalidate_month(self):
+        self.download()
+        self.assertEqual(invalidate_months([self.date_lt]), 1)
+        self.assertFalse(ReportSnapshot.objects.exists())
+        _, phonecall_queries = self.download()
+        self.assertGreater(phonecall_queries, 0)
+
+    def test_open_month_is_not_cached(self):
+        self.url = self.get_url()
+        self.download()
+        self.assertFalse(ReportSnapshot.objects.exists())
+
+    def test_writer_invalidation(self):
+        """ Lote gravado fora do Django (snapshot_sql): só o escopo da chamada perde o snapshot """
+        self.download()
+        other_organization, = create_organizations(1, prefix='snapshot-outra')
+        self.assertEqual(self.invalidate(
+            snapshot_scope(self.date_lt - timedelta(days=40), self.organization.pk, self.companies[0].pk),
+            snapshot_scope(self.date_lt, other_organization.pk),
+            snapshot_scope(self.date_lt, self.organization.pk, self.companies[1].pk)), 0)
+        _, phonecall_queries = self.download()
+        self.assertEqual(phonecall_queries, 0)
+
+        self.assertEqual(self.invalidate(
+            snapshot_scope(self.date_lt, self.organization.pk, self.companies[0].pk)), 1)
+        _, phonecall_queries = self.download()
+        self.assertGreater(phonecall_queries, 0)
+
+    def test_writer_invalidation_scope(self):
+        """ Snapshots de todas as organizações e da organização inteira caem com qualquer empresa dela """
+        month = ReportMonth.objects.get(month=self.date_gt)
+        other_organization, = create_organizations(1, prefix='snapshot-outra')
+        for report, organization, company in (('master', None, None),
+                                              ('org', self.organization, None),
+                                              ('company', self.organization, self.companies[0]),
+                                              ('other', other_organization, None)):
+            ReportSnapshot.objects.create(month=month, report=report, key=report,
+                                          organization=organization, company=company)
 
-# Create your tests here.
+        self.assertEqual(self.invalidate(
+            snapshot_scope(self.date_lt, self.organization.pk, self.companies[1].pk)), 2)
+        self.assertEqual(set(ReportSnapshot.objects.values_list('report', flat=True)), {'company', 'other'})
+        # classificação sem organização: o mês inteiro
+        self.assertEqual(self.invalidate(snapshot_scope(self.date_lt)), 2)
+        self.assertFalse(ReportSnapshot.objects.exists())
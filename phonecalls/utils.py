@@ -0,0 +1,44 @@
+# python
+import re
+
+from typing import Tuple
+
+DDD_LEN = 2  # DDD brasileiro com 2 dígitos
+COUNTRY_CODE = '55'
+
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+
+def normalize_digits(number):
+    """Remove qualquer caractere não numérico do número informado."""
+    return _NON_DIGIT_RE.sub('', number or '')
+
+
+def split_ddd_local(normalized) -> Tuple[str, str]:
+    """Separa DDD (2 dígitos) e parte local. Ex.: '8531065600' -> ('85','31065600')."""
+    if len(normalized) <= DDD_LEN:
+        return '', normalized
+    return normalized[:DDD_LEN], normalized[DDD_LEN:]
+
+
+def get_ddd(number):
+    """
+        Extrai o DDD de um número cobrado/discado
+        Retorna '' quando o número não contém DDD (ramais e números locais)
+        Ex.:
+            '+5585982345900' -> '85'
+            '08531259999'    -> '85'
+            '0218531259999'  -> '85'  (com código da operadora)
+            '31259999'       -> ''
+    """
+    normalized = normalize_digits(number)
+    if len(normalized) > 11 and normalized.startswith(COUNTRY_CODE):
+        normalized = normalized[len(COUNTRY_CODE):]
+    normalized = normalized.lstrip('0')
+    if len(normalized) in (12, 13):
+        # 0 + código da operadora (CSP) + DDD + número
+        normalized = normalized[2:]
+    if len(normalized) not in (10, 11):
+        return ''
+    ddd, _local = split_ddd_local(normalized)
+    return ddd
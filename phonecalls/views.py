@@ -1,5 +1,6 @@
 # python
 import csv
+import shutil
 import urllib
 
 from copy import copy
@@ -7,12 +8,15 @@ from datetime import date
 from datetime import datetime, timedelta
 from decimal import Decimal
 from dateutil.relativedelta import relativedelta
+from itertools import groupby
+from operator import itemgetter
 from zipfile import ZipFile
 from io import BytesIO
 # django
 from django.conf import settings
 from django.db.models import Count, Sum
 from django.db.models import F, FloatField, ExpressionWrapper, Q
+from django.http import FileResponse
 from django.http import Http404
 from django.http import HttpResponse
 from django.http import StreamingHttpResponse
@@ -56,18 +60,24 @@ from charges.constants import MO_SUPERVISOR
 from charges.constants import SOFTWARE_ACCESS_SERVICE
 from charges.constants import SOFTWARE_EXTENSION_SERVICE
 from charges.constants import WIRELESS_ACCESS_SERVICE
+from core.catalogue import CatalogueMixin
+from core.instrumentation import InstrumentedViewMixin
 from core.reports.pdf.admin import SystemReportAdministrador
 from core.reports.pdf.company import SystemReport
 from core.reports.pdf.organization import SystemReportOrganization
 from core.reports.xlsx.xlsx_company_report import XLSXCompanyReport
 from core.reports.xlsx.xlsx_org_report import XLSXOrgReport
+from core.pagination import PAGINATION_PARAMS
+from core.pagination import KeysetPaginationMixin
 from core.utils import Echo
 from core.utils import get_amount_ust
 from core.utils import get_range_date
 from core.utils import get_values_proportionality
 from core.utils import time_format
 from core.views import SuperuserRequiredMixin
-from Equipments.models import Equipment
+from Equipments.billing import get_full_month_charges
+from Equipments.billing import get_prorated_charges
+from Equipments.billing import group_charges
 
 # local
 from .constants import CALLTYPE_CHOICES, REPORT_CALLTYPE_MAP
@@ -77,6 +87,7 @@ from .constants import SERVICE_CHOICES
 from .constants import VC1, VC2, VC3, LOCAL, LDN, LDI
 from .filters import PhonecallFilter
 from .models import Phonecall
+from .snapshots import ReportSnapshotMixin
 from .constants import OLD_CONTRACT,  NEW_CONTRACT
 
 from phonecalls.models import Price, PriceTable
@@ -134,12 +145,10 @@ class BaseContextData():
         for phonecall in phonecall_data:
             #AGAIN THIS NEEDS TO BE SET RIGHT
             if(phonecall['company__organization_id']==2 and phonecall['calltype'] in (VC2, VC3)):
-                price = Price.objects.all().filter(table_id=phonecall['company__call_pricetable'],
-                                                   calltype=VC1).active().values('value')
+                price = self.catalogue.first_active_price(phonecall['company__call_pricetable'], calltype=VC1)
             else:
-                price = Price.objects.all().filter(table_id=phonecall['company__call_pricetable'],
-                                               calltype=phonecall['calltype']).active().values('value')
-            phonecall['price'] = price.first()['value']
+                price = self.catalogue.first_active_price(phonecall['company__call_pricetable'], calltype=phonecall['calltype'])
+            phonecall['price'] = price.value
             if (phonecall['company__organization_id']==2 or phonecall['company__is_new_contract']) and phonecall['calltype'] in (VC2, VC3):
                 total_mobile_count += phonecall['count']
                 total_mobile_billedtime_sum += phonecall['billedtime_sum']
@@ -164,10 +173,8 @@ class BaseContextData():
 #            date_gt=self.date_gt,
 #            proportionality=context['proportionality'])
 
-        service_pricetable = self.company.service_pricetable
-        service_price_list = {}
-        if service_pricetable:
-            service_price_list = service_pricetable.price_set.active()
+        service_pricetable = self.catalogue.get_pricetable(self.company.service_pricetable_id)
+        service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
         service_basic_amount = 0
         service_basic_cost = 0
@@ -213,14 +220,16 @@ class BaseContextData():
                     'count', 'billedtime_sum', 'cost_sum') \
             .order_by('company__name', '-calltype')
         result_companies = {}
-        company_list = Company.objects.filter(organization=self.organization).active()
-        companies_phonedata = phonecall_data.values_list('company__name', flat=True)
+        company_list = self.catalogue.get_companies(self.organization, active=True)
+        # uma única consulta de chamadas; get_Company_Context altera os dicts, por isso as cópias
+        phonecall_rows = list(phonecall_data)
         for company in company_list:
         #for company__name in phonecall_data:
             #if company.name in companies_phonedata:
             #if company.active():
                 self.company = company
-                sub_phonecall_data = self.get_Company_Context(phonecall_data.filter(company__name=company.name))
+                sub_phonecall_data = self.get_Company_Context(
+                    [dict(row) for row in phonecall_rows if row['company__name'] == company.name])
                 sub_phonecall_data.update({'contract_version': company.is_new_contract})
                 result_companies.update({company.name:sub_phonecall_data})
 
@@ -288,18 +297,12 @@ class BaseContextData():
         service_data.setdefault(CALL_LOCAL, copy(TOTAL_DICT))
         service_data.setdefault(CALL_NATIONAL, copy(TOTAL_DICT))
         service_data.setdefault(CALL_INTERNATIONAL, copy(TOTAL_DICT))
-        service_data[VC1]['price'] = Price.objects.all().filter(table_id=PriceTable.objects.get(name = "Valores Base ETICE").id,
-                                           calltype=VC1).active().values('value').first()['value']
-        service_data[LOCAL]['price'] = \
-        Price.objects.all().filter(table_id=PriceTable.objects.get(name="Valores Base ETICE").id,
-                                   calltype=LOCAL).active().values('value').first()['value']
-        service_data[LDN]['price'] = \
-        Price.objects.all().filter(table_id=PriceTable.objects.get(name="Valores Base ETICE").id,
-                                   calltype=LDN).active().values('value').first()['value']
-        service_data[LDI]['price'] = \
-            Price.objects.all().filter(table_id=PriceTable.objects.get(name="Valores Base ETICE").id,
-                                       calltype=LDI).active().values('value').first()['value']
-        for phonecall in phonecall_data:
+        base_pricetable = self.catalogue.get_pricetable(name="Valores Base ETICE")
+        service_data[VC1]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=VC1).value
+        service_data[LOCAL]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=LOCAL).value
+        service_data[LDN]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=LDN).value
+        service_data[LDI]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=LDI).value
+        for phonecall in phonecall_rows:
             company_name = phonecall['company__name']
             if (company_name in new_contract_list):
                 for company_info in new_contract_mobile:
@@ -310,9 +313,8 @@ class BaseContextData():
                     elif company_info['company__name'] == company_name and phonecall['calltype'] in (VC2, VC3):
                         phonecall['count'] = 0
                         phonecall['billedtime_sum'] = 0
-            price = Price.objects.all().filter(table_id=phonecall['company__call_pricetable'],
-                                               calltype=phonecall['calltype']).active().values('value')
-            phonecall['price'] = price.first()['value']
+            price = self.catalogue.first_active_price(phonecall['company__call_pricetable'], calltype=phonecall['calltype'])
+            phonecall['price'] = price.value
             phonecall['cost_sum'] = phonecall['billedtime_sum'] * phonecall['price'] / 60
             phonecall_map.setdefault(company_name, copy(TOTAL_DICT))
             phonecall_map[company_name][phonecall['calltype']] = phonecall
@@ -370,12 +372,10 @@ class BaseContextData():
             service_data['cost_sum'] += float(phonecall['cost_sum'])
             service_data['billedtime_sum'] += phonecall['billedtime_sum']
 
-        company_list = self.organization.company_set.all()
+        company_list = self.catalogue.get_companies(self.organization)
         for company in company_list:
-            service_pricetable = company.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            service_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
             phonecall_map.setdefault(company.name, copy(TOTAL_DICT))
             phonecall_map[company.name].update({'contract_version': company.is_new_contract})
             service_basic_amount = 0
@@ -422,8 +422,10 @@ class BaseContextData():
 
         return org_context
 
-class BaseCompanyPhonecallView(CompanyMixin,
+class BaseCompanyPhonecallView(InstrumentedViewMixin,
+                               CompanyMixin,
                                CompanyContextMixin,
+                               CatalogueMixin,
                                BaseFilterView,
                                ListView):  # COMPANY
     """
@@ -451,9 +453,11 @@ class BaseCompanyPhonecallView(CompanyMixin,
         return queryset
 
 
-class BaseOrgPhonecallView(OrganizationMixin,
+class BaseOrgPhonecallView(InstrumentedViewMixin,
+                           OrganizationMixin,
                            AdminRequiredMixin,
                            OrganizationContextMixin,
+                           CatalogueMixin,
                            BaseFilterView,
                            ListView):  # ORG
     """
@@ -480,7 +484,9 @@ class BaseOrgPhonecallView(OrganizationMixin,
         return queryset
 
 
-class BaseAdmPhonecallView(SuperuserRequiredMixin,
+class BaseAdmPhonecallView(InstrumentedViewMixin,
+                           SuperuserRequiredMixin,
+                           CatalogueMixin,
                            BaseFilterView,
                            ListView):  # SUPERUSER
     """
@@ -494,7 +500,8 @@ class BaseAdmPhonecallView(SuperuserRequiredMixin,
 
 # In this (admin case) the fixing of the date from the get to here is happening here
     def dispatch(self, request, *args, **kwargs):
-        self.params = {key: value for key, value in self.request.GET.items() if key != 'page' and value}
+        self.params = {key: value for key, value in self.request.GET.items()
+                       if key not in PAGINATION_PARAMS and value}
         self.date_gt, self.date_lt = get_range_date(self.request.GET)
         if self.date_gt is None or self.date_lt is None:
             self.date_lt = date.today()
@@ -529,7 +536,7 @@ class BaseAdmPhonecallView(SuperuserRequiredMixin,
         return super().get_context_data(**kwargs)
 
 
-class CompanyPhonecallListView(BaseCompanyPhonecallView):  # COMPANY
+class CompanyPhonecallListView(KeysetPaginationMixin, BaseCompanyPhonecallView):  # COMPANY
     """
     Lista de chamadas da empresa (cliente)
     Permissão: Membro da empresa
@@ -730,45 +737,30 @@ class CompanyPhonecallPDFReportView(BaseCompanyPhonecallView):  # COMPANY
             self.object_list = self.filterset.qs
         else:
             self.object_list = self.filterset.queryset.none()
-        context = self.get_context_data(filter=self.filterset, object_list=self.object_list)
 
         filename = self.get_filename()
-        response = HttpResponse(content_type='application/pdf')
-        response['Content-Disposition'] = f'attachement; filename={filename}.pdf'
         report = SystemReport(
             dateBegin=self.date_gt.strftime('%d/%m/%Y'),
             dateEnd=self.date_lt.strftime('%d/%m/%Y'),
             reportTitle='Relatório de Ligações por Ramal',
             company=self.company,
             formatPage=2)
-        pdf = report.make_phonecall_table(context)
-        response.write(pdf)
-        return response
+        # chamadas lidas em fluxo e PDF gerado em tabelas fatiadas (memória limitada)
+        pdf = report.make_phonecall_table_chunked(self.get_phonecall_rows(self.object_list))
+        return FileResponse(pdf, as_attachment=True, filename=f'{filename}.pdf', content_type='application/pdf')
 
-    def get_context_data(self, object_list=None, **kwargs):
+    def get_phonecall_rows(self, object_list):
+        """ Chamadas na ordem da view (ramal, data/hora decrescente), com o valor pela tabela de preços """
         phonecall_values = object_list \
             .filter(calltype__in=[LOCAL, VC1, VC2, VC3, LDN, LDI]) \
             .values('startdate', 'starttime', 'stopdate', 'stoptime', 'extension__extension',
                     'chargednumber', 'dialednumber', 'calltype', 'duration', 'billedtime', 'billedamount')
 
-        phonecall_data = {}
-        for phonecall in phonecall_values:
-            extension = phonecall['extension__extension']
-            price = Price.objects.get(Q(status=1) & \
-                                      Q(table=self.company.call_pricetable) & \
-                                      Q(calltype=phonecall['calltype']))
+        for phonecall in phonecall_values.iterator(chunk_size=2000):
+            price = self.catalogue.get_active_price(self.company.call_pricetable_id,
+                                                    calltype=phonecall['calltype'])
             phonecall['billedamount'] = phonecall['billedtime'] * price.value / 60
-            phonecall_data.setdefault(extension, {
-                'phonecall_list': [],
-                'count': 0,
-                'billedtime_sum': 0,
-                'cost_sum': 0.0})
-            phonecall_data[extension]['phonecall_list'].append(phonecall)
-            phonecall_data[extension]['count'] += 1
-            phonecall_data[extension]['billedtime_sum'] += phonecall['duration']
-            phonecall_data[extension]['cost_sum'] += float(phonecall['billedamount'])
-        kwargs['phonecall_data'] = phonecall_data
-        return super().get_context_data(**kwargs)
+            yield phonecall
 
 
 class CompanyPhonecallResumeReportRedirectView(RedirectView):  # COMPANY
@@ -791,7 +783,7 @@ class CompanyPhonecallResumeReportRedirectView(RedirectView):  # COMPANY
         return super().get(request, *args, **kwargs)
 
 
-class CompanyPhonecallResumeXLSXReportView(BaseCompanyPhonecallView):  # COMPANY
+class CompanyPhonecallResumeXLSXReportView(ReportSnapshotMixin, BaseCompanyPhonecallView):  # COMPANY
     """
     Exportar em XLSX relatório resumido das chamadas da empresa (cliente)
     Permissão: Membro da empresa
@@ -802,6 +794,11 @@ class CompanyPhonecallResumeXLSXReportView(BaseCompanyPhonecallView):  # COMPANY
     http_method_names = ['get']
     model = Phonecall
     ordering = ['-startdate', '-starttime']
+    snapshot_report = 'company_resume_xlsx'
+    snapshot_context = ('basic_service', 'communication_service')
+
+    def get_snapshot_scope(self):
+        return self.company.organization_id, self.company.pk
 
     def get(self, request, *args, **kwargs):
         filterset_class = self.get_filterset_class()
@@ -810,6 +807,9 @@ class CompanyPhonecallResumeXLSXReportView(BaseCompanyPhonecallView):  # COMPANY
             self.object_list = self.filterset.qs
         else:
             self.object_list = self.filterset.queryset.none()
+        response = self.get_snapshot_response()
+        if response is not None:
+            return response
         context = self.get_context_data(filter=self.filterset, object_list=self.object_list)
 
         report = XLSXCompanyReport(
@@ -820,14 +820,19 @@ class CompanyPhonecallResumeXLSXReportView(BaseCompanyPhonecallView):  # COMPANY
         report.build_resume_report(context)
 
         filename = self.get_filename(resume=True)
-        response = HttpResponse(
-            report.get_file(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        content = report.get_file().getvalue()
+        self.save_snapshot_file(content, f'{filename}.xlsx', content_type)
+        response = HttpResponse(content, content_type=content_type)
         response['Content-Disposition'] = f'attachement; filename={filename}.xlsx'
         return response
 
     def get_context_data(self, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
+        snapshot_data = self.get_snapshot_data()
+        if snapshot_data is not None:
+            context.update(snapshot_data)
+            return context
         phonecall_data = object_list \
             .filter(inbound=False,
                     calltype__in=[LOCAL, VC1, VC2, VC3, LDN, LDI]) \
@@ -844,10 +849,8 @@ class CompanyPhonecallResumeXLSXReportView(BaseCompanyPhonecallView):  # COMPANY
             proportionality=context['proportionality'])
 
         # basic service
-        service_pricetable = self.company.service_pricetable
-        service_price_list = {}
-        if service_pricetable:
-            service_price_list = service_pricetable.price_set.active()
+        service_pricetable = self.catalogue.get_pricetable(self.company.service_pricetable_id)
+        service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
         bs_data = {}
         for service in service_price_list:
@@ -867,6 +870,7 @@ class CompanyPhonecallResumeXLSXReportView(BaseCompanyPhonecallView):  # COMPANY
         context.update({
             'basic_service': bs_data,
             'communication_service': cs_data})
+        self.save_snapshot_data(context)
         return context
 
 
@@ -926,9 +930,8 @@ class CompanyPhonecallResumePDFReportView(BaseCompanyPhonecallView):  # COMPANY
         contract_version = OLD_CONTRACT
         teste = list(phonecall_data)
         for phonecall in phonecall_data:
-            price = Price.objects.all().filter(table_id=phonecall['company__call_pricetable'],
-                                               calltype=phonecall['calltype']).active().values('value')
-            phonecall['price'] = price.first()['value']
+            price = self.catalogue.first_active_price(phonecall['company__call_pricetable'], calltype=phonecall['calltype'])
+            phonecall['price'] = price.value
             contract_version = phonecall['company__is_new_contract']
             if phonecall['company__is_new_contract'] and phonecall['calltype'] in (VC2,VC3):
                 total_mobile_count += phonecall['count']
@@ -954,10 +957,8 @@ class CompanyPhonecallResumePDFReportView(BaseCompanyPhonecallView):  # COMPANY
             date_gt=self.date_gt,
             proportionality=context['proportionality'])
 
-        service_pricetable = self.company.service_pricetable
-        service_price_list = {}
-        if service_pricetable:
-            service_price_list = service_pricetable.price_set.active()
+        service_pricetable = self.catalogue.get_pricetable(self.company.service_pricetable_id)
+        service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
         service_basic_amount = 0
         service_basic_cost = 0
@@ -989,7 +990,7 @@ class CompanyPhonecallResumePDFReportView(BaseCompanyPhonecallView):  # COMPANY
         return context
 
 
-class OrgPhonecallListView(BaseOrgPhonecallView):  # ORG
+class OrgPhonecallListView(KeysetPaginationMixin, BaseOrgPhonecallView):  # ORG
     """
     Lista de chamadas da organização
     Permissão: Administrador da organização
@@ -1105,17 +1106,11 @@ class OrgPhonecallResumeView(BaseOrgPhonecallView):  # ORG
         service_data.setdefault(CALL_LOCAL, copy(TOTAL_DICT))
         service_data.setdefault(CALL_NATIONAL, copy(TOTAL_DICT))
         service_data.setdefault(CALL_INTERNATIONAL, copy(TOTAL_DICT))
-        service_data[VC1]['price'] = Price.objects.all().filter(table_id=PriceTable.objects.get(name = "Valores Base ETICE").id,
-                                           calltype=VC1).active().values('value').first()['value']
-        service_data[LOCAL]['price'] = \
-        Price.objects.all().filter(table_id=PriceTable.objects.get(name="Valores Base ETICE").id,
-                                   calltype=LOCAL).active().values('value').first()['value']
-        service_data[LDN]['price'] = \
-        Price.objects.all().filter(table_id=PriceTable.objects.get(name="Valores Base ETICE").id,
-                                   calltype=LDN).active().values('value').first()['value']
-        service_data[LDI]['price'] = \
-            Price.objects.all().filter(table_id=PriceTable.objects.get(name="Valores Base ETICE").id,
-                                       calltype=LDI).active().values('value').first()['value']
+        base_pricetable = self.catalogue.get_pricetable(name="Valores Base ETICE")
+        service_data[VC1]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=VC1).value
+        service_data[LOCAL]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=LOCAL).value
+        service_data[LDN]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=LDN).value
+        service_data[LDI]['price'] = self.catalogue.first_active_price(base_pricetable, calltype=LDI).value
         for phonecall in phonecall_data:
             company_name = phonecall['company__name']
             if (company_name in new_contract_list):
@@ -1129,12 +1124,10 @@ class OrgPhonecallResumeView(BaseOrgPhonecallView):  # ORG
                         phonecall['billedtime_sum'] = 0
             # AGAIN THIS NEEDS TO BE SET RIGHT
             if (phonecall['company__organization_id'] == 2 and phonecall['calltype'] in (VC2, VC3)):
-                price = Price.objects.all().filter(table_id=phonecall['company__call_pricetable'],
-                                                               calltype=VC1).active().values('value')
+                price = self.catalogue.first_active_price(phonecall['company__call_pricetable'], calltype=VC1)
             else:
-                price = Price.objects.all().filter(table_id=phonecall['company__call_pricetable'],
-                                                               calltype=phonecall['calltype']).active().values('value')
-            phonecall['price'] = price.first()['value']
+                price = self.catalogue.first_active_price(phonecall['company__call_pricetable'], calltype=phonecall['calltype'])
+            phonecall['price'] = price.value
             phonecall['cost_sum'] = phonecall['billedtime_sum'] * phonecall['price'] / 60
             phonecall_map.setdefault(company_name, copy(TOTAL_DICT))
             phonecall_map[company_name][phonecall['calltype']] = phonecall
@@ -1192,12 +1185,10 @@ class OrgPhonecallResumeView(BaseOrgPhonecallView):  # ORG
             service_data['cost_sum'] += float(phonecall['cost_sum'])
             service_data['billedtime_sum'] += phonecall['billedtime_sum']
 
-        company_list = self.organization.company_set.all()
+        company_list = self.catalogue.get_companies(self.organization)
         for company in company_list:
-            service_pricetable = company.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            service_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
             phonecall_map.setdefault(company.name, copy(TOTAL_DICT))
             phonecall_map[company.name].update({'contract_version': company.is_new_contract})
             service_basic_amount = 0
@@ -1284,10 +1275,8 @@ class OrgPhonecallUSTView(BaseOrgPhonecallView):  # ORG
             proportionality=context['proportionality'])
 
         # basic service
-        service_pricetable = self.organization.settings.service_pricetable
-        service_price_list = {}
-        if service_pricetable:
-            service_price_list = service_pricetable.price_set.active()
+        service_pricetable = self.catalogue.get_service_pricetable(self.organization)
+        service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
         bs_data = {}
         bs_amount = 0
@@ -1718,10 +1707,8 @@ class OrgPhonecallResumeXLSXReportView(BaseOrgPhonecallView):  # ORG
 
             data.setdefault(company_name, copy(TOTAL_DICT))
 
-            service_pricetable = company.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            service_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             for service in service_price_list:
                 data[company_name].setdefault(BASIC_SERVICE, {})
@@ -1744,7 +1731,7 @@ class OrgPhonecallResumeXLSXReportView(BaseOrgPhonecallView):  # ORG
         return super().get_context_data(**kwargs)
 
 
-class OrgPhonecallResumePDFReportView(BaseOrgPhonecallView):  # ORG
+class OrgPhonecallResumePDFReportView(ReportSnapshotMixin, BaseOrgPhonecallView):  # ORG
     """
     Exportar em PDF relatório resumido das chamadas da organização
     Permissão: Administrador da organização
@@ -1755,6 +1742,10 @@ class OrgPhonecallResumePDFReportView(BaseOrgPhonecallView):  # ORG
     http_method_names = ['get']
     model = Phonecall
     ordering = ['-startdate', '-starttime']
+    snapshot_report = 'org_resume_pdf'
+
+    def get_snapshot_scope(self):
+        return self.organization.pk, None
 
     def get(self, request, *args, **kwargs):
         filterset_class = self.get_filterset_class()
@@ -1763,6 +1754,9 @@ class OrgPhonecallResumePDFReportView(BaseOrgPhonecallView):  # ORG
             self.object_list = self.filterset.qs
         else:
             self.object_list = self.filterset.queryset.none()
+        response = self.get_snapshot_response()
+        if response is not None:
+            return response
         context = self.get_context_data(filter=self.filterset, object_list=self.object_list)
 
         filename = self.get_filename(resume=True)
@@ -1774,10 +1768,15 @@ class OrgPhonecallResumePDFReportView(BaseOrgPhonecallView):  # ORG
             reportTitle='Resumo Geral dos Serviços',
             context=context)
         pdf = report.create_table_resume_services(context['phonecall_map'])
+        self.save_snapshot_file(pdf, f'{filename}.pdf', 'application/pdf')
         response.write(pdf)
         return response
 
     def get_context_data(self, **kwargs):
+        snapshot_data = self.get_snapshot_data()
+        if snapshot_data is not None:
+            kwargs.update(snapshot_data)
+            return super().get_context_data(**kwargs)
         context = super().get_context_data(**kwargs)
         phonecall_data = self.object_list \
             .filter(company__isnull=False,
@@ -1881,12 +1880,10 @@ class OrgPhonecallResumePDFReportView(BaseOrgPhonecallView):  # ORG
             service_data['cost_sum'] += float(phonecall['cost_sum'])
             service_data['billedtime_sum'] += phonecall['billedtime_sum']
 
-        company_list = self.organization.company_set.all()
+        company_list = self.catalogue.get_companies(self.organization)
         for company in company_list:
-            service_pricetable = company.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            service_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             phonecall_map.setdefault(company.name, copy(TOTAL_DICT))
             phonecall_map[company.name]['desc'] = company.description
@@ -1927,6 +1924,7 @@ class OrgPhonecallResumePDFReportView(BaseOrgPhonecallView):  # ORG
         phonecall_map['ORGANIZATION'] = self.organization.name
         phonecall_map['ORGANIZATION_id'] = self.organization.id
         kwargs['phonecall_map'] = phonecall_map
+        self.save_snapshot_data(kwargs)
         return super().get_context_data(**kwargs)
 
 
@@ -2007,10 +2005,8 @@ class OrgPhonecallUSTResumeXLSXReportView(BaseOrgPhonecallView):  # ORG
             proportionality=context['proportionality'])
 
         # basic service
-        service_pricetable = self.organization.settings.service_pricetable
-        service_price_list = {}
-        if service_pricetable:
-            service_price_list = service_pricetable.price_set.active()
+        service_pricetable = self.catalogue.get_service_pricetable(self.organization)
+        service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
         bs_data = {}
         for service in service_price_list:
@@ -2034,7 +2030,7 @@ class OrgPhonecallUSTResumeXLSXReportView(BaseOrgPhonecallView):  # ORG
         return context
 
 
-class OrgPhonecallUSTResumePDFReportView(BaseOrgPhonecallView):  # ORG
+class OrgPhonecallUSTResumePDFReportView(ReportSnapshotMixin, BaseOrgPhonecallView):  # ORG
     """
     Exportar em PDF relatório resumido das chamadas da organização
     Permissão: Administrador da organização
@@ -2045,6 +2041,10 @@ class OrgPhonecallUSTResumePDFReportView(BaseOrgPhonecallView):  # ORG
     http_method_names = ['get']
     model = Phonecall
     ordering = ['-startdate', '-starttime']
+    snapshot_report = 'org_ust_resume_pdf'
+
+    def get_snapshot_scope(self):
+        return self.organization.pk, None
 
     def get(self, request, *args, **kwargs):
         filterset_class = self.get_filterset_class()
@@ -2053,6 +2053,9 @@ class OrgPhonecallUSTResumePDFReportView(BaseOrgPhonecallView):  # ORG
             self.object_list = self.filterset.qs
         else:
             self.object_list = self.filterset.queryset.none()
+        response = self.get_snapshot_response()
+        if response is not None:
+            return response
         context = self.get_context_data(filter=self.filterset, object_list=self.object_list)
         filename = self.get_filename(resume=True)
 
@@ -2065,11 +2068,16 @@ class OrgPhonecallUSTResumePDFReportView(BaseOrgPhonecallView):  # ORG
             context=context,
             ust=True)
         pdf = report.create_table_ust_services(context['phonecall_map'])
+        self.save_snapshot_file(pdf, f'{filename}.pdf', 'application/pdf')
         response.write(pdf)
         return response
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        snapshot_data = self.get_snapshot_data()
+        if snapshot_data is not None:
+            context.update(snapshot_data)
+            return context
         phonecall_data = self.object_list \
             .filter(company__isnull=False,
                     inbound=False,
@@ -2113,11 +2121,9 @@ class OrgPhonecallUSTResumePDFReportView(BaseOrgPhonecallView):  # ORG
             # company
             phonecall_map[org_name]['companies'].setdefault(company_name, copy(TOTAL_DICT))
 
-            organization = Organization.objects.get(name=org_name)
-            service_pricetable = organization.settings.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            organization = self.catalogue.get_organization(name=org_name)
+            service_pricetable = self.catalogue.get_service_pricetable(organization)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             service_basic_price = 0
             service_basic_amount = 0
@@ -2290,10 +2296,11 @@ class OrgPhonecallUSTResumePDFReportView(BaseOrgPhonecallView):  # ORG
             service_data['billedtime_sum'] += phonecall['billedtime_sum']
         phonecall_map[SERVICE] = service_data
         context['phonecall_map'] = phonecall_map
+        self.save_snapshot_data(context)
         return context
 
 
-class AdmPhonecallListView(BaseAdmPhonecallView):  # SUPERUSER
+class AdmPhonecallListView(KeysetPaginationMixin, BaseAdmPhonecallView):  # SUPERUSER
     """
     Lista de chamadas
     Permissão: Super usuário
@@ -2318,7 +2325,7 @@ class AdmPhonecallListView(BaseAdmPhonecallView):  # SUPERUSER
 
     def get_org_choices(self):
         org_choices = []
-        for org in Organization.objects.all():
+        for org in self.catalogue.get_organizations():
             org_choices.append((org.slug, org.name))
         return org_choices
 
@@ -2410,11 +2417,9 @@ class AdmPhonecallResumeView(BaseAdmPhonecallView):  # SUPERUSER
             # company
             phonecall_map[org_name]['companies'].setdefault(company_name, copy(TOTAL_DICT))
 
-            organization = Organization.objects.get(name=org_name)
-            service_pricetable = organization.settings.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            organization = self.catalogue.get_organization(name=org_name)
+            service_pricetable = self.catalogue.get_service_pricetable(organization)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             service_basic_amount = 0
             service_basic_cost = 0
@@ -2438,12 +2443,10 @@ class AdmPhonecallResumeView(BaseAdmPhonecallView):  # SUPERUSER
                     }
                 })
 
-            call_pricetable = organization.settings.call_pricetable
-            call_price_list = {}
-            if call_pricetable:
-                call_price_list = call_pricetable.price_set.active()
+            call_pricetable = self.catalogue.get_call_pricetable(organization)
+            call_price_list = self.catalogue.get_active_prices(call_pricetable)
                 # TO DO: Take everything out of the loop and do a for organization o something
-            phonecall['org_price'] = call_price_list.filter(calltype=phonecall['calltype']).values('value').first()['value']
+            phonecall['org_price'] = self.catalogue.first_active_price(call_pricetable, calltype=phonecall['calltype']).value
             phonecall_map[org_name].setdefault(phonecall['calltype'], {
                 'organization_name': org_name,
                 'company_name': company_name,
@@ -2634,11 +2637,9 @@ class AdmPhonecallUSTView(BaseAdmPhonecallView):  # SUPERUSER
             # company
             phonecall_map[org_name]['companies'].setdefault(company_name, copy(TOTAL_DICT))
 
-            organization = Organization.objects.get(name=org_name)
-            service_pricetable = organization.settings.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            organization = self.catalogue.get_organization(name=org_name)
+            service_pricetable = self.catalogue.get_service_pricetable(organization)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             service_basic_price = 0
             service_basic_amount = 0
@@ -2979,7 +2980,7 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
             date_gt=self.date_gt,
             proportionality=context['proportionality'])
 
-        org_list = Organization.objects.all()
+        org_list = self.catalogue.get_organizations()
         for org in org_list:
             phonecall_map.setdefault(org.name, copy(TOTAL_DICT))
             phonecall_map[org.name].setdefault('companies', {})
@@ -2999,23 +3000,21 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
                 .setdefault(company_name, copy(TOTAL_DICT))
             # service_data.setdefault(org_name, copy(TOTAL_DICT))
 
-            organization = Organization.objects.get(name=org_name)
-            service_pricetable = organization.settings.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            organization = self.catalogue.get_organization(name=org_name)
+            service_pricetable = self.catalogue.get_service_pricetable(organization)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             if company_name is not None:
                 try:
-                    company = Company.objects.get(name=company_name)
+                    company = self.catalogue.get_company(name=company_name)
                 except Exception as e:
                     # Catch any exception and print its details
                     print(f"An unexpected error occurred: {e}")
-                company_pricetable = company.service_pricetable
+                company_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
                 company_price_list = {}
                 phonecall_map[org_name]['companies'][company_name].setdefault('services', {})
                 if company_pricetable:
-                    company_price_list = company_pricetable.price_set.active()
+                    company_price_list = self.catalogue.get_active_prices(company_pricetable)
 # Not the value comes from the service_price_list
 
                 for company_service in company_price_list:
@@ -3028,7 +3027,7 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
                         elif company_service.basic_service == WIRELESS_ACCESS_SERVICE:
                             continue
                     #TODO: Deal with multiple values and doesnotexist
-                    service_cost = service_pricetable.price_set.active().get(basic_service=company_service.basic_service).value
+                    service_cost = self.catalogue.get_active_price(service_pricetable, basic_service=company_service.basic_service).value
                     cost = ((company_service.basic_service_amount * service_cost) / divider) * multiplier
                     #phonecall_map[org_name]['services'].setdefault(company_name, {})
                     phonecall_map[org_name]['companies'][company_name]['services'].update({
@@ -3060,12 +3059,10 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
                     }
                 })
 
-            call_pricetable = organization.settings.call_pricetable
-            call_price_list = {}
-            if call_pricetable:
-                call_price_list = call_pricetable.price_set.active()
+            call_pricetable = self.catalogue.get_call_pricetable(organization)
+            call_price_list = self.catalogue.get_active_prices(call_pricetable)
                 # TODO: Take everything out of the loop and do a for organization o something
-            phonecall['org_price'] = call_price_list.filter(calltype=phonecall['calltype']).values('value').first()['value']
+            phonecall['org_price'] = self.catalogue.first_active_price(call_pricetable, calltype=phonecall['calltype']).value
 
             phonecall_map[org_name].setdefault(phonecall['calltype'], {
                 'organization_name': org_name,
@@ -3186,15 +3183,13 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
             service_data['billedtime_sum'] += phonecall['billedtime_sum']
         Typesofcall = {VC1, VC2, VC3, LOCAL, LDN, LDI }
         for org_name in phonecall_map:
-            organization = Organization.objects.get(name=org_name)
-            call_pricetable = organization.settings.call_pricetable
-            call_price_list = {}
-            if call_pricetable:
-                call_price_list = call_pricetable.price_set.active()
+            organization = self.catalogue.get_organization(name=org_name)
+            call_pricetable = self.catalogue.get_call_pricetable(organization)
+            call_price_list = self.catalogue.get_active_prices(call_pricetable)
 
             for calltype in Typesofcall:
                 if calltype not in phonecall_map[org_name]:
-                    org_price = call_price_list.filter(calltype=calltype).values('value').first()['value']
+                    org_price = self.catalogue.first_active_price(call_pricetable, calltype=calltype).value
                     phonecall_map[org_name].setdefault(calltype, {
                         'organization_name': org_name,
                         'company_name': org_name,
@@ -3211,7 +3206,7 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
             for company_name in phonecall_map[org_name]['companies']:
                 for calltype in Typesofcall:
                     if calltype not in phonecall_map[org_name]['companies'][company_name]:
-                        org_price = call_price_list.filter(calltype=calltype).values('value').first()['value']
+                        org_price = self.catalogue.first_active_price(call_pricetable, calltype=calltype).value
                         phonecall_map[org_name]['companies'][company_name].setdefault(calltype, {
                             'organization_name': org_name,
                             'company_name': company_name,
@@ -3232,20 +3227,20 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
 
 
 #There was a problem that any company that did not generate a call would not be included
-        company_list = Company.objects.all()
+        company_list = self.catalogue.get_companies()
         for company in company_list:
             if company.status != 1:
                 continue
-            company_pricetable = company.service_pricetable
+            company_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
             company_price_list = {}
             orga = company.organization
             organizName = orga.name
-            service_pricetable = orga.settings.service_pricetable
+            service_pricetable = self.catalogue.get_service_pricetable(orga)
             phonecall_map[organizName]['companies'] \
                 .setdefault(company.name, copy(TOTAL_DICT))
             phonecall_map[organizName]['companies'][company.name].setdefault('services', {})
             if company_pricetable:
-                company_price_list = company_pricetable.price_set.active()
+                company_price_list = self.catalogue.get_active_prices(company_pricetable)
             # Not the value comes from the service_price_list
 
             for company_service in company_price_list:
@@ -3258,7 +3253,7 @@ class AdmPhonecallResumePDFReportView(BaseAdmPhonecallView):  # SUPERUSER
                     elif company_service.basic_service == WIRELESS_ACCESS_SERVICE:
                         continue
                 # TODO: Deal with multiple values and doesnotexist
-                service_cost = service_pricetable.price_set.active().get(basic_service=company_service.basic_service).value
+                service_cost = self.catalogue.get_active_price(service_pricetable, basic_service=company_service.basic_service).value
                 cost = ((company_service.basic_service_amount * service_cost) / divider) * multiplier
                 # phonecall_map[org_name]['services'].setdefault(company_name, {})
                 phonecall_map[organizName]['companies'][company.name]['services'].update({
@@ -3358,11 +3353,9 @@ class AdmPhonecallUSTPDFReportView(BaseAdmPhonecallView):  # SUPERUSER
             # company
             phonecall_map[org_name]['companies'].setdefault(company_name, copy(TOTAL_DICT))
 
-            organization = Organization.objects.get(name=org_name)
-            service_pricetable = organization.settings.service_pricetable
-            service_price_list = {}
-            if service_pricetable:
-                service_price_list = service_pricetable.price_set.active()
+            organization = self.catalogue.get_organization(name=org_name)
+            service_pricetable = self.catalogue.get_service_pricetable(organization)
+            service_price_list = self.catalogue.get_active_prices(service_pricetable)
 
             service_basic_price = 0
             service_basic_amount = 0
@@ -3579,9 +3572,11 @@ class AdmPhonecallUSTPDFReportView(BaseAdmPhonecallView):  # SUPERUSER
         return context
 
 
-class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
+class TotalReportPDFMasterOrg(ReportSnapshotMixin, AdmPhonecallResumePDFReportView):
     template_name = 'phonecalls/master_phonecall_list.html'
     http_method_names = ['get', 'post']
+    snapshot_report = 'master_resume_zip'
+    snapshot_context = ('phonecall_map', 'contract_version')
 
     def get_success_url(self):
         return reverse(
@@ -3600,8 +3595,11 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
                 self.object_list = self.filterset.qs
             else:
                 self.object_list = self.filterset.queryset.none()
+            response = self.get_snapshot_response()
+            if response is not None:
+                return response
             context = self.get_context_data(filter=self.filterset, object_list=self.object_list)
-            organization_list = Organization.objects.all()
+            organization_list = self.catalogue.get_organizations()
 
             inMemoryOutputFile = BytesIO()
             zipFile = ZipFile(inMemoryOutputFile, 'a')
@@ -3609,7 +3607,8 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
             for org in organization_list:
                 org_context = context['phonecall_map'][org.name]
                 org_context.update({
-                                       'organization': Organization.objects.get(name=org.name),
+                                       'organization': org,
+                                       'catalogue': self.catalogue,
                             })
                 report = SystemReportOrganization(
                     dateBegin=self.date_gt.strftime('%d/%m/%Y'),
@@ -3629,6 +3628,7 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
                     pdf = report2.create_table_resume_services(org_context, True)
                     zipFile.writestr(filename + org.name + 'mew.pdf', pdf)
             zipFile.close()
+            self.save_snapshot_file(inMemoryOutputFile.getvalue(), f'{filename}.zip', 'application/octet-stream')
             response = HttpResponse(content_type='application/octet-stream')
             response['Content-Disposition'] = f'attachement; filename={filename}.zip'
             response.write(inMemoryOutputFile.getvalue())
@@ -3636,25 +3636,22 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
 
 
     def get_context_data(self, **kwargs):
+        snapshot_data = self.get_snapshot_data()
+        if snapshot_data is not None:
+            # os agregados do resumo (AdmPhonecallResumePDFReportView) também estão no snapshot
+            context = super(AdmPhonecallResumePDFReportView, self).get_context_data(**kwargs)
+            context.update(snapshot_data)
+            return context
         TOTAL_DICT = {
         'count': 0,
             'cost_sum': 0.0,
             'billedtime_sum': 0}
         context = super().get_context_data(**kwargs)
-        lastmonthdate = self.date_lt.replace(day=1)
         # In fact I am not considering that the beggining has proportional. Should I???
-        basic_service_data_full = Equipment.objects\
-                                    .filter(Dateinstalled__lt=lastmonthdate, contract__org_price_table__price__status=1)\
-                                    .values('organization__name', 'company__name', 'contract__id')\
-                                    .annotate(amount_sum=Count('id'))\
-                                    .values('organization__name', 'company__name', \
-                                            'contract__id', 'contract__legacyID', 'amount_sum', \
-                                            'contract__org_price_table__price', 'contract__org_price_table__price__status', \
-                                           'contract__org_price_table__price__basic_service', 'contract__org_price_table__price__value')
-
-        org_list = Organization.objects.all()
+        basic_service_data_full = group_charges(get_full_month_charges(self.date_gt, self.date_lt))
+        org_list = self.catalogue.get_organizations()
         for org in org_list:
-            company_list = Company.objects.filter(organization__name=org.name).active()
+            company_list = self.catalogue.get_companies(org, active=True)
             #Translate from legacy to new model
             context['phonecall_map'][org.name].setdefault('basic_service', {})
             for key, value in BASIC_SERVICE_MAP.items():
@@ -3695,33 +3692,29 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
                                     'cost': context['phonecall_map'][org.name]['companies'][company.name]['services'][value]['cost'],
                                 }
                             })
-                service_data = basic_service_data_full.filter(organization__name=org.name,\
-                                                            company__name=company.name)
-                for service in service_data:
-                    if service['contract__org_price_table__price__basic_service'] != service['contract__legacyID']:
-                        continue
+                for service in basic_service_data_full.get((org.pk, company.pk), []):
                     if org.name in context['phonecall_map']:
                         # Here I have to do with the legacy of the use of fized service_map
-                        if service['contract__legacyID'] in context['phonecall_map'][org.name]['basic_service']:
-                            old_amount = context['phonecall_map'][org.name]['basic_service'][service['contract__legacyID']]['amount']
+                        if service['legacy_id'] in context['phonecall_map'][org.name]['basic_service']:
+                            old_amount = context['phonecall_map'][org.name]['basic_service'][service['legacy_id']]['amount']
                         else:
                             old_amount = 0
-                        new_amount = service['amount_sum'] + old_amount
+                        new_amount = service['amount'] + old_amount
                         context['phonecall_map'][org.name]['basic_service'].update({
-                                   service['contract__legacyID']: {
-                                   'price': service['contract__org_price_table__price__value'],
+                                   service['legacy_id']: {
+                                   'price': service['price'],
                                    'amount': new_amount,
-                                   'cost': service['contract__org_price_table__price__value']*new_amount,
+                                   'cost': service['price']*new_amount,
                                    }
                         })
-                        cost = service['amount_sum'] * service['contract__org_price_table__price__value']
+                        cost = service['cost']
                         if 'service_basic' in context['phonecall_map'][org.name]:
                             old_amount = context['phonecall_map'][org.name]['service_basic']['amount']
                             old_cost = context['phonecall_map'][org.name]['service_basic']['cost']
                         else:
                             old_amount = 0
                             old_cost = 0
-                        new_amount = old_amount + service['amount_sum']
+                        new_amount = old_amount + service['amount']
                         new_cost = old_cost + cost
                         context['phonecall_map'][org.name].update({
                             'service_basic': {
@@ -3732,64 +3725,41 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
                         context['phonecall_map'][org.name]['companies'] \
                             .setdefault(company.name, copy(TOTAL_DICT))
                         context['phonecall_map'][org.name]['companies'][company.name].setdefault('services', {})
-                        if service['contract__legacyID'] in context['phonecall_map'][org.name]['companies'][company.name]['basic_service']:
-                            old_amount = context['phonecall_map'][org.name]['companies'][company.name]['basic_service'][service['contract__legacyID']]['amount']
+                        context['phonecall_map'][org.name]['companies'][company.name].setdefault('basic_service', {})
+                        if service['legacy_id'] in context['phonecall_map'][org.name]['companies'][company.name]['basic_service']:
+                            old_amount = context['phonecall_map'][org.name]['companies'][company.name]['basic_service'][service['legacy_id']]['amount']
                         else:
                             old_amount = 0
-                        new_amount = service['amount_sum'] + old_amount
+                        new_amount = service['amount'] + old_amount
                         context['phonecall_map'][org.name]['companies'][company.name]['basic_service'].update({
-                                service['contract__legacyID']: {
-                                    'price': service['contract__org_price_table__price__value'],
-                                    'unit_cost': service['contract__org_price_table__price__value'],
+                                service['legacy_id']: {
+                                    'price': service['price'],
+                                    'unit_cost': service['price'],
                                     'amount': new_amount,
-                                    'cost': service['contract__org_price_table__price__value'] * new_amount,
+                                    'cost': service['price'] * new_amount,
                                 }
                             })
                         # Add dateinstalled!!!!!!
-        basic_service_data_prop = Equipment.objects \
-                                   .filter(Dateinstalled__gte = lastmonthdate, Dateinstalled__lte = self.date_lt, contract__org_price_table__price__status=1) \
-                                    .values('organization__name', 'company__name', 'contract__id') \
-                                    .annotate(amount_sum=Count('id')) \
-                                    .values('organization__name', 'company__name', \
-                                    'contract__id', 'contract__legacyID', 'amount_sum', \
-                                    'contract__org_price_table__price', 'Dateinstalled', \
-                                            'contract__org_price_table__price__status', \
-                                           'contract__org_price_table__price__basic_service', 'contract__org_price_table__price__value')
-        #Here I have filtered all the installation in the month that has installation date < date requested
-        if self.date_lt.month == self.date_gt.month:
-            days = self.date_lt.day - self.date_gt.day + 1
-        else:
-            days = self.date_lt
-        #temp = (self.date_lt.replace(day=1) + relativedelta(month=+1))
-        #last_day_month = ((self.date_lt.replace(day=1) + relativedelta(month=+1)) - timedelta(days=1)).day
+        basic_service_data_prop = group_charges(get_prorated_charges(self.date_gt, self.date_lt))
         for org in org_list:
             if org.name in context['phonecall_map']:
                 context['phonecall_map'][org.name].setdefault('prop', {})
-            company_list = Company.objects.filter(organization__name=org.name)
+            company_list = self.catalogue.get_companies(org)
             for company in company_list:
-                service_data = basic_service_data_prop.filter(organization__name=org.name,\
-                                                            company__name=company.name)
-                for service in service_data:
-                    if service['contract__org_price_table__price__basic_service'] != service['contract__legacyID']:
-                        continue
-                    if self.date_gt > service['Dateinstalled'] or self.date_gt.month != service['Dateinstalled'].month:
-                        days_installed = days
-                    else:
-                        days_installed = self.date_lt.day - service['Dateinstalled'].day  + 1
-                    prop = Decimal(days_installed)/Decimal(days)
+                for service in basic_service_data_prop.get((org.pk, company.pk), []):
                     if org.name in context['phonecall_map']:
                         #context['phonecall_map'][org.name].setdefault('prop', {})
-                        if service['contract__legacyID'] in context['phonecall_map'][org.name]['prop']:
-                            old_amount = context['phonecall_map'][org.name]['prop'][service['contract__legacyID']]['amount']
-                            old_cost = context['phonecall_map'][org.name]['prop'][service['contract__legacyID']]['cost']
+                        if service['legacy_id'] in context['phonecall_map'][org.name]['prop']:
+                            old_amount = context['phonecall_map'][org.name]['prop'][service['legacy_id']]['amount']
+                            old_cost = context['phonecall_map'][org.name]['prop'][service['legacy_id']]['cost']
                         else:
                             old_amount = 0
                             old_cost = Decimal(0)
-                        new_amount = service['amount_sum'] + old_amount
-                        new_cost = prop * service['amount_sum'] * service['contract__org_price_table__price__value'] + old_cost
+                        new_amount = service['amount'] + old_amount
+                        new_cost = service['cost'] + old_cost
                         context['phonecall_map'][org.name]['prop'].update({
-                                   service['contract__legacyID']: {
-                                   'price': service['contract__org_price_table__price__value'],
+                                   service['legacy_id']: {
+                                   'price': service['price'],
                                    'amount': new_amount,
                                    'cost': new_cost,
                                    }
@@ -3797,24 +3767,25 @@ class TotalReportPDFMasterOrg(AdmPhonecallResumePDFReportView):
                         context['phonecall_map'][org.name]['companies'] \
                             .setdefault(company.name, copy(TOTAL_DICT))
                         context['phonecall_map'][org.name]['companies'][company.name].setdefault('prop', {})
-                        if service['contract__legacyID'] in context['phonecall_map'][org.name]['companies'][company.name]['prop']:
-                            old_amount = context['phonecall_map'][org.name]['companies'][company.name]['prop'][service['contract__legacyID']]['amount']
+                        if service['legacy_id'] in context['phonecall_map'][org.name]['companies'][company.name]['prop']:
+                            old_amount = context['phonecall_map'][org.name]['companies'][company.name]['prop'][service['legacy_id']]['amount']
                             old_cost = \
-                            context['phonecall_map'][org.name]['companies'][company.name]['prop'][service['contract__legacyID']][
+                            context['phonecall_map'][org.name]['companies'][company.name]['prop'][service['legacy_id']][
                                 'cost']
                         else:
                             old_amount = 0
                             old_cost = Decimal(0)
-                        new_amount = service['amount_sum'] + old_amount
-                        new_cost = prop*service['amount_sum']*service['contract__org_price_table__price__value'] + old_cost
+                        new_amount = service['amount'] + old_amount
+                        new_cost = service['cost'] + old_cost
                         #NEED TO add something for multiple OS in the same month
                         context['phonecall_map'][org.name]['companies'][company.name]['prop'].update({
-                                service['contract__legacyID']: {
-                                    'price': service['contract__org_price_table__price__value'],
+                                service['legacy_id']: {
+                                    'price': service['price'],
                                     'amount': new_amount,
                                     'cost': new_cost,
                                 }
                             })
+        self.save_snapshot_data(context)
         return context
 
 class TotalReportPDFCompany(OrgPhonecallResumePDFReportView, BaseContextData):
@@ -3841,7 +3812,7 @@ class TotalReportPDFCompany(OrgPhonecallResumePDFReportView, BaseContextData):
                     self.object_list = self.filterset.qs
                 else:
                     self.object_list = self.filterset.queryset.none()
-                company_list = Company.objects.filter(organization__name=self.organization.name).active()
+                company_list = self.catalogue.get_companies(self.organization, active=True)
                 inMemoryOutputFile = BytesIO()
                 zipFile = ZipFile(inMemoryOutputFile, 'a')
                 filename = self.get_filename(resume=True)
@@ -3851,7 +3822,7 @@ class TotalReportPDFCompany(OrgPhonecallResumePDFReportView, BaseContextData):
                     if company.name not in context['company']:
                         continue
                     company_context = context['company'][company.name]
-                    company_context.update({'organization':self.organization})
+                    company_context.update({'organization': self.organization, 'catalogue': self.catalogue})
                     report = SystemReport(
                         dateBegin=self.date_gt.strftime('%d/%m/%Y'),
                         dateEnd=self.date_lt.strftime('%d/%m/%Y'),
@@ -3870,17 +3841,12 @@ class TotalReportPDFCompany(OrgPhonecallResumePDFReportView, BaseContextData):
             context = super().get_Org_Context()
             if self.IsFirst:
                 return context
-            lastmonthdate = self.date_lt.replace(day=1)
-                    # In fact I am not considering that the beggining has proportional. Should I???
-            basic_service_data_full = Equipment.objects \
-                        .filter(organization = self.organization ,Dateinstalled__lt=lastmonthdate, contract__org_price_table__price__status=1) \
-                        .values( 'company__name', 'contract__id') \
-                        .annotate(amount_sum=Count('id')) \
-                        .values( 'company__name', \
-                                'contract__id', 'contract__legacyID', 'amount_sum', \
-                                'contract__org_price_table__price', 'contract__org_price_table__price__status', \
-                                'contract__org_price_table__price__basic_service', 'contract__org_price_table__price__value')
-            company_list = Company.objects.filter(organization=self.organization)
+            # In fact I am not considering that the beggining has proportional. Should I???
+            basic_service_data_full = group_charges(
+                get_full_month_charges(self.date_gt, self.date_lt, organization=self.organization))
+            basic_service_data_prop = group_charges(
+                get_prorated_charges(self.date_gt, self.date_lt, organization=self.organization))
+            company_list = self.catalogue.get_companies(self.organization)
 
             for company in company_list:
                 if company.name in context['company']:
@@ -3898,70 +3864,62 @@ class TotalReportPDFCompany(OrgPhonecallResumePDFReportView, BaseContextData):
                             })
 
 
-                service_data = basic_service_data_full.filter(company__name=company.name)
-                service_pricetable = company.service_pricetable
-                service_price_list = {}
-                if service_pricetable:
-                    service_price_list = service_pricetable.price_set.active()
+                service_data = basic_service_data_full.get((self.organization.pk, company.pk), [])
+                service_pricetable = self.catalogue.get_pricetable(company.service_pricetable_id)
+                service_price_list = self.catalogue.get_active_prices(service_pricetable)
                 for service in service_data:
-                    if service['contract__org_price_table__price__basic_service'] != service['contract__legacyID']:
-                        continue
                     if company.name not in context['company']:
                         context['company'].setdefault(company.name, {})
                     if 'prop' not in context['company'][company.name]:
                         context['company'][company.name].setdefault('prop', {})
                     if 'basic_service' not in context['company'][company.name]:
                         context['company'][company.name].setdefault('basic_service', {})
-                    if service['contract__legacyID'] in context['company'][company.name]['basic_service']:
-                        old_amount = context['company'][company.name]['basic_service'][service['contract__legacyID']]['amount']
+                    if service['legacy_id'] in context['company'][company.name]['basic_service']:
+                        old_amount = context['company'][company.name]['basic_service'][service['legacy_id']]['amount']
                     else:
                         old_amount = 0
-                    new_amount = service['amount_sum'] + old_amount
+                    new_amount = service['amount'] + old_amount
                     if self.organization.id ==1:
                         try:
-                            price = service_price_list.get(basic_service=service['contract__legacyID']).value
+                            price = self.catalogue.get_active_price(service_pricetable, basic_service=service['legacy_id']).value
                         except Exception as e:
                             # If cannot find in the company's table go to default
-                            defaultcompany = Company.objects.get(name='SOP')
-                            service_pricetable = defaultcompany.service_pricetable
-                            service_price_list = {}
-                            if service_pricetable:
-                                service_price_list = service_pricetable.price_set.active()
+                            defaultcompany = self.catalogue.get_company(name='SOP')
+                            service_pricetable = self.catalogue.get_pricetable(defaultcompany.service_pricetable_id)
+                            service_price_list = self.catalogue.get_active_prices(service_pricetable)
                             try:
-                                price = service_price_list.get(basic_service=service['contract__legacyID']).value
+                                price = self.catalogue.get_active_price(service_pricetable, basic_service=service['legacy_id']).value
                             except Exception as e:
                                 price = 0
                     elif self.organization.id ==2:
-                        price = service['contract__org_price_table__price__value']
+                        price = service['price']
                     elif self.organization.id ==3:
-                        defaultcompany = Company.objects.get(name='SAP')
-                        service_pricetable = defaultcompany.service_pricetable
-                        service_price_list = {}
-                        if service_pricetable:
-                            service_price_list = service_pricetable.price_set.active()
-                        price = service_price_list.get(basic_service=service['contract__legacyID']).value
+                        defaultcompany = self.catalogue.get_company(name='SAP')
+                        service_pricetable = self.catalogue.get_pricetable(defaultcompany.service_pricetable_id)
+                        service_price_list = self.catalogue.get_active_prices(service_pricetable)
+                        price = self.catalogue.get_active_price(service_pricetable, basic_service=service['legacy_id']).value
                     else:
                         price = 0
                     context['company'][company.name]['basic_service'].update({
-                        service['contract__legacyID']: {
+                        service['legacy_id']: {
                             # later I will have to think if I create a contract for each of Etice's client
-                            #'price': service['contract__org_price_table__price__value'], #check unit_cost if use
+                            #'price': service['price'], #check unit_cost if use
                             'price': price,
                             'amount': new_amount,
                             #here too
-                            #'cost': service['contract__org_price_table__price__value'] * new_amount,
+                            #'cost': service['price'] * new_amount,
                             'cost': price * new_amount,
                         }
                     })
-                    #cost = service['amount_sum'] * service['contract__org_price_table__price__value']
-                    cost = service['amount_sum'] * price
+                    #cost = service['amount'] * service['price']
+                    cost = service['amount'] * price
                     if 'service_basic' in context['company'][company.name]:
                         old_amount = context['company'][company.name]['service_basic']['amount']
                         old_cost = context['company'][company.name]['service_basic']['cost']
                     else:
                         old_amount = 0
                         old_cost = 0
-                    new_amount = old_amount + service['amount_sum']
+                    new_amount = old_amount + service['amount']
                     new_cost = old_cost + cost
                     context['company'][company.name].update({
                         'service_basic': {
@@ -3972,73 +3930,46 @@ class TotalReportPDFCompany(OrgPhonecallResumePDFReportView, BaseContextData):
 
 
                             # Add dateinstalled!!!!!!
-                basic_service_data_prop = Equipment.objects \
-                    .filter(Dateinstalled__gte=lastmonthdate, Dateinstalled__lte=self.date_lt,
-                            contract__org_price_table__price__status=1, company=company) \
-                    .values('organization__name', 'company__name', 'contract__id') \
-                    .annotate(amount_sum=Count('id')) \
-                    .values('organization__name', 'company__name', \
-                            'contract__id', 'contract__legacyID', 'amount_sum', \
-                            'contract__org_price_table__price', 'Dateinstalled', \
-                            'contract__org_price_table__price__status', \
-                            'contract__org_price_table__price__basic_service', 'contract__org_price_table__price__value')
-                if self.date_lt.month == self.date_gt.month:
-                    days = self.date_lt.day - self.date_gt.day + 1
-                else:
-                    days = self.date_lt
-                #last_day_month = ((self.date_lt.replace(day=1) + relativedelta(month=+1)) - timedelta(days=1)).day
-                service_data = basic_service_data_prop.filter(company__name=company.name)
+                service_data = basic_service_data_prop.get((self.organization.pk, company.pk), [])
 
                 for service in service_data:
-                    if service['contract__org_price_table__price__basic_service'] != service['contract__legacyID']:
-                        continue
-                    if self.date_gt > service['Dateinstalled'] or self.date_gt.month != service['Dateinstalled'].month:
-                        days_installed = days
-                    else:
-                        days_installed = self.date_lt.day - service['Dateinstalled'].day  + 1
-                    prop = Decimal(days_installed) / Decimal(days)
-                    #prop = (last_day_month - service['Dateinstalled'].day + 1) / Decimal(last_day_month)
                     if company.name in context['company']:
                         context['company'][company.name].setdefault('prop', {})
                     else:
                         context['company'].setdefault(company.name, {})
                         context['company'][company.name].setdefault('prop', {})
-                    if service['contract__legacyID'] in context['company'][company.name]['prop']:
-                        old_amount = context['company'][company.name]['prop'][service['contract__legacyID']]['amount']
-                        old_cost = context['company'][company.name]['prop'][service['contract__legacyID']]['cost']
+                    if service['legacy_id'] in context['company'][company.name]['prop']:
+                        old_amount = context['company'][company.name]['prop'][service['legacy_id']]['amount']
+                        old_cost = context['company'][company.name]['prop'][service['legacy_id']]['cost']
                     else:
                         old_amount = 0
                         old_cost = Decimal(0)
-                    new_amount = service['amount_sum'] + old_amount
-                    #new_cost = prop * service['amount_sum'] * service['contract__org_price_table__price__value'] + old_cost
+                    new_amount = service['amount'] + old_amount
+                    #new_cost = prop * service['amount'] * service['price'] + old_cost
                     if self.organization.id ==1:
                         try:
-                            price = service_price_list.get(basic_service=service['contract__legacyID']).value
+                            price = self.catalogue.get_active_price(service_pricetable, basic_service=service['legacy_id']).value
                         except Exception as e:
                             # If cannot find in the company's table go to default
-                            defaultcompany = Company.objects.get(name='SOP')
-                            service_pricetable = defaultcompany.service_pricetable
-                            service_price_list = {}
-                            if service_pricetable:
-                                service_price_list = service_pricetable.price_set.active()
-                            price = service_price_list.get(basic_service=service['contract__legacyID']).value
+                            defaultcompany = self.catalogue.get_company(name='SOP')
+                            service_pricetable = self.catalogue.get_pricetable(defaultcompany.service_pricetable_id)
+                            service_price_list = self.catalogue.get_active_prices(service_pricetable)
+                            price = self.catalogue.get_active_price(service_pricetable, basic_service=service['legacy_id']).value
                     elif self.organization.id ==2:
-                        price = service['contract__org_price_table__price__value']
+                        price = service['price']
                     elif self.organization.id ==3:
-                        defaultcompany = Company.objects.get(name='SAP')
-                        service_pricetable = defaultcompany.service_pricetable
-                        service_price_list = {}
-                        if service_pricetable:
-                            service_price_list = service_pricetable.price_set.active()
-                        price = service_price_list.get(basic_service=service['contract__legacyID']).value
+                        defaultcompany = self.catalogue.get_company(name='SAP')
+                        service_pricetable = self.catalogue.get_pricetable(defaultcompany.service_pricetable_id)
+                        service_price_list = self.catalogue.get_active_prices(service_pricetable)
+                        price = self.catalogue.get_active_price(service_pricetable, basic_service=service['legacy_id']).value
                     else:
                         price = 0
-                    new_cost = prop * service['amount_sum']* price + old_cost
+                    new_cost = service['prop'] * price + old_cost
 
 
                     context['company'][company.name]['prop'].update({
-                        service['contract__legacyID']: {
-                            #'price': service['contract__org_price_table__price__value'],
+                        service['legacy_id']: {
+                            #'price': service['price'],
                             'price': price,
                             'amount': new_amount,
                             'cost': new_cost,
@@ -4067,21 +3998,25 @@ class TotalReportPDFXLSCompany(OrgPhonecallXLSXReportView, BaseContextData):
                         self.object_list = self.filterset.qs
                     else:
                         self.object_list = self.filterset.queryset.none()
-                    company_list = Company.objects.filter(organization__name=self.organization.name)
+                    companies = {company.pk: company for company in self.catalogue.get_companies(self.organization)}
                     inMemoryOutputFile = BytesIO()
                     zipFile = ZipFile(inMemoryOutputFile, 'a')
                     filename = self.get_filename(resume=False)
-                    context = self.get_context_data(filter=self.filterset, object_list=self.object_list)
 
-                    for company in company_list:
-                        self.company = company
-                        company_tag = f'{company.name.upper()} - {company.description}' if company.description else company.name.upper()
-                        if company_tag not in context['phonecall_data']:
-                            continue
-                        company_context ={}
-                        company_context.update({'phonecall_data': {}})
-                        company_context['phonecall_data'] = context['phonecall_data'][company_tag]
-                        company_context.update({'organization': self.organization})
+                    # planilhas: chamadas lidas em fluxo, uma empresa por vez em memória
+                    for company, phonecall_rows in self.iter_companies(companies):
+                        phonecall_data = {}
+                        for ramal, phonecall_list in groupby(phonecall_rows, key=itemgetter('extension__extension')):
+                            phonecall_list = list(phonecall_list)
+                            phonecall_data[ramal] = {
+                                'phonecall_list': phonecall_list,
+                                'count': len(phonecall_list),
+                                'billedtime_sum': sum(phonecall['duration'] for phonecall in phonecall_list),
+                                'cost_sum': sum(float(phonecall['billedamount']) for phonecall in phonecall_list)}
+                        company_context = {
+                            'phonecall_data': phonecall_data,
+                            'organization': self.organization,
+                            'catalogue': self.catalogue}
                         report = XLSXCompanyReport(
                             date_start=self.date_gt.strftime('%d/%m/%Y'),
                             date_stop=self.date_lt.strftime('%d/%m/%Y'),
@@ -4090,20 +4025,40 @@ class TotalReportPDFXLSCompany(OrgPhonecallXLSXReportView, BaseContextData):
                         report.build_detail_report(company_context)
                         val = report.get_file()
                         zipFile.writestr(filename + company.name + '.xlsx', val.getvalue())
+
+                    # PDFs: nova leitura em fluxo, tabelas fatiadas (memória limitada)
+                    for company, phonecall_rows in self.iter_companies(companies):
                         report = SystemReport(
                             dateBegin=self.date_gt.strftime('%d/%m/%Y'),
                             dateEnd=self.date_lt.strftime('%d/%m/%Y'),
                             reportTitle='Relatório de Ligações por Ramal',
-                            company=self.company,
+                            company=company,
                             formatPage=2)
-                        pdf = report.make_phonecall_table(company_context)
-                        zipFile.writestr(filename + company.name + '.pdf',pdf)
+                        with report.make_phonecall_table_chunked(phonecall_rows) as pdf, \
+                                zipFile.open(filename + company.name + '.pdf', 'w') as member:
+                            shutil.copyfileobj(pdf, member)
                     zipFile.close()
                     response = HttpResponse(content_type='application/octet-stream')
                     response['Content-Disposition'] = f'attachement; filename={filename}.zip'
                     response.write(inMemoryOutputFile.getvalue())
                     return response
 
+            def get_phonecall_rows(self):
+                """ Chamadas das empresas na ordem empresa, ramal, data/hora decrescente, lidas em fluxo """
+                return self.object_list \
+                    .filter(company__isnull=False,
+                            calltype__in=[VC1, VC2, VC3, LOCAL, LDN, LDI]) \
+                    .order_by('company', 'extension__extension', '-startdate', '-starttime') \
+                    .values('company', 'startdate', 'starttime', 'stopdate', 'stoptime', 'extension__extension',
+                            'chargednumber', 'dialednumber', 'calltype', 'duration', 'billedamount') \
+                    .iterator(chunk_size=2000)
+
+            def iter_companies(self, companies):
+                """ (empresa, chamadas da empresa) para as empresas de companies ({id: empresa}) com chamadas """
+                for company_id, phonecall_rows in groupby(self.get_phonecall_rows(), key=itemgetter('company')):
+                    if company_id in companies:
+                        yield companies[company_id], phonecall_rows
+
             def get_context_data(self, **kwargs):
                 context = super().get_context_data(**kwargs)
                 for client, client_phonedata in context['phonecall_data'].items():
@@ -11,6 +11,7 @@ ETL para CDR CALL_END do SBC:
 import os
 import re
 import sys
+import time
 import argparse
 from datetime import datetime
 from typing import Optional, Tuple, Dict, Any, List
@@ -18,6 +19,13 @@ from typing import Optional, Tuple, Dict, Any, List
 import psycopg2
 import psycopg2.extras
 
+# core/sbc_time.py e core/callend (sem dependência do Django) são compartilhados com o Tarifador
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.callend import fields  # noqa: E402
+from core.callend.parser import prefix_sequence  # noqa: E402
+from core.pgpool import Backoff, shared_pool  # noqa: E402
+from core.sbc_time import parse_sbc_utc  # noqa: E402
+
 # =========================
 # Configuração de conexões
 # =========================
@@ -78,7 +86,7 @@ SELECT 0::bigint AS last_src_id
 WHERE FALSE;
 """
 
-UPSERT_ONE = """
+INSERT_ONE = """
 INSERT INTO public.sbc_phonecall (
     id, hostid, startdate, starttime, stopdate, stoptime, duration,
     dialednumber, connectednumber, conditioncode, callcasedata, chargednumber,
@@ -87,7 +95,9 @@ INSERT INTO public.sbc_phonecall (
     %(id)s, %(hostid)s, %(startdate)s, %(starttime)s, %(stopdate)s, %(stoptime)s, %(duration)s,
     %(dialednumber)s, %(connectednumber)s, %(conditioncode)s, %(callcasedata)s, %(chargednumber)s,
     %(seqnumber)s, %(seqlim)s, %(callid)s, %(callidass1)s, %(callidass2)s, %(raw)s, %(event_type)s
-)
+)"""
+
+UPSERT_ONE = INSERT_ONE + """
 ON CONFLICT (id) DO UPDATE SET
     hostid=EXCLUDED.hostid,
     startdate=EXCLUDED.startdate,
@@ -109,6 +119,17 @@ ON CONFLICT (id) DO UPDATE SET
     event_type=EXCLUDED.event_type;
 """
 
+# tabela particionada por mês (core/partitions.py): a PK passa a ser (id, startdate) e um
+# ON CONFLICT (id, startdate) inseriria uma segunda linha com o mesmo id se a startdate
+# mudasse ao reimportar; remove pelo id (em qualquer partição) e insere de novo
+UPSERT_ONE_PARTITIONED = """
+DELETE FROM public.sbc_phonecall WHERE id = %(id)s;
+""" + INSERT_ONE + ";"
+
+IS_PARTITIONED = """
+SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('public.sbc_phonecall'));
+"""
+
 INSERT_REJECT = """
 INSERT INTO public.sbc_phonecall_rejects (src_max_id, sip_call_id, session_id, reason, raw)
 VALUES (%(src_max_id)s, %(sip_call_id)s, %(session_id)s, %(reason)s, %(raw)s);
@@ -143,67 +164,61 @@ def safe_int(x: Any, default: Optional[int]=None) -> Optional[int]:
 
 def parse_sbc_datetime(s: str) -> Tuple[Optional[datetime], Optional[datetime.date], Optional[datetime.time]]:
     """Ex.: '16:41:19.223  UTC Fri Oct 24 2025' -> (datetime, date, time)"""
-    if not s or not s.strip():
+    # formato esperado: "%H:%M:%S.%f UTC %a %b %d %Y" (fração opcional)
+    dt = parse_sbc_utc(s)
+    if dt is None:
         return None, None, None
-    s = s.replace("  ", " ").strip()
-    # formato esperado: "%H:%M:%S.%f UTC %a %b %d %Y"
-    try:
-        dt = datetime.strptime(s, "%H:%M:%S.%f UTC %a %b %d %Y")
-        return dt, dt.date(), dt.time()
-    except ValueError:
-        try:
-            dt = datetime.strptime(s, "%H:%M:%S UTC %a %b %d %Y")
-            return dt, dt.date(), dt.time()
-        except ValueError:
-            return None, None, None
+    return dt, dt.date(), dt.time()
+
+# Colunas gravadas em sbc_phonecall -> posição na linha CALL_END
+CALL_END_COLUMNS = (
+    ("cdr_type", fields.EVENT),                # CALL_END
+    ("endpoint_type", fields.ENDPOINT_TYPE),   # SBC
+    ("sip_call_id", fields.CALL_ID),           # 2020295436-...@...
+    ("session_token", fields.SESSION_ID),      # b77740:...
+    ("orig_side", fields.LEG),                 # RMT/LCL
+    ("src_ip", fields.SRC_IP),
+    ("src_port", fields.SRC_PORT),
+    ("dst_ip", fields.DST_IP),
+    ("dst_port", fields.DST_PORT),
+    ("transport", fields.TRANSPORT),           # TLS/UDP/TCP
+    ("src_uri", fields.SRC_URI),               # 31259915@172.20.25.6
+    ("src_uri_bm", fields.SRC_URI_BM),
+    ("dst_uri", fields.DST_URI),               # 0999918552@172.20.25.6
+    ("dst_uri_bm", fields.DST_URI_BM),
+    ("duration", fields.CAUSE),                # "0"
+    ("term_side", fields.TERM_SIDE),           # RMT/LCL
+    ("term_reason", fields.TERM_REASON),       # GWAPP_NORMAL_CALL_CLEAR
+    ("term_cat", fields.TERM_CATEGORY),        # NO_ANSWER
+    ("setup_time", fields.SETUP_TIME),         # "16:41:19.223  UTC Fri Oct 24 2025"
+    ("connect_time", fields.CONNECT_TIME),     # pode vir vazio
+    ("release_time", fields.RELEASE_TIME),
+    ("redirect_reason", fields.REDIRECT_REASON),  # "-1"
+)
+CALL_END_NAMES = [name for name, _ in CALL_END_COLUMNS]
+CALL_END_INDEXES = [index for _, index in CALL_END_COLUMNS]
 
 def parse_call_end_raw(raw_line: str) -> Dict[str, Any]:
     """
-    Faz o split por '|' e mapeia os índices baseados no CALL_END padrão (conforme exemplos anteriores).
+    Mapeia as colunas do CALL_END padrão (CALL_END_COLUMNS, índices em core/callend/fields.py).
     Ajuste os índices caso seu SBC gere ordem diferente.
     """
     out: Dict[str, Any] = {"raw": raw_line}
     if not raw_line:
         return out
 
-    # Remover prefixo do syslog tipo "<141>[S=11880] " se existir:
-    pipe_pos = raw_line.find('|')
-    if pipe_pos > 0:
-        prefix = raw_line[:pipe_pos]
-        # tenta extrair id de sessão do prefixo (opcional)
-        m = re.search(r'\[S=(\d+)\]', prefix)
-        if m:
-            out["session_id"] = m.group(1)
-
-    parts = [p for p in raw_line.split('|')]
-
-    # Protege contra linhas menores que o esperado:
-    def get(i: int) -> Optional[str]:
-        return parts[i].strip() if i < len(parts) else None
-
-    # Mapeamento base (ajuste se necessário ao seu layout):
-    out["cdr_type"]      = get(1)      # CALL_END
-    out["endpoint_type"] = get(2)      # SBC
-    out["sip_call_id"]   = get(3)      # 2020295436-...@...
-    out["session_token"] = get(4)      # b77740:...
-    out["orig_side"]     = get(5)      # RMT/LCL
-    out["src_ip"]        = get(6)
-    out["src_port"]      = get(7)
-    out["dst_ip"]        = get(8)
-    out["dst_port"]      = get(9)
-    out["transport"]     = get(10)     # TLS/UDP/TCP
-    out["src_uri"]       = get(11)     # 31259915@172.20.25.6
-    out["src_uri_bm"]    = get(12)
-    out["dst_uri"]       = get(13)     # 0999918552@172.20.25.6
-    out["dst_uri_bm"]    = get(14)
-    out["duration"]      = get(15)     # "0"
-    out["term_side"]     = get(16)     # RMT/LCL
-    out["term_reason"]   = get(17)     # GWAPP_NORMAL_CALL_CLEAR
-    out["term_cat"]      = get(18)     # NO_ANSWER
-    out["setup_time"]    = get(19)     # "16:41:19.223  UTC Fri Oct 24 2025"
-    out["connect_time"]  = get(20)     # pode vir vazio
-    out["release_time"]  = get(21)
-    out["redirect_reason"]=get(22)     # "-1"
+    # O registro é lido inteiro: um único split é mais rápido que localizar coluna a coluna
+    parts = raw_line.split('|')
+    count = len(parts)
+
+    # Prefixo do syslog tipo "<141>[S=11880] ": id de sessão (opcional)
+    sequence = prefix_sequence(parts[fields.PREFIX]) if count > 1 else None
+    if sequence is not None:
+        out["session_id"] = str(sequence)
+
+    # Mapeamento base (ajuste se necessário ao seu layout); None se a linha for menor
+    out.update(zip(CALL_END_NAMES, [parts[index].strip() if index < count else None
+                                    for index in CALL_END_INDEXES]))
 
     # Deriva dialed/connected dos URIs (parte antes do @)
     def user_from_uri(uri: Optional[str]) -> Optional[str]:
@@ -270,9 +285,14 @@ def read_source_rows(conn, table: str, limit: Optional[int]=None, since_id: Opti
         rows = cur.fetchall()
         return [dict(r) for r in rows]
 
-def upsert_call(conn, row: Dict[str, Any]):
+def get_upsert_sql(conn) -> str:
+    with conn.cursor() as cur:
+        cur.execute(IS_PARTITIONED)
+        return UPSERT_ONE_PARTITIONED if cur.fetchone()[0] else UPSERT_ONE
+
+def upsert_call(conn, row: Dict[str, Any], sql: str = UPSERT_ONE):
     with conn.cursor() as cur:
-        cur.execute(UPSERT_ONE, row)
+        cur.execute(sql, row)
 
 def insert_reject(conn, rej: Dict[str, Any]):
     with conn.cursor() as cur:
@@ -284,13 +304,26 @@ def rm_all_leading_plus(s: Optional[str]) -> Optional[str]:
     s = s.strip()
     return s.lstrip('+')
 
-def run_etl(src_dsn: str, dst_dsn: str, src_table: str, limit: Optional[int], debug: bool, ensure: bool, since_id: Optional[int]):
-    src_conn = psycopg2.connect(src_dsn)
-    dst_conn = psycopg2.connect(dst_dsn)
-
-    try:
+def connection_pool(dsn: str, statement_timeout: Optional[int] = None):
+    """
+    Conexões reaproveitadas entre execuções do mesmo processo (--interval); as perdidas
+    são descartadas e reabertas com espera exponencial se o servidor cair.
+    """
+    # max_size=2: origem e destino no mesmo banco (DSNs iguais) dividem o pool
+    return shared_pool(dsn, driver=psycopg2, max_size=2, statement_timeout=statement_timeout,
+                       application_name="etl_sbc_syslog_to_db")
+
+def run_etl(src_dsn: str, dst_dsn: str, src_table: str, limit: Optional[int], debug: bool, ensure: bool, since_id: Optional[int],
+            statement_timeout: Optional[int] = None) -> Optional[int]:
+    """Uma execução; retorna o maior id lido da origem (None se não havia linhas)."""
+    src_pool = connection_pool(src_dsn, statement_timeout)
+    dst_pool = connection_pool(dst_dsn, statement_timeout)
+
+    # o pool desfaz a transação aberta (rollback) quando a conexão volta
+    with src_pool.connection() as src_conn, dst_pool.connection() as dst_conn:
         if ensure:
             ensure_schema(dst_conn)
+        upsert_sql = get_upsert_sql(dst_conn)
 
         src_rows = read_source_rows(src_conn, src_table, limit=limit, since_id=since_id)
         if debug:
@@ -358,7 +391,7 @@ def run_etl(src_dsn: str, dst_dsn: str, src_table: str, limit: Optional[int], de
                 "event_type":    "CALL_END",
             }
 
-            upsert_call(dst_conn, dst_row)
+            upsert_call(dst_conn, dst_row, upsert_sql)
             inserted += 1
 
         # flush rejeições
@@ -370,9 +403,7 @@ def run_etl(src_dsn: str, dst_dsn: str, src_table: str, limit: Optional[int], de
         if debug:
             print(f"[etl] inseridos/atualizados: {inserted}; rejeitados: {len(rejects)}; src_max_id={src_max_id}")
 
-    finally:
-        src_conn.close()
-        dst_conn.close()
+        return src_max_id
 
 # =========================
 # CLI
@@ -383,6 +414,10 @@ def main():
     ap.add_argument("--limit", default=None, help="Limite de linhas da origem (int ou 'all')")
     ap.add_argument("--since-id", type=int, default=None, help="Processar somente id > since-id")
     ap.add_argument("--debug", action="store_true", help="Verbose")
+    ap.add_argument("--interval", type=float, default=0,
+                    help="Repete a cada N segundos a partir do último id lido, mantendo as conexões (0 = uma execução)")
+    ap.add_argument("--statement-timeout", type=int, default=int(os.getenv("ETL_STATEMENT_TIMEOUT_MS", "0")),
+                    help="statement_timeout das conexões, em ms (0 = sem limite)")
     args = ap.parse_args()
 
     limit = None
@@ -406,7 +441,28 @@ def main():
               f"port={os.getenv('DST_PGPORT', os.getenv('PGPORT','15432'))} "
               f"user={os.getenv('DST_PGUSER', os.getenv('PGUSER','sysloguser'))}")
 
-    run_etl(src_dsn, dst_dsn, args.table, limit=limit, debug=args.debug, ensure=True, since_id=args.since_id)
+    if args.interval <= 0:
+        run_etl(src_dsn, dst_dsn, args.table, limit=limit, debug=args.debug, ensure=True, since_id=args.since_id,
+                statement_timeout=args.statement_timeout)
+        return
+
+    since_id = args.since_id
+    ensure = True
+    backoff = Backoff()
+    while True:
+        try:
+            last_id = run_etl(src_dsn, dst_dsn, args.table, limit=limit, debug=args.debug, ensure=ensure,
+                              since_id=since_id, statement_timeout=args.statement_timeout)
+        except psycopg2.Error as e:
+            delay = args.interval + backoff.next()
+            print(f"[etl] falha: {str(e).strip()}; nova tentativa em {delay:.1f}s", file=sys.stderr)
+            time.sleep(delay)
+            continue
+        backoff.reset()
+        ensure = False
+        if last_id is not None:
+            since_id = last_id
+        time.sleep(args.interval)
 
 if __name__ == "__main__":
     main()
@@ -17,14 +17,19 @@ pelo modelo ``Phonecall`` (cálculo de tempo faturado, busca de preços nas
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
+import math
+import mmap
+import os
 import re
 from pathlib import Path
 import sqlite3
 import sys
-from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from zoneinfo import ZoneInfo
 import zlib
 
@@ -38,6 +43,18 @@ try:  # pragma: no cover - import guard depende do ambiente do cliente
 except ImportError:  # pragma: no cover
     psycopg2 = None  # type: ignore[assignment]
 
+# ``core/sbc_time.py`` e ``core/callend`` não dependem do Django e são
+# compartilhados com o Tarifador e os demais leitores do syslog.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from core.callend import fields  # noqa: E402
+from core.callend.parser import prefix_sequence  # noqa: E402
+from core.callend.parser import split_call_end  # noqa: E402
+from core.callend.parser import uri_user as extract_user  # noqa: E402
+from core.pgpool import connect as pg_connect  # noqa: E402
+from core.sbc_time import parse_sbc_datetime  # noqa: E402
+from phonecalls.snapshot_sql import invalidate_snapshots, snapshot_scope, snapshots_enabled  # noqa: E402
+from phonecalls.utils import get_ddd  # noqa: E402
+
 # --- Constantes principais -------------------------------------------------
 
 # Identificadores que reproduzem as escolhas do campo ``pabx`` do modelo
@@ -79,10 +96,40 @@ CALLTYPE_LABEL_MAP: Dict[str, int] = {
     "MOBILE": VC3,
 }
 
-# Os registros podem vir com ou sem o identificador de fuso horário. Guardamos
-# os dois formatos para tentar as conversões na função ``parse_datetime``.
-DATETIME_FORMAT_WITH_TZ = "%H:%M:%S.%f %Z %a %b %d %Y"
-DATETIME_FORMAT_NO_TZ = "%H:%M:%S.%f %a %b %d %Y"
+# Colunas do CALL_END lidas por ``parse_call_end_line`` (core/callend/fields.py).
+CALL_END_INDEXES = (
+    fields.CALL_ID, fields.SESSION_ID, fields.LEG, fields.SRC_URI, fields.SRC_URI_BM,
+    fields.DST_URI, fields.DST_URI_BM, fields.CAUSE, fields.TERM_SIDE, fields.TERM_REASON,
+    fields.TERM_CATEGORY, fields.SETUP_TIME, fields.CONNECT_TIME, fields.RELEASE_TIME, fields.SIP_METHOD,
+)
+
+INSERT_PHONECALL_SQL = """
+    INSERT INTO phonecalls_phonecall (
+        created, modified, pabx, inbound, internal, calltype, service,
+        description, price, org_price, billedamount, org_billedamount,
+        billedtime, md_phonecall_id, startdate, starttime, stopdate,
+        stoptime, duration, chargednumber, connectednumber,
+        dialednumber, charged_ddd, dialed_ddd, conditioncode, center_id,
+        company_id, extension_id, org_price_table_id, organization_id,
+        price_table_id, sector_id
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+# Modo em lotes: linhas por ``executemany``/commit e quantidade de
+# ``md_phonecall_id`` mantidos em um ``set`` antes de trocar por Bloom filter.
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_MAX_EXACT_IDS = 1_000_000
+BLOOM_CAPACITY = 20_000_000
+BLOOM_ERROR_RATE = 0.001
+
+# Modo paralelo (``--workers``): o arquivo é dividido em faixas de bytes
+# terminadas em ``\n``. A coluna do evento vem completada com espaços
+# (``|CALL_END        |``), por isso o filtro procura só o prefixo.
+CALL_END_MARKER = b"|CALL_END"
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
 
 # --- Estruturas de dados ---------------------------------------------------
 
@@ -176,106 +223,63 @@ def normalize_digits(number: str) -> str:
     return "".join(ch for ch in (number or "") if ch.isdigit())
 
 
-def extract_user(uri: str) -> str:
-    """Extrai a porção do usuário (antes do @) de um URI SIP/TEL."""
-    if not uri:
-        return ""
-    value = uri.strip().strip("<>").strip('"').strip()
-    if not value:
-        return ""
-    if "@" in value:
-        value = value.split("@", 1)[0]
-    if ";" in value:
-        value = value.split(";", 1)[0]
-    if ":" in value:
-        prefix, rest = value.split(":", 1)
-        if prefix.lower() in {"sip", "sips", "tel"}:
-            value = rest
-    return value.strip()
-
-
 def parse_datetime(value: str, tz: ZoneInfo) -> Optional[datetime]:
-    """Converte a string fornecida pelo SBC para ``datetime`` no fuso alvo."""
-    value = (value or "").strip()
-    if not value:
-        return None
-    try:
-        naive = datetime.strptime(value, DATETIME_FORMAT_WITH_TZ)
-    except ValueError:
-        try:
-            naive = datetime.strptime(value, DATETIME_FORMAT_NO_TZ)
-        except ValueError:
-            return None
-    aware = naive.replace(tzinfo=timezone.utc)
-    return aware.astimezone(tz)
+    """Converte a string fornecida pelo SBC para ``datetime`` no fuso alvo.
+
+    Os registros podem vir com ou sem o identificador de fuso horário; a
+    leitura e a conversão ficam em ``core/sbc_time.py``.
+    """
+    return parse_sbc_datetime(value, tz)
 
 
-def parse_call_end_line(line: str, tz: ZoneInfo) -> Optional[SbcCallRecord]:
+def parse_call_end_line(
+    line: Union[str, bytes], tz: ZoneInfo, encoding: str = "utf-8"
+) -> Optional[SbcCallRecord]:
     """Interpreta uma linha do syslog e devolve um ``SbcCallRecord``.
 
-    A linha é dividida pelos pipes (``|``) e cada coluna é normalizada. Somente
-    os registros que realmente correspondem ao evento ``CALL_END`` são
-    retornados; os demais são descartados com ``None``.
+    O evento é conferido antes de dividir a linha e, para os ``CALL_END``, a
+    linha é dividida pelos pipes (``|``) de uma vez (``core/callend``); a linha
+    pode vir em ``bytes`` (modo paralelo). Somente os registros que realmente
+    correspondem ao evento ``CALL_END`` são retornados; os demais são
+    descartados com ``None``.
     """
-    parts = line.rstrip("\n").split("|")
-    if len(parts) < 22:
+    parts = split_call_end(line, encoding)
+    if parts is None:
         return None
-    if parts[1].strip().upper() != "CALL_END":
-        return None
-
-    # O identificador de sequência ``[S=xxxx]`` aparece no prefixo da linha e é
-    # utilizado para identificar a ordem do evento dentro do syslog.
-    prefix = parts[0]
-    sequence = None
-    seq_start = prefix.find("[S=")
-    if seq_start != -1:
-        seq_start += 3
-        seq_end = prefix.find("]", seq_start)
-        if seq_end != -1:
-            seq_value = prefix[seq_start:seq_end].strip()
-            if seq_value.isdigit():
-                sequence = int(seq_value)
-
-    def _field(index: int) -> str:
-        # Função auxiliar que protege contra linhas truncadas.
-        if index >= len(parts):
-            return ""
-        return parts[index].strip()
 
-    call_id = _field(3)
-    session_id = _field(4)
-    leg = _field(5).upper()
-    from_uri = _field(11)
-    to_uri = _field(12)
-    orig_from_uri = _field(13)
-    orig_to_uri = _field(14)
+    # Colunas ausentes (linhas truncadas) viram "".
+    count = len(parts)
+    (
+        call_id, session_id, leg, from_uri, to_uri, orig_from_uri, orig_to_uri, cause_str,
+        calltype_label, release_cause, release_text, start_time, connect_time, end_time, sip_method,
+    ) = [parts[index].strip() if index < count else "" for index in CALL_END_INDEXES]
 
     cause_code = None
-    cause_str = _field(15)
     if cause_str:
         try:
             cause_code = int(cause_str)
         except ValueError:
             cause_code = None
 
-    # Construímos o ``SbcCallRecord`` normalizando cada coluna relevante.
+    # Construímos o ``SbcCallRecord`` normalizando cada coluna relevante. O
+    # identificador ``[S=xxxx]`` do prefixo da linha dá a ordem do evento.
     record = SbcCallRecord(
         call_id=call_id,
         session_id=session_id,
-        leg=leg,
+        leg=leg.upper(),
         from_uri=from_uri,
         to_uri=to_uri,
         orig_from_uri=orig_from_uri,
         orig_to_uri=orig_to_uri,
-        calltype_label=_field(16).upper(),
+        calltype_label=calltype_label.upper(),
         cause_code=cause_code,
-        release_cause=_field(17),
-        release_text=_field(18),
-        start_time=parse_datetime(_field(19), tz),
-        connect_time=parse_datetime(_field(20), tz),
-        end_time=parse_datetime(_field(21), tz),
-        sequence=sequence,
-        sip_method=_field(33),
+        release_cause=release_cause,
+        release_text=release_text,
+        start_time=parse_datetime(start_time, tz),
+        connect_time=parse_datetime(connect_time, tz),
+        end_time=parse_datetime(end_time, tz),
+        sequence=prefix_sequence(parts[fields.PREFIX]),
+        sip_method=sip_method,
     )
     return record
 
@@ -335,37 +339,32 @@ def connect_postgres(
     database: str,
     user: str,
     password: str,
+    statement_timeout: Optional[int] = None,
+    retries: int = 3,
 ):
-    """Abre conexão com o PostgreSQL usando ``psycopg`` ou ``psycopg2``."""
-
-    if psycopg is not None:  # type: ignore[attr-defined]
-        conn = psycopg.connect(  # type: ignore[call-arg]
-            host=host,
-            port=port,
-            dbname=database,
-            user=user,
-            password=password,
-        )
-        try:
-            conn.autocommit = True  # type: ignore[assignment]
-        except AttributeError:
-            pass
-        return conn
-
-    if psycopg2 is not None:  # type: ignore[attr-defined]
-        conn = psycopg2.connect(  # type: ignore[call-arg]
-            host=host,
-            port=port,
-            dbname=database,
-            user=user,
-            password=password,
+    """Abre conexão com o PostgreSQL usando ``psycopg`` ou ``psycopg2``.
+
+    Falhas de conexão são tentadas de novo ``retries`` vezes, com espera
+    exponencial com jitter (``core.pgpool``); ``statement_timeout`` em ms.
+    """
+
+    if psycopg is None and psycopg2 is None:
+        raise RuntimeError(
+            "É necessário instalar o pacote 'psycopg' ou 'psycopg2' para ler o "
+            "syslog a partir do PostgreSQL."
         )
-        conn.autocommit = True
-        return conn
 
-    raise RuntimeError(
-        "É necessário instalar o pacote 'psycopg' ou 'psycopg2' para ler o "
-        "syslog a partir do PostgreSQL."
+    return pg_connect(
+        driver=psycopg if psycopg is not None else psycopg2,
+        retries=retries,
+        autocommit=True,
+        host=host,
+        port=port,
+        dbname=database,
+        user=user,
+        password=password,
+        statement_timeout=statement_timeout,
+        application_name="sbc_syslog_etl",
     )
 
 
@@ -533,6 +532,93 @@ class ExtensionResolver:
         return iter(candidate for candidate in candidates if candidate)
 
 
+# --- Índice de chamadas existentes ----------------------------------------
+
+
+class BloomFilter:
+    """Bloom filter para inteiros de 32 bits (``md_phonecall_id``).
+
+    Usa ``k`` posições derivadas de dois hashes multiplicativos (double
+    hashing). Falsos positivos são possíveis e devem ser confirmados no banco.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE) -> None:
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: int) -> Iterator[int]:
+        h1 = (value * 0x9E3779B1) & 0xFFFFFFFF
+        h2 = ((value ^ 0x5BD1E995) * 0x85EBCA6B) & 0xFFFFFFFF | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: int) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: int) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class ExistingCallIndex:
+    """``md_phonecall_id`` já gravados, carregados por dia (``startdate``).
+
+    Cada dia é lido uma única vez, quando a primeira chamada daquele dia
+    aparece. Até ``max_exact`` ids o índice é um ``set``; acima disso passa a
+    ser um Bloom filter e os positivos são confirmados no banco, mantendo a
+    memória limitada em janelas muito grandes.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, max_exact: int = DEFAULT_MAX_EXACT_IDS) -> None:
+        self.conn = conn
+        self.max_exact = max_exact
+        self.loaded_days: set = set()
+        self.ids: set = set()
+        self.bloom: Optional[BloomFilter] = None
+        # ids aceitos no lote ainda não gravado (confirmação dos positivos do Bloom)
+        self.pending: set = set()
+
+    def load_day(self, day: date) -> None:
+        # A data local pode diferir um dia da data UTC: carregamos os vizinhos.
+        for offset in (-1, 0, 1):
+            current = day + timedelta(days=offset)
+            if current in self.loaded_days:
+                continue
+            self.loaded_days.add(current)
+            cursor = self.conn.execute(
+                "SELECT md_phonecall_id FROM phonecalls_phonecall"
+                " WHERE startdate = ? AND md_phonecall_id IS NOT NULL",
+                (current.isoformat(),),
+            )
+            for (md_phonecall_id,) in cursor:
+                self.add(md_phonecall_id)
+
+    def add(self, md_phonecall_id: int) -> None:
+        if self.bloom is not None:
+            self.bloom.add(md_phonecall_id)
+            return
+        self.ids.add(md_phonecall_id)
+        if len(self.ids) > self.max_exact:
+            self.bloom = BloomFilter(max(BLOOM_CAPACITY, 4 * self.max_exact))
+            for value in self.ids:
+                self.bloom.add(value)
+            self.ids = set()
+
+    def contains(self, md_phonecall_id: int) -> bool:
+        if self.bloom is None:
+            return md_phonecall_id in self.ids
+        if md_phonecall_id not in self.bloom:
+            return False
+        if md_phonecall_id in self.pending:
+            return True
+        cursor = self.conn.execute(
+            "SELECT 1 FROM phonecalls_phonecall WHERE md_phonecall_id = ?",
+            (md_phonecall_id,),
+        )
+        return cursor.fetchone() is not None
+
+
 # --- Núcleo da importação --------------------------------------------------
 
 
@@ -552,6 +638,9 @@ class SyslogImporter:
         self.extensions = load_extension_info(conn)
         self.resolver = ExtensionResolver(self.extensions, default_ddd)
         self.price_index = load_price_index(conn)
+        # Snapshots de relatório dos meses fechados que recebem chamadas são
+        # apagados junto com a gravação (bancos sem a tabela não têm snapshots).
+        self.snapshots = snapshots_enabled(conn.cursor(), "qmark")
 
     # -- Métodos públicos -------------------------------------------------
 
@@ -560,15 +649,36 @@ class SyslogImporter:
         lines: Iterable[str],
         target_leg: str,
         dry_run: bool,
+        batch_size: int = 0,
+        max_exact_ids: int = DEFAULT_MAX_EXACT_IDS,
     ) -> ImportStats:
+        # Converte cada linha em um ``SbcCallRecord``; se não for CALL_END,
+        # ``parse_call_end_line`` devolve ``None``.
+        records = (parse_call_end_line(line, self.tz) for line in lines)
+        return self.import_records(records, target_leg, dry_run, batch_size, max_exact_ids)
+
+    def import_records(
+        self,
+        records: Iterable[Optional[SbcCallRecord]],
+        target_leg: str,
+        dry_run: bool,
+        batch_size: int = 0,
+        max_exact_ids: int = DEFAULT_MAX_EXACT_IDS,
+    ) -> ImportStats:
+        """Importa registros já interpretados (``None`` é ignorado).
+
+        Usado por ``import_lines`` e pelo modo paralelo, em que as linhas são
+        interpretadas em outros processos (``iter_call_end_records_parallel``).
+        """
+        if batch_size > 0:
+            return self.import_records_batched(records, target_leg, dry_run, batch_size, max_exact_ids)
+
         stats = ImportStats()
         seen_call_ids = set()
+        scopes: set = set()
         cursor = self.conn.cursor()
 
-        for line in lines:
-            # Converte a linha em um ``SbcCallRecord``; se não for CALL_END,
-            # ``parse_call_end_line`` devolve ``None``.
-            record = parse_call_end_line(line, self.tz)
+        for record in records:
             if not record:
                 continue
             # Permite importar apenas um dos legs (RMT/LCL) conforme parâmetro.
@@ -608,12 +718,74 @@ class SyslogImporter:
 
             # Finalmente insere a nova chamada no banco.
             self._insert_phonecall(cursor, phonecall_data, md_phonecall_id)
+            scopes.add(self._snapshot_scope(phonecall_data))
             stats.created += 1
 
         if not dry_run:
+            self._invalidate_snapshots(cursor, scopes)
             self.conn.commit()
         return stats
 
+    def import_records_batched(
+        self,
+        records: Iterable[Optional[SbcCallRecord]],
+        target_leg: str,
+        dry_run: bool,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_exact_ids: int = DEFAULT_MAX_EXACT_IDS,
+    ) -> ImportStats:
+        """Mesmas regras de ``import_records``, gravando em lotes.
+
+        Os ``md_phonecall_id`` existentes são carregados por dia em um
+        ``ExistingCallIndex`` (sem ``SELECT`` por linha), as chamadas são
+        acumuladas e gravadas com ``executemany`` e cada lote é confirmado
+        com ``commit``. A memória fica limitada ao lote e ao índice.
+        """
+        stats = ImportStats()
+        index = ExistingCallIndex(self.conn, max_exact_ids)
+        batch: list = []
+        scopes: set = set()
+        cursor = self.conn.cursor()
+
+        for record in records:
+            if not record:
+                continue
+            if target_leg != "ANY" and record.leg != target_leg:
+                continue
+
+            phonecall_data = self._build_phonecall(record)
+            if phonecall_data is None:
+                stats.missing_extension += 1
+                continue
+
+            if phonecall_data.duration < 0:
+                stats.invalid += 1
+                continue
+
+            md_phonecall_id = zlib.crc32(record.call_id.encode("utf-8")) & 0xFFFFFFFF
+            index.load_day(phonecall_data.start.astimezone(self.tz).date())
+            # Cobre tanto as chamadas já gravadas quanto as repetidas no arquivo.
+            if index.contains(md_phonecall_id):
+                stats.duplicates += 1
+                continue
+            index.add(md_phonecall_id)
+            stats.created += 1
+            if dry_run:
+                continue
+
+            index.pending.add(md_phonecall_id)
+            batch.append(self._phonecall_params(phonecall_data, md_phonecall_id))
+            scopes.add(self._snapshot_scope(phonecall_data))
+            if len(batch) >= batch_size:
+                self._flush(cursor, batch, scopes)
+                index.pending.clear()
+                batch = []
+                scopes = set()
+
+        if batch:
+            self._flush(cursor, batch, scopes)
+        return stats
+
     # -- Métodos auxiliares ------------------------------------------------
 
     def _build_phonecall(self, record: SbcCallRecord) -> Optional["PhonecallData"]:
@@ -758,57 +930,61 @@ class SyslogImporter:
         phonecall: "PhonecallData",
         md_phonecall_id: int,
     ) -> None:
+        cursor.execute(INSERT_PHONECALL_SQL, self._phonecall_params(phonecall, md_phonecall_id))
+
+    def _flush(self, cursor: sqlite3.Cursor, batch: list, scopes: set) -> None:
+        cursor.executemany(INSERT_PHONECALL_SQL, batch)
+        self._invalidate_snapshots(cursor, scopes)
+        self.conn.commit()
+
+    def _snapshot_scope(self, phonecall: "PhonecallData") -> tuple:
+        return snapshot_scope(phonecall.start.astimezone(self.tz).date(),
+                              phonecall.organization_id, phonecall.company_id)
+
+    def _invalidate_snapshots(self, cursor: sqlite3.Cursor, scopes: set) -> None:
+        # Um DELETE por lote, na mesma transação das chamadas gravadas.
+        if self.snapshots and scopes:
+            invalidate_snapshots(cursor, scopes, "qmark")
+
+    def _phonecall_params(self, phonecall: "PhonecallData", md_phonecall_id: int) -> tuple:
         # Converte datas para o fuso configurado antes de gravar.
         start_local = phonecall.start.astimezone(self.tz)
         end_local = phonecall.end.astimezone(self.tz)
 
-        cursor.execute(
-            """
-            INSERT INTO phonecalls_phonecall (
-                created, modified, pabx, inbound, internal, calltype, service,
-                description, price, org_price, billedamount, org_billedamount,
-                billedtime, md_phonecall_id, startdate, starttime, stopdate,
-                stoptime, duration, chargednumber, connectednumber,
-                dialednumber, conditioncode, center_id, company_id,
-                extension_id, org_price_table_id, organization_id,
-                price_table_id, sector_id
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-            """,
-            (
-                phonecall.created.isoformat(sep=" "),
-                phonecall.modified.isoformat(sep=" "),
-                phonecall.pabx,
-                int(phonecall.inbound),
-                int(phonecall.internal),
-                phonecall.calltype,
-                phonecall.service,
-                phonecall.description,
-                decimal_from(phonecall.price),
-                decimal_from(phonecall.org_price),
-                decimal_from(phonecall.billedamount),
-                decimal_from(phonecall.org_billedamount),
-                phonecall.billedtime,
-                md_phonecall_id,
-                start_local.date().isoformat(),
-                start_local.time().isoformat(timespec="seconds"),
-                end_local.date().isoformat(),
-                end_local.time().isoformat(timespec="seconds"),
-                phonecall.duration,
-                phonecall.chargednumber,
-                phonecall.connectednumber,
-                phonecall.dialednumber,
-                phonecall.conditioncode,
-                phonecall.center_id,
-                phonecall.company_id,
-                phonecall.extension_id,
-                phonecall.org_price_table_id,
-                phonecall.organization_id,
-                phonecall.price_table_id,
-                phonecall.sector_id,
-            ),
+        return (
+            phonecall.created.isoformat(sep=" "),
+            phonecall.modified.isoformat(sep=" "),
+            phonecall.pabx,
+            int(phonecall.inbound),
+            int(phonecall.internal),
+            phonecall.calltype,
+            phonecall.service,
+            phonecall.description,
+            decimal_from(phonecall.price),
+            decimal_from(phonecall.org_price),
+            decimal_from(phonecall.billedamount),
+            decimal_from(phonecall.org_billedamount),
+            phonecall.billedtime,
+            md_phonecall_id,
+            start_local.date().isoformat(),
+            start_local.time().isoformat(timespec="seconds"),
+            end_local.date().isoformat(),
+            end_local.time().isoformat(timespec="seconds"),
+            phonecall.duration,
+            phonecall.chargednumber,
+            phonecall.connectednumber,
+            phonecall.dialednumber,
+            # mesmos valores do pre_save de Phonecall (set_ddd)
+            get_ddd(phonecall.chargednumber),
+            get_ddd(phonecall.dialednumber),
+            phonecall.conditioncode,
+            phonecall.center_id,
+            phonecall.company_id,
+            phonecall.extension_id,
+            phonecall.org_price_table_id,
+            phonecall.organization_id,
+            phonecall.price_table_id,
+            phonecall.sector_id,
         )
 
 
@@ -858,6 +1034,98 @@ def iter_lines_from_path(path: Path, encoding: str) -> Iterator[str]:
             yield line
 
 
+def split_file_ranges(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Divide o arquivo em faixas ``[início, fim)`` que terminam em ``\n``."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size deve ser positivo")
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    ranges = []
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            end = data.find(b"\n", min(start + chunk_size, size) - 1)
+            end = size if end == -1 else end + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_file_range(
+    path: str, start: int, end: int, encoding: str, timezone_name: str
+) -> List[SbcCallRecord]:
+    """Interpreta as linhas CALL_END de uma faixa do arquivo (roda no worker).
+
+    As linhas sem ``|CALL_END`` não são decodificadas: a busca é feita nos
+    bytes do arquivo mapeado, saltando direto para a próxima ocorrência. As
+    demais são decodificadas e divididas uma vez (``core/callend``).
+    """
+    tz = ZoneInfo(timezone_name)
+    records = []
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        position = start
+        while True:
+            found = data.find(CALL_END_MARKER, position, end)
+            if found == -1:
+                break
+            line_start = data.rfind(b"\n", position, found)
+            line_start = position if line_start == -1 else line_start + 1
+            line_end = data.find(b"\n", found, end)
+            line_end = end if line_end == -1 else line_end + 1
+            record = parse_call_end_line(data[line_start:line_end], tz, encoding)
+            if record is not None:
+                records.append(record)
+            position = line_end
+    return records
+
+
+def iter_call_end_records_parallel(
+    path: Path,
+    encoding: str,
+    timezone_name: str,
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[SbcCallRecord]:
+    """Interpreta o arquivo em ``workers`` processos, mantendo a ordem das linhas.
+
+    As faixas são entregues na ordem do arquivo ao único consumidor (o
+    ``SyslogImporter``), que continua sendo o único a gravar no banco. No
+    máximo ``2 * workers`` faixas ficam em andamento, o que limita a memória.
+    """
+    ranges = split_file_ranges(path, chunk_size)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, end in ranges:
+            pending.append(executor.submit(parse_file_range, str(path), start, end, encoding, timezone_name))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def positive_int(value: str) -> int:
+    """Tipo do argparse para inteiros maiores que zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero: {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Tipo do argparse para inteiros maiores ou iguais a zero (0 desliga a opção)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"não pode ser negativo: {value}")
+    return number
+
+
 def build_argument_parser() -> argparse.ArgumentParser:
     """Configura a interface de linha de comando da ferramenta."""
     parser = argparse.ArgumentParser(
@@ -938,11 +1206,47 @@ def build_argument_parser() -> argparse.ArgumentParser:
         type=int,
         help="Limita a quantidade máxima de linhas lidas do PostgreSQL.",
     )
+    parser.add_argument(
+        "--pg-statement-timeout",
+        type=non_negative_int,
+        default=0,
+        help="statement_timeout da conexão com o PostgreSQL, em ms (0 = sem limite).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Executa a leitura sem gravar no banco de dados.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=non_negative_int,
+        default=0,
+        help=(
+            "Grava em lotes de N chamadas (executemany + commit por lote), com"
+            " deduplicação em memória. 0 mantém a gravação linha a linha."
+        ),
+    )
+    parser.add_argument(
+        "--max-exact-ids",
+        type=int,
+        default=DEFAULT_MAX_EXACT_IDS,
+        help="No modo em lotes, ids mantidos em memória antes de usar Bloom filter.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=non_negative_int,
+        default=0,
+        help=(
+            "Interpreta o --syslog-file em N processos (faixas do arquivo mapeado"
+            " em memória). 0 lê o arquivo linha a linha no próprio processo."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Tamanho aproximado, em bytes, de cada faixa do modo --workers.",
+    )
     return parser
 
 
@@ -960,7 +1264,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     try:
         importer = SyslogImporter(conn, args.default_ddd, args.timezone)
 
-        if args.syslog_file:
+        records = None
+        lines: Iterable[str] = ()
+        if args.syslog_file and args.workers > 0:
+            if args.syslog_file == "-":
+                parser.error("--workers exige um arquivo (não funciona com stdin)")
+            records = iter_call_end_records_parallel(
+                Path(args.syslog_file),
+                args.encoding,
+                args.timezone,
+                args.workers,
+                args.chunk_size,
+            )
+        elif args.syslog_file:
             lines = iter_lines_from_path(Path(args.syslog_file), args.encoding)
         else:
             try:
@@ -970,6 +1286,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                     database=args.pg_database,
                     user=args.pg_user,
                     password=args.pg_password,
+                    statement_timeout=args.pg_statement_timeout,
                 )
             except (ValueError, RuntimeError) as exc:
                 parser.error(str(exc))
@@ -980,7 +1297,22 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 limit=args.pg_limit,
             )
 
-        stats = importer.import_lines(lines, args.leg.upper(), args.dry_run)
+        if records is not None:
+            stats = importer.import_records(
+                records,
+                args.leg.upper(),
+                args.dry_run,
+                batch_size=args.batch_size,
+                max_exact_ids=args.max_exact_ids,
+            )
+        else:
+            stats = importer.import_lines(
+                lines,
+                args.leg.upper(),
+                args.dry_run,
+                batch_size=args.batch_size,
+                max_exact_ids=args.max_exact_ids,
+            )
     finally:
         if pg_conn is not None:
             pg_conn.close()
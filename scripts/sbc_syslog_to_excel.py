@@ -8,7 +8,9 @@ ou tabelas de preço.
 """
 import argparse
 import datetime as dt
+import os
 import re
+import sys
 from decimal import Decimal
 from typing import Optional, Tuple, Iterable
 
@@ -26,7 +28,12 @@ except Exception as e:
         f"Detalhe do erro: {e}"
     )
 
+# core/callend (sem dependência do Django) é compartilhado com os demais leitores do syslog
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.callend.parser import parse_call_end, uri_user  # noqa: E402
+
 # ------------ Regex helpers ---------------------------------------------------
+# Usadas só quando a linha não segue o layout do CALL_END (ver extract_call_fields)
 
 NUM_RE = re.compile(r"(?:(?:sip:|tel:)?)(\+?\d{3,})")
 SIP_URI_RE = re.compile(r"(?:sip:)?(?P<num>\+?\d{3,})@[^\s>]*")
@@ -77,6 +84,18 @@ def extract_two_numbers(text: str) -> Tuple[Optional[str], Optional[str]]:
         return nums[0], None
     return None, None
 
+def extract_call_fields(text: str) -> Tuple[Optional[str], Optional[str], int]:
+    """(caller, callee, duração em segundos) da linha.
+
+    Linhas CALL_END completas são lidas pelas colunas (URIs de origem e destino,
+    conexão até o fim da chamada); as demais caem nas heurísticas por regex.
+    """
+    record = parse_call_end(text) if text else None
+    if record is None:
+        caller, callee = extract_two_numbers(text)
+        return caller, callee, parse_duration_seconds(text)
+    return uri_user(record.src_uri) or None, uri_user(record.dst_uri) or None, record.duration_seconds()
+
 def guess_direction(caller: Optional[str], callee: Optional[str]) -> Tuple[int, int]:
     """Heurística simples -> (inbound, internal)"""
     def is_internal(n: Optional[str]) -> bool:
@@ -144,10 +163,9 @@ def build_dataframe(rows, tzname: str) -> pd.DataFrame:
 
     for rid, received_at, raw in rows:
         start_local = to_local(received_at, tzname) if received_at else now
-        duration = parse_duration_seconds(raw or "")
+        caller, callee, duration = extract_call_fields(raw or "")
         end_local = start_local + dt.timedelta(seconds=duration)
 
-        caller, callee = extract_two_numbers(raw or "")
         inbound, internal = guess_direction(caller, callee)
 
         row = {